@@ -8,6 +8,8 @@
 #include <QObject>
 #include <QString>
 
+class PythonDaemon;
+
 class AiUtils : public QObject
 {
     Q_OBJECT
@@ -17,6 +19,9 @@ public:
 
 signals:
     void inferenceResultReady(const QString &result);
+
+private:
+    PythonDaemon *m_daemon;
 };
 
 #endif
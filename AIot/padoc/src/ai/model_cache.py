@@ -0,0 +1,139 @@
+# model_cache.py
+"""Keras(.h5) 모델을 TFLite 로 한 번 변환해 두고, 이후 실행에서는 변환본을 가볍게 로드합니다.
+
+.h5 를 로드하려면 tensorflow 전체를 import 하고 Keras 그래프를 다시 만들어야 해서 장치에서 수 초가 걸립니다.
+변환본(<모델 이름>.tflite)은 원본 옆에 저장하고, 어느 원본에서 만들었는지 확인할 수 있도록
+<모델 이름>.tflite.json 에 원본의 SHA-256 과 크기/수정 시각을 함께 기록합니다.
+
+- 원본의 크기/수정 시각이 기록과 같으면 해시를 다시 계산하지 않고 변환본을 그대로 씁니다.
+- 다르면 해시를 다시 계산해, 해시까지 다를 때만 다시 변환합니다. (모델을 교체하면 자동으로 다시 변환)
+- 변환본 로드는 tflite_runtime 이 설치되어 있으면 그것을, 없으면 tf.lite 를 사용합니다.
+
+tensorflow 는 변환할 때와 tflite_runtime 이 없을 때만 import 합니다.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_SUFFIX = ".tflite"
+SIDECAR_SUFFIX = ".tflite.json"
+
+
+def cache_paths(model_path):
+    """(변환본 경로, 체크섬 기록 경로)"""
+    model_path = Path(model_path)
+    return model_path.with_suffix(CACHE_SUFFIX), model_path.with_suffix(SIDECAR_SUFFIX)
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_stat(model_path):
+    stat = os.stat(model_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _write_atomic(path, data: bytes):
+    """쓰는 도중 종료되어도 반쯤 쓴 파일이 남지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def read_sidecar(model_path):
+    _, sidecar_path = cache_paths(model_path)
+    try:
+        return json.loads(sidecar_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def is_cache_valid(model_path) -> bool:
+    """변환본이 지금의 원본 모델에서 만들어졌는지 확인합니다. (필요하면 기록의 크기/수정 시각을 갱신)"""
+    cache_path, sidecar_path = cache_paths(model_path)
+    sidecar = read_sidecar(model_path)
+    if not sidecar or not cache_path.exists():
+        return False
+    stat = _source_stat(model_path)
+    if sidecar.get("source_size") == stat["size"] and sidecar.get("source_mtime_ns") == stat["mtime_ns"]:
+        return True
+    if sidecar.get("source_sha256") != file_sha256(model_path):
+        return False
+    # 내용은 같고 수정 시각만 바뀐 경우 (복사/배포): 다음 실행부터 해시를 생략하도록 기록을 갱신
+    sidecar.update(source_size=stat["size"], source_mtime_ns=stat["mtime_ns"])
+    _write_atomic(sidecar_path, json.dumps(sidecar, indent=2).encode("utf-8"))
+    return True
+
+
+def convert(model_path):
+    """원본 .h5 를 TFLite 로 변환해 원본 옆에 저장하고 변환본 경로를 반환합니다."""
+    import tensorflow as tf
+
+    cache_path, sidecar_path = cache_paths(model_path)
+    model = tf.keras.models.load_model(str(model_path))
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    flatbuffer = converter.convert()
+
+    _write_atomic(cache_path, flatbuffer)
+    stat = _source_stat(model_path)
+    sidecar = {
+        "source": Path(model_path).name,
+        "source_sha256": file_sha256(model_path),
+        "source_size": stat["size"],
+        "source_mtime_ns": stat["mtime_ns"],
+        "tflite_sha256": hashlib.sha256(flatbuffer).hexdigest(),
+        "tensorflow": tf.__version__,
+    }
+    _write_atomic(sidecar_path, json.dumps(sidecar, indent=2).encode("utf-8"))
+    return cache_path
+
+
+def ensure_tflite(model_path, rebuild=False):
+    """원본에 맞는 변환본 경로를 반환합니다. 없거나 원본이 바뀌었으면 (또는 rebuild) 다시 변환합니다."""
+    cache_path, _ = cache_paths(model_path)
+    if not rebuild and is_cache_valid(model_path):
+        return cache_path
+    return convert(model_path)
+
+
+def _interpreter_class():
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TfliteModel:
+    """TFLite 변환본을 Keras 모델처럼 predict(x) 로 호출할 수 있게 감쌉니다.
+
+    인터프리터는 스레드 안전하지 않으므로 호출하는 쪽에서 직렬화해야 합니다. (voice_predict._predict_lock)
+    """
+
+    def __init__(self, tflite_path, num_threads=None):
+        self.path = Path(tflite_path)
+        self.interpreter = _interpreter_class()(model_path=str(self.path), num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+
+    def predict(self, x, verbose=0):
+        import numpy as np
+
+        x = np.asarray(x, dtype=self._input["dtype"])
+        if tuple(x.shape) != tuple(self._input["shape"]):
+            self.interpreter.resize_tensor_input(self._input["index"], x.shape)
+            self.interpreter.allocate_tensors()
+            self._input = self.interpreter.get_input_details()[0]
+        self.interpreter.set_tensor(self._input["index"], x)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output["index"]).copy()
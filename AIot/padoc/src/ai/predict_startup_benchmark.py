@@ -0,0 +1,121 @@
+# predict_startup_benchmark.py
+"""voice_predict.py 시작 시간 비교: 기존(.h5 + tensorflow import) vs TFLite 변환본.
+
+측정마다 새 파이썬 프로세스를 띄워 (장치에서 Qt 앱이 스크립트를 처음 실행할 때와 같은 상태)
+다음 시간을 잽니다.
+
+    import     voice_predict 모듈 import (기존 방식은 librosa/tensorflow/matplotlib 을 함께 import)
+    load       모델 로드 (keras: tf.keras.models.load_model, tflite: 체크섬 확인 + 인터프리터 생성)
+    first      첫 예측 (1, 224, 224, 3)
+
+두 방식의 예측 확률 차이도 같은 무작위 입력으로 비교합니다.
+
+사용 예)
+    python predict_startup_benchmark.py                        # ~/padoc/ai 의 모델
+    python predict_startup_benchmark.py --model a.h5 --repeat 5
+    python predict_startup_benchmark.py --synthetic            # 같은 입력 모양의 작은 CNN 으로 측정
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 새 프로세스에서 실행하는 측정 코드. 결과를 JSON 한 줄로 출력합니다.
+_PROBE = r"""
+import json, sys, time
+started = time.perf_counter()
+if {legacy!r}:
+    import librosa, tensorflow, matplotlib.pyplot  # 기존 voice_predict 의 모듈 import
+import numpy as np
+import voice_predict
+imported = time.perf_counter()
+model = voice_predict.load_model({model!r}, {backend!r})
+loaded = time.perf_counter()
+x = np.random.default_rng(0).random((4, 1, 224, 224, 3), dtype=np.float32)
+probs = [float(voice_predict.predict(model, sample)[1]) for sample in x]
+first = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "load_ms": (loaded - imported) * 1000,
+    "first_ms": (first - loaded) * 1000 / len(x),
+    "probabilities": probs,
+}}))
+"""
+
+
+def probe(model_path, backend, legacy=False):
+    code = _PROBE.format(model=str(model_path), backend=backend, legacy=legacy)
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, check=True)
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def make_synthetic_model(path):
+    """실제 모델과 입력/출력 모양이 같은 작은 CNN 을 만들어 .h5 로 저장합니다."""
+    import tensorflow as tf
+
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input((224, 224, 3)),
+        tf.keras.layers.Conv2D(16, 3, strides=2, activation="relu"),
+        tf.keras.layers.Conv2D(32, 3, strides=2, activation="relu"),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(32, activation="relu"),
+        tf.keras.layers.Dense(1, activation="sigmoid"),
+    ])
+    model.save(path)
+
+
+def _median(runs, key):
+    return statistics.median(run[key] for run in runs)
+
+
+def main():
+    sys.path.insert(0, HERE)
+    from model_cache import cache_paths, ensure_tflite
+    from voice_predict import MODEL_PATH
+
+    parser = argparse.ArgumentParser(description="voice_predict 시작 시간 벤치마크")
+    parser.add_argument("--model", default=str(MODEL_PATH), help="Keras 모델(.h5) 경로")
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 프로세스 실행 횟수 (중앙값)")
+    parser.add_argument("--synthetic", action="store_true", help="작은 합성 모델로 측정")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = args.model
+        if args.synthetic:
+            model_path = os.path.join(tmp, "synthetic.h5")
+            make_synthetic_model(model_path)
+
+        # 변환은 처음 한 번만 일어나므로 따로 잽니다.
+        started = time.perf_counter()
+        ensure_tflite(model_path, rebuild=args.synthetic)
+        convert_ms = (time.perf_counter() - started) * 1000
+        tflite_path, _ = cache_paths(model_path)
+
+        legacy = [probe(model_path, "keras", legacy=True) for _ in range(args.repeat)]
+        tflite = [probe(model_path, "tflite") for _ in range(args.repeat)]
+
+        tflite_kib = os.path.getsize(tflite_path) / 1024
+
+    print(f"model {os.path.basename(model_path)}  (TFLite {tflite_kib:.0f} KiB, 변환 {convert_ms:.0f} ms 최초 1회)")
+    print(f"{'':<8}{'import':>10}{'load':>10}{'first':>10}{'process':>11}")
+    for name, runs in (("keras", legacy), ("tflite", tflite)):
+        print(f"{name:<8}" + "".join(
+            f"{_median(runs, key):>9.0f}ms" for key in ("import_ms", "load_ms", "first_ms")
+        ) + f"{_median(runs, 'process_ms'):>9.0f}ms")
+    diff = max(abs(a - b) for a, b in zip(legacy[0]["probabilities"], tflite[0]["probabilities"]))
+    speedup = (_median(legacy, "import_ms") + _median(legacy, "load_ms")) / max(
+        _median(tflite, "import_ms") + _median(tflite, "load_ms"), 1e-9)
+    print(f"시작(import + load) x{speedup:.1f} 빠름, 예측 확률 최대 차이 {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
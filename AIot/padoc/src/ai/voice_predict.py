@@ -6,8 +6,20 @@ WAV 파일 음성을 AI 모델로 분류하는 커맨드 라인 스크립트.
 오디오의 특정 구간에서 추출한 멜 스펙트로그램(Mel Spectrogram)을 이미지로 변환하여
 CNN(Convolutional Neural Network) 모델의 입력으로 사용합니다.
 
+시작 시간:
+    - librosa, matplotlib, tensorflow 는 실제로 필요할 때 import 합니다.
+    - `.h5` 모델은 처음 한 번 TFLite 로 변환해 원본 옆(`.tflite`, 체크섬 `.tflite.json`)에 저장하고,
+      이후에는 변환본을 TFLite 인터프리터로 로드합니다. (model_cache.py 참고)
+      원본 모델이 바뀌면 자동으로 다시 변환하며, --backend keras 로 기존 방식을 쓸 수 있습니다.
+    - 시작 시간 측정: python predict_startup_benchmark.py
+
 실행 방법:
     - python voice_predict.py <wav_file_path>
+    - 상주 모드: python -u voice_predict.py --daemon [--workers N]
+      모델을 한 번만 로드/워밍업하고, 표준 입출력으로 JSON Lines 요청 {"id": 1, "path": "..."} 를 받아
+      {"id": 1, "ok": true, "result": {"label": 0, "probability": 0.12}} 로 응답합니다. (../jsonl_daemon.py 참고)
+    - 상주 모드(Unix 소켓): python voice_predict.py --socket /tmp/padoc_predict.sock
+    - 변환본만 미리 만들기 (배포 시): python voice_predict.py --convert
 
 입력:
     - 커맨드 라인 인자로 분석할 WAV 파일의 경로 1개.
@@ -18,46 +30,91 @@ CNN(Convolutional Neural Network) 모델의 입력으로 사용합니다.
 """
 import sys
 import io
-import librosa
+import os
+import argparse
+import threading
 import numpy as np
-import tensorflow as tf
-import matplotlib.pyplot as plt
 
 from PIL import Image
 from pathlib import Path
 
+from model_cache import TfliteModel, ensure_tflite
+
+try:
+    from padoc_voice.window import load_window
+except ImportError:
+    # AIot/padoc/src/ai → 저장소 최상위 → BackEnd (음성 분석 서버와 같은 padoc_voice 패키지)
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "BackEnd")))
+    from padoc_voice.window import load_window
+
 # 모델 경로
 MODEL_PATH = Path.home() / "padoc" / "ai" / "savemodel_101_all_Dense_32.h5"
 
+# pyplot 과 Keras 모델 호출은 스레드 안전하지 않으므로 상주 모드에서는 이 잠금으로 직렬화합니다.
+# (wav 로딩과 멜 스펙트로그램 계산은 요청끼리 병렬로 처리됩니다)
+_plot_lock = threading.Lock()
+_predict_lock = threading.Lock()
+
+BACKENDS = ("auto", "tflite", "keras")
+
+def _pyplot():
+    """파일로만 그리므로 GUI 백엔드를 찾지 않도록 Agg 로 지정하고 pyplot 을 import 합니다."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+def load_model(model_path=MODEL_PATH, backend="auto", rebuild=False):
+    """predict(x) 를 가진 모델을 반환합니다.
+
+    "tflite": 변환본(없거나 원본이 바뀌었으면 변환)을 TFLite 인터프리터로 로드
+    "keras":  기존처럼 .h5 를 tf.keras 로 로드
+    "auto":   tflite 를 시도하고, 변환/로드에 실패하면 keras 로 로드
+    """
+    if backend in ("auto", "tflite"):
+        try:
+            return TfliteModel(ensure_tflite(model_path, rebuild=rebuild))
+        except Exception as e:
+            if backend == "tflite":
+                raise
+            print(f"WARNING: TFLite 모델을 쓸 수 없어 Keras 모델을 로드합니다: {e}", file=sys.stderr)
+    import tensorflow as tf
+    return tf.keras.models.load_model(str(model_path))
+
 def preprocess_wav_for_prediction(wav_path):
     try:
+        import librosa
+        plt = _pyplot()
+
         sr = 48000
-        signal, sr = librosa.load(wav_path, sr=sr)
+        # 1초 ~ 2초 구간만 읽어 리샘플합니다. (파일 전체 librosa.load 후 자르던 것과 같은 값)
+        segment, total_length = load_window(wav_path, sr, 1.0, 2.0)
 
+        # 1.5초보다 짧으면 전체를 1.5초로 0 패딩한 뒤 자른 것과 같은 길이로 맞춥니다.
         required_length = int(sr * 1.5)
-        if len(signal) < required_length:
-            signal = np.pad(signal, (0, required_length - len(signal)), 'constant')
-
-        segment = signal[int(sr):int(sr * 2)]
+        segment_length = min(int(sr * 2), max(total_length, required_length)) - int(sr)
+        segment = np.pad(segment, (0, segment_length - len(segment)), 'constant')
 
         melspec = librosa.feature.melspectrogram(y=segment, sr=sr, n_mels=256)
         melspec_db = librosa.power_to_db(melspec, ref=np.max)
 
-        fig, ax = plt.subplots()
-        ax.axes.get_xaxis().set_visible(False)
-        ax.axes.get_yaxis().set_visible(False)
-        plt.axis('off')
-        plt.margins(0)
-
-        plt.imshow(melspec_db, aspect='auto', origin='lower') # 대체 표시
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0)
-        plt.close(fig)
+        with _plot_lock:
+            fig, ax = plt.subplots()
+            ax.axes.get_xaxis().set_visible(False)
+            ax.axes.get_yaxis().set_visible(False)
+            plt.axis('off')
+            plt.margins(0)
+
+            plt.imshow(melspec_db, aspect='auto', origin='lower') # 대체 표시
+            buf = io.BytesIO()
+            plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0)
+            plt.close(fig)
         buf.seek(0)
 
         img = Image.open(buf).convert('RGB')
         img = img.resize((224, 224))
-        img_array = tf.keras.preprocessing.image.img_to_array(img) / 255.0
+        # tf.keras.preprocessing.image.img_to_array 와 같은 float32 (H, W, 3) 배열
+        img_array = np.asarray(img, dtype=np.float32) / 255.0
 
         return np.expand_dims(img_array, axis=0)  # (1, 224, 224, 3)
 
@@ -65,27 +122,80 @@ def preprocess_wav_for_prediction(wav_path):
         print(f"ERROR: {e}", file=sys.stderr)
         return None
 
+def predict(model, x):
+    """(label, probability) 를 반환합니다. label 0: HC, 1: PD"""
+    with _predict_lock:
+        pred = model.predict(x, verbose=0)
+    prob = float(pred[0][0])   # 예: sigmoid 이진분류 기준
+    return int(prob > 0.5), prob
+
+def run_daemon(model, workers, socket_path=None):
+    """모델을 메모리에 둔 채 JSON Lines 요청을 처리합니다."""
+    from concurrent.futures import ThreadPoolExecutor
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from jsonl_daemon import JsonLineDaemon, run
+
+    # 첫 요청이 그래프 생성/커널 초기화, librosa/matplotlib import 비용을 치르지 않도록 미리 해 둡니다.
+    predict(model, np.zeros((1, 224, 224, 3), dtype=np.float32))
+    import librosa  # noqa: F401
+    _pyplot()
+
+    def handle_request(request, notify):
+        wav_path = request.get("path")
+        if not wav_path:
+            raise ValueError("No file path given.")
+        x = preprocess_wav_for_prediction(wav_path)
+        if x is None:
+            raise RuntimeError("입력 파일 전처리 실패")
+        label, prob = predict(model, x)
+        return {"label": label, "probability": prob}
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    return run(JsonLineDaemon("voice_predict", handle_request, executor), socket_path)
+
 def main():
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(
+        usage="python voice_predict.py [wav_file_path] | --daemon | --socket PATH | --convert")
+    parser.add_argument("wav_path", nargs="?")
+    parser.add_argument("--daemon", action="store_true", help="표준 입출력 JSON Lines 상주 모드")
+    parser.add_argument("--socket", help="Unix 소켓 상주 모드 (소켓 경로)")
+    parser.add_argument("--workers", type=int, default=2, help="상주 모드 동시 처리 수")
+    parser.add_argument("--model", default=str(MODEL_PATH), help="Keras 모델(.h5) 경로")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto",
+                        help="auto: TFLite 변환본 우선 (기본), tflite: 변환본만, keras: .h5 직접 로드")
+    parser.add_argument("--rebuild-cache", action="store_true", help="TFLite 변환본을 다시 만듭니다.")
+    parser.add_argument("--convert", action="store_true", help="TFLite 변환본만 만들고 종료합니다.")
+    args = parser.parse_args()
+
+    if args.convert:
+        try:
+            print(ensure_tflite(args.model, rebuild=args.rebuild_cache))
+        except Exception as e:
+            print(f"ERROR: 모델 변환 실패: {e}", file=sys.stderr)
+            sys.exit(2)
+        return
+
+    daemon = args.daemon or bool(args.socket)
+    if not daemon and not args.wav_path:
         print("Usage: python voice_predict.py [wav_file_path]", file=sys.stderr)
         sys.exit(1)
-    wav_path = sys.argv[1]
 
     try:
-        model = tf.keras.models.load_model(str(MODEL_PATH))
+        model = load_model(args.model, args.backend, rebuild=args.rebuild_cache)
     except Exception as e:
         print(f"ERROR: 모델 로딩 실패: {e}", file=sys.stderr)
         sys.exit(2)
 
-    x = preprocess_wav_for_prediction(wav_path)
+    if daemon:
+        sys.exit(run_daemon(model, max(1, args.workers), args.socket))
+
+    x = preprocess_wav_for_prediction(args.wav_path)
     if x is None:
         print(f"ERROR: 입력 파일 전처리 실패", file=sys.stderr)
         sys.exit(3)
 
     # 예측
-    pred = model.predict(x)
-    prob = float(pred[0][0])   # 예: sigmoid 이진분류 기준
-    result = int(prob > 0.5)   # 0: HC, 1: PD
+    result, _ = predict(model, x)
 
     # 결과 출력: Qt에서 stdout으로 읽을 수 있음
     print(result)
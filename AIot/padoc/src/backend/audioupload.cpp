@@ -10,16 +10,45 @@
 #include <QFileInfo>
 #include <QFile>
 #include <QDebug>
+#include <QtMath>
 
 AudioUpload::AudioUpload(QObject *parent)
     : QObject(parent)
 {
 }
 
+/**
+ * @brief analyze_voice.py 결과의 업로드용 지표("uploadFeatures")를 서버 DeviceFeatures 로 바꿉니다.
+ * @details 업로드용 지표는 서버와 같은 파라미터로 계산되어 이미 서버 필드 이름(jitter_local, cpp ...)과
+ *          parameter_set 을 씁니다. 숫자가 아닌 값이 하나라도 있으면 빈 객체를 돌려주어 보내지 않습니다.
+ *          (서버는 빠진 값이 있는 요청을 거절하므로, 이때는 서버가 업로드된 파일에서 직접 추출합니다)
+ */
+static QJsonObject toDeviceFeatures(const QVariantMap &result)
+{
+    const QVariantMap uploadFeatures = result.value("uploadFeatures").toMap();
+    if (uploadFeatures.isEmpty())
+        return QJsonObject();
+
+    QJsonObject features;
+    for (auto it = uploadFeatures.constBegin(); it != uploadFeatures.constEnd(); ++it) {
+        if (it.key() == QLatin1String("parameter_set")) {
+            features[it.key()] = it.value().toString();
+            continue;
+        }
+        bool ok = false;
+        const double number = it.value().toDouble(&ok);
+        if (it.value().isNull() || !ok || !qIsFinite(number))
+            return QJsonObject();
+        features[it.key()] = number;
+    }
+    return features;
+}
+
 /**
  * @brief 전체 3단계 오디오 업로드 프로세스를 시작하는 진입점 함수입니다.
  */
-void AudioUpload::startVoiceUpload(const QString &localFilePath, const QString &type, int relatedId, const QString &token)
+void AudioUpload::startVoiceUpload(const QString &localFilePath, const QString &type, int relatedId, const QString &token,
+                                   const QVariantMap &deviceFeatures)
 {
     m_localFilePath = localFilePath;
     m_token = token;
@@ -34,6 +63,10 @@ void AudioUpload::startVoiceUpload(const QString &localFilePath, const QString &
     json["file_name"] = fileName;
     json["type"] = type;
     if(relatedId != -1) json["related_voice_record_id"] = relatedId;
+    if (!deviceFeatures.isEmpty()) {
+        const QJsonObject features = toDeviceFeatures(deviceFeatures);
+        if (!features.isEmpty()) json["device_features"] = features;
+    }
     //qDebug() << "related_voice_record_id:" << relatedId;
 
     QNetworkRequest request(QUrl("https://i13a106.p.ssafy.io/api/training/basic/upload"));
@@ -8,6 +8,7 @@
 #include <QObject>
 #include <QNetworkAccessManager>
 #include <QString>
+#include <QVariantMap>
 
 class QNetworkReply;
 
@@ -19,7 +20,10 @@ public:
     explicit AudioUpload(QObject *parent = nullptr);
 
     // 이 함수를 호출하여 전체 업로드 프로세스를 시작합니다.
-    Q_INVOKABLE  void startVoiceUpload(const QString &localFilePath, const QString &type, int relatedId, const QString &token);
+    // deviceFeatures 에 VoiceAnalyzer::analyzeForUpload 의 결과(VoiceAnalyzer::analysisCompleted)를 주면
+    // 업로드용 지표("uploadFeatures")를 함께 보내 서버의 특징 추출을 생략합니다. (서버가 일부 표본만 다시 추출해 검증합니다)
+    Q_INVOKABLE  void startVoiceUpload(const QString &localFilePath, const QString &type, int relatedId, const QString &token,
+                                       const QVariantMap &deviceFeatures = QVariantMap());
 
 signals:
     // UI에 진행률을 표시하기 위한 시그널
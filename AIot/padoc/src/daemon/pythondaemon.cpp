@@ -0,0 +1,222 @@
+/**
+ * @file pythondaemon.cpp
+ * @brief PythonDaemon 클래스의 구현을 정의합니다.
+ */
+#include "pythondaemon.h"
+#include <QCoreApplication>
+#include <QJsonDocument>
+#include <QDir>
+#include <QFileInfo>
+#include <QDebug>
+
+/**
+ * @brief 주어진 경로 후보 리스트에서 실제 파일 시스템에 존재하는 첫 번째 경로를 찾아 반환합니다.
+ * @param candidates 확인할 파일/디렉토리 경로 리스트
+ * @return 존재하는 첫 번째 경로. 없으면 빈 QString을 반환합니다.
+ */
+static QString pickExisting(const QStringList& candidates) {
+    for (const auto& p : candidates) {
+        if (QFileInfo::exists(p))
+            return p;
+    }
+    return QString();
+}
+
+PythonDaemon::PythonDaemon(const QString &scriptRelPath, const QString &fallbackScriptPath, QObject *parent)
+    : QObject(parent)
+{
+    const QString baseDir = QCoreApplication::applicationDirPath();
+    m_scriptPath = QDir(baseDir).absoluteFilePath(scriptRelPath);
+    if (!QFileInfo::exists(m_scriptPath) && QFileInfo::exists(fallbackScriptPath))
+        m_scriptPath = fallbackScriptPath;
+}
+
+/**
+ * @brief 종료 요청을 보내고 잠시 기다린 뒤, 응답이 없으면 프로세스를 강제로 종료합니다.
+ */
+PythonDaemon::~PythonDaemon()
+{
+    if (!m_process)
+        return;
+    disconnect(m_process, nullptr, this, nullptr);
+    if (m_process->state() == QProcess::Running) {
+        m_process->write("{\"op\": \"shutdown\"}\n");
+        m_process->closeWriteChannel();
+        if (!m_process->waitForFinished(3000))
+            m_process->kill();
+    }
+    m_pending.clear();
+    m_progress.clear();
+}
+
+QString PythonDaemon::findPython()
+{
+    QString pythonPath;
+#if defined(Q_OS_WIN)
+    pythonPath = pickExisting({
+        QDir::homePath() + "/micromamba/envs/padoc/python.exe",   // conda/mamba
+        QDir::homePath() + "/miniconda3/envs/padoc/python.exe",
+        QDir::homePath() + "/venv/Scripts/python.exe",            // venv
+        "python.exe"                                              // PATH
+    });
+#elif defined(Q_OS_LINUX) || defined(Q_OS_MACOS) || defined(Q_OS_DARWIN)
+    pythonPath = pickExisting({
+        QDir::homePath() + "/micromamba/envs/padoc/bin/python",   // conda/mamba
+        QDir::homePath() + "/venv/bin/python",                    // venv
+        "/usr/bin/python3",
+        "python3"                                                 // PATH
+    });
+#elif defined(Q_OS_ANDROID)
+    // Termux 등
+    pythonPath = pickExisting({
+        "/data/data/com.termux/files/usr/bin/python",
+        "python"
+    });
+#else
+    pythonPath = "python3";
+#endif
+
+    if (pythonPath.isEmpty()) pythonPath = "python3"; // 최종 폴백
+    return pythonPath;
+}
+
+/**
+ * @brief 프로세스가 없으면 `python -u <script> --daemon` 으로 실행합니다.
+ * @return 프로세스가 실행 중이면 true
+ */
+bool PythonDaemon::ensureStarted()
+{
+    if (m_process && m_process->state() == QProcess::Running)
+        return true;
+
+    if (m_process) {
+        m_process->deleteLater();
+        m_process = nullptr;
+    }
+    m_buffer.clear();
+
+    m_process = new QProcess(this);
+    connect(m_process, &QProcess::readyReadStandardOutput, this, &PythonDaemon::onReadyRead);
+    connect(m_process, &QProcess::readyReadStandardError, this, [this]() {
+        // stderr 파이프가 가득 차 스크립트가 멈추지 않도록 계속 비워 둡니다.
+        const QByteArray err = m_process->readAllStandardError();
+        if (!err.trimmed().isEmpty())
+            qDebug().noquote() << "[PythonDaemon][stderr]" << QString::fromUtf8(err).trimmed();
+    });
+    connect(m_process, QOverload<int, QProcess::ExitStatus>::of(&QProcess::finished),
+            this, &PythonDaemon::onFinished);
+    connect(m_process, &QProcess::errorOccurred, this, &PythonDaemon::onErrorOccurred);
+
+    const QString pythonPath = findPython();
+    m_process->start(pythonPath, {"-u", m_scriptPath, "--daemon"});
+    if (!m_process->waitForStarted(10000)) {
+        qWarning() << "[PythonDaemon] failed to start python:" << pythonPath << m_scriptPath;
+        m_process->deleteLater();
+        m_process = nullptr;
+        return false;
+    }
+    return true;
+}
+
+/**
+ * @brief 요청을 보냅니다. 스크립트가 모델 로딩 중이어도 요청은 파이프에 쌓였다가 순서대로 처리됩니다.
+ */
+void PythonDaemon::request(QJsonObject payload, Callback callback, ProgressCallback progress)
+{
+    if (!ensureStarted()) {
+        callback(false, QJsonValue(), QStringLiteral("Failed to start python daemon: %1").arg(m_scriptPath));
+        return;
+    }
+
+    const qint64 id = m_nextId++;
+    payload.insert(QStringLiteral("id"), id);
+    m_pending.insert(id, std::move(callback));
+    if (progress)
+        m_progress.insert(id, std::move(progress));
+    m_process->write(QJsonDocument(payload).toJson(QJsonDocument::Compact) + '\n');
+}
+
+void PythonDaemon::onReadyRead()
+{
+    QProcess *proc = qobject_cast<QProcess*>(sender());
+    if (!proc || proc != m_process) return;
+
+    m_buffer += proc->readAllStandardOutput();
+    int newline;
+    while ((newline = m_buffer.indexOf('\n')) >= 0) {
+        const QByteArray line = m_buffer.left(newline).trimmed();
+        m_buffer.remove(0, newline + 1);
+        if (!line.isEmpty())
+            handleLine(line);
+    }
+}
+
+/**
+ * @brief 응답 한 줄을 id 로 대기 중인 요청과 짝지어 콜백을 호출합니다.
+ */
+void PythonDaemon::handleLine(const QByteArray &line)
+{
+    QJsonParseError parseError;
+    const QJsonDocument doc = QJsonDocument::fromJson(line, &parseError);
+    if (parseError.error != QJsonParseError::NoError || !doc.isObject()) {
+        // 분석 라이브러리가 stdout 에 남기는 로그 등은 무시합니다.
+        qDebug().noquote() << "[PythonDaemon][stdout]" << QString::fromUtf8(line);
+        return;
+    }
+
+    const QJsonObject obj = doc.object();
+    const qint64 id = obj.value(QStringLiteral("id")).toVariant().toLongLong();
+    if (obj.contains(QStringLiteral("event"))) {
+        // {"event": "ready", ...} 는 무시하고, 요청별 중간 알림만 전달합니다.
+        const auto progress = m_progress.constFind(id);
+        if (progress != m_progress.constEnd())
+            progress.value()(obj);
+        return;
+    }
+
+    auto it = m_pending.find(id);
+    if (it == m_pending.end()) {
+        qWarning().noquote() << "[PythonDaemon] unmatched response:" << QString::fromUtf8(line);
+        return;
+    }
+    Callback callback = std::move(it.value());
+    m_pending.erase(it);
+    m_progress.remove(id);
+
+    if (obj.value(QStringLiteral("ok")).toBool())
+        callback(true, obj.value(QStringLiteral("result")), QString());
+    else
+        callback(false, QJsonValue(), obj.value(QStringLiteral("error")).toString());
+}
+
+void PythonDaemon::failPending(const QString &error)
+{
+    // 콜백 안에서 새 요청을 보낼 수 있으므로 먼저 목록을 비웁니다.
+    const auto pending = std::move(m_pending);
+    m_pending.clear();
+    m_progress.clear();
+    for (const auto &callback : pending)
+        callback(false, QJsonValue(), error);
+}
+
+void PythonDaemon::onFinished(int exitCode, QProcess::ExitStatus exitStatus)
+{
+    QProcess *proc = qobject_cast<QProcess*>(sender());
+    if (!proc || proc != m_process) return;
+
+    qWarning() << "[PythonDaemon] exited" << m_scriptPath << "exitCode" << exitCode
+               << (exitStatus == QProcess::NormalExit ? "Normal" : "Crashed");
+    m_process->deleteLater();
+    m_process = nullptr;
+    failPending(QStringLiteral("Python daemon exited (code %1)").arg(exitCode));
+}
+
+void PythonDaemon::onErrorOccurred(QProcess::ProcessError error)
+{
+    QProcess *proc = qobject_cast<QProcess*>(sender());
+    if (!proc || proc != m_process) return;
+
+    // 실행 중 충돌은 finished 에서 처리합니다.
+    if (error == QProcess::FailedToStart)
+        failPending(QStringLiteral("Failed to start python daemon: %1").arg(m_scriptPath));
+}
@@ -0,0 +1,57 @@
+/**
+ * @file pythondaemon.h
+ * @brief 상주(daemon) 모드로 실행한 Python 분석 스크립트와 JSON Lines 로 통신하는 PythonDaemon 클래스를 정의합니다.
+ */
+#pragma once
+#include <QObject>
+#include <QProcess>
+#include <QHash>
+#include <QJsonObject>
+#include <QJsonValue>
+#include <functional>
+
+/**
+ * @brief Python 스크립트를 `--daemon` 으로 한 번만 실행해 두고, 요청마다 한 줄짜리 JSON 을 주고받습니다.
+ * @details 프로토콜은 src/jsonl_daemon.py 를 참고하세요.
+ *          요청마다 id 를 붙여 응답과 짝짓고, 프로세스가 죽으면 대기 중인 요청을 모두 실패 처리한 뒤
+ *          다음 요청에서 다시 실행합니다.
+ */
+class PythonDaemon : public QObject
+{
+    Q_OBJECT
+public:
+    /// 응답 콜백. 성공 시 ok=true 와 result, 실패 시 ok=false 와 error 를 전달합니다.
+    using Callback = std::function<void(bool ok, const QJsonValue &result, const QString &error)>;
+    /// 중간 알림 콜백. 응답 전에 오는 {"id": ..., "event": ...} 줄을 그대로 전달합니다.
+    using ProgressCallback = std::function<void(const QJsonObject &event)>;
+
+    /**
+     * @param scriptRelPath 실행 파일 기준 상대 경로 (예: "../padoc/src/praat/analyze_voice.py")
+     * @param fallbackScriptPath 상대 경로에 스크립트가 없을 때 사용할 개발용 절대 경로
+     */
+    PythonDaemon(const QString &scriptRelPath, const QString &fallbackScriptPath, QObject *parent = nullptr);
+    ~PythonDaemon();
+
+    /// payload 에 id 를 붙여 보내고, 응답이 오면 callback 을, 중간 알림이 오면 progress 를 호출합니다.
+    void request(QJsonObject payload, Callback callback, ProgressCallback progress = nullptr);
+
+    /// OS별 후보 경로에서 Python 실행 파일을 찾습니다.
+    static QString findPython();
+
+private slots:
+    void onReadyRead();
+    void onFinished(int exitCode, QProcess::ExitStatus exitStatus);
+    void onErrorOccurred(QProcess::ProcessError error);
+
+private:
+    bool ensureStarted();
+    void handleLine(const QByteArray &line);
+    void failPending(const QString &error);
+
+    QString m_scriptPath;
+    QProcess *m_process = nullptr;
+    QByteArray m_buffer;
+    QHash<qint64, Callback> m_pending;
+    QHash<qint64, ProgressCallback> m_progress;
+    qint64 m_nextId = 1;
+};
@@ -0,0 +1,204 @@
+# jsonl_daemon.py
+"""분석 스크립트 상주(daemon) 모드 공용 루프.
+
+Qt 앱이 녹음마다 파이썬 프로세스를 새로 띄우면 인터프리터 시작, numpy/parselmouth/tensorflow
+import, 모델 로딩 비용을 매번 치르게 됩니다. 상주 모드에서는 프로세스를 한 번만 띄워 두고
+한 줄짜리 JSON 요청/응답(JSON Lines)을 주고받습니다.
+
+프로토콜 (한 줄 = JSON 객체 하나, UTF-8):
+    시작 완료   {"event": "ready", "name": ..., "pid": ...}
+    요청        {"id": 7, "op": "analyze", ...}      op 생략 시 "analyze"
+    진행 상황   {"id": 7, "event": "progress", ...}  handler 가 notify() 로 보내는 중간 알림 (0개 이상)
+    성공 응답   {"id": 7, "ok": true, "result": {...}, "elapsed_ms": 123.4}
+    실패 응답   {"id": 7, "ok": false, "error": "..."}
+    상태 확인   {"id": 8, "op": "ping"}     -> {"id": 8, "ok": true, "result": "pong"}
+    종료        {"id": 9, "op": "shutdown"} -> 처리 중인 요청을 마친 뒤 응답하고 종료
+
+요청은 executor 에서 동시에 처리되므로 응답 순서는 요청 순서와 다를 수 있습니다.
+클라이언트는 id 로 요청과 응답을 짝지어야 합니다.
+
+전송 방식:
+    serve_stdio()          표준 입출력 (Qt QProcess 용)
+    serve_unix_socket()    로컬 Unix 소켓. 연결마다 같은 프로토콜을 사용합니다.
+"""
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Optional, TextIO
+
+
+class RequestError(Exception):
+    """요청 형식이 잘못되었을 때 발생합니다. (응답의 error 로 그대로 전달됩니다)"""
+
+
+class JsonLineDaemon:
+    """요청 한 줄을 읽어 executor 에서 handler 를 실행하고, 결과를 한 줄로 씁니다.
+
+    handler(request, notify) 는 결과를 반환하며, 처리 중에 notify(message) 로 같은 id 의 중간 알림을
+    보낼 수 있습니다. (notify 는 executor 가 스레드 풀일 때만 사용할 수 있습니다)
+    """
+
+    def __init__(self, name: str, handler: Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Any],
+                 executor: Executor):
+        self.name = name
+        self.handler = handler
+        self.executor = executor
+        self._in_flight = 0
+        self._idle = threading.Condition()
+
+    def _write(self, out: TextIO, lock: threading.Lock, message: Dict[str, Any]) -> None:
+        line = json.dumps(message, ensure_ascii=False, allow_nan=False, default=str)
+        with lock:
+            out.write(line + "\n")
+            out.flush()
+
+    def ready_message(self) -> Dict[str, Any]:
+        return {"event": "ready", "name": self.name, "pid": os.getpid()}
+
+    def _finish(self) -> None:
+        with self._idle:
+            self._in_flight -= 1
+            self._idle.notify_all()
+
+    def wait_idle(self) -> None:
+        with self._idle:
+            self._idle.wait_for(lambda: self._in_flight == 0)
+
+    def handle_line(self, line: str, out: TextIO, lock: threading.Lock) -> bool:
+        """요청 한 줄을 처리합니다. 종료 요청이면 False 를 반환합니다."""
+        line = line.strip()
+        if not line:
+            return True
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError("요청은 JSON 객체여야 합니다.")
+        except (ValueError, RequestError) as e:
+            self._write(out, lock, {"id": None, "ok": False, "error": f"잘못된 요청: {e}"})
+            return True
+
+        request_id = request.get("id")
+        op = request.get("op", "analyze")
+        if op == "ping":
+            self._write(out, lock, {"id": request_id, "ok": True, "result": "pong"})
+            return True
+        if op == "shutdown":
+            self.wait_idle()
+            self._write(out, lock, {"id": request_id, "ok": True, "result": "bye"})
+            return False
+        if op != "analyze":
+            self._write(out, lock, {"id": request_id, "ok": False, "error": f"알 수 없는 op: {op}"})
+            return True
+
+        with self._idle:
+            self._in_flight += 1
+        started = time.perf_counter()
+
+        def notify(message: Dict[str, Any]) -> None:
+            message = {"id": request_id, **message}
+            try:
+                self._write(out, lock, message)
+            except ValueError:
+                self._write(out, lock, _replace_non_finite(message))
+
+        future = self.executor.submit(self.handler, request, notify)
+
+        def _done(done_future):
+            try:
+                result = done_future.result()
+                message = {
+                    "id": request_id,
+                    "ok": True,
+                    "result": result,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                }
+                try:
+                    self._write(out, lock, message)
+                except ValueError:
+                    # NaN/Infinity 는 JSON 표준이 아니므로 null 로 바꿔 다시 씁니다.
+                    message["result"] = _replace_non_finite(result)
+                    self._write(out, lock, message)
+            except Exception as e:
+                try:
+                    self._write(out, lock, {"id": request_id, "ok": False, "error": str(e)})
+                except (OSError, ValueError):
+                    pass  # 연결이 끊긴 경우
+            finally:
+                self._finish()
+
+        future.add_done_callback(_done)
+        return True
+
+    def serve_stdio(self, stdin: TextIO = None, stdout: TextIO = None) -> int:
+        """표준 입력이 닫히거나 종료 요청을 받을 때까지 요청을 처리합니다."""
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        lock = threading.Lock()
+        self._write(stdout, lock, self.ready_message())
+        for line in stdin:
+            if not self.handle_line(line, stdout, lock):
+                break
+        self.wait_idle()
+        self.executor.shutdown(wait=True)
+        return 0
+
+    def serve_unix_socket(self, path: str) -> int:
+        """로컬 Unix 소켓에서 연결마다 같은 프로토콜로 요청을 처리합니다."""
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                out = _SocketWriter(self.wfile)
+                lock = threading.Lock()
+                daemon._write(out, lock, daemon.ready_message())
+                for raw in self.rfile:
+                    if not daemon.handle_line(raw.decode("utf-8"), out, lock):
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        break
+                # 연결이 끊겨도 이미 받은 요청은 끝까지 처리합니다.
+                daemon.wait_idle()
+
+        if os.path.exists(path):
+            os.unlink(path)
+        with socketserver.ThreadingUnixStreamServer(path, _Handler) as server:
+            print(json.dumps({"event": "listening", "name": self.name, "socket": path}), flush=True)
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(path)
+        self.executor.shutdown(wait=True)
+        return 0
+
+
+class _SocketWriter:
+    """소켓 파일(bytes)에 str 을 쓰기 위한 얇은 래퍼"""
+
+    def __init__(self, wfile):
+        self._wfile = wfile
+
+    def write(self, text: str) -> None:
+        self._wfile.write(text.encode("utf-8"))
+
+    def flush(self) -> None:
+        self._wfile.flush()
+
+
+def _replace_non_finite(value: Any) -> Any:
+    if isinstance(value, float) and (value != value or value in (float("inf"), float("-inf"))):
+        return None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def run(daemon: JsonLineDaemon, socket_path: Optional[str] = None) -> int:
+    """socket_path 가 있으면 Unix 소켓, 없으면 표준 입출력으로 상주합니다."""
+    if socket_path:
+        return daemon.serve_unix_socket(socket_path)
+    return daemon.serve_stdio()
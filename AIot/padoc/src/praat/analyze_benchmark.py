@@ -0,0 +1,107 @@
+# analyze_benchmark.py
+"""analyze_voice.analyze 의 디코딩 횟수에 따른 처리 시간 비교.
+
+기존 방식은 한 녹음을 세 번 읽었습니다. (analyze 본문, compute_cpp_numpy 의 파일 재디코딩 + 리샘플,
+compute_lh_ratio_series 의 Sound 복사) 이 스크립트는 같은 흐름을 _UncachedAudio 로 재현해
+LoadedAudio 한 번 디코딩 방식과 시간 및 결과를 비교합니다.
+
+장치 녹음 형식(48 kHz, 모노, 16 bit)의 합성 모음 발성을 길이별로 만들어 측정하며,
+wav 파일을 직접 줄 수도 있습니다.
+
+사용 예)
+    python analyze_benchmark.py                     # 5 s, 10 s 합성 녹음
+    python analyze_benchmark.py --seconds 5 7.5 10 --repeat 5 --stereo
+    python analyze_benchmark.py a.wav b.wav
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import parselmouth
+
+from analyze_voice import LoadedAudio, analyze
+
+SAMPLE_RATE = 48000
+
+
+class _UncachedAudio(LoadedAudio):
+    """기존 analyze 와 같은 비용을 내는 LoadedAudio (파생 신호를 만들 때마다 다시 읽습니다)"""
+
+    def __init__(self, file_path):
+        super().__init__(parselmouth.Sound(file_path))
+        self.file_path = file_path
+
+    @property
+    def mono(self):
+        # 기존 compute_lh_ratio_series: parselmouth.Sound(모노 Sound) 로 한 번 더 복사
+        return parselmouth.Sound(LoadedAudio(self.sound).mono)
+
+    def resampled(self, fs_target):
+        # 기존 compute_cpp_numpy: 파일을 다시 디코딩하고 리샘플
+        return LoadedAudio.from_file(self.file_path).resampled(fs_target)
+
+
+def make_vowel(path, seconds, stereo=False, f0=180.0):
+    """약한 비브라토와 잡음이 섞인 합성 모음("아") 발성을 16 bit wav 로 저장합니다."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    phase = 2 * np.pi * np.cumsum(f0 * (1 + 0.01 * np.sin(2 * np.pi * 5 * t))) / SAMPLE_RATE
+    signal = sum(np.sin(k * phase) / k for k in range(1, 12))
+    signal = 0.3 * signal / np.max(np.abs(signal)) + 0.005 * rng.standard_normal(len(t))
+    values = np.vstack([signal, 0.8 * signal]) if stereo else signal[np.newaxis, :]
+    parselmouth.Sound(values, sampling_frequency=SAMPLE_RATE).save(path, "WAV")
+
+
+def _time(func, repeat):
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), result
+
+
+def bench_file(path, repeat):
+    legacy_s, legacy = _time(lambda: analyze(path, audio=_UncachedAudio(path)), repeat)
+    single_s, single = _time(lambda: analyze(path), repeat)
+    identical = json.dumps(legacy, sort_keys=True) == json.dumps(single, sort_keys=True)
+    # 기존 방식이 한 번 더 치르던 비용: 파일 디코딩 + 16 kHz 리샘플
+    decode_s, _ = _time(lambda: LoadedAudio.from_file(path).resampled(16000), repeat)
+    duration = parselmouth.Sound(path).duration
+    print(
+        f"{os.path.basename(path):<24} {duration:>6.2f}s"
+        f"  decode+resample {decode_s * 1000:>7.1f} ms"
+        f"  3x decode {legacy_s * 1000:>8.1f} ms"
+        f"  1x decode {single_s * 1000:>8.1f} ms"
+        f"  {(legacy_s - single_s) / legacy_s:>6.1%} faster"
+        f"  identical={identical}"
+    )
+    return identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description="analyze_voice 디코딩 횟수별 처리 시간 비교")
+    parser.add_argument("files", nargs="*", help="측정할 wav 파일 (없으면 합성 녹음 사용)")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[5.0, 10.0], help="합성 녹음 길이(초)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--stereo", action="store_true", help="합성 녹음을 2채널로 만듭니다.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = list(args.files)
+        if not paths:
+            for seconds in args.seconds:
+                path = os.path.join(tmp, f"vowel_{seconds:g}s{'_stereo' if args.stereo else ''}.wav")
+                make_vowel(path, seconds, stereo=args.stereo)
+                paths.append(path)
+
+        results = [bench_file(path, args.repeat) for path in paths]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
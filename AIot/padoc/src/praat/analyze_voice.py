@@ -9,249 +9,201 @@
 - CPPS  근사 계산.
 - L/H Ratio  계산.
 - CSID  추정.
+- 지표 계산은 음성 분석 서버와 같은 padoc_voice 패키지(BackEnd/padoc_voice)를 DEVICE 파라미터로 호출합니다.
+  (장치와 서버의 설정 차이는 padoc_voice/params.py 에 정리)
+- 파일은 한 번만 디코딩하여 LoadedAudio 로 모든 지표 계산에 넘깁니다.
+  (모노/16 kHz 리샘플 등 파생 신호도 처음 필요할 때 한 번만 만듭니다)
 
 실행 방법:
 - 단일 파일 분석: python analyze_voice.py <file_path>
-- 다중 파일 분석: python analyze_voice.py <file1_path> <file2_path> ...
-  (다중 파일의 경우, 각 지표의 평균값을 계산하여 반환)
+- 다중 파일 분석: python analyze_voice.py <file1_path> <file2_path> ... [--workers N] [--progress]
+  (다중 파일의 경우, 프로세스 풀(기본: CPU 코어 수)에서 병렬로 분석한 뒤 각 지표의 평균값을 계산하여 반환)
+  (--progress: 파일이 끝날 때마다 {"event": "progress", "index", "path", "done", "total", "result"} 를
+   한 줄씩 먼저 출력하고, 마지막 줄에 평균 결과를 출력)
+- 업로드용 지표 포함: python analyze_voice.py <file_path> --upload voice_ah|voice_sentence
+  (파일별 결과의 "uploadFeatures" 에 서버 업로드 요청의 device_features 로 보낼 값을 담습니다.
+   장치 화면용 지표와 달리 서버와 같은 SERVER 파라미터로 계산하며, 평균 결과에는 넣지 않습니다)
+- 상주 모드: python -u analyze_voice.py --daemon [--workers N]
+  (표준 입출력으로 JSON Lines 요청 {"id": 1, "paths": [...], "progress": true, "upload": "voice_ah"} 를 받아 처리,
+   ../jsonl_daemon.py 참고)
+- 상주 모드(Unix 소켓): python analyze_voice.py --socket /tmp/padoc_analyze.sock
 
 출력:
-- 모든 분석 결과는 표준 출력(stdout)을 통해 단일 JSON 객체로 반환됩니다.
+- 모든 분석 결과는 표준 출력(stdout)을 통해 단일 JSON 객체로 반환됩니다. (--progress 를 주지 않으면 기존과 동일)
 """
 import sys
 import json
 import math
-import parselmouth
-import numpy as np
-
-from parselmouth.praat import call
-from scipy.signal import get_window
+import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # ========= 파라미터 =========
-PITCH_FLOOR = 75
-PITCH_CEIL = 600
-LH_SPLIT_HZ = 4000.0
-
-def _extract_mono(snd: parselmouth.Sound) -> parselmouth.Sound:
-    if snd.n_channels == 2:
-        return call(snd, "Extract one channel...", 1)
-    return snd
-
-# CPP 계산 함수
-def compute_cpp_numpy(file_path: str,
-                      fmin=60.0, fmax=330.0,
-                      fs_target=16000,
-                      frame_len=0.01,   # 10 ms
-                      hop_len=0.005,    # 5 ms
-                      trend_method="linear",  # "linear" or "exp"
-                      eps=1e-12) -> float:
+# voice_params 가 padoc_voice 를 찾을 수 있도록 sys.path 도 맞춰 줍니다. (저장소의 BackEnd/padoc_voice)
+from voice_params import DEVICE
+from padoc_voice.audio import LoadedAudio
+from padoc_voice.batch import average, default_workers, make_pool, map_files
+from padoc_voice.features import extract_all, extract_upload_features
+
+# analyze() 결과 키 → padoc_voice 지표 이름
+RESULT_KEYS = {
+    "localJitter": "jitter_local",
+    "localShimmer": "shimmer_local",
+    "hnr": "hnr",
+    "nhr": "nhr",
+    "meanF0": "f0",
+    "maxF0": "max_f0",
+    "minF0": "min_f0",
+    "cpp": "cpp",
+    "csid": "csid",
+}
+
+# 업로드 녹음 유형(서버 RecordingTypeEnum) → padoc_voice 지표 묶음
+UPLOAD_KINDS = {"voice_ah": "ah", "voice_sentence": "sentence"}
+
+def range_st(max_f0, min_f0):
+    """최대/최소 F0 사이 음역(semitone)"""
+    return 12 * math.log2(max_f0 / min_f0) if min_f0 > 0 else float(0)
+
+def upload_features(filepath, upload_type):
+    """서버 업로드 요청의 device_features 로 보낼 지표 (서버와 같은 디코딩/SERVER 파라미터)"""
+    if upload_type not in UPLOAD_KINDS:
+        raise ValueError(f"Unsupported upload type: {upload_type}")
+    with open(filepath, "rb") as f:
+        features = extract_upload_features(f.read(), UPLOAD_KINDS[upload_type])
+    # 서버는 빠진 값이 있는 요청을 거절하므로, 계산되지 않은 값(NaN)이 있으면 보내지 않고 서버가 추출하게 합니다.
+    missing = [k for k, v in features.items() if isinstance(v, float) and not math.isfinite(v)]
+    if missing:
+        raise ValueError(f"Undefined upload features: {', '.join(missing)}")
+    return features
+
+def analyze(filepath, audio: LoadedAudio = None, upload_type=None):
+    """녹음 하나의 지표. 계산은 padoc_voice 의 DEVICE 파라미터로 합니다. (서버와 같은 구현)
+
+    upload_type("voice_ah" / "voice_sentence")을 주면 업로드용 지표를 "uploadFeatures" 에 함께 담습니다.
+    업로드용 지표를 계산하지 못하면 "uploadFeatures" 를 빼고 돌려줍니다. (서버가 직접 추출)
     """
-    순수 Python/Numpy로 CPPS(평균) 근사 계산.
-    - Praat의 PowerCepstrogram/CPPS와 수치가 완벽히 동일하진 않을 수 있지만,
-      분류/회귀용 피처로는 충분히 일관된 경향을 보입니다.
-    """
-
-    snd = parselmouth.Sound(file_path)
-    if snd.n_channels == 2:
-        snd = snd.extract_left_channel()
-
-    # 리샘플(권장)
-    if snd.sampling_frequency != fs_target:
-        # snd = parselmouth.Sound(values=snd.values, sampling_frequency=snd.sampling_frequency)
-        snd = parselmouth.praat.call(snd, "Resample...", fs_target, 50)
-    sr = int(snd.sampling_frequency)
-    x = snd.values[0].astype(np.float64)
-
-    # 프레이밍
-    N = len(x)
-    n_frame = int(round(frame_len * sr))
-    n_hop   = int(round(hop_len * sr))
-    win = get_window("hamming", n_frame, fftbins=True)
-
-    # quefrency(초) 범위
-    qmin = 1.0 / fmax
-    qmax = 1.0 / fmin
-
-    cpp_list = []
-    i = 0
-    while i + n_frame <= N:
-        seg = x[i:i+n_frame] * win
-        i += n_hop
-
-        # 켑스트럼 (log-magnitude cepstrum)
-        spec = np.fft.rfft(seg)
-        mag  = np.abs(spec) + eps
-        log_mag = np.log(mag)
-        cep = np.fft.irfft(log_mag)  # quefrency-domain
-
-        # quefrency 샘플 인덱스 범위
-        q = np.arange(len(cep)) / sr
-        mask = (q >= qmin) & (q <= qmax)
-        if not np.any(mask):
-            continue
-
-        # 추세선(cepstral trend): 선형 회귀 (또는 exp)
-        y = cep[mask]
-        xq = q[mask]
-        if trend_method == "exp":
-            # 지수 추세 근사: log(y+const) 선형화 등 다양한 변형이 가능하나,
-            # 간단히 선형과 성능 차이가 크지 않아 linear를 기본으로 사용.
-            coef = np.polyfit(xq, y, 1)
-        else:
-            coef = np.polyfit(xq, y, 1)  # linear
-        trend = np.polyval(coef, xq)
-
-        # 피크 찾기 (기본주기 부근 최대치)
-        peak_val = np.max(y)
-        peak_idx = np.argmax(y)
-        trend_at_peak = trend[peak_idx]
-
-        # CPP = (peak - trend_at_peak) [dB]
-        cpp = (peak_val - trend_at_peak) * 20 / np.log(10)  # ln→dB 변환
-        cpp_list.append(cpp)
-
-    if len(cpp_list) == 0:
-        return float("nan")
-
-    # 시간평균 (smoothed)
-    return float(np.mean(cpp_list))
-
-def estimate_csid_awan2016(cpp: float, lh_series_db: np.ndarray) -> float:
-    """Awan et al., 2016 (J Voice) 회귀식 기반 CSID 계산"""
-    if lh_series_db.size == 0 or not np.isfinite(cpp):
-        return float("nan")
-    lh_mean = float(np.mean(lh_series_db))
-    lh_sd = float(np.std(lh_series_db, ddof=1)) if lh_series_db.size > 1 else 0.0
-    csid = 154.59 - (10.39 * cpp) - (1.08 * lh_mean) - (3.71 * lh_sd)
-    return float(csid)
-
-def compute_lh_ratio_series(file_path):
-    """프레임별 L/H ratio(dB). 프레임 스펙트럼을 numpy FFT로 계산."""
-    snd = parselmouth.Sound(file_path)
-    sr = snd.sampling_frequency
-    signal = snd.values[0]
-    lh_db_list = []
-
-    frame_len = 0.05
-    hop_len = 0.025
-    frame_n = int(round(frame_len * sr))
-    hop_n   = int(round(hop_len * sr))
-
-    if frame_n <= 0 or hop_n <= 0:
-        return np.array([])
-
-    for start in range(0, len(signal) - frame_n + 1, hop_n):
-        frame = signal[start:start+frame_n]
-        win = np.hamming(len(frame))
-        x = frame * win
-        spec = np.fft.rfft(x)
-        mag2 = np.abs(spec) ** 2
-        freqs = np.fft.rfftfreq(len(x), d=1.0/sr)
-        low_mask = freqs <= LH_SPLIT_HZ
-        high_mask = freqs > LH_SPLIT_HZ
-        low_e = float(np.sum(mag2[low_mask])) + 1e-12
-        high_e = float(np.sum(mag2[high_mask])) + 1e-12
-        lh_db = 10.0 * np.log10(low_e / high_e)
-        lh_db_list.append(lh_db)
-
-    return np.array(lh_db_list, dtype=float)
-
-def analyze(filepath):
     try:
-        # 음성파일 불러오기
-        sound = parselmouth.Sound(filepath)
-
-        # 기본 세팅값 설정
-        f0min, f0max = 75, 500
-        unit = "Hertz"
-        pointProcess = call(sound, "To PointProcess (periodic, cc)", f0min, f0max)
-
-        # Jitter, Shimmer 추출
-        localJitter = call(pointProcess, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3)
-        localShimmer = call([sound, pointProcess], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
-
-        # hnr & nhr 추출
-        harmonicity = call(sound, "To Harmonicity (cc)", 0.01, 75, 0.1, 1.0)
-        hnr = call(harmonicity, "Get mean", 0, 0)
-        nhr = 10 ** (-hnr / 10)
-
-        # 주파수 추출 
-        pitch = call(sound, "To Pitch", 0.0, f0min, f0max)
-        meanF0 = call(pitch, "Get mean", 0, 0, unit)
-        maxF0 = call(pitch, "Get maximum", 0, 0, unit, "Parabolic")
-        minF0 = call(pitch, "Get minimum", 0, 0, unit, "Parabolic")
-
-        # CPP, CSID 추출
-        cpps = compute_cpp_numpy(file_path=filepath, fmin=f0min, fmax=f0max)
-        snd_tmp = _extract_mono(sound)
-        lh_series = compute_lh_ratio_series(snd_tmp)
-        csid = estimate_csid_awan2016(cpps, lh_series)
+        # 음성파일 불러오기 (한 번만 디코딩)
+        if audio is None:
+            audio = LoadedAudio.from_file(filepath, DEVICE.downmix)
+        features = extract_all(audio, DEVICE)
 
-        # rangeST
-        rangeST = 12 * math.log2(maxF0 / minF0) if minF0 > 0 else float(0)
-
-        result = {
-            "localJitter": float(localJitter),
-            "localShimmer": float(localShimmer),
-            "hnr": float(hnr),
-            "nhr": float(nhr),
-            "meanF0": float(meanF0),
-            "maxF0": float(maxF0),
-            "minF0": float(minF0),
-            "cpp": float(cpps),
-            "csid": float(csid),
-            "rangeST": float(rangeST),
-        }
-
-        # 기존 print 대신 dict 반환 (나머지 변수/주석 유지)
-        return result
+        result = {key: float(features[name]) for key, name in RESULT_KEYS.items()}
+        result["rangeST"] = float(range_st(result["maxF0"], result["minF0"]))
     except Exception as e:
         return {"error": str(e)}
 
-# analyze("C:/Users/SSAFY/Downloads/Muhammad_Ali_PD_3.wav")
-
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "No file path given."}))
-        sys.exit(1)
-
-    paths = sys.argv[1:]
-
-    # 파일 1개면 예전과 동일하게 단일 결과 출력
+    if upload_type:
+        try:
+            result["uploadFeatures"] = upload_features(filepath, upload_type)
+        except Exception as e:
+            print(f"upload features failed for {filepath}: {e}", file=sys.stderr)
+    return result
+
+AVERAGE_KEYS = ["meanF0", "maxF0", "minF0", "localJitter", "localShimmer", "hnr", "nhr", "cpp", "csid"]
+
+def average_results(results):
+    """파일별 analyze() 결과의 지표별 평균. 실패한 파일과 NaN 값은 제외합니다."""
+    avg = average(results, AVERAGE_KEYS)
+    if avg is None:
+        return {"error": "All analyses failed."}
+    avg = {k: (v if v is not None else 0.0) for k, v in avg.items()}
+    avg["rangeST"] = range_st(avg["maxF0"], avg["minF0"])
+    return avg
+
+def analyze_paths(paths, executor=None, on_result=None, upload_type=None):
+    """파일 1개면 analyze() 결과를, 여러 개면 지표별 평균을 반환합니다. (실패 시 {"error": ...})
+
+    executor(프로세스 풀)를 주면 파일 수와 상관없이 모든 분석을 executor 에서 실행하고, 파일이 끝날 때마다
+    on_result(index, path, result, done) 를 호출합니다. (끝나는 순서대로)
+    Praat(parselmouth)은 스레드 안전하지 않으므로, 상주 모드에서는 파일 1개짜리 요청도 요청 처리 스레드에서
+    직접 분석하지 않습니다.
+    평균은 항상 입력 순서대로 더하므로 순차 실행과 결과가 같습니다.
+    upload_type 의 업로드용 지표는 파일별 결과에만 담깁니다.
+    """
+    func = partial(analyze, upload_type=upload_type) if upload_type else analyze
+    results = map_files(func, paths, executor=executor, on_result=on_result)
+    # 파일 1개면 예전과 동일하게 단일 결과
     if len(paths) == 1:
-        res = analyze(paths[0])
-        print(json.dumps(res))
-        if "error" in res:
-            sys.exit(1)
-        sys.exit(0)
+        return results[0]
 
     # 여러 개면 지표별 평균
-    keys = ["meanF0", "maxF0", "minF0", "localJitter", "localShimmer", "hnr", "nhr", "cpp", "csid"]
-    sums = {k: 0.0 for k in keys}
-    counts = {k: 0 for k in keys}
+    return average_results(results)
 
-    any_success = False
-    for p in paths:
-        r = analyze(p)
-        if "error" in r:
-            continue
-        any_success = True
-        for k in keys:
-            v = float(r.get(k, float("nan")))
-            if np.isfinite(v):
-                sums[k] += v
-                counts[k] += 1
+def progress_message(index, path, result, done, total):
+    """파일 하나가 끝났을 때 내보내는 진행 상황 (NDJSON 한 줄)"""
+    return {"event": "progress", "index": index, "path": path, "done": done, "total": total, "result": result}
 
-    if not any_success:
-        print(json.dumps({"error": "All analyses failed."}))
-        sys.exit(1)
+def handle_request(request, notify, executor=None):
+    """상주 모드 요청 하나를 처리합니다. {"paths": [...]} 또는 {"path": "..."}
 
-    avg = {}
-    for k in keys:
-        c = counts[k]
-        avg[k] = (sums[k] / c) if c > 0 else 0.0
-
-    avg["rangeST"] = 12 * math.log2(avg["maxF0"] / avg["minF0"]) if avg["minF0"] > 0 else float(0)
+    "progress": true 이면 파일이 끝날 때마다 진행 상황을 먼저 보냅니다.
+    "upload": "voice_ah" / "voice_sentence" 이면 파일별 결과에 업로드용 지표를 함께 담습니다.
+    """
+    paths = request.get("paths") or ([request["path"]] if request.get("path") else [])
+    if not paths:
+        raise ValueError("No file path given.")
+    on_result = None
+    if request.get("progress"):
+        def on_result(index, path, result, done):
+            notify(progress_message(index, path, result, done, len(paths)))
+    result = analyze_paths(paths, executor=executor, on_result=on_result, upload_type=request.get("upload"))
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result
+
+def run_daemon(workers, socket_path=None):
+    """import 를 마친 프로세스를 유지하며 JSON Lines 요청을 처리합니다.
+
+    요청은 스레드에서 받아 파일 단위로 프로세스 풀에 나눠 주므로, 다중 파일 요청도 병렬로 분석됩니다.
+    """
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from jsonl_daemon import JsonLineDaemon, run
 
+    # Praat(parselmouth)은 스레드 안전하지 않으므로 분석은 (미리 띄워 둔) 프로세스 풀에서 합니다.
+    pool = make_pool(workers)
+    handler = partial(handle_request, executor=pool)
+    try:
+        return run(JsonLineDaemon("analyze_voice", handler, ThreadPoolExecutor(max_workers=workers)), socket_path)
+    finally:
+        pool.shutdown(wait=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="음성 지표 분석")
+    parser.add_argument("paths", nargs="*", help="분석할 wav 파일 (여러 개면 지표별 평균)")
+    parser.add_argument("--daemon", action="store_true", help="표준 입출력 JSON Lines 상주 모드")
+    parser.add_argument("--socket", help="Unix 소켓 상주 모드 (소켓 경로)")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="동시에 분석할 파일 수 (기본: CPU 코어 수)")
+    parser.add_argument("--upload", choices=sorted(UPLOAD_KINDS),
+                        help="파일별 결과에 서버 업로드용 지표(uploadFeatures)를 함께 계산합니다.")
+    parser.add_argument("--progress", action="store_true",
+                        help="파일이 끝날 때마다 진행 상황을 NDJSON 한 줄로 먼저 출력합니다. (마지막 줄이 최종 결과)")
+    args = parser.parse_args()
+    workers = max(1, args.workers)
+
+    if args.daemon or args.socket:
+        return run_daemon(workers, args.socket)
+
+    if not args.paths:
+        print(json.dumps({"error": "No file path given."}))
+        return 1
+
+    on_result = None
+    if args.progress:
+        def on_result(index, path, result, done):
+            print(json.dumps(progress_message(index, path, result, done, len(args.paths))), flush=True)
+
+    workers = min(workers, len(args.paths))
+    if workers > 1:
+        with make_pool(workers) as pool:
+            res = analyze_paths(args.paths, executor=pool, on_result=on_result, upload_type=args.upload)
+    else:
+        res = analyze_paths(args.paths, on_result=on_result, upload_type=args.upload)
     # 최종 결과를 기존 result 형태로 단일 객체 출력
-    print(json.dumps(avg))
+    print(json.dumps(res))
+    return 1 if "error" in res else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+# voice_params.py
+"""장치 음성 분석 공용 파라미터.
+
+analyze_voice.py(녹음 파일 분석)와 pitch_stream.py(실시간 피치/강도 추적)가 같은 피치 범위를 쓰도록
+무거운 import(parselmouth, scipy) 없이 상수만 모아 둡니다.
+
+값은 음성 분석 서버와 같은 padoc_voice 패키지의 DEVICE 파라미터 묶음에서 가져옵니다.
+padoc_voice 가 설치되어 있지 않으면 저장소의 BackEnd/padoc_voice 를 사용합니다.
+"""
+import os
+import sys
+
+try:
+    from padoc_voice.params import DEVICE
+except ImportError:
+    # AIot/padoc/src/praat → 저장소 최상위 → BackEnd
+    _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    sys.path.insert(0, os.path.join(_REPO_ROOT, "BackEnd"))
+    from padoc_voice.params import DEVICE
+
+PITCH_FLOOR = DEVICE.pitch_floor
+PITCH_CEIL = DEVICE.contour_pitch_ceiling
+LH_SPLIT_HZ = DEVICE.lh_split_hz
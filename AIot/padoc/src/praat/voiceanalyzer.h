@@ -4,7 +4,9 @@
  */
 #pragma once
 #include <QObject>
-#include <QProcess>
+#include <QVariantMap>
+
+class PythonDaemon;
 
 class VoiceAnalyzer : public QObject
 {
@@ -13,14 +15,18 @@ public:
     explicit VoiceAnalyzer(QObject *parent = nullptr);
     Q_INVOKABLE void analyze(const QString &audioFilePath);
     Q_INVOKABLE void analyze(const QStringList &audioFilePaths);
+    /// analyze 와 같지만, 결과의 "uploadFeatures" 에 AudioUpload::startVoiceUpload 로 보낼 업로드용 지표를 함께 담습니다.
+    /// uploadType 은 업로드 녹음 유형("voice_ah" / "voice_sentence")입니다.
+    Q_INVOKABLE void analyzeForUpload(const QString &audioFilePath, const QString &uploadType);
 
 signals:
+    /// 다중 파일 분석에서 파일 하나가 끝날 때마다 발생합니다. (끝나는 순서대로, result 는 해당 파일의 지표)
+    void analysisProgress(int done, int total, const QString &path, QVariantMap result);
     void analysisCompleted(QVariantMap result);
     void analysisFailed(const QString &error);
 
-private slots:
-    void onProcessFinished(int exitCode, QProcess::ExitStatus exitStatus);
-
 private:
-    QProcess *m_process;
+    void request(const QStringList &audioFilePaths, const QString &uploadType);
+
+    PythonDaemon *m_daemon;
 };
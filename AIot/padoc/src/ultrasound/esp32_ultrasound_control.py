@@ -1,21 +1,40 @@
 """
-이 스크립트는 ESP32 같은 마이크로컨트롤러와 시리얼 통신을 통해 초음파 장치를 제어합니다.
+이 스크립트는 ESP32 같은 마이크로컨트롤러와 시리얼 통신을 통해 초음파 장치를 제어하고 측정값을 수신합니다.
 상위 프로세스(예: Qt C++ 애플리케이션)로부터 표준 입력(stdin)을 통해 'start', 'stop', 'exit'
-명령어를 받아 처리하고, 처리 결과를 표준 출력(stdout)으로 전송합니다.
+명령어를 받아 처리하고, 처리 결과와 측정값을 표준 출력(stdout)으로 전송합니다.
 
 주요 기능:
-- 사용 가능한 시리얼 포트를 자동으로 감지합니다.
+- 사용 가능한 시리얼 포트를 자동으로 감지합니다. (--port 로 직접 지정 가능)
 - 지정된 속도(Baud Rate)로 시리얼 포트를 엽니다.
 - 'start' 명령어 수신 시, 시리얼 포트에 'S'를 전송하여 초음파 측정을 시작합니다.
 - 'stop' 명령어 수신 시, 시리얼 포트에 'E'를 전송하여 초음파 측정을 중지합니다.
 - 'exit' 명령어 또는 표준 입력이 끊기면(EOF) 루프를 종료하고 리소스를 정리합니다.
+- ESP32 가 보내는 측정 패킷을 별도 스레드에서 읽어 수신 시각과 함께 원형 버퍼에 쌓고,
+  --emit-hz 주기로 모아서 한 줄(JSON) 또는 바이너리 묶음으로 내보냅니다. (serial_stream.py 참고)
+
+stdin 명령 읽기, 시리얼 읽기, 출력이 각각 다른 스레드라서 명령을 기다리는 동안에도 측정값이 계속 나갑니다.
+
+사용 예)
+    python esp32_ultrasound_control.py
+    python esp32_ultrasound_control.py --port /dev/ttyUSB0 --protocol text --emit-hz 30
+    python serial_benchmark.py --serve     # 가짜 장치(pty)를 띄우고 경로를 출력합니다.
 """
+import argparse
+import queue
 import sys
+import threading
 import time
+
 import serial
 from serial.tools import list_ports as lp
 
+from serial_stream import DECODERS, BatchEmitter, Output, RingBuffer, SerialReader
+
 BAUD_RATE = 115200
+# 원형 버퍼 크기. 115200 baud 에서 가장 촘촘한 프레임(값 1개, 7바이트)으로도 약 5초 분량입니다.
+RING_CAPACITY = 1 << 13
+EMIT_HZ = 20.0
+
 
 def check_ports():
     ports = list(lp.comports())
@@ -26,52 +45,112 @@ def check_ports():
         sys.exit(1)
     return ports[0].device
 
-def start_ultrasound(ser):
-    ser.write(b'S')
-    ser.flush()
-    print("초음파 테스트 시작", flush=True)
 
-def stop_ultrasound(ser):
-    ser.write(b'E')
-    ser.flush()
-    print("초음파 테스트 끝", flush=True)
+class UltrasoundDevice:
+    """시리얼 쓰기(명령 전송)를 한 곳에서 처리합니다. 읽기는 SerialReader 스레드가 맡습니다."""
+
+    def __init__(self, ser, output):
+        self.ser = ser
+        self.output = output
+        self.running = False
+        self._write_lock = threading.Lock()
+
+    def _send(self, command):
+        with self._write_lock:
+            self.ser.write(command)
+            self.ser.flush()
+
+    def start(self):
+        self._send(b'S')
+        self.running = True
+        self.output.log("초음파 테스트 시작")
+
+    def stop(self):
+        self._send(b'E')
+        self.running = False
+        self.output.log("초음파 테스트 끝")
+
+
+def read_commands(commands, stream=None):
+    """명령 스레드: stdin 을 한 줄씩 읽어 큐에 넣습니다. EOF 면 'exit' 를 넣습니다."""
+    stream = stream or sys.stdin
+    for line in stream:
+        commands.put(line.strip().lower())
+    commands.put("exit")
+
+
+def handle_command(device, cmd):
+    """명령 하나를 처리합니다. 루프를 끝내야 하면 False 를 반환합니다."""
+    output = device.output
+    if cmd == "start":
+        if not device.running:
+            device.start()
+        else:
+            output.log("이미 실행 중입니다.")
+    elif cmd == "stop":
+        if device.running:
+            device.stop()
+        else:
+            output.log("이미 정지 상태입니다.")
+    elif cmd == "exit":
+        if device.running:
+            device.stop()
+        return False
+    elif cmd:
+        output.log(f"알 수 없는 명령: {cmd}")
+    return True
+
 
 def main():
-    port = check_ports()
-    ser = serial.Serial(port, BAUD_RATE, timeout=0.1)
-    time.sleep(2)
-    running = False
+    parser = argparse.ArgumentParser(description="ESP32 초음파 장치 제어 및 측정값 수신")
+    parser.add_argument("--port", help="시리얼 포트 (없으면 자동 감지)")
+    parser.add_argument("--baud", type=int, default=BAUD_RATE, help="통신 속도")
+    parser.add_argument("--protocol", choices=sorted(DECODERS), default="frame", help="장치 패킷 형식")
+    parser.add_argument("--output", choices=("json", "binary"), default="json", help="측정값 출력 형식")
+    parser.add_argument("--emit-hz", type=float, default=EMIT_HZ, help="측정값 묶음 출력 주기(Hz)")
+    parser.add_argument("--ring", type=int, default=RING_CAPACITY, help="원형 버퍼 크기(값 개수)")
+    parser.add_argument("--no-reset-wait", action="store_true",
+                        help="포트를 연 뒤 ESP32 재부팅을 기다리지 않습니다. (가짜 장치용)")
+    args = parser.parse_args()
+
+    output = Output(binary=args.output == "binary")
+    port = args.port or check_ports()
+    ser = serial.Serial(port, args.baud, timeout=0.05)
+    if not args.no_reset_wait:
+        # 포트를 열면 ESP32 가 재부팅되므로 잠시 기다린 뒤 부팅 로그를 버립니다.
+        time.sleep(2)
+        ser.reset_input_buffer()
+
+    ring = RingBuffer(args.ring)
+    reader = SerialReader(ser, ring, DECODERS[args.protocol](), output)
+    emitter = BatchEmitter(ring, output, rate_hz=args.emit_hz)
+    commands = queue.Queue()
+    threading.Thread(target=read_commands, args=(commands,), name="stdin-commands", daemon=True).start()
+    reader.start()
+    emitter.start()
+
+    device = UltrasoundDevice(ser, output)
     try:
         while True:
-            cmd = sys.stdin.readline()
-            if not cmd:
-                # EOF: 상위 프로세스 종료
-                break
-            cmd = cmd.strip().lower()
-            if cmd == "start":
-                if not running:
-                    start_ultrasound(ser)
-                    running = True
-                else:
-                    print("이미 실행 중입니다.", flush=True)
-            elif cmd == "stop":
-                if running:
-                    stop_ultrasound(ser)
-                    running = False
-                else:
-                    print("이미 정지 상태입니다.", flush=True)
-            elif cmd == "exit":
-                if running:
-                    stop_ultrasound(ser)
+            try:
+                cmd = commands.get(timeout=0.5)
+            except queue.Empty:
+                if not reader.is_alive():
+                    # 읽기 스레드가 오류로 끝났으면(포트 분리 등) 더 받을 값이 없습니다.
+                    break
+                continue
+            if not handle_command(device, cmd):
                 break
-            elif cmd:
-                print(f"알 수 없는 명령: {cmd}", flush=True)
     finally:
+        reader.stop()
+        reader.join(timeout=1.0)
+        emitter.stop()
+        emitter.join(timeout=1.0)
         try:
             ser.close()
         except Exception:
             pass
-        print("시리얼 포트 종료", flush=True)
+        output.log("시리얼 포트 종료")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
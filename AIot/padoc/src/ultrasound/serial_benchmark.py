@@ -0,0 +1,214 @@
+"""
+ESP32 를 흉내 내는 가짜 장치(pseudo-terminal)와 시리얼 수신 처리량 측정.
+
+FakeEsp32 는 pty 의 master 쪽에서 ESP32 처럼 동작합니다. 'S' 를 받으면 측정 프레임을 보내기 시작하고
+'E' 를 받으면 멈춥니다. slave 쪽 경로(/dev/pts/N)를 esp32_ultrasound_control.py 의 --port 로
+주면 실제 장치 없이 전체 흐름을 확인할 수 있습니다.
+
+벤치마크는 SerialReader + BatchEmitter 를 그대로 사용해 다음을 확인합니다.
+- 지정한 baud 의 선로 속도(baud / 10 바이트/s, 8N1)로 보낼 때 값 손실 없이 따라가는지
+- 속도 제한 없이 보낼 때 디코딩 최대 처리량이 선로 속도의 몇 배인지
+- 수신부터 출력까지의 지연
+
+사용 예)
+    python serial_benchmark.py                         # 115200 baud, 값 1개/4개 프레임
+    python serial_benchmark.py --baud 921600 --seconds 3 --samples 1 8 32
+    python serial_benchmark.py --serve                 # 가짜 장치만 띄워 두고 경로를 출력합니다.
+"""
+import argparse
+import io
+import json
+import os
+import select
+import statistics
+import threading
+import time
+import tty
+
+import serial
+
+from serial_stream import BatchEmitter, FrameDecoder, Output, RingBuffer, SerialReader, encode_frame
+
+BAUD_RATE = 115200
+
+
+class FakeEsp32(threading.Thread):
+    """pty master 쪽에서 동작하는 가짜 ESP32.
+
+    frame_samples 개의 값을 담은 프레임을 보내며, 값은 seq 로부터 계산되는 톱니파라
+    받는 쪽에서 손실/변형 여부를 확인할 수 있습니다. (expected_value 참고)
+    baud 를 주면 8N1 선로 속도에 맞춰 보내고, None 이면 가능한 한 빨리 보냅니다.
+    """
+
+    def __init__(self, frame_samples=1, baud=BAUD_RATE):
+        super().__init__(name="fake-esp32", daemon=True)
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+        self.frame_samples = frame_samples
+        self.bytes_per_second = baud / 10 if baud else None
+        self.streaming = threading.Event()
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def expected_value(frame_index, position):
+        return (frame_index * 7 + position) % 4096
+
+    def stop(self):
+        self._stop_event.set()
+
+    def close(self):
+        self.stop()
+        self.join(timeout=1.0)
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _poll_commands(self, timeout):
+        readable, _, _ = select.select([self.master], [], [], timeout)
+        if not readable:
+            return
+        for command in os.read(self.master, 64):
+            if command == ord("S"):
+                self.streaming.set()
+            elif command == ord("E"):
+                self.streaming.clear()
+
+    def run(self):
+        started = None
+        try:
+            while not self._stop_event.is_set():
+                if not self.streaming.is_set():
+                    started = None
+                    self._poll_commands(0.05)
+                    continue
+                self._poll_commands(0)
+                index = self.frames_sent
+                frame = encode_frame(index, [self.expected_value(index, k) for k in range(self.frame_samples)])
+                if self.bytes_per_second:
+                    # 선로 속도를 넘지 않도록 누적 전송량 기준으로 기다립니다.
+                    if started is None:
+                        started, sent_at_start = time.perf_counter(), self.bytes_sent
+                    due = started + (self.bytes_sent - sent_at_start) / self.bytes_per_second
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                os.write(self.master, frame)
+                self.frames_sent += 1
+                self.bytes_sent += len(frame)
+        except OSError:
+            pass  # close() 로 fd 가 닫힌 경우
+
+
+class _CountingSink(io.TextIOBase):
+    """BatchEmitter 의 JSON 출력을 받아 값과 지연을 확인하는 stdout 대용"""
+
+    def __init__(self, origin):
+        self.origin = origin
+        self.values = []
+        self.latencies_ms = []
+        self.dropped = 0
+        self.batches = 0
+
+    def write(self, text):
+        now_ms = (time.monotonic() - self.origin) * 1000.0
+        for line in text.splitlines():
+            batch = json.loads(line)
+            self.values.extend(batch["v"])
+            self.dropped += batch["dropped"]
+            self.batches += 1
+            self.latencies_ms.extend(now_ms - t for t in batch["ts"])
+        return len(text)
+
+
+def bench(frame_samples, baud, seconds, paced, emit_hz):
+    device = FakeEsp32(frame_samples, baud=baud if paced else None)
+    ser = serial.Serial(device.port, baud, timeout=0.05)
+    origin = time.monotonic()
+    sink = _CountingSink(origin)
+    ring = RingBuffer(1 << 16)
+    decoder = FrameDecoder()
+    reader = SerialReader(ser, ring, decoder, Output(stream=sink), origin=origin)
+    emitter = BatchEmitter(ring, Output(stream=sink), rate_hz=emit_hz)
+    reader.start()
+    emitter.start()
+    device.start()
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    ser.write(b"S")
+    time.sleep(seconds)
+    ser.write(b"E")
+    # 보내던 프레임까지 마치고 장치 스레드를 멈춘 뒤, 보낸 바이트를 모두 읽을 때까지 기다립니다.
+    device.stop()
+    device.join()
+    deadline = time.perf_counter() + 2.0
+    while reader.bytes_read < device.bytes_sent and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    reader.stop()
+    reader.join()
+    emitter.stop()
+    emitter.join()
+    device.close()
+    ser.close()
+
+    expected = [
+        device.expected_value(index, k) for index in range(device.frames_sent) for k in range(frame_samples)
+    ]
+    intact = sink.values == [float(v) for v in expected]
+    line_rate = baud / 10
+    p95 = statistics.quantiles(sink.latencies_ms, n=20)[-1] if len(sink.latencies_ms) > 1 else float("nan")
+    print(
+        f"{'paced' if paced else 'flood':<5} {frame_samples:>3} val/frame"
+        f"  {device.bytes_sent / elapsed / 1000:>8.1f} kB/s ({device.bytes_sent / elapsed / line_rate:>6.2f}x line)"
+        f"  {decoder.frames / elapsed:>9.0f} frames/s  {len(sink.values) / elapsed:>9.0f} val/s"
+        f"  cpu {cpu / elapsed:>5.1%}"
+        f"  latency p50 {statistics.median(sink.latencies_ms) if sink.latencies_ms else float('nan'):>5.1f} ms"
+        f" p95 {p95:>5.1f} ms"
+        f"  batches {sink.batches}  dropped {sink.dropped}  bad {decoder.bad_checksum}  intact={intact}"
+    )
+    return intact and sink.dropped == 0
+
+
+def serve(frame_samples, baud):
+    device = FakeEsp32(frame_samples, baud=baud)
+    device.start()
+    print(device.port, flush=True)
+    print(f"python esp32_ultrasound_control.py --port {device.port} --no-reset-wait", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        device.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 ESP32(pty) 와 시리얼 수신 처리량 측정")
+    parser.add_argument("--baud", type=int, default=BAUD_RATE, help="선로 속도")
+    parser.add_argument("--samples", type=int, nargs="+", default=[1, 4], help="프레임당 값 개수")
+    parser.add_argument("--seconds", type=float, default=2.0, help="측정 시간(초)")
+    parser.add_argument("--emit-hz", type=float, default=20.0, help="출력 주기(Hz)")
+    parser.add_argument("--serve", action="store_true", help="가짜 장치만 띄우고 pty 경로를 출력합니다.")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.samples[0], args.baud)
+        return 0
+
+    results = []
+    for frame_samples in args.samples:
+        results.append(bench(frame_samples, args.baud, args.seconds, True, args.emit_hz))
+        results.append(bench(frame_samples, args.baud, args.seconds, False, args.emit_hz))
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,287 @@
+"""
+ESP32 초음파 측정값 수신용 시리얼 스트림 구성 요소
+
+esp32_ultrasound_control.py 가 사용하며, 세 개의 스레드로 나뉘어 서로를 막지 않습니다.
+- SerialReader : 시리얼 포트를 읽어 패킷을 디코딩하고, 수신 시각과 함께 RingBuffer 에 넣습니다.
+- BatchEmitter : 정해진 주기(--emit-hz)로 RingBuffer 의 새 값들을 모아 stdout 으로 한 번에 내보냅니다.
+- (명령 스레드) : esp32_ultrasound_control.py 에서 stdin 명령을 읽습니다.
+
+패킷 형식 (--protocol)
+- frame : 바이너리 프레임. 0xAA 0x55 | seq(u8) | n(u8) | n x value(u16 LE) | checksum(u8)
+          checksum 은 seq, n, payload 바이트 합의 하위 8 bit 입니다.
+          동기 바이트를 잃거나 checksum 이 틀리면 다음 동기 바이트까지 건너뜁니다.
+- text  : 한 줄에 숫자 하나 이상 (쉼표/공백 구분, 예: "123.4\\n"). 숫자가 아닌 줄은 로그로 전달합니다.
+
+출력 형식 (--output)
+- json   : 한 줄짜리 JSON. {"type": "samples", "ts": [...], "v": [...], "dropped": 0}
+           ts 는 스트림 시작 기준 ms 입니다. (수신 시각, 소수 1자리)
+- binary : b"US" | count(u16) | dropped(u32) | count x (ts_ms f64, value f32), little endian
+           stdout 을 직접 파싱하는 소비자용이며, 상태 로그는 이때 stderr 로 보냅니다.
+"""
+import json
+import struct
+import sys
+import threading
+import time
+from array import array
+
+FRAME_SYNC = b"\xaa\x55"
+FRAME_HEADER = 4          # sync(2) + seq(1) + n(1)
+MAX_FRAME_SAMPLES = 255
+
+BINARY_MAGIC = b"US"
+BINARY_HEADER = struct.Struct("<2sHI")
+BINARY_SAMPLE = struct.Struct("<df")
+
+
+def encode_frame(seq, values):
+    """테스트용 가짜 장치와 벤치마크에서 사용하는 프레임 인코더"""
+    payload = struct.pack(f"<{len(values)}H", *values)
+    body = bytes((seq & 0xFF, len(values))) + payload
+    return FRAME_SYNC + body + bytes((sum(body) & 0xFF,))
+
+
+class FrameDecoder:
+    """바이너리 프레임 디코더. 조각난 입력을 이어 붙여 완성된 프레임만 돌려줍니다."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.frames = 0
+        self.bad_checksum = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data):
+        """받은 바이트를 넣고 (seq, values) 목록과 로그 줄 목록을 반환합니다."""
+        buffer = self._buffer
+        buffer += data
+        packets = []
+        start = 0
+        while True:
+            sync = buffer.find(FRAME_SYNC, start)
+            if sync < 0:
+                # 마지막 바이트가 동기 바이트의 앞부분일 수 있으므로 남겨 둡니다.
+                keep = 1 if len(buffer) > start and buffer.endswith(FRAME_SYNC[:1]) else 0
+                self.skipped_bytes += len(buffer) - start - keep
+                start = len(buffer) - keep
+                break
+            self.skipped_bytes += sync - start
+            if len(buffer) - sync < FRAME_HEADER:
+                start = sync
+                break
+            count = buffer[sync + 3]
+            end = sync + FRAME_HEADER + 2 * count + 1
+            if len(buffer) < end:
+                start = sync
+                break
+            body = memoryview(buffer)[sync + 2:end - 1]
+            if sum(body) & 0xFF != buffer[end - 1]:
+                body.release()
+                self.bad_checksum += 1
+                start = sync + 1
+                continue
+            packets.append((buffer[sync + 2], struct.unpack_from(f"<{count}H", buffer, sync + FRAME_HEADER)))
+            body.release()
+            self.frames += 1
+            start = end
+        del buffer[:start]
+        return packets, []
+
+
+class LineDecoder:
+    """텍스트 줄 디코더. 숫자 줄은 값으로, 나머지는 로그 줄로 돌려줍니다."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.frames = 0
+        self.bad_checksum = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data):
+        buffer = self._buffer
+        buffer += data
+        packets, logs = [], []
+        *lines, rest = buffer.split(b"\n")
+        for raw in lines:
+            line = raw.strip().decode("utf-8", "replace")
+            if not line:
+                continue
+            try:
+                values = tuple(float(token) for token in line.replace(",", " ").split())
+            except ValueError:
+                logs.append(line)
+                continue
+            packets.append((None, values))
+            self.frames += 1
+        self._buffer = bytearray(rest)
+        return packets, logs
+
+
+DECODERS = {"frame": FrameDecoder, "text": LineDecoder}
+
+
+class RingBuffer:
+    """미리 할당한 (수신 시각, 값) 원형 버퍼.
+
+    쓰기는 SerialReader 한 곳에서만 하고, 읽는 쪽은 각자 커서(지금까지 읽은 누적 개수)를 들고 있습니다.
+    읽는 쪽이 용량보다 뒤처지면 덮어쓴 만큼을 dropped 로 알려 줍니다.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._written = 0
+        self._lock = threading.Lock()
+
+    @property
+    def written(self):
+        return self._written
+
+    def extend(self, timestamp, values):
+        with self._lock:
+            capacity, index = self.capacity, self._written % self.capacity
+            for value in values:
+                self._ts[index] = timestamp
+                self._values[index] = value
+                index += 1
+                if index == capacity:
+                    index = 0
+            self._written += len(values)
+
+    def read_since(self, cursor, limit=None):
+        """cursor 이후의 값을 (다음 cursor, ts 목록, 값 목록, dropped) 로 반환합니다."""
+        with self._lock:
+            written = self._written
+            dropped = max(0, written - cursor - self.capacity)
+            cursor += dropped
+            end = written if limit is None else min(written, cursor + limit)
+            if end <= cursor:
+                return cursor, [], [], dropped
+            first, last = cursor % self.capacity, end % self.capacity
+            if first < last:
+                ts, values = self._ts[first:last], self._values[first:last]
+            else:
+                ts = self._ts[first:] + self._ts[:last]
+                values = self._values[first:] + self._values[:last]
+        return end, ts.tolist(), values.tolist(), dropped
+
+
+class Output:
+    """여러 스레드가 stdout 에 쓰는 줄이 섞이지 않도록 묶어 둔 출력기"""
+
+    def __init__(self, binary=False, stream=None, log_stream=None):
+        self.binary = binary
+        self._stream = stream or sys.stdout
+        # 바이너리 출력 중에는 상태 로그를 stderr 로 보내 stdout 을 깨끗하게 유지합니다.
+        self._log_stream = log_stream or (sys.stderr if binary else self._stream)
+        self._lock = threading.Lock()
+
+    def log(self, message):
+        with self._lock:
+            print(message, file=self._log_stream, flush=True)
+
+    def samples(self, ts, values, dropped):
+        if self.binary:
+            chunk = bytearray(BINARY_HEADER.pack(BINARY_MAGIC, len(values), dropped))
+            for timestamp, value in zip(ts, values):
+                chunk += BINARY_SAMPLE.pack(timestamp, value)
+            with self._lock:
+                self._stream.buffer.write(chunk)
+                self._stream.buffer.flush()
+            return
+        line = json.dumps(
+            {"type": "samples", "ts": [round(t, 1) for t in ts], "v": values, "dropped": dropped},
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+class SerialReader(threading.Thread):
+    """시리얼 포트를 계속 읽어 RingBuffer 에 넣는 스레드.
+
+    ser 는 timeout 이 설정된 serial.Serial (또는 read/in_waiting 을 가진 객체) 이어야
+    stop() 후 timeout 안에 스레드가 끝납니다.
+    """
+
+    def __init__(self, ser, ring, decoder, output=None, clock=time.monotonic, origin=None):
+        super().__init__(name="serial-reader", daemon=True)
+        self.ser = ser
+        self.ring = ring
+        self.decoder = decoder
+        self.output = output
+        self.clock = clock
+        self.origin = clock() if origin is None else origin
+        self.bytes_read = 0
+        self.error = None
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        ser, ring, decoder = self.ser, self.ring, self.decoder
+        try:
+            while not self._stop_event.is_set():
+                data = ser.read(max(1, ser.in_waiting))
+                if not data:
+                    continue
+                # 같은 read 로 받은 패킷은 같은 수신 시각을 갖습니다. (ms, 스트림 시작 기준)
+                received_ms = (self.clock() - self.origin) * 1000.0
+                self.bytes_read += len(data)
+                packets, logs = decoder.feed(data)
+                for _, values in packets:
+                    ring.extend(received_ms, values)
+                if self.output:
+                    for line in logs:
+                        self.output.log(line)
+        except Exception as e:  # 포트가 뽑히는 등 (SerialException / OSError)
+            self.error = e
+            if self.output:
+                self.output.log(f"시리얼 읽기 오류: {e}")
+
+
+class BatchEmitter(threading.Thread):
+    """RingBuffer 의 새 값들을 주기적으로 모아 Output 으로 내보내는 스레드"""
+
+    def __init__(self, ring, output, rate_hz=20.0, max_batch=4096):
+        super().__init__(name="batch-emitter", daemon=True)
+        self.ring = ring
+        self.output = output
+        self.interval = 1.0 / rate_hz
+        self.max_batch = max_batch
+        self.cursor = ring.written
+        self.emitted = 0
+        self.dropped = 0
+        self.batches = 0
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def flush(self):
+        """쌓인 값을 모두 내보냅니다. 내보낸 개수를 반환합니다."""
+        total = 0
+        while True:
+            self.cursor, ts, values, dropped = self.ring.read_since(self.cursor, self.max_batch)
+            if not values and not dropped:
+                return total
+            self.output.samples(ts, values, dropped)
+            self.emitted += len(values)
+            self.dropped += dropped
+            self.batches += 1
+            total += len(values)
+
+    def run(self):
+        next_tick = time.monotonic()
+        while not self._stop_event.is_set():
+            self.flush()
+            next_tick += self.interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # 출력이 밀렸으면 주기를 다시 맞춥니다. (따라잡으려고 연달아 내보내지 않음)
+                next_tick = time.monotonic()
+                delay = 0
+            self._stop_event.wait(delay)
+        self.flush()
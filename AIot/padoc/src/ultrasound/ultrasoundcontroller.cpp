@@ -8,6 +8,9 @@
 #include <QFileInfo>
 #include <QProcessEnvironment>
 #include <QDir>
+#include <QJsonDocument>
+#include <QJsonObject>
+#include <QJsonArray>
 #include <QDebug>
 
 // --- 공용 유틸: 후보들 중 존재하는 경로 하나 선택 ---
@@ -284,6 +287,8 @@ void UltrasoundController::onReadyRead()
 
     while (m_process->canReadLine()) {
         const QByteArray line = m_process->readLine();
+        if (handleSamplesLine(line))
+            continue;
         const QString s = QString::fromLocal8Bit(line).trimmed();
         if (!s.isEmpty()) {
             emit logLine(s);
@@ -295,7 +300,9 @@ void UltrasoundController::onReadyRead()
         }
     }
 
-    // 개행 없이 남은 버퍼 방출(있다면)
+    // 개행 없이 남은 버퍼는 다음 읽기에서 줄이 완성될 때까지 둡니다.
+    // (측정값 줄이 중간에 잘려 로그로 빠지지 않도록, 프로세스가 끝난 경우에만 방출)
+    if (m_process->state() == QProcess::Running) return;
     const QByteArray rest = m_process->readAll();
     if (!rest.isEmpty()) {
         const QString s = QString::fromLocal8Bit(rest).trimmed();
@@ -303,6 +310,28 @@ void UltrasoundController::onReadyRead()
     }
 }
 
+/**
+ * @brief 측정값 묶음 줄이면 samplesReceived 시그널로 전달합니다.
+ * @details 초당 수십 줄이 오므로 logLine 으로는 내보내지 않습니다.
+ * @return 측정값 줄이어서 처리했으면 true
+ */
+bool UltrasoundController::handleSamplesLine(const QByteArray& line)
+{
+    const QByteArray trimmed = line.trimmed();
+    if (!trimmed.startsWith('{'))
+        return false;
+
+    const QJsonDocument doc = QJsonDocument::fromJson(trimmed);
+    const QJsonObject obj = doc.object();
+    if (obj.value("type").toString() != QLatin1String("samples"))
+        return false;
+
+    emit samplesReceived(obj.value("ts").toArray().toVariantList(),
+                         obj.value("v").toArray().toVariantList(),
+                         obj.value("dropped").toInt());
+    return true;
+}
+
 void UltrasoundController::onErrorOccurred(QProcess::ProcessError e)
 {
     m_lastError = QString("QProcess error: %1").arg(int(e));
@@ -6,6 +6,7 @@
 #include <QObject>
 #include <QProcess>
 #include <QString>
+#include <QVariantList>
 
 class UltrasoundController : public QObject
 {
@@ -38,6 +39,9 @@ public:
 
 signals:
     void logLine(const QString& line); // 파이썬 표준출력/에러 한 줄씩 방출
+    // 측정값 묶음 (esp32_ultrasound_control.py 의 {"type": "samples"} 줄)
+    // timestamps 는 스트림 시작 기준 ms, dropped 는 버퍼가 넘쳐 건너뛴 값 개수입니다.
+    void samplesReceived(const QVariantList& timestamps, const QVariantList& values, int dropped);
     void processRunningChanged();
     void ultrasoundRunningChanged();
     void lastErrorChanged();
@@ -52,6 +56,7 @@ private:
     void ensureProcess();
     void writeLine(const QString& line);
     void setUltraRunning(bool r);
+    bool handleSamplesLine(const QByteArray& line);
 
     QProcess* m_process = nullptr;
     QString m_pythonExe = "python"; // 리눅스면 "python3"로 바꿔 셋업
@@ -0,0 +1,259 @@
+# app/cache.py
+"""대시보드 응답 캐시
+
+환자별 버전 번호를 키에 포함시키는 방식으로 동작합니다. 새 녹음의 분석이 끝나거나
+훈련 결과가 저장되면 쓰기 경로에서 invalidate_patient()를 호출해 해당 환자의 버전을
+올리고, 이전 버전의 항목은 더 이상 조회되지 않다가 LRU/TTL 에 의해 정리됩니다.
+
+- 1차 캐시: 프로세스 내부 LRU (OrderedDict)
+- 2차 캐시: REDIS_URL 이 설정되어 있고 redis 패키지가 설치된 경우에만 사용합니다.
+  여러 워커가 떠 있을 때는 버전 번호도 Redis 에서 관리하므로 무효화가 모든 워커에 반영됩니다.
+  Redis 없이 여러 워커를 띄우면 다른 워커의 무효화는 TTL 이 지나야 반영됩니다.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", "1024"))
+DASHBOARD_CACHE_TTL_SECONDS = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "300"))
+REDIS_URL = os.getenv("REDIS_URL")
+
+REDIS_KEY_PREFIX = "padoc:dashboard"
+
+# (엔드포인트, 환자 ID, 환자 버전, 시작일, 종료일, 역할)
+CacheKey = Tuple[str, int, int, str, str, str]
+
+
+@dataclass
+class CachedResponse:
+    """직렬화된 응답 본문과 ETag"""
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+def _make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값이 현재 ETag 와 일치하는지 확인합니다. (W/ 약한 비교 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class DashboardCache:
+    """대시보드 응답용 2단계(LRU + 선택적 Redis) 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int, redis_url: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_url = redis_url
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._redis = None
+        self._redis_checked = False
+        self.reset_stats()
+
+    # --- 통계 ---
+
+    def reset_stats(self) -> None:
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self.redis_errors = 0
+
+    def get_stats(self) -> dict:
+        hits = self.local_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+            "redis_errors": self.redis_errors,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "redis_enabled": self._get_redis() is not None,
+        }
+
+    def clear(self) -> None:
+        """모든 캐시 항목, 버전, 통계를 초기화합니다. (테스트용)"""
+        self._entries.clear()
+        self._versions.clear()
+        self.reset_stats()
+
+    # --- Redis ---
+
+    def _get_redis(self):
+        """Redis 클라이언트를 지연 생성합니다. 설정이 없거나 패키지가 없으면 None 을 반환합니다."""
+        if not self._redis_checked:
+            self._redis_checked = True
+            if self.redis_url:
+                try:
+                    import redis.asyncio as redis_asyncio
+                    self._redis = redis_asyncio.from_url(self.redis_url)
+                except ImportError:
+                    print("redis 패키지가 설치되어 있지 않아 대시보드 캐시는 프로세스 내부 LRU 만 사용합니다.")
+        return self._redis
+
+    def _redis_entry_key(self, key: CacheKey) -> str:
+        return REDIS_KEY_PREFIX + ":resp:" + ":".join(str(part) for part in key)
+
+    def _redis_version_key(self, patient_id: int) -> str:
+        return f"{REDIS_KEY_PREFIX}:ver:{patient_id}"
+
+    # --- 버전 ---
+
+    async def _get_version(self, patient_id: int) -> int:
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                value = await redis.get(self._redis_version_key(patient_id))
+                return int(value) if value is not None else 0
+            except Exception as e:
+                self.redis_errors += 1
+                print(f"대시보드 캐시 Redis 버전 조회 실패: {e}")
+        return self._versions.get(patient_id, 0)
+
+    async def invalidate_patient(self, patient_id: int) -> None:
+        """환자의 데이터가 바뀌었을 때 호출하여 해당 환자의 모든 캐시 항목을 무효화합니다."""
+        patient_id = int(patient_id)
+        self.invalidations += 1
+        self._versions[patient_id] = self._versions.get(patient_id, 0) + 1
+        for key in [key for key in self._entries if key[1] == patient_id]:
+            del self._entries[key]
+
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                await redis.incr(self._redis_version_key(patient_id))
+            except Exception as e:
+                self.redis_errors += 1
+                print(f"대시보드 캐시 Redis 무효화 실패 (patient_id: {patient_id}): {e}")
+
+    # --- 조회 ---
+
+    def _local_get(self, key: CacheKey) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _local_set(self, key: CacheKey, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_build(
+        self,
+        endpoint: str,
+        patient_id: int,
+        role: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        builder: Callable[[], Awaitable[object]],
+    ) -> CachedResponse:
+        """캐시된 응답을 반환하거나, 없으면 builder 를 호출해 응답을 만들고 저장합니다.
+
+        권한 검사는 이 함수를 호출하기 전에 끝나 있어야 합니다.
+        """
+        patient_id = int(patient_id)
+        version = await self._get_version(patient_id)
+        key: CacheKey = (
+            endpoint,
+            patient_id,
+            version,
+            start_date.isoformat() if start_date else "",
+            end_date.isoformat() if end_date else "",
+            str(getattr(role, "value", role)),
+        )
+
+        entry = self._local_get(key)
+        if entry is not None:
+            self.local_hits += 1
+            return entry
+
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(self._redis_entry_key(key))
+                if raw is not None:
+                    etag, body = raw.split(b"\n", 1)
+                    entry = CachedResponse(
+                        body=body,
+                        etag=etag.decode(),
+                        expires_at=time.monotonic() + self.ttl_seconds,
+                    )
+                    self._local_set(key, entry)
+                    self.redis_hits += 1
+                    return entry
+            except Exception as e:
+                self.redis_errors += 1
+                print(f"대시보드 캐시 Redis 조회 실패: {e}")
+
+        self.misses += 1
+        payload = await builder()
+        body = JSONResponse(content=jsonable_encoder(payload)).body
+        entry = CachedResponse(
+            body=body,
+            etag=_make_etag(body),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._local_set(key, entry)
+
+        if redis is not None:
+            try:
+                await redis.set(
+                    self._redis_entry_key(key),
+                    entry.etag.encode() + b"\n" + body,
+                    ex=self.ttl_seconds,
+                )
+            except Exception as e:
+                self.redis_errors += 1
+                print(f"대시보드 캐시 Redis 저장 실패: {e}")
+
+        return entry
+
+    def to_response(self, request: Request, entry: CachedResponse) -> Response:
+        """If-None-Match 가 현재 ETag 와 같으면 304, 아니면 캐시된 본문으로 200 응답을 만듭니다."""
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+dashboard_cache = DashboardCache(
+    max_entries=DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS,
+    redis_url=REDIS_URL,
+)
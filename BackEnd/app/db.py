@@ -7,6 +7,8 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel
 
+from padoc_common.metrics import instrument_engine
+
 
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
@@ -14,6 +16,8 @@ DB_USERNAME = os.getenv("DB_USERNAME")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 DB_SSL_CONFIG = os.getenv("DB_SSL_CONFIG") # .env 파일에서 SSL 설정을 문자열로 가져옵니다.
+# 실행되는 SQL 을 모두 로그로 남길지 여부 (개발 중 디버깅용, 쿼리 수/시간은 /metrics 에서 확인합니다)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
 
 if not all([DB_HOST, DB_PORT, DB_USERNAME, DB_PASSWORD, DB_NAME]):
     raise ValueError("App Error: Missing database configuration in .env file.")
@@ -37,10 +41,13 @@ if DB_SSL_CONFIG:
 
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DB_ECHO,
     connect_args=connect_args
 )
 
+# 쿼리 종류별 실행 시간과 요청당 쿼리 수를 /metrics 로 수집합니다.
+instrument_engine(engine)
+
 # SessionMaker를 모듈 레벨에서 한 번만 생성합니다.
 AsyncSessionMaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -51,6 +58,15 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_session_maker() -> async_sessionmaker:
+    """요청이 끝난 뒤에도 DB 를 읽어야 하는 경우(스트리밍 응답)에 쓰는 세션 생성기 의존성
+
+    get_session 세션은 응답 본문을 보내기 전에 닫히므로, 스트리밍 응답은 이 생성기로
+    본문을 보내는 동안 사용할 세션을 직접 열고 닫습니다.
+    """
+    return AsyncSessionMaker
+
+
 async def create_db_and_tables():
     """SQLModel 메타데이터를 기반으로 모든 테이블을 비동기적으로 생성합니다."""
     async with engine.begin() as conn:
@@ -10,8 +10,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import uvicorn
 from datetime import datetime
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from typing import Optional
+from fastapi import FastAPI, Header, Request, status
+from fastapi.responses import JSONResponse, Response
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -20,8 +21,10 @@ from fastapi.middleware.cors import CORSMiddleware
 load_dotenv()
 
 # 이제 다른 모듈들을 상대 경로로 안전하게 임포트합니다.
-from app.db import create_db_and_tables
-from app.routers import auth, dashboard, users, training, screening
+from app.db import create_db_and_tables, AsyncSessionMaker
+from app.services.users_service.search_index import patient_name_index
+from app.services.users_service.access_cache import connection_access_cache
+from app.routers import auth, dashboard, users, training, screening, export
 from padoc_common.exceptions import (
     InvalidCredentialsError, 
     LicenseVerificationError, 
@@ -34,6 +37,12 @@ from padoc_common.exceptions import (
     NotFoundError  # 새로 추가
 )
 from padoc_common.schemas.base import ErrorResponse
+from padoc_common.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    MetricsMiddleware,
+    render_latest,
+    scrape_status,
+)
 
 # Lifespan 컨텍스트 매니저 정의
 @asynccontextmanager
@@ -41,7 +50,17 @@ async def lifespan(app: FastAPI):
     """애플리케이션 시작과 종료 시 처리할 로직"""
     print("--- FastAPI app startup: creating DB tables... ---")
     await create_db_and_tables()
+    # 환자 이름 검색/자동완성 색인을 미리 적재해 첫 요청부터 DB 조회 없이 응답합니다.
+    try:
+        async with AsyncSessionMaker() as db:
+            await patient_name_index.reload(db)
+        print(f"--- Patient name index loaded: {len(patient_name_index)} patients ---")
+    except Exception as e:
+        print(f"--- Patient name index warm-up failed, will load on first search: {e} ---")
+    # REDIS_URL 이 설정된 경우 다른 레플리카의 연결 상태 변경을 구독해 권한 캐시를 무효화합니다.
+    connection_access_cache.start_listener()
     yield
+    await connection_access_cache.stop_listener()
     print("--- FastAPI app shutdown. ---")
 
 # FastAPI 앱 인스턴스 생성
@@ -170,6 +189,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 라우트별 지연 시간/요청 수/DB 쿼리 수 수집 (/metrics 로 노출)
+app.add_middleware(MetricsMiddleware)
 
 # --- 라우터 등록 --- 
 
@@ -178,6 +199,22 @@ app.include_router(dashboard.router)
 app.include_router(users.router)
 app.include_router(training.router)
 app.include_router(screening.router)
+app.include_router(export.router)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus 수집용 메트릭 (텍스트 형식)
+
+    API 와 같은 포트로 열려 있으므로 "Authorization: Bearer <METRICS_TOKEN>" 헤더가 있는 요청에만 응답합니다.
+    METRICS_TOKEN 이 설정되지 않았으면 404 로 응답합니다.
+    """
+    status_code = scrape_status(authorization)
+    if status_code == 401:
+        return Response(status_code=status_code, headers={"WWW-Authenticate": "Bearer"})
+    if status_code != 200:
+        return Response(status_code=status_code)
+    return Response(content=render_latest(), media_type=METRICS_CONTENT_TYPE)
 
 
 # 기본 루트 엔드포인트
@@ -1,22 +1,28 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, Path, Query
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, timedelta
 
 from app.db import get_session
-from app.services import auth_service, dashboard_service
+from app.cache import dashboard_cache
+from app.services import auth_service, dashboard_service, rollup_service
 from app.services.users_service import connection_service
 from padoc_common.schemas.dashboard import (
     AdvTrainingInformationList as PatientDashboardResponse,
     VoiceInformation,
     VoiceInformationList as DoctorDashboardResponse,
+    TrendResponse,
+    CacheStatsResponse,
+    DoctorOverviewResponse,
+    SamplingSeriesResponse,
+    SAMPLING_MAX_POINTS,
 )
 from padoc_common.schemas.base import ErrorResponse
 from padoc_common.models.patients import Patient
 from padoc_common.models.doctors import Doctor
 import padoc_common.exceptions as exc
-from padoc_common.models.enums import UserRoleEnum
-from app.services.features_service import nest_ah_features
+from padoc_common.models.enums import UserRoleEnum, RollupPeriodEnum
+from app.services.features_service import build_sampling_series, build_sentence_features, nest_ah_features
 
 router = APIRouter(
     prefix="/dashboard",
@@ -34,6 +40,7 @@ router = APIRouter(
     },
 )
 async def get_patient_dashboard(
+    request: Request,
     start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
     db: AsyncSession = Depends(get_session),
@@ -50,11 +57,104 @@ async def get_patient_dashboard(
         if start_date > end_date:
             raise exc.BadRequestError(message="조회 시작일은 종료일보다 늦을 수 없습니다.")
 
-    training_history = await dashboard_service.get_patient_training_history(
-        db, account_id, start_date, end_date
+    async def build_response():
+        training_history = await dashboard_service.get_patient_training_history(
+            db, account_id, start_date, end_date
+        )
+        return PatientDashboardResponse(trainings=training_history)
+
+    cached = await dashboard_cache.get_or_build(
+        "patient", account_id, role, start_date, end_date, build_response
     )
+    return dashboard_cache.to_response(request, cached)
+
+
+@router.get(
+    "/patient/trends",
+    response_model=TrendResponse,
+    summary="환자/보호자용 지표 추이(일/주 단위 집계) 조회",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        400: {"model": ErrorResponse, "description": "잘못된 기간 요청"},
+    },
+)
+async def get_patient_trends(
+    period: RollupPeriodEnum = Query(RollupPeriodEnum.DAY, description="집계 단위 (day 또는 week)"),
+    start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """환자/보호자가 자신의 음성 특징 및 심화 훈련 점수 추이를 조회합니다."""
+    account_id = int(session_info["account_id"])
+    role = session_info["role"]
+
+    if role != UserRoleEnum.PATIENT:
+        raise exc.PermissionDeniedError(message="환자 또는 보호자만 접근할 수 있습니다.")
+
+    if start_date and end_date:
+        if start_date > end_date:
+            raise exc.BadRequestError(message="조회 시작일은 종료일보다 늦을 수 없습니다.")
+
+    return await rollup_service.get_patient_trends(db, account_id, period, start_date, end_date)
+
+
+# "/doctor/{patient_id}" 보다 먼저 선언해야 "overview" 가 환자 ID 로 해석되지 않습니다.
+@router.get(
+    "/doctor/overview",
+    response_model=DoctorOverviewResponse,
+    summary="의사용 환자 목록 요약 조회",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+    },
+)
+async def get_doctor_overview(
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """의사의 모든 연결된 환자에 대해 최근 녹음일, 최근 분석 지표, 최근 훈련 점수를 저장된 목록 순서대로 조회합니다."""
+    account_id = session_info["account_id"]
+    role = session_info["role"]
+
+    if role != UserRoleEnum.DOCTOR:
+        raise exc.PermissionDeniedError(message="의사만 접근할 수 있습니다.")
+
+    return await dashboard_service.get_doctor_overview(db, account_id)
+
+
+@router.get(
+    "/doctor/{patient_id}/trends",
+    response_model=TrendResponse,
+    summary="의사용 특정 환자 지표 추이(일/주 단위 집계) 조회",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        400: {"model": ErrorResponse, "description": "잘못된 기간 요청"},
+    },
+)
+async def get_patient_trends_for_doctor(
+    patient_id: int = Path(..., title="환자 ID"),
+    period: RollupPeriodEnum = Query(RollupPeriodEnum.DAY, description="집계 단위 (day 또는 week)"),
+    start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """의사가 연결된 환자의 음성 특징 및 심화 훈련 점수 추이를 조회합니다."""
+    account_id = session_info["account_id"]
+    role = session_info["role"]
 
-    return PatientDashboardResponse(trainings=training_history)
+    if role != UserRoleEnum.DOCTOR:
+        raise exc.PermissionDeniedError(message="의사만 접근할 수 있습니다.")
+
+    if start_date and end_date:
+        if start_date > end_date:
+            raise exc.BadRequestError(message="조회 시작일은 종료일보다 늦을 수 없습니다.")
+
+    is_connected = await connection_service.check_connection(db, doctor_id=account_id, patient_id=patient_id)
+    if not is_connected:
+        raise exc.PermissionDeniedError(message="해당 환자에 대한 접근 권한이 없습니다.")
+
+    return await rollup_service.get_patient_trends(db, patient_id, period, start_date, end_date)
 
 
 @router.get(
@@ -68,6 +168,7 @@ async def get_patient_dashboard(
     },
 )
 async def get_patient_details_for_doctor(
+    request: Request,
     patient_id: int = Path(..., title="환자 ID"),
     start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
@@ -90,21 +191,78 @@ async def get_patient_details_for_doctor(
     if not is_connected:
         raise exc.PermissionDeniedError(message="해당 환자에 대한 접근 권한이 없습니다.")
 
-    patient_voices = await dashboard_service.get_patient_voice_records(
-        db, patient_id, start_date, end_date
+    async def build_response():
+        patient_voices = await dashboard_service.get_patient_voice_records(
+            db, patient_id, start_date, end_date
+        )
+
+        wrapped_patient_voices = []
+        for voice in patient_voices:
+            voice_info = VoiceInformation(
+                **voice.model_dump(exclude={"id", "related_voice_record_id", "type" ,"ah_features", "sentence_features", }),
+                voice_id=voice.id,
+                related_voice_info_id=voice.related_voice_record_id,
+                recording_type=voice.type,
+                ah_features= nest_ah_features(voice.ah_features) if voice.ah_features else None,
+                sentence_features=build_sentence_features(voice.sentence_features) if voice.sentence_features else None,
+            )
+            
+            wrapped_patient_voices.append(voice_info)
+
+        return DoctorDashboardResponse(voices=wrapped_patient_voices)
+
+    # 권한 검사가 끝난 뒤에만 캐시를 조회합니다. (같은 환자를 보는 의사들은 응답을 공유합니다)
+    cached = await dashboard_cache.get_or_build(
+        "doctor", patient_id, role, start_date, end_date, build_response
     )
+    return dashboard_cache.to_response(request, cached)
 
-    wrapped_patient_voices = []
-    for voice in patient_voices:
-        voice_info = VoiceInformation(
-            **voice.model_dump(exclude={"id", "related_voice_record_id", "type" ,"ah_features", "sentence_features", }),
-            voice_id=voice.id,
-            related_voice_info_id=voice.related_voice_record_id,
-            recording_type=voice.type,
-            ah_features= nest_ah_features(voice.ah_features) if voice.ah_features else None,
-            sentence_features=voice.sentence_features if voice.sentence_features else None,
-        )
-        
-        wrapped_patient_voices.append(voice_info)
 
-    return DoctorDashboardResponse(voices=wrapped_patient_voices)
+@router.get(
+    "/voice/{record_id}/sampling",
+    response_model=SamplingSeriesResponse,
+    summary="문장 발성 녹음의 시계열(energy/frequency) 다운샘플링 조회",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        404: {"model": ErrorResponse, "description": "시계열 정보를 찾을 수 없음"},
+    },
+)
+async def get_voice_sampling_series(
+    record_id: int = Path(..., title="녹음 ID"),
+    points: int = Query(1000, ge=2, le=SAMPLING_MAX_POINTS, description="반환할 최대 점 개수"),
+    method: Literal["lttb", "minmax"] = Query("lttb", description="다운샘플링 방식 (lttb 또는 minmax)"),
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """녹음한 환자 본인 또는 연결된 의사가 문장 발성 시계열을 차트용으로 줄여서 조회합니다."""
+    account_id = int(session_info["account_id"])
+    role = session_info["role"]
+
+    found = await dashboard_service.get_sentence_features_with_owner(db, record_id)
+    if found is None:
+        raise exc.NotFoundError(message="시계열 정보를 찾을 수 없습니다.")
+    patient_id, features = found
+
+    if role == UserRoleEnum.DOCTOR:
+        is_connected = await connection_service.check_connection(db, doctor_id=account_id, patient_id=patient_id)
+        if not is_connected:
+            raise exc.PermissionDeniedError(message="해당 환자에 대한 접근 권한이 없습니다.")
+    elif account_id != patient_id:
+        raise exc.PermissionDeniedError(message="본인의 녹음만 조회할 수 있습니다.")
+
+    response = build_sampling_series(features, points, method)
+    if response is None:
+        raise exc.NotFoundError(message="시계열 정보를 찾을 수 없습니다.")
+    return response
+
+
+@router.get(
+    "/cache/stats",
+    response_model=CacheStatsResponse,
+    summary="대시보드 응답 캐시 적중률 통계 조회",
+)
+async def get_dashboard_cache_stats(
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """대시보드 응답 캐시의 적중/미스/304 응답 횟수를 조회합니다."""
+    return CacheStatsResponse(**dashboard_cache.get_stats())
@@ -0,0 +1,73 @@
+from datetime import date
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db import get_session, get_session_maker
+from app.services import auth_service, export_service
+from app.services.users_service import connection_service
+from padoc_common.schemas.base import ErrorResponse
+from padoc_common.models.enums import UserRoleEnum
+import padoc_common.exceptions as exc
+
+router = APIRouter(
+    prefix="/export",
+    tags=["내보내기"],
+)
+
+
+@router.get(
+    "/voice-features",
+    summary="음성 특징 이력 대량 내보내기 (CSV / NDJSON / Parquet)",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {media_type.split(";")[0]: {} for media_type in export_service.MEDIA_TYPES.values()},
+            "description": "녹음 한 건당 한 행 (문장 녹음은 음성 지표 열이, /아/ 녹음은 cpp/csid 열이 비어 있습니다)",
+        },
+        400: {"model": ErrorResponse, "description": "잘못된 기간 또는 지원하지 않는 형식"},
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+    },
+)
+async def export_voice_features(
+    export_format: Literal["csv", "ndjson", "parquet"] = Query("csv", alias="format", description="내보내기 형식"),
+    patient_ids: Optional[List[int]] = Query(None, description="내보낼 환자 ID 목록 (의사만, 생략 시 연결된 모든 환자)"),
+    start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_session),
+    session_maker: async_sessionmaker = Depends(get_session_maker),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """
+    분석이 끝난 녹음의 음성 특징 이력을 환자, 녹음 시각 순서로 내보냅니다.
+    - 환자는 본인의 이력만, 의사는 연결(승인)된 환자들의 이력을 한 파일로 내보낼 수 있습니다.
+    - 행 수와 관계없이 일정한 메모리로 스트리밍합니다.
+    """
+    account_id = int(session_info["account_id"])
+    role = session_info["role"]
+
+    if start_date and end_date and start_date > end_date:
+        raise exc.BadRequestError(message="조회 시작일은 종료일보다 늦을 수 없습니다.")
+    export_service.check_format_available(export_format)
+
+    if role == UserRoleEnum.DOCTOR:
+        approved = await connection_service.get_approved_patient_ids(db, account_id)
+        if patient_ids is None:
+            targets = sorted(approved)
+        elif not set(patient_ids) <= approved:
+            raise exc.PermissionDeniedError(message="연결되지 않은 환자가 포함되어 있습니다.")
+        else:
+            targets = sorted(set(patient_ids))
+    else:
+        if patient_ids is not None and set(patient_ids) != {account_id}:
+            raise exc.PermissionDeniedError(message="본인의 이력만 내보낼 수 있습니다.")
+        targets = [account_id]
+
+    filename = f"voice_features_{date.today():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        export_service.stream_export(session_maker, export_format, targets, start_date, end_date),
+        media_type=export_service.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
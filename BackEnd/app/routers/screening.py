@@ -6,6 +6,7 @@ from padoc_common.models.enums import RecordingTypeEnum
 from padoc_common.schemas.screening import ScreeningResponse
 from padoc_common.schemas.base import ErrorResponse
 from padoc_common.exceptions import BackEndInternalError
+from padoc_common.metrics import track_upstream
 
 MODEL_SERV_URL = os.getenv("MODEL_SERV_URL")
 
@@ -38,9 +39,11 @@ async def analyze_voice(
     async with httpx.AsyncClient() as client:
         try:
             if recording_type == RecordingTypeEnum.voice_ah:
-                response = await client.post(MODEL_SERV_URL+"/ah-features", files=files, timeout=30.0)
+                with track_upstream("ah-features"):
+                    response = await client.post(MODEL_SERV_URL+"/ah-features", files=files, timeout=30.0)
             elif recording_type == RecordingTypeEnum.voice_sentence:
-                response = await client.post(MODEL_SERV_URL+"/parkinson-prediction", files=files, timeout=30.0)
+                with track_upstream("parkinson-prediction"):
+                    response = await client.post(MODEL_SERV_URL+"/parkinson-prediction", files=files, timeout=30.0)
             else:
                 raise HTTPException(status_code=400, detail="잘못된 요청입니다.")
             
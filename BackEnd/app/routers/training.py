@@ -19,7 +19,7 @@ from padoc_common.schemas.training import (
     UploadStatusRequest,
     TrainingBasicDownloadResponse,
 )
-from app.services import training_service
+from app.services import device_features_service, training_service
 from padoc_common.models import Account
 from app.services import auth_service
 from padoc_common.schemas.base import ErrorResponse
@@ -38,7 +38,7 @@ from app.services.background_file_check_service import poll_s3_file_status
     "/basic/upload",
     response_model=TrainingBasicUploadResponse,
     responses={
-        400: {"model": ErrorResponse, "description": "허용되지 않는 파일확장자"},
+        400: {"model": ErrorResponse, "description": "허용되지 않는 파일확장자 또는 잘못된 장치 특징 값"},
         403: {"model": ErrorResponse, "description": "환자가 아닌 경우"},
         404: {
             "model": ErrorResponse,
@@ -56,6 +56,10 @@ async def upload_training_file(
 ):
     """
     훈련 음성 파일 제출을 위한 업로드 URL을 반환합니다.
+
+    device_features 를 함께 보내면 장치가 계산한 특징을 바로 저장합니다.
+    (DEVICE_FEATURES_VERIFY_RATE 비율의 표본과 범위를 벗어난 값만 서버가 다시 추출합니다)
+    서버와 같은 파라미터로 계산한 녹음 유형의 모든 지표가 있어야 하며, 아니면 400 을 반환합니다.
     """
     account_id = session_info["account_id"]
     role = session_info["role"]
@@ -70,6 +74,9 @@ async def upload_training_file(
     if role != UserRoleEnum.PATIENT:
         raise PermissionDeniedError("환자가 아닙니다.")
 
+    if payload.device_features is not None:
+        device_features_service.validate_device_features(payload.type, payload.device_features)
+
     if payload.related_voice_record_id:
         result = await db.execute(
             select(VoiceRecord).where(VoiceRecord.id == payload.related_voice_record_id)
@@ -98,13 +105,22 @@ async def upload_training_file(
         related_voice_record_id=payload.related_voice_record_id,
     )
 
+    # 장치가 계산한 특징을 함께 보냈으면 바로 저장하고, 표본/비정상 값만 서버에서 다시 추출합니다.
+    extract_features = True
+    if payload.device_features is not None:
+        decision = await device_features_service.store_device_features(
+            db, record_id, payload.type, payload.device_features
+        )
+        extract_features = decision != device_features_service.DECISION_DEVICE
+
     # 프로토타입: 백그라운드 작업 추가
     #    응답이 클라이언트에 전송된 후, FastAPI가 이 함수를 실행합니다.
     background_tasks.add_task(
         poll_s3_file_status,
         s3_client=s3_client,
         s3_key=s3_key,  # generate_presigned_url 함수가 s3_key를 반환하도록 수정 필요
-        record_id=record_id
+        record_id=record_id,
+        extract_features=extract_features,
     )
 
     return TrainingBasicUploadResponse(record_id=record_id, upload_url=upload_url)
@@ -6,6 +6,7 @@ from . import schedules
 from . import list_order
 from . import connections
 from . import search
+from . import notes
 
 # '/users' 접두사를 가진 메인 라우터를 생성합니다.
 # 이 라우터가 users 모듈의 모든 하위 라우터를 통합 관리합니다.
@@ -20,4 +21,5 @@ router.include_router(connections.router)
 router.include_router(schedules.router)
 router.include_router(list_order.router)
 router.include_router(connections.router)
-router.include_router(search.router)
\ No newline at end of file
+router.include_router(search.router)
+router.include_router(notes.router)
\ No newline at end of file
@@ -14,6 +14,9 @@ from padoc_common.schemas.connection import (
     UpdateConnectionStatus,
     ConnectionList,
     ConnectionRequestPayload,
+    BulkConnectionRequestPayload,
+    BulkUpdateConnectionStatus,
+    BulkConnectionResult,
 )
 from app.services import auth_service
 from app.services.users_service import connection_service
@@ -118,7 +121,7 @@ async def approve_connection(
 
     # 예외: 해당 연결은 사용자의 연결이 아닌 경우
     if (
-        connection_service.verify_connection_ownership(
+        await connection_service.verify_connection_ownership(
             db, user_id=patient_id, role=role, connection_id=payload.connection_id
         )
         is None
@@ -163,7 +166,7 @@ async def reject_connection(
 
     # 예외: 해당 연결은 사용자의 연결이 아닌 경우
     if (
-        connection_service.verify_connection_ownership(
+        await connection_service.verify_connection_ownership(
             db, user_id=patient_id, role=role, connection_id=payload.connection_id
         )
         is None
@@ -202,7 +205,7 @@ async def disconnect_connection(
 
     # 예외: 해당 연결은 사용자의 연결이 아닌 경우
     if (
-        connection_service.verify_connection_ownership(
+        await connection_service.verify_connection_ownership(
             db, user_id=account_id, role=role, connection_id=connection_id
         )
         is None
@@ -215,3 +218,121 @@ async def disconnect_connection(
     )
     # 3. 연결 성공 여부를 응답 형식에 맞춰 전송 (204 No Content)
     return
+
+
+# --- 일괄 처리 ---
+
+
+@router.post(
+    "/bulk/requests",
+    response_model=BulkConnectionResult,
+    status_code=status.HTTP_200_OK,
+    summary="의사가 여러 환자에게 한 번에 연결 요청",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        500: {"model": ErrorResponse, "description": "연결 요청 실패"},
+    },
+)
+async def bulk_request_connections(
+    payload: BulkConnectionRequestPayload,
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    의사가 여러 환자에게 데이터 열람 연결을 한 번에 요청합니다.
+    환자별 처리 결과를 반환하며, 일부 환자가 실패해도 나머지는 처리됩니다.
+    """
+    account_id = session_info.get("account_id")
+    role = session_info.get("role")
+
+    if role != UserRoleEnum.DOCTOR:
+        raise PermissionDeniedError("의사만 연결을 요청할 수 있습니다.")
+
+    results = await connection_service.bulk_create_connection_requests(
+        db, doctor_id=int(account_id), patient_ids=payload.patient_ids
+    )
+    return BulkConnectionResult.from_results(results)
+
+
+async def _bulk_update_status(
+    payload: BulkUpdateConnectionStatus,
+    session_info: dict,
+    db: AsyncSession,
+    new_status: ConnectionStatusEnum,
+) -> BulkConnectionResult:
+    results = await connection_service.bulk_update_connection_status(
+        db,
+        user_id=int(session_info.get("account_id")),
+        role=session_info.get("role"),
+        connection_ids=payload.connection_ids,
+        new_status=new_status,
+    )
+    return BulkConnectionResult.from_results(results)
+
+
+@router.put(
+    "/bulk/approve",
+    response_model=BulkConnectionResult,
+    status_code=status.HTTP_200_OK,
+    summary="환자가 여러 연결 요청을 한 번에 승인",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        500: {"model": ErrorResponse, "description": "연결 승인 실패"},
+    },
+)
+async def bulk_approve_connections(
+    payload: BulkUpdateConnectionStatus,
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    환자가 대기 중인 연결 요청 여러 개를 한 번에 승인합니다.
+    """
+    if session_info.get("role") != UserRoleEnum.PATIENT:
+        raise PermissionDeniedError("환자만 연결을 승인할 수 있습니다.")
+
+    return await _bulk_update_status(payload, session_info, db, ConnectionStatusEnum.APPROVED)
+
+
+@router.put(
+    "/bulk/reject",
+    response_model=BulkConnectionResult,
+    status_code=status.HTTP_200_OK,
+    summary="환자가 여러 연결 요청을 한 번에 거절",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        500: {"model": ErrorResponse, "description": "연결 거절 실패"},
+    },
+)
+async def bulk_reject_connections(
+    payload: BulkUpdateConnectionStatus,
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    환자가 대기 중인 연결 요청 여러 개를 한 번에 거절합니다.
+    """
+    if session_info.get("role") != UserRoleEnum.PATIENT:
+        raise PermissionDeniedError("환자만 연결을 거절할 수 있습니다.")
+
+    return await _bulk_update_status(payload, session_info, db, ConnectionStatusEnum.REJECTED)
+
+
+@router.put(
+    "/bulk/terminate",
+    response_model=BulkConnectionResult,
+    status_code=status.HTTP_200_OK,
+    summary="여러 의사-환자 연결을 한 번에 끊기",
+    responses={
+        500: {"model": ErrorResponse, "description": "연결 끊기 실패"},
+    },
+)
+async def bulk_terminate_connections(
+    payload: BulkUpdateConnectionStatus,
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    의사 또는 환자가 승인되었거나 대기 중인 연결 여러 개를 한 번에 끊습니다.
+    """
+    return await _bulk_update_status(payload, session_info, db, ConnectionStatusEnum.TERMINATED)
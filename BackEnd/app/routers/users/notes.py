@@ -0,0 +1,133 @@
+# app/routers/users/notes.py
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_session
+from padoc_common.schemas.base import ErrorResponse
+from padoc_common.schemas.note import (
+    NOTE_PAGE_MAX_LIMIT,
+    Note,
+    NoteCountList,
+    NoteCreate,
+    NotePage,
+    NoteUpdate,
+)
+from app.services import auth_service
+from app.services.users_service import connection_service, notes_service
+from padoc_common.models.enums import UserRoleEnum
+from padoc_common.exceptions import PermissionDeniedError
+
+
+router = APIRouter(prefix="/notes", tags=["notes"])
+
+
+def _require_doctor(session_info: dict) -> int:
+    if session_info.get("role") != UserRoleEnum.DOCTOR:
+        raise PermissionDeniedError("의사만 접근 가능합니다.")
+    return int(session_info.get("account_id"))
+
+
+async def _require_connection(db: AsyncSession, doctor_id: int, patient_id: int) -> None:
+    if not await connection_service.check_connection(db, doctor_id=doctor_id, patient_id=patient_id):
+        raise PermissionDeniedError("해당 환자의 데이터에 접근할 권한이 없습니다.")
+
+
+@router.get(
+    "/counts",
+    response_model=NoteCountList,
+    summary="환자별 메모 개수 요약",
+    responses={403: {"model": ErrorResponse, "description": "의사가 아닌 경우"}},
+)
+async def get_note_counts(
+    patient_ids: Optional[List[int]] = Query(None, description="요약할 환자 ID 목록 (생략 시 연결된 모든 환자)"),
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """
+    환자 목록 화면의 메모 배지용으로, 여러 환자의 메모 개수를 한 번에 조회합니다.
+    - 연결(승인)되지 않은 환자 ID 는 결과에서 제외됩니다.
+    """
+    doctor_id = _require_doctor(session_info)
+    approved = await connection_service.get_approved_patient_ids(db, doctor_id)
+    if patient_ids is None:
+        targets = sorted(approved)
+    else:
+        targets = [patient_id for patient_id in patient_ids if patient_id in approved]
+
+    counts = await notes_service.get_note_counts(db, doctor_id, targets)
+    return NoteCountList(counts=counts)
+
+
+@router.get(
+    "",
+    response_model=NotePage,
+    summary="환자에 대한 메모 목록 조회 (최신순)",
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 커서"},
+        403: {"model": ErrorResponse, "description": "의사가 아니거나 연결되지 않은 환자"},
+    },
+)
+async def list_notes(
+    patient_id: int = Query(..., description="환자 ID"),
+    limit: int = Query(20, ge=1, le=NOTE_PAGE_MAX_LIMIT, description="한 페이지의 최대 메모 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """
+    연결된 환자에 대해 본인이 작성한 메모를 최신순으로 조회합니다.
+    - 다음 페이지는 응답의 **next_cursor** 를 cursor 로 넘겨 조회합니다.
+    """
+    doctor_id = _require_doctor(session_info)
+    await _require_connection(db, doctor_id, patient_id)
+    return await notes_service.list_notes(db, doctor_id=doctor_id, patient_id=patient_id, limit=limit, cursor=cursor)
+
+
+@router.post(
+    "",
+    response_model=Note,
+    summary="환자에 대한 메모 작성",
+    responses={403: {"model": ErrorResponse, "description": "의사가 아니거나 연결되지 않은 환자"}},
+)
+async def create_note(
+    payload: NoteCreate,
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """
+    연결된 환자에 대한 메모를 작성합니다.
+    - **doctor** 역할만 이 엔드포인트를 사용할 수 있습니다.
+    """
+    doctor_id = _require_doctor(session_info)
+    await _require_connection(db, doctor_id, payload.patient_id)
+    return await notes_service.create_note(
+        db, doctor_id=doctor_id, patient_id=payload.patient_id, note_content=payload.note_content
+    )
+
+
+@router.put(
+    "/{note_id}",
+    response_model=Note,
+    summary="메모 수정",
+    responses={
+        403: {"model": ErrorResponse, "description": "본인이 작성한 메모가 아니거나 연결이 끊긴 환자"},
+        404: {"model": ErrorResponse, "description": "메모가 없는 경우"},
+    },
+)
+async def update_note(
+    note_id: int,
+    payload: NoteUpdate,
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """
+    본인이 작성한 메모의 내용을 수정합니다.
+    - 메모 대상 환자와의 연결이 끊긴 경우 수정할 수 없습니다.
+    """
+    doctor_id = _require_doctor(session_info)
+    note = await notes_service.get_own_note(db, doctor_id=doctor_id, note_id=note_id)
+    await _require_connection(db, doctor_id, note.patient_id)
+    return await notes_service.update_note(
+        db, doctor_id=doctor_id, note_id=note_id, note_content=payload.note_content
+    )
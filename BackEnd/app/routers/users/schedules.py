@@ -1,18 +1,28 @@
 # app/routers/users/schedules.py
-from typing import List
+from typing import List, Optional
 from fastapi.responses import JSONResponse
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from datetime import date, datetime
 from app.db import get_session
 from padoc_common.schemas.base import ErrorResponse
-from padoc_common.schemas.schedule import ScheduleDate, ScheduleListResponse, ScheduleCreate, PermissionDeniedError, ScheduleNotFoundError
+from padoc_common.schemas.schedule import (
+    ScheduleDate,
+    ScheduleListResponse,
+    ScheduleCreate,
+    ScheduleBulkCreate,
+    ScheduleRecurrenceCreate,
+    ScheduleBulkCreateResponse,
+    SCHEDULE_BULK_MAX_DATES,
+    PermissionDeniedError,
+    ScheduleNotFoundError,
+)
 from padoc_common.schemas.base import SuccessResponse
 from app.services import auth_service
 from app.services.users_service import schedules_service
 from padoc_common.models.enums import UserRoleEnum
 from padoc_common.models import Account
-from padoc_common.exceptions import BackEndInternalError, PermissionDeniedError
+from padoc_common.exceptions import BackEndInternalError, BadRequestError, PermissionDeniedError
 
 
 router = APIRouter(
@@ -25,11 +35,14 @@ router = APIRouter(
     response_model=ScheduleListResponse,
     summary="환자의 스케줄 목록 조회",
     responses={
+        400: {"model": ErrorResponse, "description": "잘못된 조회 기간"},
         403: {"model": ErrorResponse, "description": "권한 없음"},
         500: {"model": ErrorResponse, "description": "스케줄 목록 조회 실패"},
     },
 )
 async def get_schedules(
+    start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
     session_info: dict = Depends(auth_service.get_current_active_session_info),
     db: AsyncSession = Depends(get_session),
 ):
@@ -39,8 +52,13 @@ async def get_schedules(
     if role != UserRoleEnum.PATIENT:
         raise PermissionDeniedError(message="환자만 스케줄을 조회할 수 있습니다.")
 
+    if start_date and end_date and start_date > end_date:
+        raise BadRequestError(message="조회 시작일은 종료일보다 늦을 수 없습니다.")
+
     # 서비스는 이제 ORM 객체 리스트를 반환합니다. try/except가 필요 없습니다.
-    schedules = await schedules_service.get_schedules_by_patient_id(db, patient_id=patient_id)
+    schedules = await schedules_service.get_schedules_by_patient_id(
+        db, patient_id=patient_id, start_date=start_date, end_date=end_date
+    )
     return {"appointment_dates": schedules}
 
 
@@ -76,6 +94,72 @@ async def create_schedule(
     return {"schedule_id": new_schedule.id}
 
 
+@router.post(
+    "/bulk",
+    response_model=ScheduleBulkCreateResponse,
+    summary="스케줄 일괄 생성",
+    responses={
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        500: {"model": ErrorResponse, "description": "스케줄 생성 실패"},
+    },
+)
+async def create_schedules_bulk(
+    payload: ScheduleBulkCreate,
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+    db: AsyncSession = Depends(get_session),
+):
+    """여러 날짜의 스케줄을 한 번에 생성합니다. 이미 예약된 날짜는 건너뜁니다."""
+    patient_id = session_info.get("account_id")
+    role = session_info.get("role")
+
+    if role != UserRoleEnum.PATIENT:
+        raise PermissionDeniedError("환자만 스케줄을 생성할 수 있습니다.")
+
+    return await _bulk_create(db, patient_id, payload.dates)
+
+
+@router.post(
+    "/recurring",
+    response_model=ScheduleBulkCreateResponse,
+    summary="반복 스케줄 생성",
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 반복 조건"},
+        403: {"model": ErrorResponse, "description": "권한 없음"},
+        500: {"model": ErrorResponse, "description": "스케줄 생성 실패"},
+    },
+)
+async def create_recurring_schedules(
+    payload: ScheduleRecurrenceCreate,
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+    db: AsyncSession = Depends(get_session),
+):
+    """시작일부터 지정한 주 수 동안 선택한 요일마다 스케줄을 생성합니다. (예: 12주 동안 월/수/금)"""
+    patient_id = session_info.get("account_id")
+    role = session_info.get("role")
+
+    if role != UserRoleEnum.PATIENT:
+        raise PermissionDeniedError("환자만 스케줄을 생성할 수 있습니다.")
+
+    dates = schedules_service.expand_recurrence(payload.start_date, payload.weekdays, payload.weeks)
+    if not dates:
+        raise BadRequestError(message="반복 조건에 해당하는 날짜가 없습니다.")
+    if len(dates) > SCHEDULE_BULK_MAX_DATES:
+        raise BadRequestError(message=f"한 번에 최대 {SCHEDULE_BULK_MAX_DATES}개의 스케줄만 생성할 수 있습니다.")
+
+    return await _bulk_create(db, patient_id, dates)
+
+
+async def _bulk_create(db: AsyncSession, patient_id, dates: List[date]) -> ScheduleBulkCreateResponse:
+    schedules, created_count = await schedules_service.bulk_create_schedules(
+        db, patient_id=patient_id, dates=dates
+    )
+    return ScheduleBulkCreateResponse(
+        appointment_dates=schedules,
+        created_count=created_count,
+        skipped_count=len(schedules) - created_count,
+    )
+
+
 @router.delete(
     "/{schedule_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -4,8 +4,8 @@ from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_session
 from padoc_common.schemas.base import ErrorResponse
-from app.services.users_service.search_service import search_users_by_name
-from padoc_common.schemas.search import UserSearchResponse
+from app.services.users_service.search_service import search_users_by_name, typeahead_patients
+from padoc_common.schemas.search import TypeaheadResponse, UserSearchResponse
 from app.services import auth_service
 from padoc_common.models import Account
 from padoc_common.models.enums import UserRoleEnum
@@ -32,6 +32,8 @@ router = APIRouter(prefix="/search", tags=["search"])
 )
 async def search_users(
     q: str = Query(..., description="검색할 사용자 이름의 일부 또는 전체"),
+    limit: int = Query(20, ge=1, le=100, description="반환할 최대 결과 수"),
+    offset: int = Query(0, ge=0, description="건너뛸 결과 수 (페이지네이션)"),
     db: AsyncSession = Depends(get_session),
     session_info: dict = Depends(auth_service.get_current_active_session_info),
 ):
@@ -47,5 +49,37 @@ async def search_users(
     if role != UserRoleEnum.DOCTOR:
         raise PermissionDeniedError("의사만 환자를 검색할 수 있습니다.")
 
-    users = await search_users_by_name(db, q)
+    users = await search_users_by_name(db, q, limit=limit, offset=offset)
     return UserSearchResponse.model_validate(users)
+
+
+
+@router.get(
+    "/typeahead",
+    summary="환자 이름/로그인 ID 자동완성",
+    description="입력한 접두사로 시작하는 환자 이름 또는 로그인 ID 를 최대 k 명 반환합니다.",
+    response_model=TypeaheadResponse,
+    responses={
+        403: {
+            "model": ErrorResponse,
+            "description": "의사만 환자를 검색할 수 있습니다.",
+        },
+        400: {"model": ErrorResponse, "description": "검색어가 빈 문자열 입니다."},
+    },
+)
+async def typeahead_users(
+    q: str = Query(..., description="검색할 환자 이름 또는 로그인 ID 의 앞부분"),
+    k: int = Query(10, ge=1, le=50, description="반환할 최대 결과 수"),
+    db: AsyncSession = Depends(get_session),
+    session_info: dict = Depends(auth_service.get_current_active_session_info),
+):
+    """
+    환자 자동완성 API
+    """
+    if q.strip() == "":
+        raise BadRequestError("검색어를 입력하지 않았습니다.")
+
+    if session_info.get("role") != UserRoleEnum.DOCTOR:
+        raise PermissionDeniedError("의사만 환자를 검색할 수 있습니다.")
+
+    return await typeahead_patients(db, q, k=k)
@@ -15,6 +15,7 @@ from sqlmodel import select
 from sqlalchemy.orm import selectinload
 
 from app.db import get_session
+from app.services.users_service.search_index import patient_name_index
 from padoc_common.exceptions import InvalidCredentialsError, LicenseVerificationError
 from padoc_common.models.accounts import Account
 from padoc_common.models.doctors import Doctor, DoctorCreate
@@ -215,6 +216,9 @@ async def register_patient(db: AsyncSession, signup_data: PatientCreate):
         await db.rollback()
         raise
 
+    # 이름 검색 색인에 새 환자를 반영합니다.
+    patient_name_index.upsert(new_account.id, new_account.full_name, new_account.login_id)
+
 
 async def register_doctor(db: AsyncSession, signup_data: DoctorCreate):
     """
@@ -5,9 +5,12 @@ import botocore
 import httpx
 from app import db, storage
 from app.services.features_service import flatten_ah_features
+from app.services import device_features_service, rollup_service
 from padoc_common.models import Account, AhFeatures, SentenceFeatures
+from padoc_common.metrics import track_upstream
+from padoc_common.sampling_codec import SamplingSeries, encode_sampling_data, encode_sampling_lod
 from padoc_common.exceptions import PermissionDeniedError, BackEndInternalError, NotFoundError
-from padoc_common.models.enums import FileStatusEnum, RecordingTypeEnum
+from padoc_common.models.enums import FeatureSourceEnum, FileStatusEnum, RecordingTypeEnum
 from botocore.exceptions import ClientError
 from sqlalchemy.ext.asyncio import AsyncSession
 from padoc_common.models.voice_records import VoiceRecord
@@ -86,6 +89,7 @@ async def process_voice_features(
     2. S3에서 음성 데이터를 다운로드합니다.
     3. 음성 타입에 따라 Praat 서비스로 특징을 추출합니다.
     4. 추출된 특징을 해당 특징 테이블에 저장하고 voice_record에 연결합니다.
+       장치가 보낸 특징이 이미 저장되어 있으면(표본 검증) 서버 값으로 교체하고 차이를 기록합니다.
     """
     # 1. voice_record 정보 가져오기
     record = await db.get(VoiceRecord, record_id)
@@ -114,29 +118,37 @@ async def process_voice_features(
             # 3. 음성 타입에 따라 특징 추출
             if record.type == RecordingTypeEnum.voice_ah:
                 # 'ah' 특징 추출 (nested schema)
-                features_dict = (await client.post(MODEL_SERV_URL+"/ah-features", files=files, timeout=30.0)).json()
+                with track_upstream("ah-features"):
+                    features_dict = (await client.post(MODEL_SERV_URL+"/ah-features", files=files, timeout=30.0)).json()
                 # model_validate 메서드를 사용해 Pydantic 모델 객체 생성
                 features_dict = WrappedAhFeatures.model_validate(features_dict)
                 features_dict = flatten_ah_features(features_dict)
                 # 특징 테이블에 저장
-                new_ah_features = AhFeatures(
-                    record_id=record.id,
-                    **(features_dict.model_dump())
+                new_features = await _save_features(
+                    db, record, AhFeatures, features_dict.model_dump()
                 )
-                db.add(new_ah_features)
             elif record.type == RecordingTypeEnum.voice_sentence:
                 # 문장 특징 추출
-                features_dict = (await client.post(MODEL_SERV_URL+"/sentence-features", files=files, timeout=30.0)).json()
+                with track_upstream("sentence-features"):
+                    features_dict = (await client.post(MODEL_SERV_URL+"/sentence-features", files=files, timeout=30.0)).json()
 
                 if features_dict is None:
                     raise ValueError("특징 추출 함수(praat_sentence_real)가 실패하여 None을 반환했습니다.")
                 
-                # 4. 특징 테이블에 저장
-                new_sentence_features = SentenceFeatures(
-                    record_id=record.id,
-                    **features_dict
+                # 4. 특징 테이블에 저장 (시계열은 JSON 대신 이진 형식으로 저장하고,
+                #    차트 조회용 LOD 피라미드도 여기서 미리 계산해 둡니다)
+                sampling_data = features_dict.pop("sampling_data", None)
+                sampling_blob = encode_sampling_data(sampling_data) if sampling_data else None
+                new_features = await _save_features(
+                    db,
+                    record,
+                    SentenceFeatures,
+                    dict(
+                        sampling_blob=sampling_blob,
+                        sampling_lod=encode_sampling_lod(SamplingSeries(sampling_blob)) if sampling_blob else None,
+                        **features_dict,
+                    ),
                 )
-                db.add(new_sentence_features)
             else:
                 # 지원하지 않는 타입이면 실패 처리
                 raise ValueError(f"Unsupported recording type: {record.type}")
@@ -144,9 +156,12 @@ async def process_voice_features(
         # 변경사항 커밋
         await db.commit()
 
-        # 파일 상태를 완료로 변경
+        # 파일 상태를 완료로 변경 (대시보드 캐시 무효화도 여기서 함께 처리됩니다)
         await update_voice_record_status(db, record_id, FileStatusEnum.COMPLETED)
 
+        # 일/주 단위 집계 갱신 (실패해도 특징 저장 결과에는 영향을 주지 않습니다)
+        await rollup_service.apply_rollup_safely(db, record.patient_id, record.created_at, new_features)
+
     except Exception as e:
         # 에러 발생 시 롤백 및 상태 변경
         await db.rollback()
@@ -156,6 +171,55 @@ async def process_voice_features(
         raise BackEndInternalError("특징 추출 과정에서 오류가 발생했습니다.")
 
 
+async def _save_features(db: AsyncSession, record: VoiceRecord, model, values: dict):
+    """서버 추출 값을 특징 테이블에 저장합니다.
+
+    장치 값이 저장된 녹음(표본 검증)이면 새 행을 만들지 않고 서버 값으로 덮어쓰며,
+    두 값의 최대 상대 오차를 feature_drift 에 기록합니다. 이전 서버 추출(재시도 등)로
+    이미 행이 있으면 검증으로 표시하지 않고 서버 값으로 덮어씁니다.
+    """
+    existing = await db.get(model, record.id)
+    if existing is None:
+        features = model(record_id=record.id, **values)
+        db.add(features)
+        record.feature_source = FeatureSourceEnum.SERVER
+        db.add(record)
+        return features
+
+    verifying = record.feature_source == FeatureSourceEnum.DEVICE
+    if verifying:
+        fields = device_features_service.feature_fields(record.type)
+        device_values = {name: getattr(existing, name) for name in fields}
+        drift = device_features_service.feature_drift(record.type, device_values, values)
+    for name, value in values.items():
+        setattr(existing, name, value)
+    db.add(existing)
+    if verifying:
+        record.feature_source = FeatureSourceEnum.DEVICE_VERIFIED
+        record.feature_drift = drift
+        device_features_service.record_verification(record.id, record.type, drift)
+    elif record.feature_source is None:
+        record.feature_source = FeatureSourceEnum.SERVER
+    db.add(record)
+    return existing
+
+
+async def complete_with_device_features(db: AsyncSession, record_id: int) -> None:
+    """장치가 보낸 특징으로 저장이 끝난 녹음을 서버 추출 없이 완료 처리합니다."""
+    record = await db.get(VoiceRecord, record_id)
+    if not record:
+        raise NotFoundError(f"음성 기록(ID: {record_id})을 찾을 수 없습니다.")
+    model = AhFeatures if record.type == RecordingTypeEnum.voice_ah else SentenceFeatures
+    features = await db.get(model, record_id)
+    if features is None:
+        # 장치 값이 없으면(예: 저장 직후 삭제) 기존처럼 서버에서 추출합니다.
+        raise NotFoundError(f"장치 특징 값(record_id: {record_id})이 없습니다.")
+
+    # 파일 상태를 완료로 변경 (대시보드 캐시 무효화도 여기서 함께 처리됩니다)
+    await update_voice_record_status(db, record_id, FileStatusEnum.COMPLETED)
+    await rollup_service.apply_rollup_safely(db, record.patient_id, record.created_at, features)
+
+
 # BackgroundTasks에서 실행될 비동기 폴링 함수
 async def poll_s3_file_status(
     s3_client,
@@ -164,10 +228,14 @@ async def poll_s3_file_status(
     interval_seconds: int = 5,
     timeout_seconds: int = DEFAULT_EXPIRES_IN, # 5분
     bucket_name: str = S3_BUCKET_NAME,
+    extract_features: bool = True,
 ):
     """
     S3 파일 존재 여부를 비동기적으로 폴링하고, 파일이 발견되면 후속 처리를 시작합니다.
     이 함수는 BackgroundTasks에 의해 실행됩니다.
+
+    extract_features=False 이면 업로드 요청과 함께 받은 장치 특징을 그대로 쓰고
+    음성 분석 서버 호출을 생략합니다. (device_features_service 참고)
     """
     start_time = time.time()
     
@@ -179,7 +247,13 @@ async def poll_s3_file_status(
                 # 1. 상태를 UPLOAD_COMPLETED로 변경
                 await update_voice_record_status(db, record_id, FileStatusEnum.UPLOAD_COMPLETED)
                 # 2. 특징 추출 및 분석 작업 실행
-                await process_voice_features(db, s3_client, record_id)
+                if extract_features:
+                    await process_voice_features(db, s3_client, record_id)
+                else:
+                    try:
+                        await complete_with_device_features(db, record_id)
+                    except NotFoundError:
+                        await process_voice_features(db, s3_client, record_id)
                 return  # 성공적으로 처리 후 함수 종료
 
             # time.sleep() 대신 asyncio.sleep()을 사용해야 이벤트 루프를 막지 않습니다.
@@ -1,14 +1,27 @@
 # app/services/dashboard_service.py
 
 from datetime import date, timedelta
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
+from app.services.rollup_service import AH_ROLLUP_METRICS, SENTENCE_ROLLUP_METRICS
+from app.services.users_service import list_order_service
+from padoc_common.models import Account, AhFeatures, PatientDoctorAccess, SentenceFeatures
+from padoc_common.models.enums import ConnectionStatusEnum, FileStatusEnum
 from padoc_common.models.voice_records import VoiceRecord
 from padoc_common.models.advanced_training_informations import AdvancedTrainingInformation
+from padoc_common.schemas.dashboard import DoctorOverviewResponse, PatientOverview, PendingPatient
+
+# 마지막 녹음일 계산에 포함하는 녹음 상태 (업로드되지 않았거나 실패한 녹음은 제외)
+OVERVIEW_RECORD_STATUSES = (
+    FileStatusEnum.UPLOAD_COMPLETED,
+    FileStatusEnum.PROCESSING,
+    FileStatusEnum.COMPLETED,
+)
 
 
 async def get_patient_training_history(
@@ -101,3 +114,139 @@ async def get_patient_voice_records(
 
     result = await db.execute(statement)
     return list(result.scalars().all())
+
+
+def _approved_patient_ids(doctor_id: int):
+    """의사와 승인된 연결이 있는 환자 ID 서브쿼리"""
+    return (
+        select(PatientDoctorAccess.patient_id)
+        .where(PatientDoctorAccess.doctor_id == doctor_id)
+        .where(PatientDoctorAccess.connection_status == ConnectionStatusEnum.APPROVED)
+    )
+
+
+def _latest_per_patient(patient_column, order_columns, columns, *joins, where=None):
+    """환자별로 가장 최근 한 행만 고르는 구문을 만듭니다. (ROW_NUMBER() 윈도 함수 사용)"""
+    row_number = func.row_number().over(
+        partition_by=patient_column,
+        order_by=[column.desc() for column in order_columns],
+    ).label("row_number")
+    ranked = select(patient_column.label("patient_id"), *columns, row_number)
+    for target, on_clause in joins:
+        ranked = ranked.join(target, on_clause)
+    if where is not None:
+        ranked = ranked.where(where)
+    ranked = ranked.subquery()
+    return select(ranked).where(ranked.c.row_number == 1)
+
+
+async def get_doctor_overview(db: AsyncSession, doctor_id: int) -> DoctorOverviewResponse:
+    """
+    의사의 환자 목록 화면에 필요한 환자별 요약을 한 번에 조회합니다.
+
+    환자 수와 관계없이 고정된 횟수(목록 순서 1회 + 요약 5회)의 쿼리만 실행합니다.
+    최근 값은 환자별 GROUP BY / ROW_NUMBER() 로 한 번에 구합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 의사의 계정 ID (account_id)입니다.
+
+    Returns:
+        저장된 목록 순서대로의 승인된 환자 요약과, 승인 대기 중인 환자 목록입니다.
+    """
+    doctor_id = int(doctor_id)
+    approved = _approved_patient_ids(doctor_id)
+
+    # 1. 저장된 목록 순서 (승인된 연결과 동기화됨)
+    patient_order = (await list_order_service.get_patient_order(db, doctor_id)).patient_order
+
+    # 2. 승인/대기 중인 연결과 환자 이름
+    connection_rows = (
+        await db.execute(
+            select(
+                PatientDoctorAccess.id,
+                PatientDoctorAccess.patient_id,
+                PatientDoctorAccess.connection_status,
+                Account.full_name,
+            )
+            .join(Account, Account.id == PatientDoctorAccess.patient_id)
+            .where(PatientDoctorAccess.doctor_id == doctor_id)
+            .where(
+                PatientDoctorAccess.connection_status.in_(
+                    (ConnectionStatusEnum.APPROVED, ConnectionStatusEnum.PENDING)
+                )
+            )
+            .order_by(PatientDoctorAccess.id)
+        )
+    ).all()
+
+    overviews: Dict[int, PatientOverview] = {}
+    pending: List[PendingPatient] = []
+    for connection_id, patient_id, connection_status, full_name in connection_rows:
+        if connection_status == ConnectionStatusEnum.APPROVED:
+            overviews[patient_id] = PatientOverview(patient_id=patient_id, full_name=full_name)
+        else:
+            pending.append(
+                PendingPatient(patient_id=patient_id, full_name=full_name, connection_id=connection_id)
+            )
+
+    if overviews:
+        # 3. 환자별 마지막 녹음 시각
+        last_records = await db.execute(
+            select(VoiceRecord.patient_id, func.max(VoiceRecord.created_at))
+            .where(VoiceRecord.patient_id.in_(approved))
+            .where(VoiceRecord.status.in_(OVERVIEW_RECORD_STATUSES))
+            .group_by(VoiceRecord.patient_id)
+        )
+        for patient_id, last_recorded_at in last_records.all():
+            if patient_id in overviews:
+                overviews[patient_id].last_recorded_at = last_recorded_at
+
+        # 4~5. 환자별 가장 최근 '아' / 문장 발성 분석 지표
+        for features_model, metrics in ((AhFeatures, AH_ROLLUP_METRICS), (SentenceFeatures, SENTENCE_ROLLUP_METRICS)):
+            statement = _latest_per_patient(
+                VoiceRecord.patient_id,
+                (VoiceRecord.created_at, VoiceRecord.id),
+                [getattr(features_model, column).label(metric) for metric, column in metrics.items()],
+                (features_model, features_model.record_id == VoiceRecord.id),
+                where=VoiceRecord.patient_id.in_(approved),
+            )
+            for row in (await db.execute(statement)).mappings().all():
+                overview = overviews.get(row["patient_id"])
+                if overview is not None:
+                    for metric in metrics:
+                        setattr(overview, metric, row[metric])
+
+        # 6. 환자별 가장 최근 심화 훈련 점수
+        statement = _latest_per_patient(
+            AdvancedTrainingInformation.patient_id,
+            (AdvancedTrainingInformation.created_at, AdvancedTrainingInformation.id),
+            [AdvancedTrainingInformation.avg_score, AdvancedTrainingInformation.created_at],
+            where=AdvancedTrainingInformation.patient_id.in_(approved),
+        )
+        for row in (await db.execute(statement)).mappings().all():
+            overview = overviews.get(row["patient_id"])
+            if overview is not None:
+                overview.last_avg_score = row["avg_score"]
+                overview.last_trained_at = row["created_at"]
+
+    # 저장된 순서대로 정렬하고, 순서에 아직 없는 환자는 뒤에 붙입니다.
+    ordered_ids = [pid for pid in patient_order if pid in overviews]
+    listed = set(ordered_ids)
+    ordered_ids += [pid for pid in overviews if pid not in listed]
+    return DoctorOverviewResponse(patients=[overviews[pid] for pid in ordered_ids], pending=pending)
+
+
+async def get_sentence_features_with_owner(
+    db: AsyncSession, record_id: int
+) -> Optional[Tuple[int, SentenceFeatures]]:
+    """녹음 ID 로 문장 특징과 녹음한 환자 ID 를 조회합니다. 문장 특징이 없으면 None 을 반환합니다."""
+    row = (
+        await db.execute(
+            select(VoiceRecord.patient_id, SentenceFeatures)
+            .join(SentenceFeatures, SentenceFeatures.record_id == VoiceRecord.id)
+            .where(VoiceRecord.id == record_id)
+        )
+    ).first()
+    return (row[0], row[1]) if row else None
+
@@ -0,0 +1,206 @@
+# app/services/device_features_service.py
+"""장치 계산 특징 저장과 서버 표본 검증
+
+장치(AIot)는 analyze_voice.py 로 jitter/shimmer/HNR/CPP/CSID 를 이미 계산합니다. 업로드 요청에
+device_features 를 함께 보내면 그 값을 바로 저장하고, 음성 분석 서버 호출을 생략합니다.
+
+장치 값은 서버 추출 값과 같은 AhFeatures / SentenceFeatures 열에 저장되므로, 서버와 같은 정의로
+계산한 값만 받습니다. (padoc_voice.extract_upload_features: 서버와 같은 디코딩, SERVER 파라미터)
+- parameter_set 이 PARAMETER_SET("server")이 아니거나, 녹음 유형의 지표가 하나라도 빠지면
+  validate_device_features 가 요청을 거절합니다. (장치 화면용 DEVICE 파라미터 값은 받지 않습니다)
+
+서버 재추출(검증)은 다음 경우에만 합니다.
+- 무작위 표본: DEVICE_FEATURES_VERIFY_RATE 비율 (기본 10%)
+- 값이 범위를 벗어난 경우 (PLAUSIBLE_RANGES, F0 최소 ≤ 평균 ≤ 최대)
+  이 경우에는 장치 값을 저장하지 않고 기존처럼 서버 추출 값만 저장합니다.
+
+표본 검증에서는 서버 값으로 교체하고, 두 값의 최대 상대 오차(feature_drift)를 기록합니다.
+DEVICE_FEATURES_DRIFT_TOLERANCE 를 넘으면 로그를 남기며, /metrics 의
+padoc_device_feature_drift_ratio 로 장치와 서버 계산의 차이를 추적할 수 있습니다.
+"""
+
+import math
+import os
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from padoc_common.metrics import DEVICE_FEATURE_DRIFT, DEVICE_FEATURE_UPLOADS
+from padoc_common.models import AhFeatures, SentenceFeatures
+from padoc_common.models.enums import FeatureSourceEnum, RecordingTypeEnum
+from padoc_common.models.voice_records import VoiceRecord
+from padoc_common.exceptions import BadRequestError, NotFoundError
+from padoc_common.schemas.training import DeviceFeatures
+
+# 받을 수 있는 장치 값의 파라미터 묶음 이름 (padoc_voice.params.SERVER.name, 서버 추출과 같은 정의)
+PARAMETER_SET = "server"
+# 장치 값을 받은 업로드 중 서버가 다시 추출해 비교하는 비율 (0 ~ 1)
+VERIFY_RATE = float(os.getenv("DEVICE_FEATURES_VERIFY_RATE", "0.1"))
+# 이 상대 오차를 넘으면 장치/서버 계산이 어긋난 것으로 보고 로그를 남깁니다.
+DRIFT_TOLERANCE = float(os.getenv("DEVICE_FEATURES_DRIFT_TOLERANCE", "0.2"))
+
+# 업로드 처리 방식
+DECISION_DEVICE = "device"    # 장치 값 저장, 서버 추출 생략
+DECISION_VERIFY = "verify"    # 장치 값 저장, 서버가 다시 추출해 비교 후 교체
+DECISION_SERVER = "server"    # 장치 값이 비정상이라 저장하지 않고 서버 추출 (기존 방식)
+
+AH_FIELDS = (
+    "jitter_local", "jitter_rap", "jitter_ppq5", "jitter_ddp",
+    "shimmer_local", "shimmer_apq3", "shimmer_apq5", "shimmer_apq11", "shimmer_dda",
+    "hnr", "nhr", "f0", "max_f0", "min_f0",
+)
+SENTENCE_FIELDS = ("cpp", "csid")
+
+# 사람 목소리에서 나올 수 있는 값의 범위 (Praat 단위: jitter/shimmer 는 비율, F0 는 Hz, HNR/CPP 는 dB)
+PLAUSIBLE_RANGES: Dict[str, Tuple[float, float]] = {
+    "jitter_local": (0.0, 0.2),
+    "jitter_rap": (0.0, 0.2),
+    "jitter_ppq5": (0.0, 0.2),
+    "jitter_ddp": (0.0, 0.6),
+    "shimmer_local": (0.0, 0.6),
+    "shimmer_apq3": (0.0, 0.6),
+    "shimmer_apq5": (0.0, 0.6),
+    "shimmer_apq11": (0.0, 1.0),
+    "shimmer_dda": (0.0, 1.8),
+    "hnr": (-20.0, 50.0),
+    "nhr": (0.0, 100.0),
+    "f0": (60.0, 650.0),
+    "max_f0": (60.0, 650.0),
+    "min_f0": (60.0, 650.0),
+    "cpp": (0.0, 40.0),
+    "csid": (-100.0, 200.0),
+}
+
+# 상대 오차를 계산할 때 분모의 최솟값 (0 에 가까운 값에서 오차가 과장되지 않도록)
+DRIFT_SCALE_FLOOR: Dict[str, float] = {
+    **{name: 0.005 for name in AH_FIELDS if name.startswith("jitter_")},
+    **{name: 0.02 for name in AH_FIELDS if name.startswith("shimmer_")},
+    "hnr": 1.0,
+    "nhr": 0.01,
+    "f0": 10.0,
+    "max_f0": 10.0,
+    "min_f0": 10.0,
+    "cpp": 1.0,
+    "csid": 5.0,
+}
+
+
+def feature_fields(recording_type: RecordingTypeEnum) -> Tuple[str, ...]:
+    """녹음 유형에 해당하는 특징 필드 이름"""
+    if recording_type == RecordingTypeEnum.voice_ah:
+        return AH_FIELDS
+    if recording_type == RecordingTypeEnum.voice_sentence:
+        return SENTENCE_FIELDS
+    return ()
+
+
+def missing_fields(recording_type: RecordingTypeEnum, values: Dict[str, Optional[float]]) -> List[str]:
+    """녹음 유형의 지표 중 값이 없는 필드 이름 목록"""
+    return [name for name in feature_fields(recording_type) if values.get(name) is None]
+
+
+def validate_device_features(recording_type: RecordingTypeEnum, device_features: DeviceFeatures) -> None:
+    """서버 추출 값과 같은 열에 저장할 수 있는 장치 값인지 확인합니다.
+
+    Raises:
+        BadRequestError: 특징 테이블이 없는 녹음 유형이거나, 서버와 다른 파라미터로 계산했거나,
+            녹음 유형의 지표가 하나라도 빠진 경우 발생합니다.
+    """
+    if not feature_fields(recording_type):
+        raise BadRequestError(f"{recording_type.value} 녹음은 장치 특징 값을 받지 않습니다.")
+    if device_features.parameter_set != PARAMETER_SET:
+        raise BadRequestError(
+            f"장치 특징 값은 '{PARAMETER_SET}' 파라미터로 계산해야 합니다. (받은 값: {device_features.parameter_set})"
+        )
+    missing = missing_fields(recording_type, device_features.model_dump())
+    if missing:
+        raise BadRequestError(f"장치 특징 값이 빠졌습니다: {', '.join(missing)}")
+
+
+def implausible_fields(recording_type: RecordingTypeEnum, values: Dict[str, Optional[float]]) -> List[str]:
+    """비어 있거나 범위를 벗어난 필드 이름 목록을 반환합니다. (빈 목록이면 정상)"""
+    problems = missing_fields(recording_type, values)
+    for name in feature_fields(recording_type):
+        value = values.get(name)
+        if value is None or name in problems:
+            continue
+        low, high = PLAUSIBLE_RANGES[name]
+        if not math.isfinite(value) or not low <= value <= high:
+            problems.append(name)
+
+    f0, max_f0, min_f0 = values.get("f0"), values.get("max_f0"), values.get("min_f0")
+    if None not in (f0, max_f0, min_f0) and not min_f0 <= f0 <= max_f0:
+        problems.append("f0_order")
+    return problems
+
+
+def decide(
+    recording_type: RecordingTypeEnum,
+    values: Dict[str, Optional[float]],
+    verify_rate: Optional[float] = None,
+    rng: Callable[[], float] = random.random,
+) -> str:
+    """장치 값을 어떻게 처리할지 정합니다. (DECISION_DEVICE / DECISION_VERIFY / DECISION_SERVER)"""
+    if not feature_fields(recording_type) or implausible_fields(recording_type, values):
+        return DECISION_SERVER
+    if rng() < (VERIFY_RATE if verify_rate is None else verify_rate):
+        return DECISION_VERIFY
+    return DECISION_DEVICE
+
+
+async def store_device_features(
+    db: AsyncSession,
+    record_id: int,
+    recording_type: RecordingTypeEnum,
+    device_features: DeviceFeatures,
+) -> str:
+    """장치 값을 검사해 저장하고, 처리 방식을 반환합니다.
+
+    validate_device_features 를 통과한 값이어야 합니다. DECISION_SERVER 이면 아무것도 저장하지 않습니다. 나머지는 특징 행을 만들고
+    feature_source 를 DEVICE 로 표시합니다. (녹음 상태는 파일 업로드 확인 후 완료로 바뀝니다)
+    """
+    fields = feature_fields(recording_type)
+    values = device_features.model_dump(include=set(fields))
+    decision = decide(recording_type, values)
+    DEVICE_FEATURE_UPLOADS.inc(type=recording_type.value, decision=decision)
+    if decision == DECISION_SERVER:
+        print(f"장치 특징 값이 비정상이라 서버에서 추출합니다 (record_id: {record_id}): "
+              f"{implausible_fields(recording_type, values)}")
+        return decision
+
+    record = await db.get(VoiceRecord, record_id)
+    if record is None:
+        raise NotFoundError(f"음성 기록(ID: {record_id})을 찾을 수 없습니다.")
+
+    model = AhFeatures if recording_type == RecordingTypeEnum.voice_ah else SentenceFeatures
+    db.add(model(record_id=record_id, **values))
+    record.feature_source = FeatureSourceEnum.DEVICE
+    db.add(record)
+    await db.commit()
+    return decision
+
+
+def feature_drift(
+    recording_type: RecordingTypeEnum,
+    device_values: Dict[str, Optional[float]],
+    server_values: Dict[str, Optional[float]],
+) -> Optional[float]:
+    """양쪽에 모두 있는 필드의 최대 상대 오차. 비교할 필드가 없으면 None 입니다."""
+    drift = None
+    for name in feature_fields(recording_type):
+        device, server = device_values.get(name), server_values.get(name)
+        if device is None or server is None or not (math.isfinite(device) and math.isfinite(server)):
+            continue
+        relative = abs(device - server) / max(abs(server), DRIFT_SCALE_FLOOR[name])
+        drift = relative if drift is None else max(drift, relative)
+    return drift
+
+
+def record_verification(record_id: int, recording_type: RecordingTypeEnum, drift: Optional[float]) -> None:
+    """표본 검증 결과를 /metrics 에 기록하고, 허용 오차를 넘으면 로그를 남깁니다."""
+    if drift is None:
+        return
+    DEVICE_FEATURE_DRIFT.observe(drift, type=recording_type.value)
+    if drift > DRIFT_TOLERANCE:
+        print(f"장치/서버 특징 값 차이가 큽니다 (record_id: {record_id}, drift: {drift:.3f})")
@@ -0,0 +1,214 @@
+# app/services/export_service.py
+"""환자 음성 특징 이력 대량 내보내기 (CSV / NDJSON / Parquet)
+
+VoiceRecord 와 AhFeatures/SentenceFeatures 를 조인한 행을 서버 측 커서(stream_results)로
+EXPORT_CHUNK_ROWS 개씩 읽어 바로 직렬화하여 내보냅니다. ORM 객체나 응답 모델을 만들지 않고,
+한 번에 한 묶음만 메모리에 올리므로 환자의 녹음 수와 관계없이 메모리 사용량이 일정합니다.
+
+Parquet 은 pyarrow 가 설치된 경우에만 지원하며, 묶음마다 하나의 row group 으로 씁니다.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from padoc_common.models import AhFeatures, SentenceFeatures
+from padoc_common.models.enums import FileStatusEnum
+from padoc_common.models.voice_records import VoiceRecord
+import padoc_common.exceptions as exc
+
+# 서버 측 커서에서 한 번에 가져와 직렬화하는 행 수
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "1000"))
+
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+AH_EXPORT_COLUMNS = (
+    "jitter_local", "jitter_rap", "jitter_ppq5", "jitter_ddp",
+    "shimmer_local", "shimmer_apq3", "shimmer_apq5", "shimmer_apq11", "shimmer_dda",
+    "hnr", "nhr", "f0", "max_f0", "min_f0",
+)
+SENTENCE_EXPORT_COLUMNS = ("cpp", "csid")
+
+# 내보내는 열 순서 (모든 형식 공통)
+EXPORT_COLUMNS = (
+    ("record_id", VoiceRecord.id),
+    ("patient_id", VoiceRecord.patient_id),
+    ("recording_type", VoiceRecord.type),
+    ("created_at", VoiceRecord.created_at),
+    *((name, getattr(AhFeatures, name)) for name in AH_EXPORT_COLUMNS),
+    *((name, getattr(SentenceFeatures, name)) for name in SENTENCE_EXPORT_COLUMNS),
+)
+EXPORT_COLUMN_NAMES = tuple(name for name, _ in EXPORT_COLUMNS)
+
+
+def build_export_statement(patient_ids: Sequence[int], start_date: Optional[date], end_date: Optional[date]):
+    """분석이 끝난(COMPLETED) 녹음의 특징을 환자, 녹음 시각 순서로 조회하는 쿼리를 만듭니다."""
+    statement = (
+        select(*(column.label(name) for name, column in EXPORT_COLUMNS))
+        .select_from(VoiceRecord)
+        .outerjoin(AhFeatures, AhFeatures.record_id == VoiceRecord.id)
+        .outerjoin(SentenceFeatures, SentenceFeatures.record_id == VoiceRecord.id)
+        .where(VoiceRecord.patient_id.in_(patient_ids))
+        .where(VoiceRecord.status == FileStatusEnum.COMPLETED)
+        .order_by(VoiceRecord.patient_id, VoiceRecord.created_at, VoiceRecord.id)
+    )
+    if start_date:
+        statement = statement.where(VoiceRecord.created_at >= start_date)
+    if end_date:
+        statement = statement.where(VoiceRecord.created_at < end_date + timedelta(days=1))
+    return statement
+
+
+async def iter_export_chunks(
+    db: AsyncSession, patient_ids: Sequence[int], start_date: Optional[date], end_date: Optional[date]
+) -> AsyncIterator[List[tuple]]:
+    """서버 측 커서로 EXPORT_CHUNK_ROWS 개씩 행 묶음을 반환합니다."""
+    if not patient_ids:
+        return
+    statement = build_export_statement(patient_ids, start_date, end_date).execution_options(
+        yield_per=EXPORT_CHUNK_ROWS
+    )
+    result = await db.stream(statement)
+    try:
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+    finally:
+        await result.close()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_chunk(rows: Iterable[tuple], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_COLUMN_NAMES)
+    writer.writerows(("" if value is None else _plain(value) for value in row) for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunk(rows: Iterable[tuple]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMN_NAMES, map(_plain, row))), ensure_ascii=False) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 가 쓴 바이트를 모아 두었다가 꺼내 가는 출력 스트림
+
+    Parquet 푸터에는 절대 위치가 기록되므로, 버퍼를 비워도 tell() 은 지금까지 쓴 전체 크기를 반환합니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _load_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def check_format_available(export_format: str) -> None:
+    """요청한 형식을 이 서버에서 만들 수 없으면 BadRequestError 를 발생시킵니다."""
+    if export_format == "parquet" and _load_pyarrow() is None:
+        raise exc.BadRequestError(message="이 서버에는 pyarrow 가 설치되어 있지 않아 parquet 형식을 지원하지 않습니다.")
+
+
+def _parquet_schema(pa):
+    fields = [
+        pa.field("record_id", pa.int64()),
+        pa.field("patient_id", pa.int64()),
+        pa.field("recording_type", pa.string()),
+        pa.field("created_at", pa.timestamp("us")),
+    ]
+    fields += [pa.field(name, pa.float64()) for name in AH_EXPORT_COLUMNS + SENTENCE_EXPORT_COLUMNS]
+    return pa.schema(fields)
+
+
+async def _parquet_stream(chunks: AsyncIterator[List[tuple]]) -> AsyncIterator[bytes]:
+    pa = _load_pyarrow()
+    schema = _parquet_schema(pa)
+    sink = _ChunkSink()
+    writer = pa.parquet.ParquetWriter(sink, schema)
+    try:
+        async for rows in chunks:
+            columns = list(zip(*rows))
+            columns[2] = [_plain(value) for value in columns[2]]
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+async def stream_export(
+    session_maker: async_sessionmaker,
+    export_format: str,
+    patient_ids: Sequence[int],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> AsyncIterator[bytes]:
+    """내보내기 응답 본문을 묶음 단위 바이트로 반환합니다.
+
+    스트리밍 응답은 요청 처리 함수가 끝난 뒤에 본문을 만들므로, 본문을 보내는 동안 쓸 세션을
+    여기서 직접 열고 닫습니다.
+    """
+    async with session_maker() as db:
+        chunks = iter_export_chunks(db, patient_ids, start_date, end_date)
+        if export_format == "parquet":
+            async for data in _parquet_stream(chunks):
+                if data:
+                    yield data
+            return
+
+        serialize: Callable[[List[tuple]], bytes] = _ndjson_chunk
+        if export_format == "csv":
+            yield _csv_chunk((), header=True)
+            serialize = _csv_chunk
+        async for rows in chunks:
+            yield serialize(rows)
@@ -1,4 +1,16 @@
-from padoc_common.schemas.features import AhFeatures as AhFeaturesResponse, FlatAhFeatures
+import math
+from typing import List, Optional, Sequence, Tuple
+
+from padoc_common.downsampling import downsample, lttb
+from padoc_common.models import SentenceFeatures
+from padoc_common.sampling_codec import SamplingSeries, encode_sampling_data
+from padoc_common.schemas.dashboard import DownsampledSeries, SamplingSeriesResponse
+from padoc_common.schemas.features import (
+    AhFeatures as AhFeaturesResponse,
+    FlatAhFeatures,
+    SamplingData,
+    SentenceFeatures as SentenceFeaturesResponse,
+)
 
 
 def flatten_ah_features(nested_response: AhFeaturesResponse) -> FlatAhFeatures:
@@ -58,4 +70,89 @@ def nest_ah_features(flat_response: FlatAhFeatures) -> AhFeaturesResponse:
     nested_data["jitter"] = jitter_data
     nested_data["shimmer"] = shimmer_data
     
-    return AhFeaturesResponse(**nested_data)
\ No newline at end of file
+    return AhFeaturesResponse(**nested_data)
+
+
+def _column(values: Sequence[float]) -> List[Optional[float]]:
+    return [None if math.isnan(value) else value for value in values]
+
+
+def build_sentence_features(features: SentenceFeatures) -> SentenceFeaturesResponse:
+    """SentenceFeatures DB 객체를 응답 스키마로 변환합니다.
+
+    이진 형식으로 저장된 energy/frequency 열을 프레임별 딕셔너리로 펼치지 않고 그대로 응답하며,
+    값은 DB 에 저장할 때 이미 검증했으므로 model_construct 로 검증 없이 만듭니다.
+    아직 이진 형식으로 옮기지 않은 행은 JSON 값을 같은 열 형식으로 변환합니다.
+    """
+    series = features.sampling_series()
+    if series is None:
+        series = SamplingSeries(encode_sampling_data(features.sampling_data or {}, compress=False))
+
+    sampling_data = SamplingData.model_construct(
+        sampling_rate=series.sampling_rate,
+        start_time=series.start_time,
+        time_step=series.time_step,
+        energy=_column(series.energy),
+        frequency=_column(series.frequency),
+    )
+    return SentenceFeaturesResponse.model_construct(
+        cpp=features.cpp, csid=features.csid, sampling_data=sampling_data
+    )
+
+
+def _downsampled(indices: Sequence[int], values: Sequence[Optional[float]]) -> DownsampledSeries:
+    return DownsampledSeries.model_construct(
+        index=list(indices),
+        values=[None if value is None or math.isnan(value) else value for value in values],
+    )
+
+
+def _from_lod_level(
+    indices: Sequence[int], values: Sequence[float], points: int
+) -> Tuple[List[int], List[float]]:
+    """저장된 LOD 단계를 points 개로 한 번 더 줄입니다. (x 좌표는 원본 프레임 번호)"""
+    if points >= len(indices):
+        return list(indices), list(values)
+    positions = lttb(values, points, xs=indices)
+    return [indices[i] for i in positions], [values[i] for i in positions]
+
+
+def build_sampling_series(
+    features: SentenceFeatures, points: int, method: str = "lttb"
+) -> Optional[SamplingSeriesResponse]:
+    """문장 발성 시계열을 points 개 이하로 줄여 응답 스키마로 변환합니다.
+
+    LTTB 요청은 저장된 LOD 피라미드에서 points 이상인 가장 작은 단계를 골라 사용하므로
+    원본 시계열을 풀지 않습니다. LOD 가 없는 행(이전 데이터)이나 min/max 요청은 원본에서 계산합니다.
+    시계열이 없으면 None 을 반환합니다.
+    """
+    series = features.sampling_series()
+    if series is None:
+        if not features.sampling_data:
+            return None
+        series = SamplingSeries(encode_sampling_data(features.sampling_data))
+
+    energy = frequency = None
+    lod = features.sampling_lod_levels()
+    if method == "lttb" and points < series.count and lod is not None and lod.source_count == series.count:
+        target = next((level for level in lod.targets() if level >= points), None)
+        if target is not None:
+            (energy_idx, energy_val), (frequency_idx, frequency_val) = lod.level(target)
+            energy = _downsampled(*_from_lod_level(energy_idx, energy_val, points))
+            frequency = _downsampled(*_from_lod_level(frequency_idx, frequency_val, points))
+
+    if energy is None:
+        energy = _downsampled(*downsample(series.energy, points, method))
+        frequency = _downsampled(*downsample(series.frequency, points, method))
+
+    return SamplingSeriesResponse.model_construct(
+        record_id=features.record_id,
+        method=method,
+        source_points=series.count,
+        sampling_rate=series.sampling_rate,
+        start_time=series.start_time,
+        time_step=series.time_step,
+        energy=energy,
+        frequency=frequency,
+    )
+
@@ -0,0 +1,429 @@
+# app/services/rollup_service.py
+"""환자별 음성 특징 / 심화 훈련 점수의 일·주 단위 집계(rollup) 서비스 로직"""
+
+import math
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from padoc_common.models import (
+    AdvancedTrainingInformation,
+    AhFeatures,
+    PatientFeatureRollup,
+    SentenceFeatures,
+    VoiceRecord,
+)
+from padoc_common.models.enums import RollupPeriodEnum
+from padoc_common.schemas.dashboard import MetricSummary, TrendBucket, TrendResponse
+
+
+# 조회 기간이 이 일수 이상이면 원본 대신 집계 테이블을 읽습니다.
+ROLLUP_THRESHOLD_DAYS = int(os.getenv("ROLLUP_THRESHOLD_DAYS", "31"))
+
+# 집계 지표 이름 -> 원본 모델의 컬럼 이름
+AH_ROLLUP_METRICS = {
+    "jitter": "jitter_local",
+    "shimmer": "shimmer_local",
+    "hnr": "hnr",
+    "f0": "f0",
+}
+SENTENCE_ROLLUP_METRICS = {
+    "cpp": "cpp",
+    "csid": "csid",
+}
+TRAINING_ROLLUP_METRICS = {
+    "avg_score": "avg_score",
+}
+
+RollupSource = Union[AhFeatures, SentenceFeatures, AdvancedTrainingInformation]
+# (집계 단위, 시작일, 지표) -> {"count", "total", "min", "max"}
+Aggregates = Dict[Tuple[RollupPeriodEnum, date, str], dict]
+
+
+# --- 보조 함수 ---
+
+
+def _period_start(day: date, period: RollupPeriodEnum) -> date:
+    """날짜가 속한 집계 구간의 시작일을 반환합니다. (주 단위는 월요일 시작)"""
+    if period == RollupPeriodEnum.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _period_end(day: date, period: RollupPeriodEnum) -> date:
+    """날짜가 속한 집계 구간의 마지막 날을 반환합니다."""
+    if period == RollupPeriodEnum.WEEK:
+        return _period_start(day, period) + timedelta(days=6)
+    return day
+
+
+def _to_date(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def extract_rollup_values(source: RollupSource) -> Dict[str, float]:
+    """원본 레코드에서 집계 대상 지표 값만 추출합니다. (None, NaN 값은 제외)"""
+    if isinstance(source, AhFeatures):
+        mapping = AH_ROLLUP_METRICS
+    elif isinstance(source, SentenceFeatures):
+        mapping = SENTENCE_ROLLUP_METRICS
+    elif isinstance(source, AdvancedTrainingInformation):
+        mapping = TRAINING_ROLLUP_METRICS
+    else:
+        raise ValueError(f"집계할 수 없는 레코드 타입입니다: {type(source).__name__}")
+
+    values = {}
+    for metric, column in mapping.items():
+        value = getattr(source, column, None)
+        if value is not None and math.isfinite(float(value)):
+            values[metric] = float(value)
+    return values
+
+
+def _accumulate(aggregates: Aggregates, day: date, values: Dict[str, float]) -> None:
+    """하나의 원본 값을 일/주 단위 누적값에 반영합니다."""
+    for period in RollupPeriodEnum:
+        start = _period_start(day, period)
+        for metric, value in values.items():
+            acc = aggregates.setdefault(
+                (period, start, metric), {"count": 0, "total": 0.0, "min": None, "max": None}
+            )
+            acc["count"] += 1
+            acc["total"] += value
+            acc["min"] = value if acc["min"] is None else min(acc["min"], value)
+            acc["max"] = value if acc["max"] is None else max(acc["max"], value)
+
+
+def _build_buckets(aggregates: Aggregates, period: RollupPeriodEnum) -> List[TrendBucket]:
+    """누적값을 시작일 오름차순의 TrendBucket 리스트로 변환합니다."""
+    grouped: Dict[date, List[MetricSummary]] = {}
+    for (acc_period, start, metric), acc in sorted(aggregates.items(), key=lambda item: (item[0][1], item[0][2])):
+        if acc_period != period or acc["count"] == 0:
+            continue
+        grouped.setdefault(start, []).append(
+            MetricSummary(
+                metric=metric,
+                mean=acc["total"] / acc["count"],
+                min=acc["min"],
+                max=acc["max"],
+                count=acc["count"],
+            )
+        )
+    return [TrendBucket(period_start=start, metrics=metrics) for start, metrics in grouped.items()]
+
+
+# --- 증분 갱신 ---
+
+
+async def apply_rollup(
+    db: AsyncSession,
+    patient_id: int,
+    occurred_at: Union[date, datetime],
+    source: RollupSource,
+) -> None:
+    """새로 저장된 원본 레코드 하나를 일/주 단위 집계에 반영합니다.
+
+    같은 환자/날짜의 집계가 동시에 갱신되어도 값이 유실되지 않도록, 읽고 고쳐 쓰는 대신
+    INSERT ... ON DUPLICATE KEY UPDATE (SQLite 는 ON CONFLICT DO UPDATE) 한 문장으로
+    DB 가 기존 값에 더하게 합니다. 커밋은 호출하는 쪽에서 수행합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        patient_id: 레코드의 환자 계정 ID입니다.
+        occurred_at: 레코드 생성 시각입니다.
+        source: AhFeatures, SentenceFeatures 또는 AdvancedTrainingInformation 객체입니다.
+    """
+    values = extract_rollup_values(source)
+    if not values:
+        return
+
+    day = _to_date(occurred_at)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "patient_id": patient_id,
+            "period": period,
+            "period_start": _period_start(day, period),
+            "metric": metric,
+            "count": 1,
+            "total": value,
+            "min_value": value,
+            "max_value": value,
+            "updated_at": now,
+        }
+        for period in RollupPeriodEnum
+        for metric, value in values.items()
+    ]
+    await db.execute(_upsert_rollups_statement(db, rows))
+
+
+def _upsert_rollups_statement(db: AsyncSession, rows: List[dict]):
+    """집계 행을 추가하거나, 이미 있으면 개수/합계/최솟값/최댓값을 DB 에서 누적하는 문장"""
+    table = PatientFeatureRollup.__table__
+    c = table.c
+    is_sqlite = db.get_bind().dialect.name == "sqlite"
+
+    if is_sqlite:
+        # SQLite 는 인자가 두 개인 min()/max() 가 스칼라 함수입니다.
+        statement = sqlite_insert(table).values(rows)
+        new, least, greatest = statement.excluded, func.min, func.max
+    else:
+        statement = mysql_insert(table).values(rows)
+        new, least, greatest = statement.inserted, func.least, func.greatest
+
+    accumulated = {
+        "count": c.count + new.count,
+        "total": c.total + new.total,
+        # 기존 값이 NULL 이면 LEAST/GREATEST 결과도 NULL 이므로 새 값으로 대신합니다.
+        "min_value": least(func.coalesce(c.min_value, new.min_value), new.min_value),
+        "max_value": greatest(func.coalesce(c.max_value, new.max_value), new.max_value),
+        "updated_at": new.updated_at,
+    }
+    if is_sqlite:
+        return statement.on_conflict_do_update(
+            index_elements=[c.patient_id, c.period, c.period_start, c.metric],
+            set_=accumulated,
+        )
+    return statement.on_duplicate_key_update(accumulated)
+
+
+async def apply_rollup_safely(
+    db: AsyncSession,
+    patient_id: int,
+    occurred_at: Union[date, datetime],
+    source: RollupSource,
+) -> None:
+    """원본 저장이 끝난 뒤 집계를 갱신하고 커밋합니다.
+
+    집계 갱신 실패가 원본 저장을 되돌리지 않도록 별도 트랜잭션으로 처리하며,
+    실패 시 롤백 후 로그만 남깁니다. 누락된 집계는 backfill_rollups로 복구합니다.
+    """
+    try:
+        await apply_rollup(db, patient_id, occurred_at, source)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        print(f"집계 갱신 실패 (patient_id: {patient_id}): {e}")
+
+
+# --- 원본 데이터 집계 ---
+
+
+async def aggregate_raw(
+    db: AsyncSession,
+    patient_id: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Dict[int, Aggregates]:
+    """원본 테이블에서 직접 일/주 단위 집계를 계산합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        patient_id: 집계할 환자 ID입니다. None이면 모든 환자를 집계합니다.
+        start_date: 조회 시작일입니다. (포함)
+        end_date: 조회 종료일입니다. (포함)
+
+    Returns:
+        환자 ID별 누적값 딕셔너리를 반환합니다.
+    """
+    sources = [
+        (AhFeatures, VoiceRecord.patient_id, VoiceRecord.created_at, AH_ROLLUP_METRICS),
+        (SentenceFeatures, VoiceRecord.patient_id, VoiceRecord.created_at, SENTENCE_ROLLUP_METRICS),
+        (
+            AdvancedTrainingInformation,
+            AdvancedTrainingInformation.patient_id,
+            AdvancedTrainingInformation.created_at,
+            TRAINING_ROLLUP_METRICS,
+        ),
+    ]
+
+    result: Dict[int, Aggregates] = {}
+    for model, patient_col, created_col, mapping in sources:
+        metrics = list(mapping)
+        columns = [getattr(model, column) for column in mapping.values()]
+        statement = select(patient_col, created_col, *columns)
+        if model is not AdvancedTrainingInformation:
+            statement = statement.join(model, model.record_id == VoiceRecord.id)
+        if patient_id is not None:
+            statement = statement.where(patient_col == patient_id)
+        if start_date is not None:
+            statement = statement.where(created_col >= start_date)
+        if end_date is not None:
+            statement = statement.where(created_col < end_date + timedelta(days=1))
+
+        for row in (await db.execute(statement)).all():
+            row_patient_id, created_at, *raw_values = row
+            values = {
+                metric: float(value)
+                for metric, value in zip(metrics, raw_values)
+                if value is not None and math.isfinite(float(value))
+            }
+            if values:
+                _accumulate(result.setdefault(row_patient_id, {}), _to_date(created_at), values)
+    return result
+
+
+# --- 조회 ---
+
+
+async def get_patient_trends(
+    db: AsyncSession,
+    patient_id: int,
+    period: RollupPeriodEnum,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> TrendResponse:
+    """환자의 지표 추이를 일/주 단위로 조회합니다.
+
+    기간이 ROLLUP_THRESHOLD_DAYS 이상이거나 지정되지 않은 경우 집계 테이블을 읽고,
+    짧은 기간은 원본 테이블에서 바로 계산합니다. 두 경로 모두 구간 경계(주 단위는
+    월요일~일요일)에 맞춰 기간을 확장하므로 같은 결과를 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        patient_id: 조회할 환자의 계정 ID입니다.
+        period: 집계 단위 (day 또는 week) 입니다.
+        start_date: 조회 시작일입니다.
+        end_date: 조회 종료일입니다.
+
+    Returns:
+        구간별 지표 집계가 담긴 TrendResponse 객체를 반환합니다.
+    """
+    if start_date is not None:
+        start_date = _period_start(start_date, period)
+    if end_date is not None:
+        end_date = _period_end(end_date, period)
+
+    use_rollup = (
+        start_date is None
+        or end_date is None
+        or (end_date - start_date).days + 1 >= ROLLUP_THRESHOLD_DAYS
+    )
+
+    if not use_rollup:
+        aggregates = (await aggregate_raw(db, patient_id, start_date, end_date)).get(patient_id, {})
+        return TrendResponse(period=period, source="raw", buckets=_build_buckets(aggregates, period))
+
+    statement = (
+        select(PatientFeatureRollup)
+        .where(PatientFeatureRollup.patient_id == patient_id)
+        .where(PatientFeatureRollup.period == period)
+    )
+    if start_date is not None:
+        statement = statement.where(PatientFeatureRollup.period_start >= start_date)
+    if end_date is not None:
+        statement = statement.where(PatientFeatureRollup.period_start <= end_date)
+
+    aggregates: Aggregates = {
+        (row.period, row.period_start, row.metric): {
+            "count": row.count,
+            "total": row.total,
+            "min": row.min_value,
+            "max": row.max_value,
+        }
+        for row in (await db.execute(statement)).scalars().all()
+    }
+    return TrendResponse(period=period, source="rollup", buckets=_build_buckets(aggregates, period))
+
+
+# --- 백필 및 정합성 검사 ---
+
+
+async def backfill_rollups(db: AsyncSession, patient_id: Optional[int] = None) -> int:
+    """원본 데이터로부터 집계 테이블을 다시 만듭니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        patient_id: 다시 만들 환자 ID입니다. None이면 모든 환자를 대상으로 합니다.
+
+    Returns:
+        새로 저장된 집계 행의 개수를 반환합니다.
+    """
+    aggregates_by_patient = await aggregate_raw(db, patient_id)
+
+    statement = delete(PatientFeatureRollup)
+    if patient_id is not None:
+        statement = statement.where(PatientFeatureRollup.patient_id == patient_id)
+    await db.execute(statement)
+
+    rows = [
+        PatientFeatureRollup(
+            patient_id=row_patient_id,
+            period=period,
+            period_start=start,
+            metric=metric,
+            count=acc["count"],
+            total=acc["total"],
+            min_value=acc["min"],
+            max_value=acc["max"],
+        )
+        for row_patient_id, aggregates in aggregates_by_patient.items()
+        for (period, start, metric), acc in aggregates.items()
+    ]
+    db.add_all(rows)
+    await db.commit()
+    return len(rows)
+
+
+async def check_rollup_consistency(
+    db: AsyncSession, patient_id: Optional[int] = None, tolerance: float = 1e-6
+) -> List[dict]:
+    """집계 테이블과 원본 데이터를 비교하여 어긋난 항목 목록을 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        patient_id: 검사할 환자 ID입니다. None이면 모든 환자를 검사합니다.
+        tolerance: 합계/최솟값/최댓값 비교 시 허용 오차입니다.
+
+    Returns:
+        불일치 항목 딕셔너리의 리스트를 반환합니다. 비어 있으면 정합성이 맞는 상태입니다.
+    """
+    expected_by_patient = await aggregate_raw(db, patient_id)
+
+    statement = select(PatientFeatureRollup)
+    if patient_id is not None:
+        statement = statement.where(PatientFeatureRollup.patient_id == patient_id)
+    actual_by_patient: Dict[int, Aggregates] = {}
+    for row in (await db.execute(statement)).scalars().all():
+        actual_by_patient.setdefault(row.patient_id, {})[(row.period, row.period_start, row.metric)] = {
+            "count": row.count,
+            "total": row.total,
+            "min": row.min_value,
+            "max": row.max_value,
+        }
+
+    def _differs(a: Optional[float], b: Optional[float]) -> bool:
+        if a is None or b is None:
+            return a is not b
+        return abs(a - b) > tolerance * max(1.0, abs(a), abs(b))
+
+    mismatches = []
+    for row_patient_id in set(expected_by_patient) | set(actual_by_patient):
+        expected = expected_by_patient.get(row_patient_id, {})
+        actual = actual_by_patient.get(row_patient_id, {})
+        for key in set(expected) | set(actual):
+            exp, act = expected.get(key), actual.get(key)
+            if (
+                exp is None
+                or act is None
+                or exp["count"] != act["count"]
+                or any(_differs(exp[field], act[field]) for field in ("total", "min", "max"))
+            ):
+                period, start, metric = key
+                mismatches.append(
+                    {
+                        "patient_id": row_patient_id,
+                        "period": period.value,
+                        "period_start": start.isoformat(),
+                        "metric": metric,
+                        "expected": exp,
+                        "actual": act,
+                    }
+                )
+    return mismatches
@@ -7,7 +7,10 @@ from typing import Dict, Any
 from padoc_common.models.advanced_training_informations import AdvancedTrainingInformation
 from padoc_common.schemas.training import AdvTrainingInfromation
 from app import db, storage
-from padoc_common.models import Account, AhFeatures, SentenceFeatures, PatientDoctorAccess
+from app.cache import dashboard_cache
+from app.services import rollup_service
+from app.services.users_service import connection_service
+from padoc_common.models import Account, AhFeatures, SentenceFeatures
 from padoc_common.models.enums import FileStatusEnum, RecordingTypeEnum
 from padoc_common.models.voice_records import VoiceRecord, VoiceRecordCreate
 from padoc_common.exceptions import PermissionDeniedError, BackEndInternalError, NotFoundError
@@ -21,7 +24,6 @@ from padoc_common.schemas.screening import (
     AhScreeningResult as AhFeaturesResponse,
     SentenceScreeningResult as SentenceFeaturessResponse,
 )
-from padoc_common.models.enums import ConnectionStatusEnum
 import boto3
 from botocore.exceptions import ClientError
 from fastapi import Depends, HTTPException, status
@@ -119,6 +121,7 @@ async def create_voice_record(
     db.add(new_record)
     await db.commit()
     await db.refresh(new_record)
+    await dashboard_cache.invalidate_patient(patient_id)
 
     if related_voice_record_id is not None:
         statement = select(VoiceRecord).where(VoiceRecord.id == related_voice_record_id)
@@ -167,6 +170,9 @@ async def update_voice_record_status(
     await db.commit()
     await db.refresh(record_to_update)
 
+    # 5. 상태가 바뀐 기록은 의사 대시보드에 노출되므로 해당 환자의 캐시를 무효화합니다.
+    await dashboard_cache.invalidate_patient(record_to_update.patient_id)
+
 
 async def process_advanced_training(
     db: AsyncSession,
@@ -188,9 +194,6 @@ async def process_advanced_training(
         # 변경사항을 DB에 최종적으로 커밋(저장)합니다.
         await db.commit()
 
-        # 성공 응답을 반환합니다.
-        return SuccessResponse()
-
     except Exception as e:
         # DB 작업 중 에러가 발생하면 롤백하여 데이터 일관성을 유지합니다.
         await db.rollback()
@@ -199,6 +202,16 @@ async def process_advanced_training(
         # 적절한 에러를 발생시켜 라우터에서 처리하도록 합니다.
         raise BackEndInternalError("데이터베이스 저장 중 오류가 발생했습니다.")
 
+    await dashboard_cache.invalidate_patient(patient_id)
+
+    # 일/주 단위 집계 갱신 (실패해도 훈련 결과 저장에는 영향을 주지 않습니다)
+    await rollup_service.apply_rollup_safely(
+        db, int(patient_id), new_training_record.created_at, new_training_record
+    )
+
+    # 성공 응답을 반환합니다.
+    return SuccessResponse()
+
 
 async def process_check_status(
     db: AsyncSession, record_id: int, current_user: dict
@@ -238,14 +251,7 @@ async def generate_download_url_for_doctor(
 
     # 2. 새로운 소유권 확인
     patient_id = record.patient_id
-    statement = select(PatientDoctorAccess).where(
-    PatientDoctorAccess.doctor_id == doctor_id,
-    PatientDoctorAccess.patient_id == patient_id,
-    PatientDoctorAccess.connection_status == ConnectionStatusEnum.APPROVED
-    )
-    connection_result = await db.execute(statement)
-    connection = connection_result.scalars().first()
-    if not connection:
+    if not await connection_service.check_connection(db, doctor_id, patient_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="해당 환자의 데이터에 접근할 권한이 없습니다."
@@ -0,0 +1,154 @@
+# app/services/users_service/access_cache.py
+"""의사-환자 승인 연결(ACL) 메모리 캐시
+
+의사별로 승인(APPROVED)된 환자 ID 집합을 메모리에 두어, 대시보드/다운로드 URL 요청마다
+PatientDoctorAccess 를 조회하지 않고 권한을 확인합니다.
+
+- 의사별 집합은 처음 확인할 때 한 번의 쿼리로 적재합니다. (지연 로딩)
+- 연결 상태가 바뀌는 쓰기 경로(connection_service)에서 커밋 후 해당 의사를 무효화합니다.
+- REDIS_URL 이 설정되어 있고 redis 패키지가 설치된 경우, 무효화를 Redis pub/sub 채널로
+  다른 레플리카에도 전파합니다. 메시지 유실에 대비해 항목은 ACL_CACHE_TTL_SECONDS 후 만료됩니다.
+  Redis 없이 여러 레플리카를 띄우면 다른 레플리카의 변경은 TTL 이 지나야 반영됩니다.
+"""
+
+import asyncio
+import os
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from padoc_common.models.patient_doctor_access import PatientDoctorAccess
+from padoc_common.models.enums import ConnectionStatusEnum
+
+
+ACL_CACHE_TTL_SECONDS = int(os.getenv("ACL_CACHE_TTL_SECONDS", "300"))
+REDIS_URL = os.getenv("REDIS_URL")
+ACL_INVALIDATION_CHANNEL = "padoc:acl:invalidate"
+
+
+class ConnectionAccessCache:
+    """의사별 승인된 환자 ID 집합 캐시"""
+
+    def __init__(self, ttl_seconds: int = ACL_CACHE_TTL_SECONDS, redis_url: Optional[str] = REDIS_URL):
+        self.ttl_seconds = ttl_seconds
+        self.redis_url = redis_url
+        self._redis = None
+        self._redis_checked = False
+        self._listener_task: Optional[asyncio.Task] = None
+        self.clear()
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 비웁니다. (테스트용)"""
+        # doctor_id -> (승인된 환자 ID 집합, 만료 시각)
+        self._approved: Dict[int, Tuple[FrozenSet[int], float]] = {}
+        # doctor_id -> 무효화 횟수. 적재 도중 무효화된 결과를 저장하지 않기 위해 사용합니다.
+        self._generations: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # --- 조회 ---
+
+    async def _load(self, db: AsyncSession, doctor_id: int) -> FrozenSet[int]:
+        generation = self._generations.get(doctor_id, 0)
+        statement = (
+            select(PatientDoctorAccess.patient_id)
+            .where(PatientDoctorAccess.doctor_id == doctor_id)
+            .where(PatientDoctorAccess.connection_status == ConnectionStatusEnum.APPROVED)
+        )
+        patient_ids = frozenset((await db.execute(statement)).scalars().all())
+        if self._generations.get(doctor_id, 0) == generation:
+            self._approved[doctor_id] = (patient_ids, time.monotonic() + self.ttl_seconds)
+        return patient_ids
+
+    async def get_approved_patients(self, db: AsyncSession, doctor_id: int) -> FrozenSet[int]:
+        """의사와 승인된 연결이 있는 환자 ID 집합을 반환합니다."""
+        doctor_id = int(doctor_id)
+        entry = self._approved.get(doctor_id)
+        if entry is not None and entry[1] > time.monotonic():
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return await self._load(db, doctor_id)
+
+    async def is_approved(self, db: AsyncSession, doctor_id: int, patient_id: int) -> bool:
+        """의사와 환자 사이에 승인된 연결이 있는지 확인합니다."""
+        return int(patient_id) in await self.get_approved_patients(db, doctor_id)
+
+    # --- 무효화 ---
+
+    def _drop_local(self, doctor_ids: Iterable[int]) -> None:
+        for doctor_id in doctor_ids:
+            self._generations[doctor_id] = self._generations.get(doctor_id, 0) + 1
+            self._approved.pop(doctor_id, None)
+
+    async def invalidate(self, doctor_ids: Iterable[int]) -> None:
+        """연결 상태가 바뀐 의사들의 캐시를 무효화하고, 다른 레플리카에도 알립니다.
+
+        연결 변경이 커밋된 뒤에 호출해야 합니다.
+        """
+        doctor_ids = {int(doctor_id) for doctor_id in doctor_ids}
+        if not doctor_ids:
+            return
+        self._drop_local(doctor_ids)
+
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                await redis.publish(ACL_INVALIDATION_CHANNEL, ",".join(str(doctor_id) for doctor_id in doctor_ids))
+            except Exception as e:
+                print(f"ACL 캐시 무효화 메시지 발행 실패: {e}")
+
+    # --- Redis pub/sub ---
+
+    def _get_redis(self):
+        """Redis 클라이언트를 지연 생성합니다. 설정이 없거나 패키지가 없으면 None 을 반환합니다."""
+        if not self._redis_checked:
+            self._redis_checked = True
+            if self.redis_url:
+                try:
+                    import redis.asyncio as redis_asyncio
+                    self._redis = redis_asyncio.from_url(self.redis_url)
+                except ImportError:
+                    print("redis 패키지가 설치되어 있지 않아 ACL 캐시 무효화는 현재 프로세스에만 적용됩니다.")
+        return self._redis
+
+    async def _listen(self) -> None:
+        redis = self._get_redis()
+        while True:
+            try:
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(ACL_INVALIDATION_CHANNEL)
+                # 구독이 끊겼던 동안의 메시지는 받을 수 없으므로 전체를 비우고 다시 시작합니다.
+                self._drop_local(list(self._approved))
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    self._drop_local(int(doctor_id) for doctor_id in data.split(",") if doctor_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"ACL 캐시 무효화 구독 오류, 5초 후 재연결합니다: {e}")
+                await asyncio.sleep(5)
+
+    def start_listener(self) -> None:
+        """Redis 가 설정되어 있으면 무효화 메시지 구독을 시작합니다. (앱 시작 시 호출)"""
+        if self._listener_task is None and self._get_redis() is not None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """무효화 메시지 구독을 종료합니다. (앱 종료 시 호출)"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+
+connection_access_cache = ConnectionAccessCache()
@@ -1,7 +1,11 @@
 # app/services/users_service/connection_service.py
 """의사-환자 연결 관련 서비스 로직"""
 
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from sqlalchemy import and_, case, literal, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 from sqlalchemy.orm import aliased
@@ -13,7 +17,9 @@ from padoc_common.models import Doctor, Patient, Account
 from padoc_common.exceptions import AlreadyConnectedError, BadRequestError
 import padoc_common.exceptions as exc
 
-from padoc_common.schemas.connection import Connection
+from padoc_common.schemas.connection import BulkConnectionItemResult, Connection
+
+from app.services.users_service.access_cache import connection_access_cache
 
 
 async def check_connection(db: AsyncSession, doctor_id: int, patient_id: int) -> bool:
@@ -27,16 +33,21 @@ async def check_connection(db: AsyncSession, doctor_id: int, patient_id: int) ->
     Returns:
         승인된 연결이 존재하면 True, 그렇지 않으면 False를 반환합니다.
     """
-    statement = (
-        select(PatientDoctorAccess)
-        .where(PatientDoctorAccess.doctor_id == doctor_id)
-        .where(PatientDoctorAccess.patient_id == patient_id)
-        .where(PatientDoctorAccess.connection_status == ConnectionStatusEnum.APPROVED)
-    )
+    # 의사별 승인된 환자 집합을 캐시해 두므로, 캐시가 적재된 뒤에는 DB 를 조회하지 않습니다.
+    return await connection_access_cache.is_approved(db, doctor_id, patient_id)
+
 
-    connection = (await db.execute(statement)).first()
+async def get_approved_patient_ids(db: AsyncSession, doctor_id: int) -> FrozenSet[int]:
+    """의사와 승인된(APPROVED) 연결이 있는 환자 ID 집합을 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 의사의 계정 ID (account_id) 입니다.
 
-    return connection is not None
+    Returns:
+        승인된 연결이 있는 환자 계정 ID 의 집합을 반환합니다.
+    """
+    return await connection_access_cache.get_approved_patients(db, doctor_id)
 
 
 async def get_connection_list(
@@ -129,6 +140,7 @@ async def create_connection_request(
             existing.connection_status = ConnectionStatusEnum.PENDING
             await db.commit()
             await db.refresh(existing)
+            await connection_access_cache.invalidate([doctor_id])
             return existing
     else:
         # 2. 새로운 연결 요청 객체 생성 (기본 상태: PENDING)
@@ -142,6 +154,7 @@ async def create_connection_request(
         db.add(new_connection)
         await db.commit()
         await db.refresh(new_connection)
+        await connection_access_cache.invalidate([doctor_id])
 
         return new_connection
 
@@ -172,6 +185,9 @@ async def update_connection_status(
     await db.commit()
     await db.refresh(connection_to_update)
 
+    # 3. 권한 캐시 무효화
+    await connection_access_cache.invalidate([connection_to_update.doctor_id])
+
     return connection_to_update
 
 
@@ -197,7 +213,8 @@ async def verify_connection_ownership(
     if not connection:
         return None
 
-    # 3. 역할에 따라 소유권 확인
+    # 3. 역할에 따라 소유권 확인 (세션의 account_id 는 문자열일 수 있으므로 정수로 맞춥니다)
+    user_id = int(user_id)
     ownership_verified = False
     if role == UserRoleEnum.DOCTOR:
         # 사용자가 의사일 경우, 연결의 doctor_id와 일치하는지 확인
@@ -212,6 +229,276 @@ async def verify_connection_ownership(
     return connection if ownership_verified else None
 
 
+# --- 일괄 처리 ---
+
+# 일괄 상태 변경 시 각 목표 상태로 바꿀 수 있는 현재 상태
+BULK_ALLOWED_FROM = {
+    ConnectionStatusEnum.APPROVED: (ConnectionStatusEnum.PENDING,),
+    ConnectionStatusEnum.REJECTED: (ConnectionStatusEnum.PENDING,),
+    ConnectionStatusEnum.TERMINATED: (ConnectionStatusEnum.APPROVED, ConnectionStatusEnum.PENDING),
+}
+
+# 다시 요청할 수 없는(이미 진행 중인) 연결 상태
+_ACTIVE_STATUSES = (ConnectionStatusEnum.APPROVED, ConnectionStatusEnum.PENDING)
+
+
+def _unique(ids: Iterable[int]) -> List[int]:
+    """순서를 유지하며 중복 ID 를 제거합니다."""
+    return list(dict.fromkeys(ids))
+
+
+def _upsert_pending_statement(db: AsyncSession, doctor_id: int, patient_ids: List[int]):
+    """uq_patient_doctor_access 에 대해 PENDING 상태로 INSERT ... ON DUPLICATE KEY UPDATE 하는 구문을 만듭니다.
+
+    이미 승인/대기 중인 연결은 그 사이 다른 요청으로 바뀌었더라도 덮어쓰지 않습니다.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "doctor_id": doctor_id,
+            "patient_id": patient_id,
+            "connection_status": ConnectionStatusEnum.PENDING,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for patient_id in patient_ids
+    ]
+    table = PatientDoctorAccess.__table__
+    status_column = table.c.connection_status
+
+    if db.get_bind().dialect.name == "sqlite":
+        statement = sqlite_insert(table).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=[table.c.patient_id, table.c.doctor_id],
+            set_={"connection_status": ConnectionStatusEnum.PENDING, "updated_at": now},
+            where=status_column.notin_(_ACTIVE_STATUSES),
+        )
+
+    # MySQL 은 SET 절을 왼쪽부터 적용하므로, 바뀌기 전 상태를 보고 updated_at 을 먼저 정합니다.
+    statement = mysql_insert(table).values(rows)
+    return statement.on_duplicate_key_update(
+        [
+            (
+                "updated_at",
+                case(
+                    (status_column.in_(_ACTIVE_STATUSES), table.c.updated_at),
+                    else_=literal(now, table.c.updated_at.type),
+                ),
+            ),
+            (
+                "connection_status",
+                case(
+                    (status_column.in_(_ACTIVE_STATUSES), status_column),
+                    else_=literal(ConnectionStatusEnum.PENDING, status_column.type),
+                ),
+            ),
+        ]
+    )
+
+
+async def bulk_create_connection_requests(
+    db: AsyncSession, *, doctor_id: int, patient_ids: List[int]
+) -> List[BulkConnectionItemResult]:
+    """의사가 여러 환자에게 한 번에 연결을 요청합니다.
+
+    환자 존재 여부와 기존 연결 상태를 한 번의 IN 쿼리로 확인하고, 요청 가능한 환자들은
+    한 번의 INSERT ... ON DUPLICATE KEY UPDATE 로 'PENDING' 상태를 만듭니다.
+    거절/해제되었던 연결은 다시 'PENDING' 으로 바뀝니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 연결을 요청하는 의사의 계정 ID입니다.
+        patient_ids: 연결을 요청받는 환자 계정 ID 목록입니다.
+
+    Returns:
+        요청한 환자 순서대로의 항목별 처리 결과 리스트를 반환합니다.
+    """
+    patient_ids = _unique(patient_ids)
+    statement = (
+        select(Patient.account_id, PatientDoctorAccess.connection_status)
+        .outerjoin(
+            PatientDoctorAccess,
+            and_(
+                PatientDoctorAccess.patient_id == Patient.account_id,
+                PatientDoctorAccess.doctor_id == doctor_id,
+            ),
+        )
+        .where(Patient.account_id.in_(patient_ids))
+    )
+    existing_status: Dict[int, Optional[ConnectionStatusEnum]] = {
+        patient_id: connection_status
+        for patient_id, connection_status in (await db.execute(statement)).all()
+    }
+
+    failures: Dict[int, str] = {}
+    requestable = []
+    for patient_id in patient_ids:
+        if patient_id not in existing_status:
+            failures[patient_id] = "환자를 찾을 수 없습니다."
+        elif existing_status[patient_id] == ConnectionStatusEnum.APPROVED:
+            failures[patient_id] = "이미 승인된 연결입니다."
+        elif existing_status[patient_id] == ConnectionStatusEnum.PENDING:
+            failures[patient_id] = "이미 요청 중인 연결입니다."
+        else:
+            requestable.append(patient_id)
+
+    connection_ids: Dict[int, int] = {}
+    statuses: Dict[int, ConnectionStatusEnum] = {}
+    if requestable:
+        await db.execute(_upsert_pending_statement(db, doctor_id, requestable))
+        rows = (
+            await db.execute(
+                select(
+                    PatientDoctorAccess.patient_id,
+                    PatientDoctorAccess.id,
+                    PatientDoctorAccess.connection_status,
+                )
+                .where(PatientDoctorAccess.doctor_id == doctor_id)
+                .where(PatientDoctorAccess.patient_id.in_(requestable))
+            )
+        ).all()
+        await db.commit()
+        await connection_access_cache.invalidate([doctor_id])
+        for patient_id, connection_id, connection_status in rows:
+            connection_ids[patient_id] = connection_id
+            statuses[patient_id] = connection_status
+
+    results = []
+    for patient_id in patient_ids:
+        if patient_id in failures:
+            results.append(
+                BulkConnectionItemResult(
+                    id=patient_id,
+                    success=False,
+                    connection_status=existing_status.get(patient_id),
+                    message=failures[patient_id],
+                )
+            )
+        else:
+            results.append(
+                BulkConnectionItemResult(
+                    id=patient_id,
+                    success=True,
+                    connection_id=connection_ids.get(patient_id),
+                    connection_status=statuses.get(patient_id),
+                )
+            )
+    return results
+
+
+async def bulk_update_connection_status(
+    db: AsyncSession,
+    *,
+    user_id: int,
+    role: UserRoleEnum,
+    connection_ids: List[int],
+    new_status: ConnectionStatusEnum,
+) -> List[BulkConnectionItemResult]:
+    """여러 연결의 상태를 한 번에 변경합니다.
+
+    소유권과 현재 상태를 한 번의 IN 쿼리로 확인하고, 변경 가능한 연결들을 한 번의
+    UPDATE 로 처리합니다. UPDATE 에도 현재 상태 조건을 걸어 그 사이 다른 요청으로
+    상태가 바뀐 연결은 변경하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        user_id: 요청을 보낸 사용자의 계정 ID입니다.
+        role: 요청을 보낸 사용자의 역할입니다.
+        connection_ids: 상태를 변경할 연결 ID 목록입니다.
+        new_status: 변경할 연결 상태 (APPROVED, REJECTED, TERMINATED) 입니다.
+
+    Raises:
+        BadRequestError: 일괄 변경을 지원하지 않는 상태이거나 역할이 잘못된 경우 발생합니다.
+
+    Returns:
+        요청한 연결 순서대로의 항목별 처리 결과 리스트를 반환합니다.
+    """
+    if new_status not in BULK_ALLOWED_FROM:
+        raise BadRequestError("일괄 변경할 수 없는 연결 상태입니다.")
+    if role == UserRoleEnum.DOCTOR:
+        owner_column = PatientDoctorAccess.doctor_id
+    elif role == UserRoleEnum.PATIENT:
+        owner_column = PatientDoctorAccess.patient_id
+    else:
+        raise BadRequestError("잘못된 역할입니다.")
+
+    allowed_from = BULK_ALLOWED_FROM[new_status]
+    connection_ids = _unique(connection_ids)
+
+    owned_rows = (
+        await db.execute(
+            select(
+                PatientDoctorAccess.id,
+                PatientDoctorAccess.connection_status,
+                PatientDoctorAccess.doctor_id,
+            )
+            .where(PatientDoctorAccess.id.in_(connection_ids))
+            .where(owner_column == user_id)
+        )
+    ).all()
+    owned_status: Dict[int, ConnectionStatusEnum] = {
+        connection_id: connection_status for connection_id, connection_status, _ in owned_rows
+    }
+    doctor_ids: Dict[int, int] = {connection_id: doctor_id for connection_id, _, doctor_id in owned_rows}
+
+    failures: Dict[int, str] = {}
+    updatable = []
+    for connection_id in connection_ids:
+        if connection_id not in owned_status:
+            failures[connection_id] = "해당 연결은 사용자의 연결이 아닙니다."
+        elif owned_status[connection_id] not in allowed_from:
+            failures[connection_id] = "잘못된 연결 상태입니다."
+        else:
+            updatable.append(connection_id)
+
+    if updatable:
+        result = await db.execute(
+            update(PatientDoctorAccess)
+            .where(PatientDoctorAccess.id.in_(updatable))
+            .where(PatientDoctorAccess.connection_status.in_(allowed_from))
+            .values(connection_status=new_status, updated_at=datetime.now(timezone.utc))
+        )
+        if result.rowcount != len(updatable):
+            # 확인 이후 다른 요청으로 상태가 바뀐 연결이 있으므로, 실제 상태를 다시 읽습니다.
+            current_status = dict(
+                (
+                    await db.execute(
+                        select(PatientDoctorAccess.id, PatientDoctorAccess.connection_status)
+                        .where(PatientDoctorAccess.id.in_(updatable))
+                    )
+                ).all()
+            )
+            for connection_id in updatable:
+                if current_status.get(connection_id) != new_status:
+                    failures[connection_id] = "잘못된 연결 상태입니다."
+                    owned_status[connection_id] = current_status.get(connection_id)
+        await db.commit()
+        await connection_access_cache.invalidate(doctor_ids[connection_id] for connection_id in updatable)
+
+    results = []
+    for connection_id in connection_ids:
+        if connection_id in failures:
+            results.append(
+                BulkConnectionItemResult(
+                    id=connection_id,
+                    success=False,
+                    connection_id=connection_id if connection_id in owned_status else None,
+                    connection_status=owned_status.get(connection_id),
+                    message=failures[connection_id],
+                )
+            )
+        else:
+            results.append(
+                BulkConnectionItemResult(
+                    id=connection_id,
+                    success=True,
+                    connection_id=connection_id,
+                    connection_status=new_status,
+                )
+            )
+    return results
+
+
 # --- 보조 함수 ---
 
 
@@ -1,99 +1,123 @@
 # app/services/users_service/list_order_service.py
 import logging
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from padoc_common.models import DoctorPatientViewSetting, PatientDoctorAccess
-from padoc_common.models.enums import ConnectionStatusEnum, UserRoleEnum
+from padoc_common.models import Doctor, DoctorPatientViewSetting, PatientDoctorAccess
+from padoc_common.models.enums import ConnectionStatusEnum
 from padoc_common.exceptions import PermissionDeniedError
 from padoc_common.schemas.list_order import PatientOrder
-from app.services.users_service.connection_service import get_connection_list
 
 
-async def _init_patient_order(db: AsyncSession, doctor_id: int) -> PatientOrder:
-    """의사의 환자 목록 순서를 최초로 생성하고 저장합니다.
+# 동시에 다른 요청이 순서를 바꿨을 때 다시 읽어 병합을 재시도하는 최대 횟수
+ORDER_SYNC_MAX_ATTEMPTS = 3
 
-    현재 의사와 연결된 환자 목록을 기반으로 기본 순서를 생성하여 DB에 저장한 후,
-    생성된 순서 정보를 반환합니다. 내부적으로만 사용되는 헬퍼 함수입니다.
 
-    Args:
-        db: 데이터베이스 세션입니다.
-        doctor_id: 순서를 초기화할 의사의 계정 ID입니다.
+async def _fetch_order_state(
+    db: AsyncSession, doctor_id: int
+) -> Optional[Tuple[Optional[int], Optional[List[int]], Optional[int], List[int]]]:
+    """저장된 순서 설정과 승인된 환자 ID 목록을 한 번의 쿼리로 조회합니다.
+
+    Doctor 를 기준으로 설정 테이블과 승인된 연결을 LEFT JOIN 하므로,
+    설정이나 승인된 환자가 없어도 최소 한 행이 반환됩니다.
 
     Returns:
-        새롭게 생성되고 저장된 PatientOrder 스키마 객체를 반환합니다.
+        (설정 ID, 저장된 순서, 설정 버전, 승인된 환자 ID 목록) 튜플을 반환합니다.
+        설정이 없으면 앞의 세 값은 None 이고, 의사 정보가 없으면 None 을 반환합니다.
     """
-    connection_list = await get_connection_list(db, doctor_id, UserRoleEnum.DOCTOR)
-    patient_order = PatientOrder(
-        patient_order=[connection.patient_id for connection in connection_list]
-    )
-
-    view_setting_stmt = select(DoctorPatientViewSetting).where(
-        DoctorPatientViewSetting.doctor_id == doctor_id
+    statement = (
+        select(
+            DoctorPatientViewSetting.id,
+            DoctorPatientViewSetting.connected_patient_order,
+            DoctorPatientViewSetting.version,
+            PatientDoctorAccess.patient_id,
+        )
+        .select_from(Doctor)
+        .outerjoin(DoctorPatientViewSetting, DoctorPatientViewSetting.doctor_id == Doctor.account_id)
+        .outerjoin(
+            PatientDoctorAccess,
+            and_(
+                PatientDoctorAccess.doctor_id == Doctor.account_id,
+                PatientDoctorAccess.connection_status == ConnectionStatusEnum.APPROVED,
+            ),
+        )
+        .where(Doctor.account_id == doctor_id)
+        .order_by(PatientDoctorAccess.id)
     )
-    view_setting = (await db.execute(view_setting_stmt)).scalars().first()
-
-    if not view_setting:
-        view_setting = DoctorPatientViewSetting(doctor_id=doctor_id)
-        db.add(view_setting)
-
-    view_setting.connected_patient_order = patient_order.patient_order
-
-    await db.commit()
-    return patient_order
+    rows = (await db.execute(statement)).all()
+    if not rows:
+        return None
+
+    setting_id, saved_order, version, _ = rows[0]
+    approved_patient_ids = [row.patient_id for row in rows if row.patient_id is not None]
+    return setting_id, saved_order, version, approved_patient_ids
+
+
+def _merge_order(saved_order: List[int], approved_patient_ids: List[int]) -> List[int]:
+    """저장된 순서를 유지하면서 해제된 환자는 빼고 새로 승인된 환자는 뒤에 붙입니다."""
+    approved_set = set(approved_patient_ids)
+    seen = set()
+    merged = []
+    for pid in saved_order:
+        if pid in approved_set and pid not in seen:
+            seen.add(pid)
+            merged.append(pid)
+    for pid in approved_patient_ids:
+        if pid not in seen:
+            seen.add(pid)
+            merged.append(pid)
+    return merged
 
 
 async def get_patient_order(db: AsyncSession, doctor_id: int) -> PatientOrder:
     """의사의 환자 목록 순서를 조회하고, 최신 연결 상태와 동기화합니다.
 
-    만약 저장된 순서 정보가 없다면, 현재 연결된 환자 목록을 기반으로
-    기본 순서를 생성하고 저장한 뒤 그 결과를 반환합니다.
-    
-    저장된 순서가 있더라도 실제 연결 상태와 다를 경우(새 환자 추가/삭제),
-    자동으로 목록을 동기화하여 최신 상태를 유지합니다.
+    저장된 순서와 승인된 환자 목록을 한 번의 쿼리로 읽어 병합합니다. 조회 요청이므로
+    병합 결과가 저장된 순서와 실제로 다를 때만 저장하고, 저장된 설정이 없으면
+    승인된 환자 목록을 기본 순서로 반환만 합니다. (설정은 순서를 변경할 때 생성됩니다)
+
+    저장은 version 을 조건으로 거는 낙관적 동시성 제어로 수행하며, 그 사이 다른 요청이
+    순서를 바꿨다면 다시 읽어 병합합니다.
 
     Args:
         db: 데이터베이스 세션입니다.
         doctor_id: 환자 목록 순서를 조회할 의사의 계정 ID입니다.
 
     Returns:
-        저장되어 있거나 새로 생성/동기화된 PatientOrder 스키마 객체를 반환합니다.
+        저장된 순서를 최신 연결 상태와 동기화한 PatientOrder 스키마 객체를 반환합니다.
     """
-    statement = select(DoctorPatientViewSetting).where(
-        DoctorPatientViewSetting.doctor_id == doctor_id
-    )
-    current_view_setting = (await db.execute(statement)).scalars().first()
-    
-    # 설정이 없으면 새로 생성하여 반환
-    if not current_view_setting:
-        return await _init_patient_order(db, doctor_id)
-
-    # 현재 승인된 환자 목록을 DB에서 조회
-    connection_list = await get_connection_list(db, doctor_id, UserRoleEnum.DOCTOR)
-    approved_patient_ids = [connection.patient_id for connection in connection_list]
-
-    # 저장된 순서와 실제 승인된 목록이 다를 경우 동기화 수행
-    if set(current_view_setting.connected_patient_order or []) != set(approved_patient_ids):
-        saved_order_set = set(current_view_setting.connected_patient_order or [])
-        approved_set = set(approved_patient_ids)
-
-        ids_to_add = list(approved_set - saved_order_set)
-        ids_to_remove = saved_order_set - approved_set
-
-        synced_order = [
-            pid
-            for pid in current_view_setting.connected_patient_order
-            if pid not in ids_to_remove
-        ]
-        synced_order.extend(ids_to_add)
-
-        current_view_setting.connected_patient_order = synced_order
-
+    merged_order: List[int] = []
+    for _ in range(ORDER_SYNC_MAX_ATTEMPTS):
+        state = await _fetch_order_state(db, doctor_id)
+        if state is None:
+            return PatientOrder(patient_order=[])
+        setting_id, saved_order, version, approved_patient_ids = state
+        saved_order = saved_order or []
+        merged_order = _merge_order(saved_order, approved_patient_ids)
+
+        if setting_id is None or merged_order == saved_order:
+            return PatientOrder(patient_order=merged_order)
+
+        result = await db.execute(
+            update(DoctorPatientViewSetting)
+            .where(DoctorPatientViewSetting.id == setting_id)
+            .where(DoctorPatientViewSetting.version == version)
+            .values(
+                connected_patient_order=merged_order,
+                version=DoctorPatientViewSetting.version + 1,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
         await db.commit()
-        await db.refresh(current_view_setting)
-    
-    return PatientOrder(patient_order=current_view_setting.connected_patient_order)
+        if result.rowcount == 1:
+            return PatientOrder(patient_order=merged_order)
+        # 다른 요청이 먼저 순서를 바꿨으므로 다시 읽어 병합합니다.
+
+    logging.warning(f"환자 목록 순서 동기화 경합으로 저장하지 못했습니다: doctor_id={doctor_id}")
+    return PatientOrder(patient_order=merged_order)
 
 
 async def update_patient_order(
@@ -137,9 +161,11 @@ async def update_patient_order(
     if not view_setting:
         view_setting = DoctorPatientViewSetting(doctor_id=doctor_id)
         db.add(view_setting)
+    else:
+        # 동기화 중인 조회 요청이 이 변경을 덮어쓰지 않도록 버전을 올립니다.
+        view_setting.version = DoctorPatientViewSetting.version + 1
 
     # 4. 순서를 업데이트하고 커밋합니다.
     view_setting.connected_patient_order = new_order
 
-    await db.commit()
-    await db.refresh(view_setting)
\ No newline at end of file
+    await db.commit()
\ No newline at end of file
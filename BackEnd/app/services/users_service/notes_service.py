@@ -0,0 +1,186 @@
+# app/services/users_service/notes_service.py
+"""의사 메모 관련 서비스 로직"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from padoc_common.exceptions import BadRequestError, NotFoundError, PermissionDeniedError
+from padoc_common.models import DoctorNote
+from padoc_common.schemas.note import Note, NoteCount, NotePage
+
+
+def _encode_cursor(created_at: datetime, note_id: int) -> str:
+    """페이지의 마지막 메모 위치 (created_at, id) 를 불투명한 커서 문자열로 만듭니다."""
+    raw = json.dumps([created_at.isoformat(), note_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, note_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(note_id)
+    except Exception:
+        raise BadRequestError("잘못된 커서입니다.")
+
+
+async def create_note(
+    db: AsyncSession, *, doctor_id: int, patient_id: int, note_content: str
+) -> DoctorNote:
+    """의사가 환자에 대한 메모를 작성합니다.
+
+    연결 여부 확인은 호출하는 쪽에서 끝나 있어야 합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 메모를 작성하는 의사의 계정 ID입니다.
+        patient_id: 메모 대상 환자의 계정 ID입니다.
+        note_content: 메모 내용입니다.
+
+    Returns:
+        새롭게 생성된 DoctorNote 객체를 반환합니다.
+    """
+    note = DoctorNote(doctor_id=int(doctor_id), patient_id=int(patient_id), note_content=note_content)
+    db.add(note)
+    await db.commit()
+    await db.refresh(note)
+    return note
+
+
+async def get_own_note(db: AsyncSession, *, doctor_id: int, note_id: int) -> DoctorNote:
+    """의사가 자신이 작성한 메모를 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 조회를 요청한 의사의 계정 ID입니다.
+        note_id: 조회할 메모의 고유 ID입니다.
+
+    Raises:
+        NotFoundError: 메모가 존재하지 않는 경우 발생합니다.
+        PermissionDeniedError: 다른 의사가 작성한 메모인 경우 발생합니다.
+
+    Returns:
+        DoctorNote 객체를 반환합니다.
+    """
+    note = await db.get(DoctorNote, note_id)
+    if note is None:
+        raise NotFoundError("메모를 찾을 수 없습니다.")
+    if note.doctor_id != int(doctor_id):
+        raise PermissionDeniedError("본인이 작성한 메모만 수정할 수 있습니다.")
+    return note
+
+
+async def update_note(
+    db: AsyncSession, *, doctor_id: int, note_id: int, note_content: str
+) -> DoctorNote:
+    """의사가 자신이 작성한 메모의 내용을 수정합니다.
+
+    연결 여부 확인은 호출하는 쪽에서 끝나 있어야 합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 수정을 요청한 의사의 계정 ID입니다.
+        note_id: 수정할 메모의 고유 ID입니다.
+        note_content: 새 메모 내용입니다.
+
+    Raises:
+        NotFoundError: 메모가 존재하지 않는 경우 발생합니다.
+        PermissionDeniedError: 다른 의사가 작성한 메모인 경우 발생합니다.
+
+    Returns:
+        수정된 DoctorNote 객체를 반환합니다.
+    """
+    note = await get_own_note(db, doctor_id=doctor_id, note_id=note_id)
+    note.note_content = note_content
+    await db.commit()
+    await db.refresh(note)
+    return note
+
+
+async def list_notes(
+    db: AsyncSession, *, doctor_id: int, patient_id: int, limit: int, cursor: Optional[str] = None
+) -> NotePage:
+    """의사가 환자에 대해 작성한 메모를 최신순으로 한 페이지 조회합니다.
+
+    다른 의사가 같은 환자에 대해 작성한 메모는 포함하지 않습니다.
+    OFFSET 대신 (created_at, id) 커서를 사용하므로, 뒤 페이지로 가도
+    ix_doctornote_doctor_patient_created 인덱스에서 커서 이후 limit 개만 읽습니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 메모를 조회하는 의사의 계정 ID입니다.
+        patient_id: 메모를 조회할 환자의 계정 ID입니다.
+        limit: 한 페이지의 최대 메모 수입니다.
+        cursor: 이전 페이지 응답의 next_cursor 입니다. None 이면 첫 페이지를 조회합니다.
+
+    Raises:
+        BadRequestError: 커서 형식이 잘못된 경우 발생합니다.
+
+    Returns:
+        메모 목록과 다음 페이지 커서를 담은 NotePage 를 반환합니다.
+    """
+    statement = (
+        select(DoctorNote)
+        .where(DoctorNote.doctor_id == int(doctor_id), DoctorNote.patient_id == int(patient_id))
+        .order_by(DoctorNote.created_at.desc(), DoctorNote.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        created_at, note_id = _decode_cursor(cursor)
+        statement = statement.where(
+            or_(
+                DoctorNote.created_at < created_at,
+                and_(DoctorNote.created_at == created_at, DoctorNote.id < note_id),
+            )
+        )
+
+    notes = (await db.execute(statement)).scalars().all()
+
+    # limit 보다 하나 더 읽어 다음 페이지가 있는지 확인합니다.
+    next_cursor = None
+    if len(notes) > limit:
+        notes = notes[:limit]
+        next_cursor = _encode_cursor(notes[-1].created_at, notes[-1].id)
+
+    return NotePage(notes=[Note.model_validate(note) for note in notes], next_cursor=next_cursor)
+
+
+async def get_note_counts(db: AsyncSession, doctor_id: int, patient_ids: Iterable[int]) -> List[NoteCount]:
+    """의사가 작성한 여러 환자의 메모 개수와 최근 작성 시각을 한 번의 GROUP BY 쿼리로 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        doctor_id: 메모를 조회하는 의사의 계정 ID입니다.
+        patient_ids: 요약할 환자 계정 ID 목록입니다.
+
+    Returns:
+        요청한 환자 순서대로의 NoteCount 리스트를 반환합니다. 메모가 없는 환자는 count 가 0 입니다.
+    """
+    patient_ids = list(dict.fromkeys(int(patient_id) for patient_id in patient_ids))
+    if not patient_ids:
+        return []
+
+    statement = (
+        select(DoctorNote.patient_id, func.count(DoctorNote.id), func.max(DoctorNote.created_at))
+        .where(DoctorNote.doctor_id == int(doctor_id), DoctorNote.patient_id.in_(patient_ids))
+        .group_by(DoctorNote.patient_id)
+    )
+    summary = {
+        patient_id: (count, latest_at)
+        for patient_id, count, latest_at in (await db.execute(statement)).all()
+    }
+
+    return [
+        NoteCount(
+            patient_id=patient_id,
+            count=summary.get(patient_id, (0, None))[0],
+            latest_at=summary.get(patient_id, (0, None))[1],
+        )
+        for patient_id in patient_ids
+    ]
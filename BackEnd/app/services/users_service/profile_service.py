@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
+from app.services.users_service.search_index import patient_name_index
 from padoc_common.exceptions import BackEndInternalError
 from padoc_common.models import (
     Account,
@@ -131,5 +132,9 @@ async def update_profile(
     # 5. DB의 최신 정보로 객체를 갱신합니다.
     await db.refresh(account)
     await db.refresh(entity_object)
+
+    # 6. 환자의 이름/로그인 ID 가 바뀌었을 수 있으므로 이름 검색 색인을 갱신합니다.
+    if role == UserRoleEnum.PATIENT:
+        patient_name_index.upsert(account.id, account.full_name, account.login_id)
     
     return entity_object
\ No newline at end of file
@@ -1,10 +1,12 @@
 import os
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Union, List
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional, Tuple, Union, List
 
 from fastapi import HTTPException, Depends, status
 from jose import jwt, JWTError
 from passlib.context import CryptContext
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -21,14 +23,21 @@ from padoc_common.schemas.schedule import ScheduleCreate, ScheduleDate
 
 
 async def get_schedules_by_patient_id(
-    db: AsyncSession, patient_id: int
+    db: AsyncSession,
+    patient_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
 ) -> List[ScheduleDate]:
     """
-    환자 ID로 모든 스케줄을 조회하고, ScheduleDate 스키마 리스트로 변환하여 반환합니다.
+    환자 ID로 스케줄을 조회하고, ScheduleDate 스키마 리스트로 변환하여 반환합니다.
+
+    기간이 주어지면 uq_calendar_event_patient_date (patient_id, event_date) 인덱스 범위만 읽습니다.
 
     Args:
         db: 데이터베이스 세션입니다.
         patient_id: 스케줄을 조회할 환자의 계정 ID입니다.
+        start_date: 조회 시작일 (포함) 입니다. None 이면 제한하지 않습니다.
+        end_date: 조회 종료일 (포함) 입니다. None 이면 제한하지 않습니다.
 
     Returns:
         조회된 스케줄 정보를 ScheduleDate 형태로 변환한 리스트를 반환합니다.
@@ -42,6 +51,10 @@ async def get_schedules_by_patient_id(
         .where(CalendarEvent.patient_id == patient_id)
         .order_by(CalendarEvent.event_date.asc())
     )
+    if start_date is not None:
+        statement = statement.where(CalendarEvent.event_date >= start_date)
+    if end_date is not None:
+        statement = statement.where(CalendarEvent.event_date <= end_date)
     
     result = await db.execute(statement)
     
@@ -69,20 +82,7 @@ async def create_schedule(
     Returns:
         성공적으로 생성된 CalendarEvent 객체를 반환합니다.
     """
-    statement = (
-        select(CalendarEvent)
-        .where(CalendarEvent.patient_id == patient_id)
-        .where(CalendarEvent.event_date == schedule_data.date)
-    )
-    result = await db.execute(statement)
-
-    # .first()를 호출하여 실제 데이터 행(row)을 가져옵니다.
-    # 조회된 데이터가 없으면 existing_event는 None이 됩니다.
-    existing_event = result.scalars().first()
-
-    # 가져온 데이터 행이 존재하는지(None이 아닌지) 확인합니다.
-    if existing_event:
-        raise BadRequestError("이미 예약된 날짜입니다.")
+    # 중복 여부는 미리 조회하지 않고 (patient_id, event_date) 유니크 제약으로 확인합니다.
     try:
         new_schedule = CalendarEvent(
             patient_id=patient_id, event_date=schedule_data.date
@@ -94,11 +94,92 @@ async def create_schedule(
         
         return new_schedule
 
+    except IntegrityError:
+        await db.rollback()
+        raise BadRequestError("이미 예약된 날짜입니다.")
     except Exception:
         await db.rollback()
         raise BackEndInternalError("스케줄 생성에 실패했습니다.")
 
 
+def expand_recurrence(start_date: date, weekdays: Iterable[int], weeks: int) -> List[date]:
+    """반복 일정을 날짜 목록으로 펼칩니다.
+
+    Args:
+        start_date: 반복을 시작하는 날짜입니다. 이 날짜가 속한 주부터 weeks 주 동안 반복합니다.
+        weekdays: 반복할 요일 목록입니다. (0=월요일 ... 6=일요일)
+        weeks: 반복할 주 수입니다.
+
+    Returns:
+        start_date 이후(포함)의 해당 요일 날짜들을 오름차순으로 반환합니다.
+    """
+    week_start = start_date - timedelta(days=start_date.weekday())
+    offsets = sorted(set(weekdays))
+    return [
+        week_start + timedelta(weeks=week, days=offset)
+        for week in range(weeks)
+        for offset in offsets
+        if week_start + timedelta(weeks=week, days=offset) >= start_date
+    ]
+
+
+async def bulk_create_schedules(
+    db: AsyncSession, patient_id: int, dates: Iterable[date]
+) -> Tuple[List[ScheduleDate], int]:
+    """여러 날짜의 스케줄을 한 번의 INSERT 로 생성합니다.
+
+    이미 예약된 날짜는 (patient_id, event_date) 유니크 제약에 걸려 건너뜁니다.
+    (MySQL 은 INSERT IGNORE, SQLite 는 ON CONFLICT DO NOTHING)
+
+    Args:
+        db: 데이터베이스 세션입니다.
+        patient_id: 스케줄을 생성할 환자의 계정 ID입니다.
+        dates: 생성할 날짜 목록입니다.
+
+    Raises:
+        BackEndInternalError: 데이터베이스 저장 과정에서 오류가 발생한 경우입니다.
+
+    Returns:
+        (요청한 날짜들의 스케줄 목록, 새로 생성된 스케줄 수) 를 반환합니다.
+        스케줄 목록에는 이전부터 있던 날짜도 포함됩니다.
+    """
+    patient_id = int(patient_id)
+    dates = sorted(set(dates))
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"patient_id": patient_id, "event_date": event_date, "created_at": now, "updated_at": now}
+        for event_date in dates
+    ]
+    table = CalendarEvent.__table__
+
+    if db.get_bind().dialect.name == "sqlite":
+        statement = sqlite_insert(table).values(rows).on_conflict_do_nothing(
+            index_elements=[table.c.patient_id, table.c.event_date]
+        )
+    else:
+        statement = mysql_insert(table).values(rows).prefix_with("IGNORE")
+
+    try:
+        created_count = (await db.execute(statement)).rowcount
+        schedules = (
+            await db.execute(
+                select(
+                    CalendarEvent.id.label("schedule_id"),
+                    CalendarEvent.event_date.label("date"),
+                )
+                .where(CalendarEvent.patient_id == patient_id)
+                .where(CalendarEvent.event_date.in_(dates))
+                .order_by(CalendarEvent.event_date.asc())
+            )
+        ).mappings().all()
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise BackEndInternalError("스케줄 생성에 실패했습니다.")
+
+    return [ScheduleDate(**row) for row in schedules], created_count
+
+
 async def delete_schedule(db: AsyncSession, patient_id: int, schedule_id: int) -> None:
     """환자의 특정 스케줄을 삭제합니다.
 
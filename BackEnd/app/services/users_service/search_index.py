@@ -0,0 +1,315 @@
+# app/services/users_service/search_index.py
+"""환자 이름 검색용 프로세스 내부 색인
+
+`Account.full_name LIKE '%q%'` 는 키 입력마다 account 테이블 전체를 훑기 때문에,
+환자 이름의 1-gram, 2-gram 역색인을 메모리에 두고 후보를 좁힌 뒤
+부분 문자열 여부를 다시 확인합니다. 한국어 이름은 2~4 음절이 대부분이라 3-gram 대신
+2-gram 을 사용합니다. 각 색인 목록은 (이름 길이, 이름, ID) 순으로 정렬되어 있어
+결과 한 페이지를 채우는 즉시 탐색을 멈출 수 있습니다.
+
+자동완성(typeahead)용으로는 (이름, ID), (로그인 ID, ID) 를 한 목록에 정렬해 두고
+bisect 로 접두사 범위를 찾습니다.
+
+- 앱 시작 시(또는 최초 검색 시) DB 에서 환자 계정을 읽어 색인을 만듭니다.
+- 회원가입(register_patient), 프로필 수정(update_profile) 시 색인을 함께 갱신하고
+  version 을 올립니다. 자동완성 결과 캐시는 version 이 바뀌면 버려집니다.
+- 워커가 여러 개인 경우 다른 워커에서 생긴 변경은 SEARCH_INDEX_REFRESH_SECONDS 마다
+  백그라운드 재적재로 반영됩니다. 재적재 중에도 기존 색인으로 응답합니다.
+"""
+
+import asyncio
+import os
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from itertools import chain, islice
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from padoc_common.models import Account
+from padoc_common.models.enums import UserRoleEnum
+
+
+SEARCH_INDEX_REFRESH_SECONDS = int(os.getenv("SEARCH_INDEX_REFRESH_SECONDS", "300"))
+TYPEAHEAD_CACHE_SIZE = int(os.getenv("TYPEAHEAD_CACHE_SIZE", "1024"))
+
+# 색인 목록의 정렬 키: (정규화된 이름 길이, 정규화된 이름, account_id)
+# 검색 결과는 앞부분 일치(완전 일치 포함) 를 먼저, 부분 일치를 나중에 이 순서대로 반환합니다.
+# 완전 일치는 앞부분 일치 중 길이가 가장 짧으므로 자연스럽게 맨 앞에 옵니다.
+SortKey = Tuple[int, str, int]
+
+# 검색 결과 한 건: (account_id, full_name, login_id)
+SearchHit = Tuple[int, str, str]
+
+
+def normalize(text: Optional[str]) -> str:
+    """검색 비교용 문자열 정규화 (앞뒤 공백 제거, 소문자화)"""
+    return (text or "").strip().lower()
+
+
+def _grams(text: str) -> Set[str]:
+    """문자열의 1-gram 과 2-gram 집합을 반환합니다."""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _prefixes(text: str) -> Set[str]:
+    """문자열의 1글자, 2글자 접두사 집합을 반환합니다."""
+    return {text[:1], text[:2]} if text else set()
+
+
+def _remove_sorted(items: list, value) -> None:
+    position = bisect_left(items, value)
+    if position < len(items) and items[position] == value:
+        del items[position]
+
+
+class _IndexTables:
+    """색인 자료구조 묶음. 재적재 시 새로 만들어 한 번에 교체합니다."""
+
+    def __init__(self):
+        # account_id -> (full_name, login_id, 정렬 키)
+        self.entries: Dict[int, Tuple[str, str, SortKey]] = {}
+        # 1/2-gram -> 해당 gram 을 포함하는 이름의 정렬 키 목록
+        self.postings: Dict[str, List[SortKey]] = {}
+        # 1/2글자 접두사 -> 해당 접두사로 시작하는 이름의 정렬 키 목록
+        self.prefix_postings: Dict[str, List[SortKey]] = {}
+        # 자동완성용 (정규화된 이름 또는 로그인 ID, account_id) 정렬 목록
+        self.typeahead_keys: List[Tuple[str, int]] = []
+
+    @classmethod
+    def build(cls, rows) -> "_IndexTables":
+        """(account_id, full_name, login_id) 행 목록으로 색인을 만듭니다."""
+        tables = cls()
+        for account_id, full_name, login_id in rows:
+            tables.add(account_id, full_name or "", login_id, keep_sorted=False)
+        for posting in chain(tables.postings.values(), tables.prefix_postings.values()):
+            posting.sort()
+        tables.typeahead_keys.sort()
+        return tables
+
+    def add(self, account_id: int, full_name: str, login_id: str, keep_sorted: bool = True) -> None:
+        name_key = normalize(full_name)
+        key: SortKey = (len(name_key), name_key, account_id)
+        self.entries[account_id] = (full_name, login_id, key)
+        targets = [self.postings.setdefault(gram, []) for gram in _grams(name_key)]
+        targets += [self.prefix_postings.setdefault(prefix, []) for prefix in _prefixes(name_key)]
+        typeahead_entries = {(name_key, account_id), (normalize(login_id), account_id)}
+        if keep_sorted:
+            for posting in targets:
+                insort(posting, key)
+            for entry in typeahead_entries:
+                insort(self.typeahead_keys, entry)
+        else:
+            for posting in targets:
+                posting.append(key)
+            self.typeahead_keys.extend(typeahead_entries)
+
+    def discard(self, account_id: int) -> None:
+        entry = self.entries.pop(account_id, None)
+        if entry is None:
+            return
+        _, login_id, key = entry
+        name_key = key[1]
+        for table, tokens in ((self.postings, _grams(name_key)), (self.prefix_postings, _prefixes(name_key))):
+            for token in tokens:
+                posting = table.get(token)
+                if posting is None:
+                    continue
+                _remove_sorted(posting, key)
+                if not posting:
+                    del table[token]
+        for typeahead_entry in {(name_key, account_id), (normalize(login_id), account_id)}:
+            _remove_sorted(self.typeahead_keys, typeahead_entry)
+
+
+class PatientNameIndex:
+    """환자 이름 n-gram 역색인 + 자동완성용 접두사 목록"""
+
+    def __init__(
+        self,
+        refresh_seconds: int = SEARCH_INDEX_REFRESH_SECONDS,
+        typeahead_cache_size: int = TYPEAHEAD_CACHE_SIZE,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.typeahead_cache_size = typeahead_cache_size
+        self._lock = asyncio.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """색인을 비우고 다음 검색 때 다시 적재하도록 합니다. (테스트용)"""
+        self._tables = _IndexTables()
+        self._loaded_at: Optional[float] = None
+        self._pending: Optional[Dict[int, Optional[Tuple[str, str]]]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # (정규화된 접두사, k) -> (version, 결과)
+        self._typeahead_cache: "OrderedDict[Tuple[str, int], Tuple[int, List[SearchHit]]]" = OrderedDict()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._tables.entries)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    # --- 색인 갱신 ---
+
+    def upsert(self, account_id: int, full_name: Optional[str], login_id: str) -> None:
+        """환자 계정의 이름/로그인 ID 를 색인에 추가하거나 갱신합니다."""
+        account_id = int(account_id)
+        if self._pending is not None:
+            self._pending[account_id] = (full_name or "", login_id)
+        if self._loaded_at is None:
+            return
+        self._tables.discard(account_id)
+        self._tables.add(account_id, full_name or "", login_id)
+        self.version += 1
+
+    def remove(self, account_id: int) -> None:
+        """색인에서 환자 계정을 제거합니다."""
+        account_id = int(account_id)
+        if self._pending is not None:
+            self._pending[account_id] = None
+        if self._loaded_at is None:
+            return
+        self._tables.discard(account_id)
+        self.version += 1
+
+    def load_rows(self, rows) -> None:
+        """(account_id, full_name, login_id) 행 목록으로 색인을 새로 만듭니다."""
+        self._swap(_IndexTables.build(rows))
+
+    def _swap(self, tables: _IndexTables) -> None:
+        # 적재 쿼리 이후에 들어온 변경은 새 색인에 다시 반영합니다.
+        for account_id, value in (self._pending or {}).items():
+            tables.discard(account_id)
+            if value is not None:
+                tables.add(account_id, *value)
+        self._tables = tables
+        self._loaded_at = time.monotonic()
+        self.version += 1
+
+    async def reload(self, db: AsyncSession, force: bool = True) -> None:
+        """DB 에서 환자 계정을 읽어 색인을 다시 만듭니다.
+
+        색인 생성은 이벤트 루프를 막지 않도록 스레드에서 수행합니다.
+        force 가 False 이면 이미 적재된 경우 아무것도 하지 않습니다.
+        """
+        async with self._lock:
+            if not force and self._loaded_at is not None:
+                return
+            self._pending = {}
+            try:
+                query = select(Account.id, Account.full_name, Account.login_id).where(
+                    Account.role == UserRoleEnum.PATIENT
+                )
+                rows = (await db.execute(query)).all()
+                tables = await asyncio.to_thread(_IndexTables.build, rows)
+                self._swap(tables)
+            finally:
+                self._pending = None
+
+    async def _refresh_in_background(self) -> None:
+        from app.db import AsyncSessionMaker
+
+        try:
+            async with AsyncSessionMaker() as db:
+                await self.reload(db)
+        except Exception as e:
+            print(f"환자 이름 색인 재적재 실패: {e}")
+        finally:
+            self._refresh_task = None
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """색인이 비어 있으면 적재하고, 오래되었으면 백그라운드 재적재를 예약합니다."""
+        if self._loaded_at is None:
+            await self.reload(db, force=False)
+            return
+        if time.monotonic() - self._loaded_at >= self.refresh_seconds and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+    # --- 검색 ---
+
+    def search(self, q: str, limit: int = 20, offset: int = 0) -> Tuple[int, List[SearchHit]]:
+        """이름에 질의어가 포함된 환자를 완전 일치 > 앞부분 일치 > 부분 일치 순으로 반환합니다.
+
+        Args:
+            q: 검색어입니다.
+            limit: 반환할 최대 결과 수입니다.
+            offset: 건너뛸 결과 수입니다.
+
+        Returns:
+            (전체 일치 수, [(account_id, full_name, login_id), ...]) 튜플을 반환합니다.
+        """
+        query = normalize(q)
+        if not query:
+            return 0, []
+
+        tables = self._tables
+        if len(query) <= 2:
+            # 1/2글자 검색어는 gram 목록 자체가 정확한 일치 목록이므로 확인 없이 바로 사용합니다.
+            matches = tables.postings.get(query, [])
+            prefix_matches = tables.prefix_postings.get(query, [])
+        else:
+            # 가장 짧은 2-gram 목록을 후보로 삼고, 실제 포함 여부를 다시 확인합니다.
+            postings = [tables.postings.get(query[i:i + 2]) for i in range(len(query) - 1)]
+            if not all(postings):
+                return 0, []
+            matches = [key for key in min(postings, key=len) if query in key[1]]
+            prefix_matches = [key for key in tables.prefix_postings.get(query[:2], []) if key[1].startswith(query)]
+
+        substring_matches = (key for key in matches if not key[1].startswith(query))
+        page = islice(chain(prefix_matches, substring_matches), offset, offset + limit)
+
+        results = []
+        for _, _, account_id in page:
+            full_name, login_id, _ = tables.entries[account_id]
+            results.append((account_id, full_name, login_id))
+        return len(matches), results
+
+    def typeahead(self, q: str, k: int = 10) -> List[SearchHit]:
+        """이름 또는 로그인 ID 가 q 로 시작하는 환자를 최대 k 명 반환합니다.
+
+        완전 일치가 먼저 오고, 나머지는 사전순입니다. 같은 version 에서 같은 접두사 요청은
+        캐시된 결과를 그대로 돌려줍니다.
+        """
+        query = normalize(q)
+        if not query:
+            return []
+
+        cache_key = (query, k)
+        cached = self._typeahead_cache.get(cache_key)
+        if cached is not None and cached[0] == self.version:
+            self._typeahead_cache.move_to_end(cache_key)
+            return cached[1]
+
+        tables = self._tables
+        keys = tables.typeahead_keys
+        seen: Set[int] = set()
+        results: List[SearchHit] = []
+        position = bisect_left(keys, (query, -1))
+        # 정렬 목록에서 query 로 시작하는 범위를 앞에서부터 k 명이 찰 때까지만 훑습니다.
+        # (query 자체가 가장 짧은 접두사이므로 완전 일치가 범위의 맨 앞에 옵니다.)
+        while position < len(keys) and len(results) < k:
+            key, account_id = keys[position]
+            if not key.startswith(query):
+                break
+            position += 1
+            if account_id in seen:
+                continue
+            seen.add(account_id)
+            full_name, login_id, _ = tables.entries[account_id]
+            results.append((account_id, full_name, login_id))
+
+        self._typeahead_cache[cache_key] = (self.version, results)
+        self._typeahead_cache.move_to_end(cache_key)
+        while len(self._typeahead_cache) > self.typeahead_cache_size:
+            self._typeahead_cache.popitem(last=False)
+        return results
+
+
+patient_name_index = PatientNameIndex()
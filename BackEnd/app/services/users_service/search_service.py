@@ -1,30 +1,40 @@
 # app/services/users_service/search_service.py
-from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
-from padoc_common.models import Account
-from padoc_common.schemas.search import UserSearchResult, UserSearchResultList
-from padoc_common.models.enums import UserRoleEnum
+from padoc_common.schemas.search import TypeaheadResponse, UserSearchResult, UserSearchResultList
+from app.services.users_service.search_index import patient_name_index
 
 
-async def search_users_by_name(db: AsyncSession, q: str) -> UserSearchResultList:
-    """이름으로 사용자 검색."""
-    # SQL query to search for users by name
-    query = (
-        select(Account.id, Account.full_name, Account.login_id)
-        .where(Account.full_name.like(f"%{q}%"))
-        .where(Account.role == UserRoleEnum.PATIENT)
-    )
+async def search_users_by_name(
+    db: AsyncSession, q: str, limit: int = 20, offset: int = 0
+) -> UserSearchResultList:
+    """이름으로 환자 검색.
+
+    LIKE '%q%' 전체 스캔 대신 프로세스 내부 n-gram 색인을 사용하며,
+    완전 일치 > 앞부분 일치 > 부분 일치 순으로 정렬합니다.
+    """
+    await patient_name_index.ensure_loaded(db)
+    total, users = patient_name_index.search(q, limit=limit, offset=offset)
+
+    user_list = [
+        UserSearchResult(account_id=account_id, full_name=full_name, login_id=login_id)
+        for account_id, full_name, login_id in users
+    ]
+    return UserSearchResultList(users=user_list, total=total)
+
 
-    result = await db.execute(query)
-    users = result.all()
-
-    user_list = []
-    for user in users:
-        user_list.append(
-            UserSearchResult(
-                **{"account_id": user[0], "full_name": user[1], "login_id": user[2]}
-            )
-        )
-    return UserSearchResultList(users=user_list)
+async def typeahead_patients(db: AsyncSession, q: str, k: int = 10) -> TypeaheadResponse:
+    """이름 또는 로그인 ID 접두사로 환자 상위 k 명을 반환합니다.
+
+    색인이 적재된 뒤에는 DB 를 조회하지 않습니다.
+    """
+    await patient_name_index.ensure_loaded(db)
+    users = patient_name_index.typeahead(q, k=k)
+
+    return TypeaheadResponse(
+        users=[
+            UserSearchResult(account_id=account_id, full_name=full_name, login_id=login_id)
+            for account_id, full_name, login_id in users
+        ],
+        version=patient_name_index.version,
+    )
@@ -92,7 +92,8 @@ CREATE TABLE `doctor_patient_view_settings` (
   `connected_patient_order` json,
   `pending_patient_order` json,
   `unconnected_patient_order` json,
-  `updated_at` timestamp DEFAULT (now())
+  `updated_at` timestamp DEFAULT (now()),
+  `version` integer NOT NULL DEFAULT 0
 );
 
 CREATE TABLE `advanced_training_information` (
@@ -105,6 +106,10 @@ CREATE TABLE `advanced_training_information` (
 
 CREATE UNIQUE INDEX `patient_doctor_access_index_0` ON `patient_doctor_access` (`patient_id`, `doctor_id`);
 
+CREATE UNIQUE INDEX `uq_calendar_event_patient_date` ON `calendar_events` (`patient_id`, `event_date`);
+
+CREATE INDEX `ix_doctornote_doctor_patient_created` ON `doctor_notes` (`doctor_id`, `patient_id`, `created_at`, `id`);
+
 ALTER TABLE `patients` ADD FOREIGN KEY (`account_id`) REFERENCES `accounts` (`id`);
 
 ALTER TABLE `doctors` ADD FOREIGN KEY (`account_id`) REFERENCES `accounts` (`id`);
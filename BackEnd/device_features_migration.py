@@ -0,0 +1,82 @@
+# device_features_migration.py
+# backend안에 위치
+# 장치 계산 특징 업로드(device_features_service)에 필요한 voicerecord.feature_source/feature_drift 컬럼을 추가합니다.
+# 이미 있는 컬럼은 건너뛰므로 여러 번 실행해도 안전합니다.
+# 기존 녹음은 모두 서버에서 추출했으므로 --backfill 을 주면 특징 행이 있는 녹음의 feature_source 를 'server' 로 채웁니다.
+#
+# 사용 예)
+#   python device_features_migration.py               # 컬럼만 추가합니다.
+#   python device_features_migration.py --backfill    # 컬럼 추가 후 기존 녹음의 출처를 채웁니다.
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import asyncio
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import inspect, or_, text, update
+from sqlmodel import select
+
+from app.db import AsyncSessionMaker
+from padoc_common.models import AhFeatures, SentenceFeatures
+from padoc_common.models.enums import FeatureSourceEnum
+from padoc_common.models.voice_records import VoiceRecord
+
+SOURCE_COLUMNS = ("feature_source", "feature_drift")
+
+
+def _ensure_source_columns(sync_conn) -> list:
+    """출처 컬럼이 없으면 추가합니다. 추가한 컬럼 이름 목록을 반환합니다."""
+    table = VoiceRecord.__table__
+    columns = {column["name"] for column in inspect(sync_conn).get_columns(table.name)}
+    added = []
+    for name in SOURCE_COLUMNS:
+        if name in columns:
+            continue
+        column_type = table.c[name].type.compile(dialect=sync_conn.dialect)
+        sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type} NULL"))
+        added.append(name)
+    return added
+
+
+async def run(backfill: bool) -> int:
+    async with AsyncSessionMaker() as db:
+        connection = await db.connection()
+        added = await connection.run_sync(_ensure_source_columns)
+        for name in added:
+            print(f"{name} 컬럼을 추가했습니다.")
+        await db.commit()
+
+        backfilled = 0
+        if backfill:
+            has_features = or_(
+                VoiceRecord.id.in_(select(AhFeatures.record_id)),
+                VoiceRecord.id.in_(select(SentenceFeatures.record_id)),
+            )
+            result = await db.execute(
+                update(VoiceRecord)
+                .where(VoiceRecord.feature_source.is_(None))
+                .where(has_features)
+                .values(feature_source=FeatureSourceEnum.SERVER)
+            )
+            backfilled = result.rowcount or 0
+            await db.commit()
+
+    print(f"✅ 컬럼 추가 {len(added)}개, 출처 채움 {backfilled}건")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="voicerecord 특징 출처 컬럼 추가")
+    parser.add_argument("--backfill", action="store_true", help="기존 녹음의 feature_source 를 'server' 로 채웁니다.")
+    args = parser.parse_args()
+    return asyncio.run(run(args.backfill))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
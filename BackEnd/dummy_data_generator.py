@@ -21,6 +21,7 @@ from padoc_common.models.accounts import Account
 from padoc_common.models.voice_records import VoiceRecord
 from padoc_common.models.ah_features import AhFeatures
 from padoc_common.models.sentence_features import SentenceFeatures
+from padoc_common.sampling_codec import encode_sampling_data
 from padoc_common.models.enums import RecordingTypeEnum, UserRoleEnum
 
 # --- 현실적인 Praat 지표 값 생성을 위한 범위 ---
@@ -33,6 +34,57 @@ CPP_RANGE = (5.0, 25.0)
 CSID_RANGE = (20.0, 50.0)
 
 
+# --- 검색 벤치마크용 합성 환자 이름 ---
+KOREAN_SURNAMES = [
+    "김", "이", "박", "최", "정", "강", "조", "윤", "장", "임",
+    "한", "오", "서", "신", "권", "황", "안", "송", "류", "전",
+    "홍", "고", "문", "양", "손", "배", "백", "허", "유", "남",
+    "남궁", "황보", "제갈", "선우",
+]
+KOREAN_GIVEN_NAME_SYLLABLES = [
+    "민", "서", "지", "현", "수", "영", "준", "우", "예", "하",
+    "윤", "도", "은", "재", "진", "성", "연", "원", "정", "유",
+    "호", "태", "혜", "경", "상", "동", "승", "미", "숙",
+    "철", "희", "주", "아", "린", "빈", "훈", "석", "나", "라", "규",
+]
+
+
+def generate_dummy_patient_names(count: int, seed: int | None = None) -> List[tuple[str, str]]:
+    """(login_id, full_name) 형태의 합성 환자 계정 정보를 count 개 생성합니다.
+
+    이름은 성 1개 + 이름 1~3 음절로 만들며, 같은 이름이 여러 번 나올 수 있습니다.
+    """
+    rng = random.Random(seed)
+    accounts = []
+    for i in range(count):
+        given_length = rng.choices((1, 2, 3), weights=(1, 12, 1))[0]
+        full_name = rng.choice(KOREAN_SURNAMES) + "".join(
+            rng.choice(KOREAN_GIVEN_NAME_SYLLABLES) for _ in range(given_length)
+        )
+        accounts.append((f"dummy_patient_{i:06d}", full_name))
+    return accounts
+
+
+async def create_dummy_patient_accounts(db: AsyncSession, count: int, batch_size: int = 5000, seed: int | None = None) -> int:
+    """합성 환자 계정(Account, role=patient)을 count 개 DB에 저장합니다.
+
+    로그인에 사용할 수 없는 계정이므로 비밀번호에는 해시가 아닌 고정 값을 넣습니다.
+    """
+    names = generate_dummy_patient_names(count, seed=seed)
+    for start in range(0, len(names), batch_size):
+        db.add_all(
+            Account(
+                login_id=login_id,
+                full_name=full_name,
+                role=UserRoleEnum.PATIENT,
+                password="!",
+            )
+            for login_id, full_name in names[start:start + batch_size]
+        )
+        await db.commit()
+    return len(names)
+
+
 def get_db_url_and_ssl_config() -> tuple[str, dict | None]:
     """db_access.json 파일을 읽어 DB연결 URL과 SSL 설정을 반환합니다."""
     db_access_path = project_root / "BackEnd" / "db_access.json"
@@ -82,7 +134,7 @@ def create_dummy_sentence_feature() -> SentenceFeatures:
     return SentenceFeatures(
         cpp=random.uniform(*CPP_RANGE),
         csid=random.uniform(*CSID_RANGE),
-        sampling_data=sampling_data
+        sampling_blob=encode_sampling_data(sampling_data)
     )
 
 
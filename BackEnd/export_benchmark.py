@@ -0,0 +1,97 @@
+# export_benchmark.py
+# backend안에 위치
+# 환자 음성 특징 이력을 대시보드 방식(ORM 객체 + 응답 모델 전체 생성)으로 읽을 때와
+# /export/voice-features 의 스트리밍 방식으로 내보낼 때의 최대 메모리 사용량과 시간을 비교합니다.
+# 메모리 SQLite DB 에 합성 데이터를 채운 뒤 tracemalloc 으로 측정합니다.
+#
+# 사용 예)
+#   python export_benchmark.py                        # 환자 1명, 녹음 5,000개
+#   python export_benchmark.py --records 100000 --format ndjson
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+
+from overview_benchmark import populate
+from padoc_common.models import PatientDoctorAccess
+from padoc_common.schemas.dashboard import VoiceInformation
+from app.services import dashboard_service, export_service
+from app.services.features_service import build_sentence_features, nest_ah_features
+
+
+async def dashboard_style(session_maker, patient_ids) -> int:
+    """대시보드처럼 환자별 녹음을 모두 ORM 객체로 읽고 응답 모델을 만듭니다."""
+    voices = []
+    async with session_maker() as db:
+        for patient_id in patient_ids:
+            for voice in await dashboard_service.get_patient_voice_records(db, patient_id, None, None):
+                voices.append(VoiceInformation(
+                    **voice.model_dump(exclude={"id", "related_voice_record_id", "type", "ah_features", "sentence_features"}),
+                    voice_id=voice.id,
+                    related_voice_info_id=voice.related_voice_record_id,
+                    recording_type=voice.type,
+                    ah_features=nest_ah_features(voice.ah_features) if voice.ah_features else None,
+                    sentence_features=build_sentence_features(voice.sentence_features) if voice.sentence_features else None,
+                ))
+    return len(voices)
+
+
+async def streaming(session_maker, patient_ids, export_format: str) -> int:
+    """내보내기 응답 본문을 만들어 버립니다. (전송된 바이트 수만 셉니다)"""
+    total = 0
+    async for data in export_service.stream_export(session_maker, export_format, patient_ids):
+        total += len(data)
+    return total
+
+
+async def _measure(label: str, coroutine) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = await coroutine
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {elapsed:8.2f} s   peak {peak / 1024 / 1024:8.1f} MiB   ({result:,})")
+
+
+async def run(patients: int, records: int, export_format: str) -> None:
+    random.seed(7)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as db:
+        started = time.perf_counter()
+        doctor_id = await populate(db, patients, records)
+        patient_ids = list(
+            (await db.execute(select(PatientDoctorAccess.patient_id).where(PatientDoctorAccess.doctor_id == doctor_id))).scalars()
+        )
+        print(f"환자 {patients:,}명 x 녹음 {records:,}개 생성: {time.perf_counter() - started:.2f} s")
+
+    await _measure("dashboard", dashboard_style(session_maker, patient_ids))
+    await _measure(f"export {export_format}", streaming(session_maker, patient_ids, export_format))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음성 특징 이력 내보내기 메모리 벤치마크")
+    parser.add_argument("--patients", type=int, default=1, help="환자 수")
+    parser.add_argument("--records", type=int, default=5000, help="환자당 녹음 수")
+    parser.add_argument("--format", choices=export_service.EXPORT_FORMATS, default="csv", help="내보내기 형식")
+    args = parser.parse_args()
+    asyncio.run(run(args.patients, args.records, args.format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# overview_benchmark.py
+# backend안에 위치
+# 의사용 환자 목록 요약을 환자별로 조회하는 방식(N+1)과 /dashboard/doctor/overview 의
+# 고정 쿼리 방식을 비교합니다. 메모리 SQLite DB 에 합성 데이터를 채운 뒤 측정합니다.
+#
+# 사용 예)
+#   python overview_benchmark.py                      # 환자 500명, 환자당 녹음 20개
+#   python overview_benchmark.py --patients 1000 --records 50
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+
+from dummy_data_generator import (
+    create_dummy_a_feature,
+    create_dummy_sentence_feature,
+    generate_dummy_patient_names,
+)
+from padoc_common.models import (
+    Account,
+    AdvancedTrainingInformation,
+    Doctor,
+    Patient,
+    PatientDoctorAccess,
+    VoiceRecord,
+)
+from padoc_common.models.enums import (
+    ConnectionStatusEnum,
+    FileStatusEnum,
+    RecordingTypeEnum,
+    UserRoleEnum,
+)
+from app.services import dashboard_service
+from app.services.users_service import connection_service, list_order_service
+
+
+async def populate(db: AsyncSession, patients: int, records: int) -> int:
+    """의사 1명과 승인된 환자 patients 명, 환자별 녹음/훈련 기록을 만들고 의사 ID 를 반환합니다."""
+    doctor_account = Account(login_id="bench_doctor", full_name="벤치의사", role=UserRoleEnum.DOCTOR, password="!")
+    db.add(doctor_account)
+    await db.flush()
+    db.add(Doctor(account_id=doctor_account.id, valid_license_id="BENCH-0001", is_verified=True))
+
+    now = datetime.now(timezone.utc)
+    for login_id, full_name in generate_dummy_patient_names(patients, seed=7):
+        account = Account(login_id=login_id, full_name=full_name, role=UserRoleEnum.PATIENT, password="!")
+        db.add(account)
+        await db.flush()
+        db.add(Patient(account_id=account.id))
+        db.add(
+            PatientDoctorAccess(
+                doctor_id=doctor_account.id,
+                patient_id=account.id,
+                connection_status=ConnectionStatusEnum.APPROVED,
+            )
+        )
+        for i in range(records):
+            is_ah = i % 2 == 0
+            record = VoiceRecord(
+                patient_id=account.id,
+                file_path=f"bench/{account.id}/{i}.wav",
+                type=RecordingTypeEnum.voice_ah if is_ah else RecordingTypeEnum.voice_sentence,
+                status=FileStatusEnum.COMPLETED,
+                created_at=now - timedelta(hours=random.randint(0, 24 * 90)),
+            )
+            if is_ah:
+                record.ah_features = create_dummy_a_feature()
+            else:
+                record.sentence_features = create_dummy_sentence_feature()
+            db.add(record)
+        for _ in range(max(1, records // 4)):
+            db.add(
+                AdvancedTrainingInformation(
+                    patient_id=account.id,
+                    avg_score=random.randint(0, 100),
+                    created_at=now - timedelta(hours=random.randint(0, 24 * 90)),
+                )
+            )
+    await db.commit()
+    return doctor_account.id
+
+
+async def per_patient_overview(db: AsyncSession, doctor_id: int) -> int:
+    """기존 화면처럼 목록 순서/연결 목록을 읽고 환자마다 대시보드 데이터를 조회합니다."""
+    order = await list_order_service.get_patient_order(db, doctor_id)
+    await connection_service.get_connection_list(db, doctor_id, UserRoleEnum.DOCTOR)
+    for patient_id in order.patient_order:
+        voices = await dashboard_service.get_patient_voice_records(db, patient_id, None, None)
+        trainings = (
+            await db.execute(
+                select(AdvancedTrainingInformation)
+                .where(AdvancedTrainingInformation.patient_id == patient_id)
+                .order_by(AdvancedTrainingInformation.created_at.desc())
+                .limit(1)
+            )
+        ).scalars().first()
+        _ = (voices[:1], trainings)
+    return len(order.patient_order)
+
+
+def _report(label: str, samples: list, queries: int) -> None:
+    samples_ms = sorted(sample * 1000 for sample in samples)
+    print(f"{label:<16} median {statistics.median(samples_ms):9.2f} ms   max {samples_ms[-1]:9.2f} ms   queries {queries}")
+
+
+async def run(patients: int, records: int, repeat: int) -> None:
+    random.seed(7)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    async with session_maker() as db:
+        started = time.perf_counter()
+        doctor_id = await populate(db, patients, records)
+        print(f"환자 {patients:,}명 x 녹음 {records}개 생성: {time.perf_counter() - started:.2f} s")
+        # 의사가 순서를 한 번 저장해 둔 상태에서 측정합니다.
+        order = await list_order_service.get_patient_order(db, doctor_id)
+        await list_order_service.update_patient_order(db, doctor_id, order.patient_order)
+
+    for label, func in (("per-patient", per_patient_overview), ("overview", dashboard_service.get_doctor_overview)):
+        samples = []
+        queries = 0
+        for _ in range(repeat):
+            async with session_maker() as db:
+                statements.clear()
+                started = time.perf_counter()
+                await func(db, doctor_id)
+                samples.append(time.perf_counter() - started)
+                queries = len(statements)
+        _report(label, samples, queries)
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="의사용 환자 목록 요약 벤치마크")
+    parser.add_argument("--patients", type=int, default=500, help="승인된 환자 수")
+    parser.add_argument("--records", type=int, default=20, help="환자당 녹음 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+    asyncio.run(run(args.patients, args.records, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# padoc_common/downsampling.py
+"""차트 표시용 시계열 다운샘플링
+
+프레임 간격이 일정한 시계열(x = 프레임 번호)을 대상으로 하며, 모든 함수는 원본에서 고른
+프레임 번호 목록을 오름차순으로 반환합니다. 값이 없는 프레임(None/NaN)은 면적 계산에서 0 으로
+취급하지만, 골라진 프레임의 값은 원본 그대로 돌려줍니다.
+
+- lttb: Largest-Triangle-Three-Buckets. 모양(피크, 급격한 변화)을 잘 보존합니다.
+- minmax: 구간마다 최솟값과 최댓값 프레임을 고릅니다. 스파이크를 놓치지 않습니다.
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+
+def _clean(values: Sequence[Optional[float]]) -> List[float]:
+    return [0.0 if value is None or math.isnan(value) else value for value in values]
+
+
+def lttb(
+    values: Sequence[Optional[float]], threshold: int, xs: Optional[Sequence[float]] = None
+) -> List[int]:
+    """LTTB 로 threshold 개의 위치를 고릅니다. (첫/마지막은 항상 포함)
+
+    xs 를 주면 values 의 x 좌표로 사용합니다. 이미 줄인 시계열(프레임 번호가 고르지 않음)을
+    다시 줄일 때 씁니다. 반환값은 항상 values 안의 위치입니다.
+    """
+    count = len(values)
+    if threshold >= count:
+        return list(range(count))
+    if threshold <= 2:
+        return [0, count - 1][:max(threshold, 0)]
+
+    ys = _clean(values)
+    if xs is None:
+        xs = range(count)
+    selected = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # 다음 구간의 평균점
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        avg_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+
+        # 현재 구간에서 이전 선택점, 다음 구간 평균점과 이루는 삼각형 면적이 가장 큰 점
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+
+    selected.append(count - 1)
+    return selected
+
+
+def minmax(values: Sequence[Optional[float]], threshold: int) -> List[int]:
+    """threshold // 2 개의 구간마다 최솟값/최댓값 프레임을 골라 최대 threshold 개를 반환합니다."""
+    count = len(values)
+    if threshold >= count:
+        return list(range(count))
+
+    ys = _clean(values)
+    buckets = max(1, threshold // 2)
+    bucket_size = count / buckets
+    selected = []
+    for i in range(buckets):
+        start = int(i * bucket_size)
+        end = min(int((i + 1) * bucket_size), count)
+        if start >= end:
+            continue
+        segment = ys[start:end]
+        low = start + segment.index(min(segment))
+        high = start + segment.index(max(segment))
+        selected.extend(sorted({low, high}))
+    return selected
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def downsample(
+    values: Sequence[Optional[float]], threshold: int, method: str = "lttb"
+) -> Tuple[List[int], List[Optional[float]]]:
+    """(골라진 프레임 번호, 해당 값) 을 반환합니다."""
+    indices = METHODS[method](values, threshold)
+    return indices, [None if values[i] is None or math.isnan(values[i]) else values[i] for i in indices]
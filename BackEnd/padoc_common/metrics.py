@@ -0,0 +1,371 @@
+# padoc_common/metrics.py
+"""백엔드/음성 분석 서버 공용 메트릭 (Prometheus 텍스트 형식)
+
+외부 패키지 없이 카운터, 게이지, 히스토그램을 프로세스 메모리에 모아 두고
+/metrics 에서 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 값은 프로세스 단위이므로
+워커를 여러 개 띄우면 워커마다 따로 수집됩니다.
+
+- MetricsMiddleware: 라우트별 요청 수/지연 시간 히스토그램, 처리 중 요청 수, 요청당 DB 쿼리 수/시간
+- instrument_engine: SQLAlchemy 이벤트로 쿼리 종류별 실행 시간을 수집합니다.
+- track_upstream: 모델 서버 등 외부 호출 지연 시간
+- track_stage: 음성 특징 추출 단계별(디코딩, 피치, CPPS ...) 처리 시간
+- scrape_status: /metrics 요청의 수집 토큰(METRICS_TOKEN) 확인
+"""
+
+import hmac
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# /metrics 요청에 Bearer 토큰으로 보내야 하는 수집 토큰의 환경 변수 이름
+METRICS_TOKEN_ENV = "METRICS_TOKEN"
+
+# 요청/쿼리 지연 시간 히스토그램 구간(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 음성 분석/모델 서버 호출처럼 오래 걸리는 작업의 구간(초)
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+# 요청당 DB 쿼리 수 구간
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+# 상대 오차(비율)
+DRIFT_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 의 라벨은 {self.labelnames} 이어야 합니다.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        with self._lock:
+            samples = self._samples()
+        return header + "".join(line + "\n" for line in samples)
+
+
+class Counter(_Metric):
+    """단조 증가하는 값"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """늘었다 줄었다 하는 현재 값"""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """구간별 누적 개수와 합계"""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # 라벨 값 -> ([구간별 개수], 합계, 전체 개수)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    def get_count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def get_sum(self, **labels: str) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry[1] if entry else 0.0
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """등록된 메트릭을 이름 순서대로 내보냅니다."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"{metric.name} 메트릭이 다른 형태로 이미 등록되어 있습니다.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "".join(metric.render() for metric in metrics)
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.counter(
+    "padoc_http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_LATENCY = registry.histogram(
+    "padoc_http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+HTTP_IN_PROGRESS = registry.gauge(
+    "padoc_http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method",)
+)
+REQUEST_DB_QUERIES = registry.histogram(
+    "padoc_http_request_db_queries", "HTTP 요청 하나가 실행한 DB 쿼리 수", ("route",), QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_SECONDS = registry.histogram(
+    "padoc_http_request_db_seconds", "HTTP 요청 하나가 DB 쿼리에 쓴 시간", ("route",)
+)
+DB_QUERY_LATENCY = registry.histogram(
+    "padoc_db_query_duration_seconds", "DB 쿼리 실행 시간", ("operation",)
+)
+UPSTREAM_LATENCY = registry.histogram(
+    "padoc_upstream_request_duration_seconds", "외부 서버 호출 시간", ("target", "outcome"), SLOW_BUCKETS
+)
+STAGE_LATENCY = registry.histogram(
+    "padoc_voice_stage_duration_seconds", "음성 특징 추출/예측 단계별 처리 시간", ("stage",), SLOW_BUCKETS
+)
+DEVICE_FEATURE_UPLOADS = registry.counter(
+    "padoc_device_feature_uploads_total", "장치 계산 특징을 함께 보낸 업로드 수 (처리 방식별)", ("type", "decision")
+)
+DEVICE_FEATURE_DRIFT = registry.histogram(
+    "padoc_device_feature_drift_ratio", "표본 검증에서 장치 값과 서버 값의 최대 상대 오차", ("type",), DRIFT_BUCKETS
+)
+
+
+# --- 요청 단위 DB 통계 ---
+
+class _RequestStats:
+    __slots__ = ("db_queries", "db_seconds")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[_RequestStats]] = ContextVar("padoc_request_stats", default=None)
+
+# 라우트를 찾지 못한 요청(404 등)은 경로 대신 이 값으로 묶어 라벨 수가 늘어나지 않게 합니다.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """요청 수, 지연 시간, 처리 중 요청 수, 요청당 DB 쿼리 수를 수집하는 ASGI 미들웨어
+
+    라우트 라벨은 실제 경로가 아닌 라우트 템플릿(/dashboard/doctor/{patient_id})을 사용합니다.
+    """
+
+    def __init__(self, app, skip_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = frozenset(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_PROGRESS.dec(method=method)
+            _request_stats.reset(token)
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            REQUEST_DB_QUERIES.observe(stats.db_queries, route=route)
+            REQUEST_DB_SECONDS.observe(stats.db_seconds, route=route)
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def instrument_engine(engine) -> None:
+    """엔진에서 실행되는 쿼리의 종류별 실행 시간과 요청당 쿼리 수/시간을 수집합니다.
+
+    AsyncEngine 을 넘기면 내부의 sync_engine 에 이벤트를 등록합니다.
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if getattr(sync_engine, "_padoc_metrics", False):
+        return
+    sync_engine._padoc_metrics = True
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("padoc_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["padoc_query_started"].pop()
+        elapsed = time.perf_counter() - started
+        DB_QUERY_LATENCY.observe(elapsed, operation=_operation(statement))
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.db_queries += 1
+            stats.db_seconds += elapsed
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("padoc_query_started"):
+            connection.info["padoc_query_started"].pop()
+
+
+@contextmanager
+def track_upstream(target: str) -> Iterator[None]:
+    """외부 서버 호출 시간을 outcome(ok/error) 라벨과 함께 기록합니다."""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        UPSTREAM_LATENCY.observe(time.perf_counter() - started, target=target, outcome=outcome)
+
+
+def track_stage(stage: str):
+    """음성 특징 추출 단계 하나의 처리 시간을 기록하는 컨텍스트 매니저를 반환합니다."""
+    return STAGE_LATENCY.time(stage=stage)
+
+
+def render_latest() -> str:
+    """등록된 모든 메트릭을 Prometheus 텍스트 형식으로 반환합니다."""
+    return registry.render()
+
+
+def scrape_status(authorization: Optional[str]) -> int:
+    """/metrics 요청의 Authorization 헤더를 확인해 응답할 상태 코드를 반환합니다.
+
+    METRICS_TOKEN 이 설정되지 않았으면 메트릭을 내보내지 않도록 404, 헤더가
+    "Bearer <METRICS_TOKEN>" 이 아니면 401, 맞으면 200 입니다.
+    """
+    expected = os.getenv(METRICS_TOKEN_ENV)
+    if not expected:
+        return 404
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), expected.encode()):
+        return 401
+    return 200
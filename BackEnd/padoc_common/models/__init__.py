@@ -9,6 +9,7 @@ from .ah_features import AhFeaturesCreate, AhFeaturesRead, AhFeaturesUpdate, AhF
 from .sentence_features import SentenceFeatures, SentenceFeaturesCreate, SentenceFeaturesRead, SentenceFeaturesUpdate
 from .advanced_training_informations import AdvancedTrainingInformation, AdvancedTrainingInformationCreate, AdvancedTrainingInformationRead, AdvancedTrainingInformationUpdate
 from .accounts import AccountCreate, AccountRead, AccountUpdate, Account 
+from .feature_rollups import PatientFeatureRollup, PatientFeatureRollupCreate, PatientFeatureRollupRead, PatientFeatureRollupUpdate
 
 # 모든 테이블 모델의 관계를 재설정합니다.
 Patient.model_rebuild()
@@ -67,4 +68,9 @@ SentenceFeaturesRead.model_rebuild()
 SentenceFeaturesCreate.model_rebuild()
 SentenceFeaturesUpdate.model_rebuild()
 
+PatientFeatureRollup.model_rebuild()
+PatientFeatureRollupCreate.model_rebuild()
+PatientFeatureRollupRead.model_rebuild()
+PatientFeatureRollupUpdate.model_rebuild()
+
 print("--- All separated model files initialized and rebuilt successfully. ---")
\ No newline at end of file
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 import enum
 
 from sqlmodel import Field, Relationship, SQLModel
-from sqlalchemy import Column, Integer, ForeignKey, func
+from sqlalchemy import Column, Index, Integer, ForeignKey, func
 from sqlalchemy.orm import Mapped
 from .enums import AdvTrainingProgressEnum
 
@@ -37,6 +37,9 @@ class AdvancedTrainingInformation(AdvancedTrainingInformationBase, table=True):
 
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # 환자별 최근 훈련 기록 조회용 인덱스
+    __table_args__ = (Index("ix_advancedtraininginformation_patient_created", "patient_id", "created_at"),)
+
     # Patient 모델과의 1:1 관계 설정
     patient: Mapped["Patient"] = Relationship(back_populates="advanced_training")
 
@@ -4,7 +4,7 @@ from typing import Optional, TYPE_CHECKING
 from datetime import datetime, date, timezone
 from sqlmodel import Field, Relationship, SQLModel
 from sqlalchemy import func
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped # 1. Mapped 타입을 임포트합니다.
 
 if TYPE_CHECKING:
@@ -26,6 +26,9 @@ class CalendarEvent(CalendarEventBase, table=True):
     # 2. Relationship의 타입 힌트를 Mapped[...]로 감싸줍니다.
     patient: Mapped["Patient"] = Relationship(back_populates="calendar_events")
 
+    # 환자별 하루 한 건만 허용합니다. (patient_id, event_date) 순서라 기간 조회 인덱스로도 쓰입니다.
+    __table_args__ = (UniqueConstraint("patient_id", "event_date", name="uq_calendar_event_patient_date"),)
+
 class CalendarEventCreate(CalendarEventBase):
     pass
 
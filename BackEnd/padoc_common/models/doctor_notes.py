@@ -2,7 +2,7 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy import func
 from sqlalchemy.orm import Mapped # 1. Mapped 타입을 임포트합니다.
 
@@ -28,6 +28,9 @@ class DoctorNote(DoctorNoteBase, table=True):
     patient: Mapped["Patient"] = Relationship(back_populates="notes_about")
     doctor: Mapped["Doctor"] = Relationship(back_populates="notes_written")
 
+    # 의사-환자별 최신순 커서 페이지네이션 (created_at, id) 용 인덱스
+    __table_args__ = (Index("ix_doctornote_doctor_patient_created", "doctor_id", "patient_id", "created_at", "id"),)
+
 class DoctorNoteCreate(DoctorNoteBase):
     pass
 
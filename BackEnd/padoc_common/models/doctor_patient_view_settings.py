@@ -26,6 +26,8 @@ class DoctorPatientViewSetting(DoctorPatientViewSettingBase, table=True):
     pending_patient_order: List[int] = Field(default_factory=list, sa_column=Column(JSON))
     unconnected_patient_order: List[int] = Field(default_factory=list, sa_column=Column(JSON))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), sa_column_kwargs={"onupdate": func.now()})
+    # 순서를 바꿀 때마다 1씩 올리는 버전 (낙관적 동시성 제어용)
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"}, nullable=False)
 
     doctor: Mapped["Doctor"] = Relationship(back_populates="view_setting")
 
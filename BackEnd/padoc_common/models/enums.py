@@ -42,4 +42,17 @@ class FileStatusEnum(str, enum.Enum):
     UPLOAD_COMPLETED = "UPLOAD_COMPLETED"  # S3에 업로드 완료, 분석 대기 중
     PROCESSING = "PROCESSING"           # 워커가 파일을 가져가 분석 중
     COMPLETED = "COMPLETED"             # 분석 완료 및 결과 저장 성공
-    FAILED = "FAILED"                   # 업로드 또는 분석 과정에서 실패
\ No newline at end of file
+    FAILED = "FAILED"                   # 업로드 또는 분석 과정에서 실패
+
+class FeatureSourceEnum(str, enum.Enum):
+    """음성 특징 값을 어디서 계산했는지 나타내는 Enum"""
+
+    SERVER = "server"                    # 음성 분석 서버가 업로드된 파일에서 추출 (기존 방식)
+    DEVICE = "device"                    # 장치가 계산해 업로드 요청과 함께 보낸 값을 그대로 저장
+    DEVICE_VERIFIED = "device_verified"  # 장치 값을 받은 뒤 표본 검증으로 서버가 다시 추출한 값으로 교체
+
+class RollupPeriodEnum(str, enum.Enum):
+    """집계(rollup) 단위를 나타내는 Enum"""
+
+    DAY = "day"      # 일 단위 집계
+    WEEK = "week"    # 주 단위 집계 (월요일 시작)
@@ -0,0 +1,50 @@
+# app/models/feature_rollups.py
+
+from typing import Optional
+from datetime import date, datetime, timezone
+from sqlmodel import Field, SQLModel
+from sqlalchemy import func, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Integer
+from .enums import RollupPeriodEnum
+
+
+# =================================================================
+# 환자별 음성 특징 / 심화 훈련 점수의 일·주 단위 집계 테이블
+# =================================================================
+
+class PatientFeatureRollupBase(SQLModel):
+    """PatientFeatureRollup의 공통 필드"""
+    patient_id: int
+    period: "RollupPeriodEnum"
+    period_start: date
+    metric: str = Field(max_length=32)
+    count: int = Field(default=0)
+    total: float = Field(default=0.0)
+    min_value: Optional[float] = Field(default=None)
+    max_value: Optional[float] = Field(default=None)
+
+class PatientFeatureRollup(PatientFeatureRollupBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    patient_id: int = Field(sa_column=Column(Integer, ForeignKey("patient.account_id", ondelete="CASCADE"), nullable=False, index=True))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": func.now()}
+    )
+    # (환자, 집계 단위, 시작일, 지표) 조합은 하나만 존재해야 하며, 기간 조회용 인덱스 역할도 합니다.
+    __table_args__ = (
+        UniqueConstraint("patient_id", "period", "period_start", "metric", name="uq_patient_feature_rollup"),
+    )
+
+class PatientFeatureRollupCreate(PatientFeatureRollupBase):
+    pass
+
+class PatientFeatureRollupRead(PatientFeatureRollupBase):
+    id: int
+    updated_at: datetime
+    model_config = {"from_attributes": True}
+
+class PatientFeatureRollupUpdate(SQLModel):
+    count: Optional[int] = None
+    total: Optional[float] = None
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
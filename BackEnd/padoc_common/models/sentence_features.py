@@ -2,7 +2,10 @@
 
 from typing import Optional, Dict, Any, TYPE_CHECKING
 from sqlmodel import Field, Relationship, SQLModel
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, JSON, LargeBinary
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
+
+from padoc_common.sampling_codec import SamplingLod, SamplingSeries
 
 if TYPE_CHECKING:
     from .voice_records import VoiceRecord
@@ -19,8 +22,24 @@ class SentenceFeaturesBase(SQLModel):
 
 class SentenceFeatures(SentenceFeaturesBase, table=True):
     record_id: int = Field(foreign_key="voicerecord.id", unique=True, primary_key=True)
+    # sampling_data 를 padoc_common.sampling_codec 의 이진 형식으로 저장한 값 (새 데이터는 여기에만 저장)
+    sampling_blob: Optional[bytes] = Field(
+        default=None, sa_column=Column(LargeBinary().with_variant(MEDIUMBLOB(), "mysql"))
+    )
+    # sampling_blob 을 LTTB 로 미리 줄여 둔 단계별 결과 (padoc_common.sampling_codec.encode_sampling_lod)
+    sampling_lod: Optional[bytes] = Field(
+        default=None, sa_column=Column(LargeBinary().with_variant(MEDIUMBLOB(), "mysql"))
+    )
     record: "VoiceRecord" = Relationship(back_populates="sentence_features")
 
+    def sampling_series(self) -> Optional[SamplingSeries]:
+        """이진 시계열을 지연 디코더로 반환합니다. 아직 이진 형식으로 옮기지 않은 행은 None 입니다."""
+        return SamplingSeries(self.sampling_blob) if self.sampling_blob else None
+
+    def sampling_lod_levels(self) -> Optional[SamplingLod]:
+        """미리 계산한 LOD 피라미드를 지연 디코더로 반환합니다. 없으면 None 입니다."""
+        return SamplingLod(self.sampling_lod) if self.sampling_lod else None
+
 class SentenceFeaturesCreate(SentenceFeaturesBase):
     """내부적으로 SentenceFeaturess를 생성할 때 사용하는 스키마"""
     pass
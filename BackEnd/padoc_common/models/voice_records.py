@@ -4,8 +4,8 @@ from typing import Optional, TYPE_CHECKING, List
 from datetime import datetime, timezone
 from sqlmodel import Field, Relationship, SQLModel
 from sqlalchemy.orm import Mapped
-from sqlalchemy import Column, Integer, ForeignKey
-from .enums import RecordingTypeEnum, FileStatusEnum
+from sqlalchemy import Column, Index, Integer, ForeignKey
+from .enums import RecordingTypeEnum, FileStatusEnum, FeatureSourceEnum
 
 # --- 순환 참조 방지를 위한 타입 체킹 ---
 if TYPE_CHECKING:
@@ -34,10 +34,18 @@ class VoiceRecordBase(SQLModel):
     type: "RecordingTypeEnum" = Field(default=RecordingTypeEnum.none_)
     status: "FileStatusEnum" = Field(default=FileStatusEnum.PENDING_UPLOAD)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # 특징 값의 출처 (기존 데이터는 NULL = 서버 추출)
+    feature_source: Optional["FeatureSourceEnum"] = Field(default=None)
+    # 표본 검증 시 장치 값과 서버 값의 최대 상대 오차 (검증하지 않았으면 NULL)
+    feature_drift: Optional[float] = Field(default=None)
 
 class VoiceRecord(VoiceRecordBase, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
+
+    # 환자별 최근 녹음 조회(의사용 환자 목록 요약 등)용 인덱스
+    __table_args__ = (Index("ix_voicerecord_patient_created", "patient_id", "created_at"),)
+
     patient: Mapped["Patient"] = Relationship(back_populates="voice_records")
     ah_features: Mapped[Optional["AhFeatures"]] = Relationship(
         back_populates="record", sa_relationship_kwargs={"cascade": "all, delete-orphan", "uselist": False}
@@ -0,0 +1,305 @@
+# padoc_common/sampling_codec.py
+"""SentenceFeatures 시계열(sampling_data)의 이진 저장 형식
+
+기존 JSON 은 25 ms 프레임마다 {"energy": x, "frequency": y} 딕셔너리를 저장하여 키 이름이
+반복되고, 읽을 때마다 DataPoint 로 검증합니다. 이진 형식은 값을 열(column) 단위 float32
+배열로 저장합니다.
+
+레이아웃 (리틀 엔디언)::
+
+    헤더  magic "PDS1" | version u8 | flags u8 | reserved u16 | count u32
+          | sampling_rate f64 | start_time f64 | time_step f64
+    본문  energy float32[count] + frequency float32[count]
+
+- flags & FLAG_ZLIB: 본문을 바이트 단위로 섞은(shuffle) 뒤 zlib 으로 압축합니다.
+  float32 의 같은 자리 바이트끼리 모이므로 압축률이 높아집니다. (무손실)
+- 값이 없는 프레임(None)은 NaN 으로 저장하고, 디코딩할 때 None 으로 되돌립니다.
+- start_time/time_step 을 모르는 기존 데이터는 NaN 으로 저장합니다.
+
+차트용 다운샘플링 결과(LOD 피라미드)는 별도의 형식으로 저장합니다::
+
+    헤더  magic "PDL1" | version u8 | flags u8 | level_count u16 | source_count u32
+    본문  단계마다 target u32, 그리고 energy/frequency 각각 n u32 + index u32[n] + value f32[n]
+"""
+
+import math
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from padoc_common.downsampling import lttb
+
+MAGIC = b"PDS1"
+LOD_MAGIC = b"PDL1"
+VERSION = 1
+FLAG_ZLIB = 0x01
+
+_HEADER = struct.Struct("<4sBBHIddd")
+_LOD_HEADER = struct.Struct("<4sBBHI")
+_U32 = struct.Struct("<I")
+_ITEM_SIZE = 4  # float32
+
+# 미리 계산해 두는 LOD 단계(목표 점 개수). 원본 프레임 수보다 작은 단계만 저장합니다.
+LOD_LEVELS = (2048, 1024, 512, 256, 128)
+
+
+class SamplingCodecError(ValueError):
+    """이진 시계열 데이터의 형식이 잘못된 경우 발생합니다."""
+
+
+def _to_float32_array(values: Sequence[Optional[float]]) -> array:
+    column = array("f", (math.nan if value is None else value for value in values))
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def _from_float32_bytes(raw: bytes) -> array:
+    column = array("f")
+    column.frombytes(raw)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def _shuffle(raw: bytes) -> bytes:
+    return b"".join(raw[i::_ITEM_SIZE] for i in range(_ITEM_SIZE))
+
+
+def _unshuffle(raw: bytes) -> bytes:
+    out = bytearray(len(raw))
+    lane = len(raw) // _ITEM_SIZE
+    for i in range(_ITEM_SIZE):
+        out[i::_ITEM_SIZE] = raw[i * lane:(i + 1) * lane]
+    return bytes(out)
+
+
+def encode_sampling(
+    energy: Sequence[Optional[float]],
+    frequency: Sequence[Optional[float]],
+    sampling_rate: Optional[float] = None,
+    start_time: Optional[float] = None,
+    time_step: Optional[float] = None,
+    compress: bool = True,
+) -> bytes:
+    """energy/frequency 열을 이진 형식으로 인코딩합니다."""
+    if len(energy) != len(frequency):
+        raise SamplingCodecError("energy 와 frequency 의 길이가 다릅니다.")
+
+    body = _to_float32_array(energy).tobytes() + _to_float32_array(frequency).tobytes()
+    flags = 0
+    if compress:
+        body = zlib.compress(_shuffle(body), 6)
+        flags |= FLAG_ZLIB
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        flags,
+        0,
+        len(energy),
+        math.nan if sampling_rate is None else sampling_rate,
+        math.nan if start_time is None else start_time,
+        math.nan if time_step is None else time_step,
+    )
+    return header + body
+
+
+def encode_sampling_data(sampling_data: Dict[str, Any], compress: bool = True) -> bytes:
+    """기존 JSON 형식({"sampling_rate", "data_points": [{"energy", "frequency"}, ...]})을 인코딩합니다.
+
+    start_time, time_step 키가 있으면 함께 저장합니다.
+    """
+    points = sampling_data.get("data_points") or []
+    return encode_sampling(
+        [point.get("energy") for point in points],
+        [point.get("frequency") for point in points],
+        sampling_rate=sampling_data.get("sampling_rate"),
+        start_time=sampling_data.get("start_time"),
+        time_step=sampling_data.get("time_step"),
+        compress=compress,
+    )
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class SamplingSeries:
+    """이진 시계열의 지연 디코더
+
+    헤더만 먼저 읽고, energy/frequency 배열은 처음 접근할 때 한 번만 풀어 둡니다.
+    """
+
+    __slots__ = ("_blob", "count", "sampling_rate", "start_time", "time_step", "_flags", "_columns")
+
+    def __init__(self, blob: bytes):
+        if len(blob) < _HEADER.size:
+            raise SamplingCodecError("이진 시계열 데이터가 너무 짧습니다.")
+        magic, version, flags, _, count, sampling_rate, start_time, time_step = _HEADER.unpack_from(blob)
+        if magic != MAGIC or version != VERSION:
+            raise SamplingCodecError("지원하지 않는 이진 시계열 형식입니다.")
+        self._blob = blob
+        self._flags = flags
+        self._columns = None
+        self.count = count
+        self.sampling_rate = _optional(sampling_rate)
+        self.start_time = _optional(start_time)
+        self.time_step = _optional(time_step)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _decode(self):
+        if self._columns is None:
+            body = self._blob[_HEADER.size:]
+            if self._flags & FLAG_ZLIB:
+                body = _unshuffle(zlib.decompress(body))
+            column_size = self.count * _ITEM_SIZE
+            if len(body) != 2 * column_size:
+                raise SamplingCodecError("이진 시계열 데이터의 길이가 헤더와 다릅니다.")
+            self._columns = (
+                _from_float32_bytes(body[:column_size]),
+                _from_float32_bytes(body[column_size:]),
+            )
+        return self._columns
+
+    @property
+    def energy(self) -> array:
+        return self._decode()[0]
+
+    @property
+    def frequency(self) -> array:
+        return self._decode()[1]
+
+    def times(self) -> Optional[List[float]]:
+        """프레임별 시각(초)을 반환합니다. 시작 시각/간격을 모르면 None 입니다."""
+        if self.start_time is None or self.time_step is None:
+            return None
+        return [self.start_time + i * self.time_step for i in range(self.count)]
+
+    def points(self) -> List[Tuple[Optional[float], Optional[float]]]:
+        """프레임별 (energy, frequency) 목록을 반환합니다. NaN 은 None 으로 바꿉니다."""
+        energy, frequency = self._decode()
+        return [(_optional(e), _optional(f)) for e, f in zip(energy, frequency)]
+
+    def to_sampling_data(self) -> Dict[str, Any]:
+        """기존 JSON 형식의 딕셔너리로 변환합니다. (API 응답 호환용)"""
+        return {
+            "sampling_rate": self.sampling_rate,
+            "start_time": self.start_time,
+            "time_step": self.time_step,
+            "data_points": [{"energy": e, "frequency": f} for e, f in self.points()],
+        }
+
+
+# --- LOD 피라미드 ---
+
+# (골라진 프레임 번호, 값) 쌍
+IndexedSeries = Tuple[Sequence[int], Sequence[Optional[float]]]
+
+
+def _to_uint32_array(values: Sequence[int]) -> array:
+    column = array("I", values)
+    if column.itemsize != 4:
+        column = array("L", values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def _from_uint32_bytes(raw: bytes) -> array:
+    column = array("I")
+    column.frombytes(raw)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def encode_lod(source_count: int, levels: Dict[int, Tuple[IndexedSeries, IndexedSeries]]) -> bytes:
+    """단계별 (energy, frequency) 다운샘플링 결과를 LOD 형식으로 인코딩합니다.
+
+    Args:
+        source_count: 원본 프레임 수입니다.
+        levels: 목표 점 개수 -> ((energy 프레임 번호, 값), (frequency 프레임 번호, 값)) 입니다.
+    """
+    parts = []
+    for target in sorted(levels):
+        parts.append(_U32.pack(target))
+        for indices, values in levels[target]:
+            parts.append(_U32.pack(len(indices)))
+            parts.append(_to_uint32_array(indices).tobytes())
+            parts.append(_to_float32_array(values).tobytes())
+    body = zlib.compress(b"".join(parts), 6)
+    return _LOD_HEADER.pack(LOD_MAGIC, VERSION, FLAG_ZLIB, len(levels), source_count) + body
+
+
+def encode_sampling_lod(series: "SamplingSeries", levels: Sequence[int] = LOD_LEVELS) -> Optional[bytes]:
+    """이진 시계열에서 LTTB 로 단계별 LOD 피라미드를 만들어 인코딩합니다.
+
+    원본이 가장 작은 단계보다 짧아 저장할 단계가 없으면 None 을 반환합니다.
+    """
+    energy, frequency = series.energy, series.frequency
+    computed = {}
+    for target in levels:
+        if target >= series.count:
+            continue
+        energy_indices = lttb(energy, target)
+        frequency_indices = lttb(frequency, target)
+        computed[target] = (
+            (energy_indices, [energy[i] for i in energy_indices]),
+            (frequency_indices, [frequency[i] for i in frequency_indices]),
+        )
+    if not computed:
+        return None
+    return encode_lod(series.count, computed)
+
+
+class SamplingLod:
+    """LOD 피라미드의 지연 디코더 (헤더만 먼저 읽고, 단계 데이터는 처음 접근할 때 풉니다)"""
+
+    __slots__ = ("_blob", "_flags", "_levels", "level_count", "source_count")
+
+    def __init__(self, blob: bytes):
+        if len(blob) < _LOD_HEADER.size:
+            raise SamplingCodecError("LOD 데이터가 너무 짧습니다.")
+        magic, version, flags, level_count, source_count = _LOD_HEADER.unpack_from(blob)
+        if magic != LOD_MAGIC or version != VERSION:
+            raise SamplingCodecError("지원하지 않는 LOD 형식입니다.")
+        self._blob = blob
+        self._flags = flags
+        self._levels = None
+        self.level_count = level_count
+        self.source_count = source_count
+
+    def _decode(self) -> Dict[int, Tuple[Tuple[array, array], Tuple[array, array]]]:
+        if self._levels is None:
+            body = self._blob[_LOD_HEADER.size:]
+            if self._flags & FLAG_ZLIB:
+                body = zlib.decompress(body)
+            levels = {}
+            offset = 0
+            for _ in range(self.level_count):
+                (target,), offset = _U32.unpack_from(body, offset), offset + _U32.size
+                series = []
+                for _ in range(2):
+                    (n,), offset = _U32.unpack_from(body, offset), offset + _U32.size
+                    indices = _from_uint32_bytes(body[offset:offset + n * _ITEM_SIZE])
+                    offset += n * _ITEM_SIZE
+                    values = _from_float32_bytes(body[offset:offset + n * _ITEM_SIZE])
+                    offset += n * _ITEM_SIZE
+                    series.append((indices, values))
+                levels[target] = tuple(series)
+            self._levels = levels
+        return self._levels
+
+    def targets(self) -> List[int]:
+        """저장된 단계의 목표 점 개수 목록 (오름차순)"""
+        return sorted(self._decode())
+
+    def level(self, target: int) -> Tuple[Tuple[array, array], Tuple[array, array]]:
+        """((energy 프레임 번호, 값), (frequency 프레임 번호, 값)) 을 반환합니다."""
+        return self._decode()[target]
+
@@ -1,8 +1,8 @@
 # app/schemas/connection.py
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from padoc_common.models.enums import ConnectionStatusEnum
 
@@ -29,3 +29,35 @@ class Connection(BaseModel):
 class ConnectionList(BaseModel):
     """연결 정보 목록"""
     connections: List[Connection]
+
+
+# 일괄 처리 요청 한 번에 받을 수 있는 최대 항목 수
+BULK_CONNECTION_MAX_ITEMS = 500
+
+
+class BulkConnectionRequestPayload(BaseModel):
+    """의사가 여러 환자에게 한 번에 연결을 요청할 때의 요청 본문"""
+    patient_ids: List[int] = Field(..., min_length=1, max_length=BULK_CONNECTION_MAX_ITEMS)
+
+class BulkUpdateConnectionStatus(BaseModel):
+    """여러 연결의 상태를 한 번에 변경할 때의 요청 본문"""
+    connection_ids: List[int] = Field(..., min_length=1, max_length=BULK_CONNECTION_MAX_ITEMS)
+
+class BulkConnectionItemResult(BaseModel):
+    """일괄 처리의 항목별 결과 (id 는 요청 시 보낸 환자 ID 또는 연결 ID)"""
+    id: int
+    success: bool
+    connection_id: Optional[int] = None
+    connection_status: Optional[ConnectionStatusEnum] = None
+    message: Optional[str] = None
+
+class BulkConnectionResult(BaseModel):
+    """일괄 처리 결과 목록"""
+    succeeded: int
+    failed: int
+    results: List[BulkConnectionItemResult]
+
+    @classmethod
+    def from_results(cls, results: List[BulkConnectionItemResult]) -> "BulkConnectionResult":
+        succeeded = sum(1 for item in results if item.success)
+        return cls(succeeded=succeeded, failed=len(results) - succeeded, results=results)
@@ -1,8 +1,8 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict
-from padoc_common.models.enums import RecordingTypeEnum, AdvTrainingProgressEnum
+from padoc_common.models.enums import RecordingTypeEnum, AdvTrainingProgressEnum, RollupPeriodEnum
 from padoc_common.schemas.features import AhFeatures, SentenceFeatures
 
 
@@ -44,3 +44,90 @@ class AdvTrainingInformation(BaseModel):
 
 class AdvTrainingInformationList(BaseModel):
     trainings: List[AdvTrainingInformation]
+
+
+class MetricSummary(BaseModel):
+    """기간 내 단일 지표의 집계 값"""
+    metric: str
+    mean: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    count: int = 0
+
+
+class TrendBucket(BaseModel):
+    """일/주 단위 집계 구간"""
+    period_start: date
+    metrics: List[MetricSummary]
+
+
+class TrendResponse(BaseModel):
+    """환자 지표 추이 응답 (source: 'rollup' 또는 'raw')"""
+    period: RollupPeriodEnum
+    source: str
+    buckets: List[TrendBucket]
+
+
+class CacheStatsResponse(BaseModel):
+    """대시보드 응답 캐시 통계"""
+    local_hits: int
+    redis_hits: int
+    misses: int
+    hit_ratio: float
+    not_modified: int
+    invalidations: int
+    redis_errors: int
+    entries: int
+    max_entries: int
+    redis_enabled: bool
+
+
+class PatientOverview(BaseModel):
+    """의사용 환자 목록 화면의 환자별 요약 (지표 값이 없으면 None)"""
+    patient_id: int
+    full_name: str
+    last_recorded_at: Optional[datetime] = None
+    jitter: Optional[float] = None
+    shimmer: Optional[float] = None
+    hnr: Optional[float] = None
+    f0: Optional[float] = None
+    cpp: Optional[float] = None
+    csid: Optional[float] = None
+    last_avg_score: Optional[int] = None
+    last_trained_at: Optional[datetime] = None
+
+
+class PendingPatient(BaseModel):
+    """의사가 요청했지만 아직 승인되지 않은 환자"""
+    patient_id: int
+    full_name: str
+    connection_id: int
+
+
+class DoctorOverviewResponse(BaseModel):
+    """의사용 환자 목록 요약 (patients 는 저장된 목록 순서대로)"""
+    patients: List[PatientOverview]
+    pending: List[PendingPatient]
+
+
+# 시계열 다운샘플링 요청의 최대 점 개수
+SAMPLING_MAX_POINTS = 10000
+
+
+class DownsampledSeries(BaseModel):
+    """다운샘플링한 시계열 (index 는 원본 프레임 번호, 값이 없는 프레임은 None)"""
+    index: List[int]
+    values: List[Optional[float]]
+
+
+class SamplingSeriesResponse(BaseModel):
+    """문장 발성 녹음의 energy/frequency 시계열 (프레임 시각 = start_time + index * time_step)"""
+    record_id: int
+    method: Literal["lttb", "minmax"]
+    source_points: int
+    sampling_rate: Optional[float] = None
+    start_time: Optional[float] = None
+    time_step: Optional[float] = None
+    energy: DownsampledSeries
+    frequency: DownsampledSeries
+
@@ -19,14 +19,14 @@ class ShimmerMetrics(BaseModel):
     apq11: float
     dda: float
 
-class DataPoint(BaseModel):
-    energy: Optional[float] = None
-    frequency: Optional[float] = None
-
-# "sampling_data" 딕셔너리에 해당하는 모델
+# 문장 발성 시계열 응답 모델 (열 단위)
+# energy[i], frequency[i] 가 i 번째 프레임의 값이며, 값이 없는 프레임은 None 입니다.
 class SamplingData(BaseModel):
     sampling_rate: Optional[float] = None
-    data_points: List[DataPoint] = []
+    start_time: Optional[float] = None  # 첫 프레임 시각(초)
+    time_step: Optional[float] = None   # 프레임 간격(초)
+    energy: List[Optional[float]] = []
+    frequency: List[Optional[float]] = []
 
 
 class AhFeatures(BaseModel):
@@ -73,4 +73,14 @@ class SentenceFeatures(BaseModel):
 
 class ParkinsonPredictionResult(BaseModel):
     """파킨슨병 진단 결과"""
-    ai_score: int
\ No newline at end of file
+    ai_score: int
+
+class ParkinsonWindowScore(BaseModel):
+    """녹음 구간 하나의 파킨슨병 예측 점수"""
+    start_time: float  # 구간 시작 시각(초)
+    ai_score: int
+
+class ParkinsonWindowPredictionResult(ParkinsonPredictionResult):
+    """여러 구간 파킨슨병 진단 결과 (ai_score 는 구간별 확률 평균)"""
+    window_seconds: float
+    windows: List[ParkinsonWindowScore]
@@ -0,0 +1,49 @@
+# app/schemas/note.py
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# 메모 목록 한 페이지의 최대 개수
+NOTE_PAGE_MAX_LIMIT = 100
+
+
+class NoteCreate(BaseModel):
+    """의사 메모 작성 요청 본문"""
+    patient_id: int
+    note_content: str = Field(..., min_length=1)
+
+class NoteUpdate(BaseModel):
+    """의사 메모 수정 요청 본문"""
+    note_content: str = Field(..., min_length=1)
+
+class Note(BaseModel):
+    """환자에 대한 의사 메모 (doctor_note 테이블)"""
+    id: int
+    patient_id: int
+    doctor_id: int
+    note_content: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class NotePage(BaseModel):
+    """메모 목록 한 페이지
+
+    next_cursor 를 다음 요청의 cursor 로 보내면 이어지는 (더 오래된) 메모를 받습니다.
+    더 이상 메모가 없으면 None 입니다.
+    """
+    notes: List[Note]
+    next_cursor: Optional[str] = None
+
+class NoteCount(BaseModel):
+    """환자별 메모 개수 요약"""
+    patient_id: int
+    count: int
+    latest_at: Optional[datetime] = None
+
+class NoteCountList(BaseModel):
+    """환자별 메모 개수 요약 목록"""
+    counts: List[NoteCount]
@@ -1,8 +1,11 @@
 import datetime
-from typing import Any, List, Optional
+from typing import Annotated, Any, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# 한 번의 일괄 등록/반복 일정으로 만들 수 있는 최대 날짜 수
+SCHEDULE_BULK_MAX_DATES = 366
+
 class ScheduleDate(BaseModel):
     schedule_id: int
     date: datetime.date
@@ -13,8 +16,22 @@ class ScheduleListResponse(BaseModel):
 class ScheduleCreate(BaseModel):
     date: datetime.date
 
+class ScheduleBulkCreate(BaseModel):
+    dates: List[datetime.date] = Field(..., min_length=1, max_length=SCHEDULE_BULK_MAX_DATES)
+
+class ScheduleRecurrenceCreate(BaseModel):
+    """반복 일정 (예: 시작일부터 12주 동안 매주 월/수/금)"""
+    start_date: datetime.date
+    weekdays: List[Annotated[int, Field(ge=0, le=6)]] = Field(..., min_length=1, max_length=7, description="요일 (0=월요일 ... 6=일요일)")
+    weeks: int = Field(..., ge=1, le=52, description="반복할 주 수")
+
+class ScheduleBulkCreateResponse(BaseModel):
+    appointment_dates: List[ScheduleDate]
+    created_count: int
+    skipped_count: int
+
 class ScheduleNotFoundError(Exception):
     pass
 
 class PermissionDeniedError(Exception):
-    pass
\ No newline at end of file
+    pass
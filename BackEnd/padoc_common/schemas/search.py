@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 
 
@@ -16,9 +16,20 @@ class UserSearchResultList(BaseModel):
     """유저 검색 결과 리스트 스키마"""
 
     users: List[UserSearchResult]
+    total: Optional[int] = None  # 페이지와 관계없는 전체 검색 결과 수
     model_config = ConfigDict(from_attributes=True)
 
 class UserSearchResponse(UserSearchResultList):
     """유저 검색 응답 스키마"""
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class TypeaheadResponse(BaseModel):
+    """자동완성 응답 스키마
+
+    version 은 색인이 바뀔 때마다 증가합니다. 클라이언트는 늦게 도착한 응답의 version 이
+    이미 받은 응답보다 작으면 버릴 수 있습니다.
+    """
+
+    users: List[UserSearchResult]
+    version: int
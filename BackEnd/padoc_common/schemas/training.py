@@ -7,11 +7,35 @@ from padoc_common.schemas.features import AhFeatures
 from padoc_common.schemas.screening import SentenceScreeningResult
 
 
+# 장치가 직접 계산한 음성 특징 (AhFeatures / SentenceFeatures 의 평평한 필드 이름을 사용)
+# 녹음 유형의 지표를 모두, 서버와 같은 파라미터(parameter_set="server")로 계산해 보내야 합니다.
+class DeviceFeatures(BaseModel):
+    parameter_set: str = Field(..., example="server")
+    jitter_local: Optional[float] = Field(None, example=0.0093)
+    jitter_rap: Optional[float] = None
+    jitter_ppq5: Optional[float] = None
+    jitter_ddp: Optional[float] = None
+    shimmer_local: Optional[float] = Field(None, example=0.052)
+    shimmer_apq3: Optional[float] = None
+    shimmer_apq5: Optional[float] = None
+    shimmer_apq11: Optional[float] = None
+    shimmer_dda: Optional[float] = None
+    hnr: Optional[float] = Field(None, example=18.2)
+    nhr: Optional[float] = Field(None, example=0.015)
+    f0: Optional[float] = Field(None, example=182.5)
+    max_f0: Optional[float] = Field(None, example=195.1)
+    min_f0: Optional[float] = Field(None, example=171.3)
+    cpp: Optional[float] = Field(None, example=9.8)
+    csid: Optional[float] = Field(None, example=12.4)
+
+
 # 훈련 음성 파일 제출 요청 시 받는 데이터
 class BasicTrainingUploadRequest(BaseModel):
     file_name: str = Field(..., example="training_voice_20250804.wav")
     type: enums.RecordingTypeEnum = Field(..., example="voice_ah")
     related_voice_record_id: Optional[int] = Field(None, example=1)
+    # 선택: 장치가 계산한 특징. 보내면 서버 재추출 없이 바로 저장합니다. (일부 표본만 서버가 검증)
+    device_features: Optional[DeviceFeatures] = None
 
 
 # 백엔드가 클라이언트에 응답할 데이터 (업로드 URL)
@@ -0,0 +1,48 @@
+# padoc_voice/__init__.py
+"""장치(AIot)와 음성 분석 서버가 함께 쓰는 음성 지표 계산 라이브러리.
+
+    from padoc_voice import DEVICE, SERVER, extract_ah, extract_sentence, extract_many
+
+- params   : 파라미터 묶음 (DEVICE / SERVER) — 무거운 import 없음
+- audio    : LoadedAudio (한 번 디코딩 + 모노/리샘플 캐시)
+- kernels  : CPPS, L/H ratio, CSID, pitch 시계열 벡터화 커널
+- features : 녹음 하나의 지표 계산
+- batch    : 여러 녹음 분석 (프로세스 풀), 평균
+- window   : 녹음 일부 구간만 디코딩 + 리샘플 (파킨슨 예측 전처리, soundfile/librosa 필요)
+- CLI      : python -m padoc_voice --help
+
+parselmouth/numpy/scipy 는 실제로 지표를 계산하는 이름을 처음 쓸 때 import 하므로,
+`from padoc_voice.params import DEVICE` 처럼 파라미터만 필요한 곳은 가볍게 불러올 수 있습니다.
+"""
+from importlib import import_module
+
+from .params import DEVICE, PARAMETER_SETS, SERVER, ParameterSet, get_params
+
+_LAZY = {
+    "LoadedAudio": "audio",
+    "extract_ah": "features",
+    "extract_sentence": "features",
+    "extract_all": "features",
+    "extract_upload_features": "features",
+    "sampling_contour": "features",
+    "nest_ah": "features",
+    "AH_KEYS": "features",
+    "SENTENCE_KEYS": "features",
+    "extract_file": "batch",
+    "extract_many": "batch",
+    "map_files": "batch",
+    "average": "batch",
+    "load_window": "window",
+}
+
+__all__ = ["DEVICE", "PARAMETER_SETS", "SERVER", "ParameterSet", "get_params", *_LAZY]
+__version__ = "0.1.0"
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'padoc_voice' has no attribute '{name}'")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,59 @@
+# padoc_voice/__main__.py
+"""음성 지표 계산 CLI.
+
+사용 예)
+    python -m padoc_voice a.wav b.wav                         # 장치 설정, 파일별 결과 (JSON Lines)
+    python -m padoc_voice --params server --kind ah a.wav     # 서버 설정, '아' 지표만
+    python -m padoc_voice --kind sentence --contour a.wav     # 문장 지표 + intensity/pitch 시계열
+    python -m padoc_voice --average --workers 4 *.wav         # 여러 파일을 병렬로 분석해 평균만 출력
+"""
+import argparse
+import json
+import math
+import sys
+
+from .batch import EXTRACTORS, average, default_workers, extract_many
+from .features import AH_KEYS, SENTENCE_KEYS
+from .params import PARAMETER_SETS
+
+
+def _json_safe(value):
+    """NaN/inf 는 JSON 표준이 아니므로 null 로 바꿉니다."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="padoc_voice", description="음성 지표 계산 (jitter/shimmer/HNR/CPPS/CSID)")
+    parser.add_argument("paths", nargs="+", help="분석할 wav 파일")
+    parser.add_argument("--params", choices=sorted(PARAMETER_SETS), default="device", help="파라미터 묶음")
+    parser.add_argument("--kind", choices=sorted(EXTRACTORS), default="all", help="계산할 지표 묶음")
+    parser.add_argument("--contour", action="store_true", help="--kind sentence 일 때 시계열(sampling_data)도 출력")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="동시에 분석할 파일 수")
+    parser.add_argument("--average", action="store_true", help="파일별 결과 대신 지표별 평균 한 줄만 출력")
+    args = parser.parse_args(argv)
+
+    on_result = None
+    if not args.average:
+        def on_result(index, path, result, done):
+            print(json.dumps(_json_safe({"path": path, **result}), ensure_ascii=False), flush=True)
+
+    results = extract_many(
+        args.paths, kind=args.kind, params=args.params, workers=max(1, args.workers),
+        on_result=on_result, contour=args.contour,
+    )
+    failed = sum("error" in r for r in results)
+    if args.average:
+        keys = {"ah": AH_KEYS, "sentence": SENTENCE_KEYS, "all": AH_KEYS + SENTENCE_KEYS}[args.kind]
+        averaged = average(results, keys)
+        print(json.dumps(_json_safe(averaged if averaged is not None else {"error": "All analyses failed."})))
+    return 1 if failed == len(results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
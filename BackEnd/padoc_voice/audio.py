@@ -0,0 +1,90 @@
+# padoc_voice/audio.py
+"""녹음 한 번 디코딩 + 파생 신호(모노, 리샘플) 캐시"""
+import io
+from functools import cached_property
+
+import numpy as np
+import parselmouth
+from parselmouth.praat import call
+
+from .params import DOWNMIX_FIRST, DOWNMIX_MEAN
+
+
+def _to_mono(snd: parselmouth.Sound, downmix: str) -> parselmouth.Sound:
+    if snd.n_channels == 1:
+        return snd
+    if downmix == DOWNMIX_MEAN:
+        return call(snd, "Convert to mono")
+    return call(snd, "Extract one channel...", 1)
+
+
+class LoadedAudio:
+    """한 번 디코딩한 녹음과, 지표 계산에 쓰는 파생 신호(모노, 리샘플)의 캐시.
+
+    파생 신호는 처음 접근할 때 한 번만 만들고, 이후에는 같은 객체를 돌려줍니다.
+    downmix 는 여러 채널 녹음을 모노로 만드는 방법입니다. (params.DOWNMIX_MEAN / DOWNMIX_FIRST)
+    """
+
+    def __init__(self, sound: parselmouth.Sound, downmix: str = DOWNMIX_FIRST):
+        self.sound = sound
+        self.downmix = downmix
+        self._resampled = {}
+
+    @classmethod
+    def from_file(cls, file_path, downmix: str = DOWNMIX_FIRST) -> "LoadedAudio":
+        return cls(parselmouth.Sound(str(file_path)), downmix)
+
+    @classmethod
+    def from_samples(cls, samples, sampling_frequency, downmix=DOWNMIX_MEAN) -> "LoadedAudio":
+        """(샘플 수,) 또는 (샘플 수, 채널 수) 배열로 만듭니다. downmix="mean" 이면 채널을 평균합니다."""
+        samples = np.asarray(samples, dtype=np.float64)
+        if samples.ndim == 2:
+            samples = samples.mean(axis=1) if downmix == DOWNMIX_MEAN else samples.T
+        return cls(parselmouth.Sound(samples, sampling_frequency=sampling_frequency), downmix)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, downmix=DOWNMIX_MEAN) -> "LoadedAudio":
+        """wav 바이트를 soundfile 로 디코딩합니다. (서버 업로드 처리용, soundfile 필요)"""
+        import soundfile as sf
+
+        samples, sampling_frequency = sf.read(io.BytesIO(data))
+        return cls.from_samples(samples, sampling_frequency, downmix)
+
+    @classmethod
+    def coerce(cls, source, downmix: str = DOWNMIX_FIRST) -> "LoadedAudio":
+        """LoadedAudio, parselmouth.Sound, 파일 경로 중 무엇이든 LoadedAudio 로 바꿉니다.
+
+        이미 LoadedAudio 이면 (만들 때 정한 downmix 그대로) 같은 객체를 돌려줍니다.
+        """
+        if isinstance(source, cls):
+            return source
+        if isinstance(source, parselmouth.Sound):
+            return cls(source, downmix)
+        return cls.from_file(source, downmix)
+
+    @property
+    def duration(self) -> float:
+        return self.sound.duration
+
+    @cached_property
+    def mono(self) -> parselmouth.Sound:
+        """모노 신호: 채널 평균 또는 첫 번째 채널 (모노 녹음이면 원본 그대로)"""
+        return _to_mono(self.sound, self.downmix)
+
+    @property
+    def praat_sound(self) -> parselmouth.Sound:
+        """Praat 분석(피치, jitter/shimmer, HNR ...)에 넘기는 신호.
+
+        DOWNMIX_FIRST 는 예전 장치 동작대로 원본 채널을 그대로 넘기고 (Praat 이 채널을 함께 사용),
+        DOWNMIX_MEAN 은 채널 평균 모노를 넘깁니다.
+        """
+        return self.mono if self.downmix == DOWNMIX_MEAN else self.sound
+
+    def resampled(self, fs_target: int) -> parselmouth.Sound:
+        """fs_target 으로 리샘플한 모노 신호 (원본과 같은 샘플링 주파수면 모노 그대로)"""
+        if fs_target not in self._resampled:
+            mono = self.mono
+            if mono.sampling_frequency != fs_target:
+                mono = call(mono, "Resample...", fs_target, 50)
+            self._resampled[fs_target] = mono
+        return self._resampled[fs_target]
@@ -0,0 +1,92 @@
+# padoc_voice/batch.py
+"""여러 녹음을 한 번에 분석하는 API.
+
+Praat(parselmouth)은 스레드 안전하지 않으므로 병렬 처리는 프로세스 풀에서 합니다.
+결과는 항상 입력 순서로 돌려주며, 실패한 파일은 {"error": "..."} 로 채웁니다.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from .features import extract_ah, extract_all, extract_sentence
+from .params import DEVICE, get_params
+
+EXTRACTORS = {"ah": extract_ah, "sentence": extract_sentence, "all": extract_all}
+
+
+def extract_file(path, kind="all", params=DEVICE, contour=False) -> dict:
+    """파일 하나를 분석합니다. 예외 대신 {"error": ...} 를 돌려주므로 프로세스 풀에서 쓰기 좋습니다."""
+    try:
+        extractor = EXTRACTORS[kind]
+        if kind == "sentence":
+            return extractor(path, get_params(params), contour=contour)
+        return extractor(path, get_params(params))
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def map_files(func, paths, executor=None, on_result=None) -> list:
+    """paths 마다 func(path) 를 실행해 입력 순서대로 결과 목록을 돌려줍니다.
+
+    executor 를 주면 병렬로 실행하고, 파일이 끝날 때마다 (끝나는 순서대로)
+    on_result(index, path, result, done) 를 호출합니다.
+    """
+    results = [None] * len(paths)
+    if executor is None:
+        for i, path in enumerate(paths):
+            results[i] = func(path)
+            if on_result:
+                on_result(i, path, results[i], i + 1)
+        return results
+
+    futures = {executor.submit(func, path): i for i, path in enumerate(paths)}
+    for done, future in enumerate(as_completed(futures), start=1):
+        i = futures[future]
+        try:
+            results[i] = future.result()
+        except Exception as e:  # 작업 프로세스가 죽은 경우 등
+            results[i] = {"error": str(e)}
+        if on_result:
+            on_result(i, paths[i], results[i], done)
+    return results
+
+
+def default_workers() -> int:
+    """이 프로세스가 쓸 수 있는 CPU 코어 수"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def make_pool(workers: int) -> ProcessPoolExecutor:
+    """작업 프로세스를 미리 띄워 둔 프로세스 풀 (첫 요청이 프로세스 시작/import 비용을 치르지 않도록)"""
+    pool = ProcessPoolExecutor(max_workers=workers)
+    for future in [pool.submit(math.sqrt, 1.0) for _ in range(workers)]:
+        future.result()
+    return pool
+
+
+def extract_many(paths, kind="all", params=DEVICE, workers=None, on_result=None, contour=False) -> list:
+    """여러 파일을 분석합니다. workers 가 2 이상이면 프로세스 풀에서 병렬로 처리합니다."""
+    func = partial(extract_file, kind=kind, params=get_params(params), contour=contour)
+    workers = min(workers or default_workers(), len(paths))
+    if workers <= 1:
+        return map_files(func, paths, on_result=on_result)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return map_files(func, paths, executor=pool, on_result=on_result)
+
+
+def average(results, keys) -> dict:
+    """성공한 결과들의 지표별 평균. NaN 은 제외하며, 값이 하나도 없는 지표는 None 입니다.
+
+    성공한 결과가 하나도 없으면 None 을 돌려줍니다.
+    """
+    successes = [r for r in results if "error" not in r]
+    if not successes:
+        return None
+    averaged = {}
+    for key in keys:
+        values = [float(r[key]) for r in successes if r.get(key) is not None and math.isfinite(float(r[key]))]
+        averaged[key] = sum(values) / len(values) if values else None
+    return averaged
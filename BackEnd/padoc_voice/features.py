@@ -0,0 +1,155 @@
+# padoc_voice/features.py
+"""녹음 하나에서 음성 지표를 계산합니다.
+
+결과 키는 서버 DB(AhFeatures / SentenceFeatures)와 같은 이름을 씁니다.
+(jitter_local, shimmer_apq3, hnr, nhr, f0, max_f0, min_f0, cpp, csid)
+
+장치가 업로드 요청에 함께 보내는 값(device_features)은 extract_upload_features 로 계산합니다.
+서버 DB 의 같은 열에 저장되므로, 음성 분석 서버와 같은 디코딩과 SERVER 파라미터를 씁니다.
+
+stage 에 컨텍스트 매니저를 돌려주는 함수(예: voice_analysis_server.profiling.stage)를 주면
+단계별로 감싸서 호출합니다. 단계 이름은 서버 프로파일링에서 쓰던 이름 그대로입니다.
+"""
+from contextlib import nullcontext
+
+import numpy as np
+from parselmouth.praat import call
+
+from . import kernels
+from .audio import LoadedAudio
+from .params import SERVER, get_params
+
+JITTER_TYPES = ("local", "rap", "ppq5", "ddp")
+SHIMMER_TYPES = ("local", "apq3", "apq5", "apq11", "dda")
+AH_KEYS = (
+    *(f"jitter_{kind}" for kind in JITTER_TYPES),
+    *(f"shimmer_{kind}" for kind in SHIMMER_TYPES),
+    "hnr", "nhr", "f0", "max_f0", "min_f0",
+)
+SENTENCE_KEYS = ("cpp", "csid")
+
+
+def _stage(stage, name):
+    return stage(name) if stage else nullcontext()
+
+
+def extract_ah(source, params=SERVER, stage=None) -> dict:
+    """'아' 발성 지표: jitter 4종, shimmer 5종, HNR, NHR, F0 평균/최대/최소"""
+    params = get_params(params)
+    audio = LoadedAudio.coerce(source, params.downmix)
+    snd = audio.praat_sound
+    floor, ceiling = params.pitch_floor, params.pitch_ceiling
+
+    with _stage(stage, "point_process"):
+        point_process = call(snd, "To PointProcess (periodic, cc)", floor, ceiling)
+    with _stage(stage, "pitch"):
+        pitch = call(snd, "To Pitch", 0.0, floor, ceiling)
+    with _stage(stage, "harmonicity"):
+        harmonicity = call(
+            snd, "To Harmonicity (cc)",
+            params.harmonicity_time_step, floor,
+            params.harmonicity_silence_threshold, params.harmonicity_periods_per_window,
+        )
+
+    features = {}
+    with _stage(stage, "jitter_shimmer"):
+        for kind in JITTER_TYPES:
+            features[f"jitter_{kind}"] = call(point_process, f"Get jitter ({kind})", *params.jitter_args)
+        for kind in SHIMMER_TYPES:
+            features[f"shimmer_{kind}"] = call(
+                [snd, point_process], f"Get shimmer ({kind})", *params.jitter_args, *params.shimmer_extra_args
+            )
+
+    hnr = call(harmonicity, "Get mean", 0, 0)
+    features["hnr"] = hnr
+    features["nhr"] = 10 ** (-hnr / 10) if hnr > 0 or not params.nhr_clip_nonpositive else 0.0
+    features["f0"] = call(pitch, "Get mean", 0, 0, "Hertz")
+    features["max_f0"] = call(pitch, "Get maximum", 0, 0, "Hertz", "Parabolic")
+    features["min_f0"] = call(pitch, "Get minimum", 0, 0, "Hertz", "Parabolic")
+    return features
+
+
+def extract_sentence(source, params=SERVER, stage=None, contour=True) -> dict:
+    """문장 발성 지표: CPPS, CSID (+ contour=True 이면 intensity/pitch 시계열 sampling_data)"""
+    params = get_params(params)
+    audio = LoadedAudio.coerce(source, params.downmix)
+
+    with _stage(stage, "cpps"):
+        resampled = audio.resampled(params.cpp_fs_target)
+        cpp = kernels.cpps(
+            resampled.values[0].astype(np.float64), int(resampled.sampling_frequency), params
+        )
+    with _stage(stage, "lh"):
+        mono = audio.mono
+        lh_series = kernels.lh_ratio_series(mono.values[0], mono.sampling_frequency, params)
+
+    features = {"cpp": cpp, "csid": kernels.csid_awan2016(cpp, lh_series)}
+    if contour:
+        features["sampling_data"] = sampling_contour(audio, params, stage)
+    return features
+
+
+def sampling_contour(source, params=SERVER, stage=None) -> dict:
+    """intensity 프레임마다의 (energy, frequency) 시계열. 값이 없는 프레임(무성 등)은 0 입니다."""
+    params = get_params(params)
+    audio = LoadedAudio.coerce(source, params.downmix)
+    snd = audio.praat_sound
+
+    with _stage(stage, "intensity"):
+        intensity = call(snd, "To Intensity...", params.intensity_min_pitch, params.intensity_time_step, True)
+    with _stage(stage, "pitch"):
+        pitch = call(
+            snd, "To Pitch...", params.pitch_time_step, params.pitch_floor, params.contour_pitch_ceiling
+        )
+
+    # 프레임마다 get_value 를 부르던 루프 대신 배열로 한 번에 읽습니다.
+    with _stage(stage, "intensity_sampling"):
+        times = intensity.xs()
+        energy = np.nan_to_num(intensity.values[0]).tolist()
+        frequency = np.nan_to_num(kernels.pitch_at_times(pitch, times)).tolist()
+        data_points = [{"energy": e, "frequency": f} for e, f in zip(energy, frequency)]
+
+    return {
+        "sampling_rate": float(snd.sampling_frequency),
+        "start_time": float(times[0]) if len(times) else 0.0,
+        "time_step": float(intensity.dx),
+        "data_points": data_points,
+    }
+
+
+def extract_all(source, params=SERVER, stage=None) -> dict:
+    """'아' 지표와 CPPS/CSID 를 한 번의 디코딩으로 함께 계산합니다. (장치 분석용, 시계열 제외)"""
+    params = get_params(params)
+    audio = LoadedAudio.coerce(source, params.downmix)
+    return {
+        **extract_ah(audio, params, stage),
+        **extract_sentence(audio, params, stage, contour=False),
+    }
+
+
+def extract_upload_features(data: bytes, kind: str) -> dict:
+    """업로드 요청의 device_features 로 보낼 지표 (kind: "ah" 또는 "sentence")
+
+    음성 분석 서버처럼 wav 바이트를 soundfile 로 디코딩해 채널을 평균하고 SERVER 파라미터로 계산하므로,
+    서버가 같은 파일에서 추출한 값과 같습니다. 계산에 쓴 파라미터 묶음 이름을 parameter_set 에 담습니다.
+    """
+    audio = LoadedAudio.from_bytes(data, SERVER.downmix)
+    if kind == "ah":
+        features = extract_ah(audio, SERVER)
+    elif kind == "sentence":
+        features = extract_sentence(audio, SERVER, contour=False)
+    else:
+        raise ValueError(f"알 수 없는 지표 묶음: {kind} (가능: ah, sentence)")
+    return {**{key: float(value) for key, value in features.items()}, "parameter_set": SERVER.name}
+
+
+def nest_ah(features: dict) -> dict:
+    """평면 키를 음성 분석 서버 응답 형식({"jitter": {...}, "shimmer": {...}, ...})으로 바꿉니다."""
+    nested = {"jitter": {}, "shimmer": {}}
+    for key, value in features.items():
+        group, _, kind = key.partition("_")
+        if group in nested and kind:
+            nested[group][kind] = value
+        else:
+            nested[key] = value
+    return nested
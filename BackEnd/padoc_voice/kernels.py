@@ -0,0 +1,141 @@
+# padoc_voice/kernels.py
+"""프레임 단위 수치 커널 (CPPS, L/H ratio, CSID, intensity/pitch 시계열).
+
+예전 구현은 프레임마다 파이썬 루프에서 FFT 와 np.polyfit 을 호출했습니다. 여기서는 프레임을
+(프레임 수, 프레임 길이) 행렬로 한 번에 만들어 FFT 와 추세선 계산을 행 단위로 처리합니다.
+긴 녹음에서 메모리가 커지지 않도록 BLOCK_FRAMES 개씩 나누어 계산합니다.
+결과는 예전 루프 구현과 부동소수점 반올림 차이 수준(1e-9 미만)으로 같습니다.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
+
+from .params import WINDOW_SYMMETRIC
+
+# 한 번에 계산하는 프레임 수 (48 kHz L/H 프레임 기준 약 20 MB)
+BLOCK_FRAMES = 1024
+
+# 자연로그 켑스트럼 → dB
+_LN_TO_DB = 20 / np.log(10)
+
+
+def hamming(n: int, kind: str) -> np.ndarray:
+    """kind="periodic" 이면 FFT 용 주기 창(scipy 기본), "symmetric" 이면 대칭 창(np.hamming)"""
+    if kind == WINDOW_SYMMETRIC:
+        return np.hamming(n)
+    return get_window("hamming", n, fftbins=True)
+
+
+def frame_blocks(x: np.ndarray, frame_n: int, hop_n: int, block: int = BLOCK_FRAMES):
+    """x 를 frame_n 길이, hop_n 간격 프레임으로 나누어 (block, frame_n) 행렬 단위로 돌려줍니다.
+
+    마지막에 frame_n 보다 짧게 남는 구간은 버립니다. (예전 루프와 같은 프레임 수)
+    복사하지 않는 view 이므로 읽기 전용으로 사용해야 합니다.
+    """
+    if frame_n <= 0 or hop_n <= 0 or len(x) < frame_n:
+        return
+    frames = sliding_window_view(x, frame_n)[::hop_n]
+    for start in range(0, len(frames), block):
+        yield frames[start:start + block]
+
+
+def cpps_frames(x: np.ndarray, sr: int, params) -> np.ndarray:
+    """프레임별 CPP(dB). x 는 params.cpp_fs_target 으로 리샘플한 모노 신호입니다.
+
+    켑스트럼의 1/fmax ~ 1/fmin 구간에서 선형 추세선 대비 최대 피크 높이를 구합니다.
+    추세선은 모든 프레임이 같은 quefrency 축을 쓰므로 최소제곱 해를 닫힌 식으로 한 번에 계산합니다.
+    """
+    n_frame = int(round(params.cpp_frame_len * sr))
+    n_hop = int(round(params.cpp_hop_len * sr))
+    if n_frame <= 0:
+        return np.array([])
+    win = hamming(n_frame, "periodic")
+
+    n_cep = 2 * (n_frame // 2)   # irfft 기본 길이
+    q = np.arange(n_cep) / sr
+    mask = (q >= 1.0 / params.cpp_fmax) & (q <= 1.0 / params.cpp_fmin)
+    if np.count_nonzero(mask) < 2:
+        return np.array([])
+    xq = q[mask]
+    xq_centered = xq - xq.mean()
+    sxx = np.dot(xq_centered, xq_centered)
+
+    result = []
+    for frames in frame_blocks(x, n_frame, n_hop):
+        log_mag = np.log(np.abs(np.fft.rfft(frames * win, axis=1)) + params.eps)
+        y = np.fft.irfft(log_mag, axis=1)[:, mask]
+        slope = (y - y.mean(axis=1, keepdims=True)) @ xq_centered / sxx
+        intercept = y.mean(axis=1) - slope * xq.mean()
+        peak_idx = np.argmax(y, axis=1)
+        peak_val = y[np.arange(len(y)), peak_idx]
+        trend_at_peak = intercept + slope * xq[peak_idx]
+        result.append((peak_val - trend_at_peak) * _LN_TO_DB)
+    return np.concatenate(result) if result else np.array([])
+
+
+def cpps(x: np.ndarray, sr: int, params) -> float:
+    """CPPS 근사 (프레임별 CPP 의 시간 평균). 프레임이 없으면 NaN"""
+    values = cpps_frames(x, sr, params)
+    return float(np.mean(values)) if values.size else float("nan")
+
+
+def lh_ratio_series(signal: np.ndarray, sr: float, params) -> np.ndarray:
+    """프레임별 L/H ratio(dB). lh_split_hz 이하/초과 대역 에너지 비"""
+    frame_n = int(round(params.lh_frame_len * sr))
+    hop_n = int(round(params.lh_hop_len * sr))
+    if frame_n <= 0 or hop_n <= 0:
+        return np.array([])
+    win = hamming(frame_n, params.lh_window)
+    freqs = np.fft.rfftfreq(frame_n, d=1.0 / sr)
+    low_mask = freqs <= params.lh_split_hz
+
+    result = []
+    for frames in frame_blocks(signal, frame_n, hop_n):
+        mag2 = np.abs(np.fft.rfft(frames * win, axis=1)) ** 2
+        low_e = mag2[:, low_mask].sum(axis=1) + params.eps
+        high_e = mag2[:, ~low_mask].sum(axis=1) + params.eps
+        result.append(10.0 * np.log10(low_e / high_e))
+    return np.concatenate(result).astype(float) if result else np.array([])
+
+
+def csid_awan2016(cpp: float, lh_series_db: np.ndarray) -> float:
+    """Awan et al., 2016 (J Voice) 회귀식 기반 CSID 계산"""
+    if lh_series_db.size == 0 or not np.isfinite(cpp):
+        return float("nan")
+    lh_mean = float(np.mean(lh_series_db))
+    lh_sd = float(np.std(lh_series_db, ddof=1)) if lh_series_db.size > 1 else 0.0
+    return float(154.59 - (10.39 * cpp) - (1.08 * lh_mean) - (3.71 * lh_sd))
+
+
+def pitch_at_times(pitch, times: np.ndarray) -> np.ndarray:
+    """Praat Pitch 의 Get value at time (선형 보간) 을 여러 시각에 한 번에 적용합니다.
+
+    Praat(Sampled_getValueAtX) 과 같은 규칙입니다: 가까운 프레임이 무성이면 NaN,
+    먼 쪽 이웃만 무성이거나 범위 밖이면 가까운 프레임 값을 그대로 씁니다.
+    """
+    frequency = pitch.selected_array["frequency"]
+    nx = len(frequency)
+    voiced = (frequency > 0) & (frequency < pitch.ceiling)
+    values = np.where(voiced, frequency, np.nan)
+
+    times = np.asarray(times, dtype=float)
+    inside = (times >= pitch.x1 - 0.5 * pitch.dx) & (times <= pitch.x1 + (nx - 0.5) * pitch.dx)
+
+    # 0 기반 프레임 위치
+    position = (times - pitch.x1) / pitch.dx
+    left = np.floor(position).astype(np.int64)
+    phase = position - left
+    near_is_left = phase < 0.5
+    near = np.where(near_is_left, left, left + 1)
+    far = np.where(near_is_left, left + 1, left)
+    phase = np.where(near_is_left, phase, 1.0 - phase)
+
+    valid = inside & (near >= 0) & (near < nx)
+    near_value = np.full(times.shape, np.nan)
+    near_value[valid] = values[near[valid]]
+    far_ok = valid & (far >= 0) & (far < nx)
+    far_value = np.full(times.shape, np.nan)
+    far_value[far_ok] = values[far[far_ok]]
+
+    result = np.where(np.isnan(far_value), near_value, near_value + phase * (far_value - near_value))
+    return np.where(valid, result, np.nan)
@@ -0,0 +1,92 @@
+# padoc_voice/params.py
+"""특징 추출 파라미터 묶음.
+
+장치(AIot analyze_voice.py)와 음성 분석 서버(voice_analysis_server)는 같은 지표를 조금씩 다른
+설정으로 계산해 왔습니다. 두 설정을 DEVICE / SERVER 로 이름 붙여 두고, 어느 쪽이 무엇이 다른지
+여기 한 곳에서 보이도록 합니다. (값을 바꾸면 tests/golden 의 기준값도 다시 만들어야 합니다)
+
+| 항목                   | DEVICE                   | SERVER                    |
+|------------------------|--------------------------|---------------------------|
+| 채널 처리              | Praat 은 원본, 수치 계산은 첫 채널 | 모든 채널 평균       |
+| CPPS 탐색 F0 범위      | 75 ~ 500 Hz              | 60 ~ 330 Hz               |
+| L/H 프레임 창          | 대칭 Hamming             | 주기 Hamming (FFT 용)     |
+| NHR (HNR ≤ 0 일 때)    | 10^(-HNR/10)             | 0                         |
+
+이 모듈은 무거운 import 없이 불러올 수 있어야 합니다. (장치의 voice_params.py 가 사용)
+"""
+from dataclasses import dataclass, replace
+from typing import Tuple
+
+DOWNMIX_MEAN = "mean"      # 모든 채널 평균 후 분석
+DOWNMIX_FIRST = "first"    # Praat 은 원본 채널, CPPS/LH 는 첫 번째 채널
+
+WINDOW_PERIODIC = "periodic"    # scipy get_window("hamming", n) (FFT 용 주기 창)
+WINDOW_SYMMETRIC = "symmetric"  # numpy hamming(n)
+
+
+@dataclass(frozen=True)
+class ParameterSet:
+    name: str
+
+    # 채널 처리
+    downmix: str = DOWNMIX_MEAN
+
+    # 피치 / 주기 (jitter, shimmer, F0)
+    pitch_floor: float = 75.0
+    pitch_ceiling: float = 500.0
+    jitter_args: Tuple[float, ...] = (0, 0, 0.0001, 0.02, 1.3)   # 구간 시작/끝, 최소/최대 주기, 최대 주기 비
+    shimmer_extra_args: Tuple[float, ...] = (1.6,)              # 최대 진폭 비
+
+    # HNR (To Harmonicity (cc): 시간 간격, 최소 피치, 무음 임계값, 창당 주기 수)
+    harmonicity_time_step: float = 0.01
+    harmonicity_silence_threshold: float = 0.1
+    harmonicity_periods_per_window: float = 1.0
+    nhr_clip_nonpositive: bool = True
+
+    # CPPS
+    cpp_fmin: float = 60.0
+    cpp_fmax: float = 330.0
+    cpp_fs_target: int = 16000
+    cpp_frame_len: float = 0.01
+    cpp_hop_len: float = 0.005
+    eps: float = 1e-12
+
+    # L/H ratio
+    lh_split_hz: float = 4000.0
+    lh_frame_len: float = 0.05
+    lh_hop_len: float = 0.025
+    lh_window: str = WINDOW_PERIODIC
+
+    # 문장 시계열 (intensity / pitch)
+    contour_pitch_ceiling: float = 600.0
+    intensity_min_pitch: float = 100.0
+    intensity_time_step: float = 0.025
+    pitch_time_step: float = 0.0
+
+    def with_overrides(self, **changes) -> "ParameterSet":
+        """일부 값만 바꾼 새 파라미터 묶음 (실험용)"""
+        return replace(self, **changes)
+
+
+SERVER = ParameterSet(name="server")
+
+DEVICE = ParameterSet(
+    name="device",
+    downmix=DOWNMIX_FIRST,
+    nhr_clip_nonpositive=False,
+    cpp_fmin=75.0,
+    cpp_fmax=500.0,
+    lh_window=WINDOW_SYMMETRIC,
+)
+
+PARAMETER_SETS = {params.name: params for params in (DEVICE, SERVER)}
+
+
+def get_params(name) -> ParameterSet:
+    """이름("device" / "server") 또는 ParameterSet 을 ParameterSet 으로 바꿉니다."""
+    if isinstance(name, ParameterSet):
+        return name
+    try:
+        return PARAMETER_SETS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 파라미터 묶음: {name} (가능: {', '.join(PARAMETER_SETS)})") from None
@@ -0,0 +1,81 @@
+# padoc_voice/window.py
+"""녹음의 일부 구간만 디코딩 + 리샘플합니다. (파킨슨 예측 전처리용, soundfile / librosa 필요)
+
+librosa.load(..., sr=...) 은 파일 전체를 디코딩하고 전체를 고품질(soxr_hq) 리샘플한 뒤
+필요한 구간만 잘라 씁니다. 여기서는 soundfile 로 필요한 프레임(+ 필터 여유 구간)만 읽어
+그 부분만 같은 방식으로 리샘플하므로, 녹음 길이와 상관없이 비용이 일정합니다.
+
+- 읽기 시작 위치를 원본/목표 샘플링 주파수 비의 정수배에 맞춰, 리샘플 결과의 샘플 위치가
+  전체 리샘플 결과와 정확히 겹치도록 합니다.
+- 여유 구간(margin) 밖의 필터 경계 효과는 잘라 내므로 결과는 전체 디코딩과 float32 반올림 수준으로 같습니다.
+- 녹음이 짧아 여유 구간이 파일 전체를 덮으면 librosa.load 와 같은 계산을 그대로 합니다.
+- soundfile 이 읽지 못하는 형식(mp3 등)은 librosa.load 로 전체를 디코딩합니다.
+"""
+import math
+
+import numpy as np
+
+# 리샘플 필터 경계 효과를 잘라 낼 여유 구간 (soxr_hq 필터 길이보다 충분히 깁니다)
+DEFAULT_MARGIN_S = 0.05
+RES_TYPE = "soxr_hq"  # librosa.load 기본값
+
+
+def _to_mono(y: np.ndarray) -> np.ndarray:
+    # librosa.to_mono 와 같은 채널 평균 ((채널 수, 샘플 수) → (샘플 수,))
+    return np.mean(y, axis=0) if y.ndim > 1 else y
+
+
+def _resample(y: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    if orig_sr == target_sr:
+        return y
+    import librosa
+
+    return librosa.resample(y, orig_sr=orig_sr, target_sr=target_sr, res_type=RES_TYPE)
+
+
+def _load_full(source, sr: int):
+    import librosa
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+    y, _ = librosa.load(source, sr=sr)
+    return y, len(y)
+
+
+def load_window(source, sr: int, start: float, stop: float, margin: float = DEFAULT_MARGIN_S):
+    """source(파일 경로 또는 파일 객체)의 [start, stop) 초 구간을 sr 로 리샘플한 모노 float32 신호.
+
+    librosa.load(source, sr=sr)[0][int(sr * start):int(sr * stop)] 와 같은 값을 돌려주며,
+    녹음이 stop 보다 짧으면 그만큼 짧게 돌려줍니다.
+    반환값은 (구간 신호, 전체 녹음을 sr 로 리샘플했을 때의 샘플 수) 입니다.
+    """
+    import soundfile as sf
+
+    try:
+        f = sf.SoundFile(source)
+    except RuntimeError:  # soundfile 이 지원하지 않는 형식
+        y, total = _load_full(source, sr)
+        return y[int(sr * start):int(sr * stop)], total
+
+    with f:
+        native_sr, native_frames = f.samplerate, f.frames
+        # librosa.resample 과 같은 방식(부동소수점 비)으로 전체 길이를 계산합니다.
+        total = int(np.ceil(native_frames * (float(sr) / native_sr)))
+        first, last = min(int(sr * start), total), min(int(sr * stop), total)
+        if first >= last:
+            return np.zeros(0, dtype=np.float32), total
+
+        # 읽기 시작 위치를 native_sr / gcd 의 배수로 맞추면 리샘플 후 위치(lo * sr / native_sr)가 정수입니다.
+        step = native_sr // math.gcd(native_sr, sr)
+        margin_frames = int(math.ceil(margin * native_sr))
+        lo = max(0, (first * native_sr // sr - margin_frames) // step * step)
+        hi = min(native_frames, math.ceil(last * native_sr / sr) + margin_frames)
+
+        f.seek(lo)
+        y = f.read(frames=hi - lo, dtype="float32", always_2d=False).T
+
+    y = _resample(_to_mono(y), native_sr, sr)
+    offset = lo * sr // native_sr
+    window = y[first - offset:last - offset]
+    # 파일 끝에서 librosa 가 길이를 맞추려 붙이는 0 과 같은 처리
+    return np.pad(window, (0, last - first - len(window))), total
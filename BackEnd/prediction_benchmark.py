@@ -0,0 +1,118 @@
+# prediction_benchmark.py
+# backend안에 위치
+# 파킨슨병 예측을 여러 구간에 대해 할 때, 구간마다 따로 요청하는 방식(디코딩 + 멜 + 이미지 + 모델 호출 K번)과
+# predict_parkinsons_windows 의 한 번 요청(디코딩 1번, 멜 STFT 1번, 모델 호출 1번)의 처리량을 비교합니다.
+# 결과는 녹음 1초당 처리 시간과 초당 처리한 녹음 길이로 출력합니다.
+#
+# 사용 예)
+#   MODEL_PATH=... python prediction_benchmark.py a.wav --windows 8 16
+#   python prediction_benchmark.py --synthetic --seconds 10      # 입력 모양이 같은 작은 합성 모델, 합성 녹음
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import io
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+TARGET_SR = 48000
+
+
+def make_synthetic_model(path):
+    """실제 모델과 입력/출력 모양이 같은 작은 CNN 을 저장합니다."""
+    import tensorflow as tf
+
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input((224, 224, 3)),
+        tf.keras.layers.Conv2D(16, 3, strides=2, activation="relu"),
+        tf.keras.layers.Conv2D(32, 3, strides=2, activation="relu"),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(32, activation="relu"),
+        tf.keras.layers.Dense(1, activation="sigmoid"),
+    ])
+    model.save(path)
+
+
+def make_recording(seconds):
+    """피치가 천천히 바뀌는 합성 발성 wav 바이트"""
+    import soundfile as sf
+
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * TARGET_SR)) / TARGET_SR
+    signal = 0.3 * np.sin(2 * np.pi * (150 + 20 * np.sin(t)) * t) + 0.01 * rng.standard_normal(len(t))
+    buf = io.BytesIO()
+    sf.write(buf, signal, TARGET_SR, format="WAV", subtype="PCM_16")
+    return buf.getvalue()
+
+
+def separate_requests(model, voice_data, starts):
+    """구간마다 따로 요청했을 때와 같은 비용: 매번 디코딩, 멜/이미지 1장, 모델 호출 1번"""
+    import librosa
+
+    from voice_analysis_server.ai_model.parkins_prediction import SEGMENT_DURATION_S
+
+    window_length = int(TARGET_SR * SEGMENT_DURATION_S)
+    scores = []
+    for start in starts:
+        signal, _ = librosa.load(io.BytesIO(voice_data), sr=TARGET_SR)
+        offset = int(start * TARGET_SR)
+        segment = np.pad(signal, (0, window_length))[offset:offset + window_length]
+        image = model._spectrogram_images(segment[np.newaxis, :], TARGET_SR)
+        scores.append(float(model.model.predict(image, verbose=0)[0][0]))
+    return scores
+
+
+def _timeit(func, repeat):
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파킨슨병 예측 여러 구간 처리량 벤치마크")
+    parser.add_argument("files", nargs="*", help="측정할 .wav 파일 (없으면 합성 녹음)")
+    parser.add_argument("--seconds", type=float, default=10, help="합성 녹음 길이(초)")
+    parser.add_argument("--windows", type=int, nargs="+", default=[4, 8, 16], help="구간 수 K")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값)")
+    parser.add_argument("--synthetic", action="store_true", help="작은 합성 모델로 측정 (MODEL_PATH 불필요)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.synthetic:
+            os.environ["MODEL_PATH"] = os.path.join(tmp, "synthetic.keras")
+            make_synthetic_model(os.environ["MODEL_PATH"])
+
+        from voice_analysis_server.ai_model import parkins_prediction
+
+        model = parkins_prediction.ParkinsPredictionModel()
+        recordings = [(path, open(path, "rb").read()) for path in args.files] or [
+            (f"synthetic {args.seconds:g}s", make_recording(args.seconds))
+        ]
+
+        for name, voice_data in recordings:
+            for k in args.windows:
+                batched_s, result = _timeit(
+                    lambda: model.predict_parkinsons_windows(io.BytesIO(voice_data), max_windows=k), args.repeat)
+                starts = [window.start_time for window in result.windows]
+                separate_s, scores = _timeit(lambda: separate_requests(model, voice_data, starts), args.repeat)
+
+                audio_s = len(starts) * parkins_prediction.SEGMENT_DURATION_S
+                diff = max(abs(int(score * 100) - window.ai_score) for score, window in zip(scores, result.windows))
+                print(
+                    f"{name:<20} K={len(starts):<3} 구간마다 요청 {separate_s * 1000:8.1f} ms"
+                    f" ({audio_s / separate_s:6.1f} 녹음초/s)  한 번에 {batched_s * 1000:8.1f} ms"
+                    f" ({audio_s / batched_s:6.1f} 녹음초/s)  x{separate_s / batched_s:5.1f}  점수 차이 {diff}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# rollup_backfill.py
+# backend안에 위치
+# 일/주 단위 지표 집계(rollup) 테이블을 원본 데이터로부터 다시 계산하거나, 원본과 일치하는지 검사합니다.
+#
+# 사용 예)
+#   python rollup_backfill.py backfill                 # 전체 환자 재계산
+#   python rollup_backfill.py backfill --patient-id 3  # 특정 환자만 재계산
+#   python rollup_backfill.py check                    # 집계 테이블과 원본 데이터 비교
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import asyncio
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.db import AsyncSessionMaker
+from app.services import rollup_service
+
+
+async def run_backfill(patient_id):
+    async with AsyncSessionMaker() as db:
+        written = await rollup_service.backfill_rollups(db, patient_id=patient_id)
+    target = f"patient_id={patient_id}" if patient_id is not None else "전체 환자"
+    print(f"✅ [집계 재계산 완료] {target}, 기록된 행 수: {written}")
+    return 0
+
+
+async def run_check(patient_id):
+    async with AsyncSessionMaker() as db:
+        mismatches = await rollup_service.check_rollup_consistency(db, patient_id=patient_id)
+    if not mismatches:
+        print("✅ [집계 검사 완료] 원본 데이터와 집계 테이블이 일치합니다.")
+        return 0
+    print(f"❌ [집계 불일치] {len(mismatches)}건")
+    for item in mismatches:
+        print(f"  - {item}")
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="환자 지표 일/주 단위 집계 테이블 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = subparsers.add_parser("backfill", help="원본 데이터로부터 집계 테이블을 다시 계산합니다.")
+    backfill_parser.add_argument("--patient-id", type=int, default=None, help="특정 환자만 재계산")
+
+    check_parser = subparsers.add_parser("check", help="집계 테이블과 원본 데이터의 일치 여부를 검사합니다.")
+    check_parser.add_argument("--patient-id", type=int, default=None, help="특정 환자만 검사")
+
+    args = parser.parse_args()
+    if args.command == "backfill":
+        return asyncio.run(run_backfill(args.patient_id))
+    return asyncio.run(run_check(args.patient_id))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
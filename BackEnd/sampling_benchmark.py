@@ -0,0 +1,92 @@
+# sampling_benchmark.py
+# backend안에 위치
+# 문장 발성 시계열(sampling_data)의 기존 JSON 저장 형식과 이진 형식(padoc_common.sampling_codec)의
+# 저장 크기, 인코딩 시간, 대시보드 응답용 변환 시간을 비교합니다.
+# 차트용 다운샘플링 조회(/dashboard/voice/{record_id}/sampling)의 LOD 사용 여부에 따른 시간도 측정합니다.
+#
+# 사용 예)
+#   python sampling_benchmark.py                  # 3분 녹음 (25 ms 프레임 7,200개)
+#   python sampling_benchmark.py --seconds 600
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import json
+import math
+import random
+import statistics
+import time
+
+from padoc_common.models import SentenceFeatures
+from padoc_common.sampling_codec import SamplingSeries, encode_sampling_data, encode_sampling_lod
+from app.services.features_service import build_sampling_series, build_sentence_features
+
+FRAME_SECONDS = 0.025
+
+
+def make_sampling_data(seconds: float) -> dict:
+    """praat_sentence.extract_sentence_features 와 같은 모양의 합성 시계열을 만듭니다."""
+    count = int(seconds / FRAME_SECONDS)
+    points = []
+    for i in range(count):
+        voiced = math.sin(i / 40) > -0.3
+        points.append({
+            "energy": 55 + 15 * math.sin(i / 13) + random.uniform(-2, 2),
+            "frequency": 120 + 30 * math.sin(i / 57) + random.uniform(-3, 3) if voiced else 0.0,
+        })
+    return {"sampling_rate": 44100.0, "start_time": FRAME_SECONDS / 2, "time_step": FRAME_SECONDS, "data_points": points}
+
+
+def _timeit(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문장 발성 시계열 저장 형식 벤치마크")
+    parser.add_argument("--seconds", type=float, default=180, help="녹음 길이(초)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument("--points", type=int, default=1024, help="다운샘플링 목표 점 개수")
+    args = parser.parse_args()
+
+    random.seed(1)
+    sampling_data = make_sampling_data(args.seconds)
+    json_text = json.dumps(sampling_data)
+    blob = encode_sampling_data(sampling_data)
+    raw_blob = encode_sampling_data(sampling_data, compress=False)
+
+    print(f"프레임 {len(sampling_data['data_points']):,}개")
+    print(f"{'JSON':<22} {len(json_text):>10,} bytes")
+    print(f"{'float32':<22} {len(raw_blob):>10,} bytes ({len(json_text) / len(raw_blob):.1f}x)")
+    print(f"{'float32 + shuffle/zlib':<22} {len(blob):>10,} bytes ({len(json_text) / len(blob):.1f}x)")
+
+    print(f"{'encode JSON':<22} {_timeit(lambda: json.dumps(sampling_data), args.repeat):8.2f} ms")
+    print(f"{'encode binary':<22} {_timeit(lambda: encode_sampling_data(sampling_data), args.repeat):8.2f} ms")
+
+    # 대시보드 응답을 만들 때처럼 DB 값에서 SentenceFeatures 응답 객체까지 변환하는 시간
+    # (JSON 컬럼은 DB 드라이버가 읽을 때 json.loads 를 거치므로 그 시간도 포함합니다)
+    blob_row = SentenceFeatures(record_id=1, cpp=10.0, csid=5.0, sampling_blob=blob)
+    print(f"{'response from JSON':<22} {_timeit(lambda: build_sentence_features(SentenceFeatures(record_id=2, cpp=10.0, csid=5.0, sampling_data=json.loads(json_text))), args.repeat):8.2f} ms")
+    print(f"{'response from blob':<22} {_timeit(lambda: build_sentence_features(blob_row), args.repeat):8.2f} ms")
+    print(f"{'decode columns (blob)':<22} {_timeit(lambda: SamplingSeries(blob).energy, args.repeat):8.2f} ms")
+
+    # 차트용 다운샘플링: 원본에서 매번 계산 vs 저장된 LOD 피라미드 사용
+    lod = encode_sampling_lod(SamplingSeries(blob))
+    lod_row = SentenceFeatures(record_id=1, cpp=10.0, csid=5.0, sampling_blob=blob, sampling_lod=lod)
+    print(f"{'LOD pyramid':<22} {len(lod):>10,} bytes  (encode {_timeit(lambda: encode_sampling_lod(SamplingSeries(blob)), 3):.1f} ms)")
+    for points in (args.points, args.points * 3 // 5):
+        for label, row in ((f"lttb {points} (raw)", blob_row), (f"lttb {points} (LOD)", lod_row)):
+            print(f"{label:<22} {_timeit(lambda: build_sampling_series(row, points), args.repeat):8.2f} ms")
+        label = f"minmax {points}"
+        print(f"{label:<22} {_timeit(lambda: build_sampling_series(blob_row, points, 'minmax'), args.repeat):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
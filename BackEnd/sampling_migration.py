@@ -0,0 +1,127 @@
+# sampling_migration.py
+# backend안에 위치
+# SentenceFeatures.sampling_data(JSON)를 padoc_common.sampling_codec 의 이진 형식(sampling_blob)으로 옮깁니다.
+# 차트 조회용 LOD 피라미드(sampling_lod)도 함께 계산합니다.
+# sampling_blob/sampling_lod 컬럼이 없으면 먼저 추가하고, 아직 옮기지 않은 행만 record_id 순서로 나누어 처리합니다.
+# 여러 번 실행해도 안전합니다.
+#
+# 사용 예)
+#   python sampling_migration.py                  # 옮긴 뒤 JSON 값은 비웁니다.
+#   python sampling_migration.py --keep-json      # JSON 값을 남겨 둡니다. (배포 중 이전 버전과 함께 돌 때)
+#   python sampling_migration.py --dry-run        # 옮길 행 수와 예상 크기만 출력합니다.
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import asyncio
+import json
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import inspect, or_, text, update
+from sqlmodel import select
+
+from app.db import AsyncSessionMaker
+from padoc_common.models import SentenceFeatures
+from padoc_common.sampling_codec import SamplingSeries, encode_sampling_data, encode_sampling_lod
+
+BLOB_COLUMNS = ("sampling_blob", "sampling_lod")
+
+
+def _ensure_blob_columns(sync_conn) -> list:
+    """이진 컬럼이 없으면 추가합니다. 추가한 컬럼 이름 목록을 반환합니다."""
+    table = SentenceFeatures.__table__
+    columns = {column["name"] for column in inspect(sync_conn).get_columns(table.name)}
+    added = []
+    for name in BLOB_COLUMNS:
+        if name in columns:
+            continue
+        column_type = table.c[name].type.compile(dialect=sync_conn.dialect)
+        sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type} NULL"))
+        added.append(name)
+    return added
+
+
+async def run(batch_size: int, keep_json: bool, dry_run: bool) -> int:
+    async with AsyncSessionMaker() as db:
+        if not dry_run:
+            connection = await db.connection()
+            for name in await connection.run_sync(_ensure_blob_columns):
+                print(f"{name} 컬럼을 추가했습니다.")
+            await db.commit()
+
+        last_record_id = 0
+        migrated = skipped = json_bytes = blob_bytes = lod_bytes = 0
+        while True:
+            rows = (
+                await db.execute(
+                    select(
+                        SentenceFeatures.record_id,
+                        SentenceFeatures.sampling_data,
+                        SentenceFeatures.sampling_blob,
+                    )
+                    .where(SentenceFeatures.record_id > last_record_id)
+                    .where(or_(SentenceFeatures.sampling_blob.is_(None), SentenceFeatures.sampling_lod.is_(None)))
+                    .order_by(SentenceFeatures.record_id)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not rows:
+                break
+            last_record_id = rows[-1].record_id
+
+            for record_id, sampling_data, blob in rows:
+                values = {}
+                if blob is None:
+                    if not sampling_data:
+                        skipped += 1
+                        continue
+                    blob = encode_sampling_data(sampling_data)
+                    json_bytes += len(json.dumps(sampling_data, separators=(",", ":")))
+                    blob_bytes += len(blob)
+                    values["sampling_blob"] = blob
+                    if not keep_json:
+                        values["sampling_data"] = None
+                # 가장 작은 단계보다 짧은 시계열은 LOD 가 없으므로 매번 다시 계산됩니다. (비용은 작습니다)
+                lod = encode_sampling_lod(SamplingSeries(blob))
+                if lod is not None:
+                    lod_bytes += len(lod)
+                    values["sampling_lod"] = lod
+                if not values:
+                    continue
+                migrated += 1
+                if dry_run:
+                    continue
+                await db.execute(
+                    update(SentenceFeatures)
+                    .where(SentenceFeatures.record_id == record_id)
+                    .values(**values)
+                )
+            if not dry_run:
+                await db.commit()
+            print(f"  ... record_id {last_record_id} 까지 처리 ({migrated}건 변환)")
+
+    action = "변환 예정" if dry_run else "변환 완료"
+    print(f"✅ [{action}] {migrated}건, 시계열 없음 {skipped}건")
+    if blob_bytes:
+        print(f"   JSON {json_bytes:,} bytes -> 이진 {blob_bytes:,} bytes ({json_bytes / blob_bytes:.1f}배 감소)")
+    if lod_bytes:
+        print(f"   LOD 피라미드 {lod_bytes:,} bytes")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SentenceFeatures 시계열 이진 형식 변환")
+    parser.add_argument("--batch-size", type=int, default=200, help="한 번에 변환할 행 수")
+    parser.add_argument("--keep-json", action="store_true", help="변환 후에도 JSON 값을 남겨 둡니다.")
+    parser.add_argument("--dry-run", action="store_true", help="DB 를 바꾸지 않고 결과만 출력합니다.")
+    args = parser.parse_args()
+    return asyncio.run(run(args.batch_size, args.keep_json, args.dry_run))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# search_benchmark.py
+# backend안에 위치
+# 환자 이름 검색의 LIKE '%q%' 전체 스캔과 n-gram 색인 검색, 자동완성 시간을 비교합니다.
+# dummy_data_generator.py 의 합성 환자 이름으로 메모리 SQLite DB 를 채운 뒤 측정합니다.
+#
+# 사용 예)
+#   python search_benchmark.py                 # 100,000 계정
+#   python search_benchmark.py --count 300000 --repeat 50
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+
+from dummy_data_generator import create_dummy_patient_accounts
+from padoc_common.models import Account
+from padoc_common.models.enums import UserRoleEnum
+from app.services.users_service.search_index import PatientNameIndex
+
+# 키 입력 순서대로 들어오는 검색어를 흉내 냅니다.
+QUERIES = ["김", "김민", "김민서", "서연", "민", "남궁", "지훈", "선우희", "박", "재"]
+
+
+def _report(label: str, samples: list) -> None:
+    samples_ms = sorted(sample * 1000 for sample in samples)
+    p95 = samples_ms[max(0, int(len(samples_ms) * 0.95) - 1)]
+    print(f"{label:<16} median {statistics.median(samples_ms):8.3f} ms   p95 {p95:8.3f} ms")
+
+
+async def run(count: int, repeat: int, limit: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as db:
+        started = time.perf_counter()
+        await create_dummy_patient_accounts(db, count, seed=42)
+        print(f"합성 환자 계정 {count:,}개 생성: {time.perf_counter() - started:.2f} s")
+
+        index = PatientNameIndex()
+        started = time.perf_counter()
+        await index.ensure_loaded(db)
+        print(f"n-gram 색인 적재: {time.perf_counter() - started:.2f} s ({len(index):,} patients)")
+
+        like_samples, index_samples, typeahead_samples = [], [], []
+        for _ in range(repeat):
+            for q in QUERIES:
+                started = time.perf_counter()
+                query = (
+                    select(Account.id, Account.full_name, Account.login_id)
+                    .where(Account.full_name.like(f"%{q}%"))
+                    .where(Account.role == UserRoleEnum.PATIENT)
+                    .limit(limit)
+                )
+                (await db.execute(query)).all()
+                like_samples.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                index.search(q, limit=limit)
+                index_samples.append(time.perf_counter() - started)
+
+                # 자동완성 결과 캐시를 거치지 않은 bisect 탐색 시간을 잽니다.
+                index._typeahead_cache.clear()
+                started = time.perf_counter()
+                index.typeahead(q, k=limit)
+                typeahead_samples.append(time.perf_counter() - started)
+
+        print(f"검색어 {len(QUERIES)}개 x {repeat}회, limit={limit}")
+        _report("LIKE '%q%'", like_samples)
+        _report("n-gram index", index_samples)
+        _report("typeahead", typeahead_samples)
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="환자 이름 검색 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="생성할 합성 환자 계정 수")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어 목록 반복 횟수")
+    parser.add_argument("--limit", type=int, default=20, help="검색 결과 최대 개수")
+    args = parser.parse_args()
+    asyncio.run(run(args.count, args.repeat, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,10 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel # 👈 이 SQLModel이 Base 역할을 합니다.
 
 from app.main import app  # FastAPI app 객체
-from app.db import get_session  # 실제 get_session과 DB 모델 Base
+from app.db import get_session, get_session_maker  # 실제 get_session과 DB 모델 Base
+from app.cache import dashboard_cache
+from app.services.users_service.search_index import patient_name_index
+from app.services.users_service.access_cache import connection_access_cache
 
 # padoc_common.models의 모든 테이블 모델을 import하여 Base.metadata에 등록합니다.
 from padoc_common.models import (
@@ -23,6 +26,7 @@ from padoc_common.models import (
     doctor_patient_view_settings,
     doctors,
     enums,
+    feature_rollups,
     patient_doctor_access,
     patients,
     sentence_features,
@@ -55,7 +59,7 @@ async def db_session(engine, tables):
         yield session
 
 @pytest_asyncio.fixture
-async def client(db_session):
+async def client(engine, db_session):
     """
     테스트용 비동기 클라이언트를 생성하고, 
     앱의 DB 의존성을 테스트용 DB 세션으로 교체합니다.
@@ -64,6 +68,16 @@ async def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    # 스트리밍 응답이 직접 여는 세션도 테스트 DB 를 사용하도록 교체합니다.
+    app.dependency_overrides[get_session_maker] = lambda: sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    # 테스트 간 대시보드 응답 캐시가 공유되지 않도록 초기화합니다.
+    dashboard_cache.clear()
+    # 이름 검색 색인도 테스트 DB 기준으로 다시 적재되도록 비웁니다.
+    patient_name_index.clear()
+    # 의사-환자 권한 캐시도 테스트 DB 기준으로 다시 적재되도록 비웁니다.
+    connection_access_cache.clear()
     # 1. ASGITransport 객체를 app과 함께 생성합니다.
     transport = ASGITransport(app=app)
     # 2. AsyncClient에는 app 대신 transport를 전달합니다.
@@ -130,4 +144,48 @@ async def doctor_auth_headers(client: AsyncClient, doctor_signup_data: dict) ->
     response = await client.post("/auth/sessions", json=login_credentials)
     response.raise_for_status() # 로그인 성공 확인
     access_token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {access_token}"}
\ No newline at end of file
+    return {"Authorization": f"Bearer {access_token}"}
+
+@pytest.fixture
+def signup_patient(client: AsyncClient):
+    """환자를 가입시키고 (account_id, 인증 헤더)를 반환하는 함수를 제공합니다."""
+    async def _signup(login_id: str) -> tuple:
+        data = {"login_id": login_id, "password": "password_X!", "full_name": f"환자_{login_id}", "role": "patient"}
+        await client.post("/auth/patients", json=data)
+        login_res = await client.post("/auth/sessions", json={"login_id": login_id, "password": data["password"]})
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        account_id = (await client.get("/users/profile", headers=headers)).json()["account_id"]
+        return account_id, headers
+
+    return _signup
+
+
+@pytest.fixture
+def connect_patient(client: AsyncClient):
+    """의사가 환자에게 연결을 요청하고 (approve 이면) 환자가 승인하게 하는 함수를 제공합니다.
+
+    함수는 환자 ID 를 반환합니다.
+    """
+    async def _connect(doctor_headers: dict, patient_headers: dict, approve: bool = True) -> int:
+        patient_id = (await client.get("/users/profile", headers=patient_headers)).json()["account_id"]
+        await client.post("/users/connections/requests", json={"patient_id": patient_id}, headers=doctor_headers)
+        if approve:
+            connection_id = (await client.get("/users/connections", headers=patient_headers)).json()["connections"][0]["id"]
+            await client.put("/users/connections/approve", json={"connection_id": connection_id}, headers=patient_headers)
+        return patient_id
+
+    return _connect
+
+
+@pytest.fixture
+def submit_training(client: AsyncClient):
+    """심화 훈련 결과를 제출하는 함수를 제공합니다."""
+    async def _submit(headers: dict, avg_score: int) -> None:
+        response = await client.post(
+            "/training/advanced",
+            json={"avg_score": avg_score, "progress": "level 1"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+    return _submit
@@ -0,0 +1,56 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_patient_dashboard_etag_not_modified(client: AsyncClient, patient_auth_headers: dict, submit_training):
+    """같은 ETag로 다시 조회하면 304를 반환하는지 테스트"""
+    await submit_training(patient_auth_headers, 80)
+
+    first = await client.get("/dashboard/patient", headers=patient_auth_headers)
+    assert first.status_code == 200
+    assert len(first.json()["trainings"]) == 1
+    etag = first.headers["etag"]
+
+    second = await client.get(
+        "/dashboard/patient", headers={**patient_auth_headers, "If-None-Match": etag}
+    )
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+    stats = (await client.get("/dashboard/cache/stats", headers=patient_auth_headers)).json()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] == 1
+    assert stats["not_modified"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_patient_dashboard_invalidated_by_training(client: AsyncClient, patient_auth_headers: dict, submit_training):
+    """훈련 결과 저장 후에는 이전 ETag로 조회해도 새 응답을 반환하는지 테스트"""
+    await submit_training(patient_auth_headers, 80)
+    first = await client.get("/dashboard/patient", headers=patient_auth_headers)
+    etag = first.headers["etag"]
+
+    await submit_training(patient_auth_headers, 60)
+
+    second = await client.get(
+        "/dashboard/patient", headers={**patient_auth_headers, "If-None-Match": etag}
+    )
+    assert second.status_code == 200
+    assert second.headers["etag"] != etag
+    assert len(second.json()["trainings"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_patient_dashboard_cache_keyed_by_date_range(client: AsyncClient, patient_auth_headers: dict, submit_training):
+    """조회 기간이 다르면 별도의 캐시 항목을 사용하는지 테스트"""
+    await submit_training(patient_auth_headers, 80)
+
+    all_time = await client.get("/dashboard/patient", headers=patient_auth_headers)
+    past = await client.get(
+        "/dashboard/patient?start_date=2000-01-01&end_date=2000-01-31", headers=patient_auth_headers
+    )
+    assert len(all_time.json()["trainings"]) == 1
+    assert past.json()["trainings"] == []
+    assert all_time.headers["etag"] != past.headers["etag"]
@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from padoc_common.models import AhFeatures, SentenceFeatures, VoiceRecord
+from padoc_common.models.enums import FileStatusEnum, RecordingTypeEnum
+
+
+async def _add_record(db_session, patient_id: int, created_at: datetime, **features) -> None:
+    record = VoiceRecord(
+        patient_id=patient_id,
+        file_path=f"{patient_id}/{created_at.timestamp()}.wav",
+        type=RecordingTypeEnum.voice_ah if "jitter_local" in features else RecordingTypeEnum.voice_sentence,
+        status=FileStatusEnum.COMPLETED,
+        created_at=created_at,
+    )
+    db_session.add(record)
+    await db_session.flush()
+    if "jitter_local" in features:
+        db_session.add(AhFeatures(record_id=record.id, **features))
+    else:
+        db_session.add(SentenceFeatures(record_id=record.id, **features))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_doctor_overview(client: AsyncClient, db_session, engine, doctor_auth_headers: dict, signup_patient, connect_patient):
+    """환자 목록 요약의 값, 순서, 대기 목록 및 환자 수와 무관한 쿼리 수 테스트"""
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    first_id, first_headers = await signup_patient("overview_first")
+    await connect_patient(doctor_auth_headers, first_headers)
+
+    now = datetime.now(timezone.utc)
+    await _add_record(db_session, first_id, now - timedelta(days=2), jitter_local=0.5, hnr=20.0)
+    await _add_record(db_session, first_id, now - timedelta(days=1), jitter_local=0.3, hnr=22.0)
+    await _add_record(db_session, first_id, now - timedelta(days=3), cpp=11.0, csid=5.0)
+    await client.post("/training/advanced", json={"avg_score": 70, "progress": "level 1"}, headers=first_headers)
+
+    # 첫 조회는 목록 순서를 새로 저장하므로, 두 번째 조회의 쿼리 수를 기준으로 삼습니다.
+    await client.get("/dashboard/doctor/overview", headers=doctor_auth_headers)
+    statements.clear()
+    response = await client.get("/dashboard/doctor/overview", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    single_patient_queries = len(statements)
+
+    body = response.json()
+    assert body["pending"] == []
+    overview = body["patients"][0]
+    assert overview["patient_id"] == first_id
+    assert overview["jitter"] == 0.3
+    assert overview["hnr"] == 22.0
+    assert overview["cpp"] == 11.0
+    assert overview["last_avg_score"] == 70
+    assert overview["last_recorded_at"].startswith((now - timedelta(days=1)).date().isoformat())
+
+    second_id, second_headers = await signup_patient("overview_second")
+    await connect_patient(doctor_auth_headers, second_headers)
+    third_id, third_headers = await signup_patient("overview_third")
+    await connect_patient(doctor_auth_headers, third_headers, approve=False)
+    await client.post("/users/list-order", json={"patient_order": [second_id, first_id]}, headers=doctor_auth_headers)
+
+    statements.clear()
+    response = await client.get("/dashboard/doctor/overview", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    assert len(statements) == single_patient_queries
+
+    body = response.json()
+    assert [patient["patient_id"] for patient in body["patients"]] == [second_id, first_id]
+    assert body["patients"][0]["last_recorded_at"] is None
+    assert [patient["patient_id"] for patient in body["pending"]] == [third_id]
+
+
+@pytest.mark.asyncio
+async def test_doctor_overview_requires_doctor(client: AsyncClient, patient_auth_headers: dict):
+    """환자 계정으로 환자 목록 요약 조회 시 권한 오류 테스트"""
+    response = await client.get("/dashboard/doctor/overview", headers=patient_auth_headers)
+    assert response.status_code == 403
@@ -0,0 +1,91 @@
+import math
+
+import pytest
+from httpx import AsyncClient
+
+from padoc_common.models import SentenceFeatures, VoiceRecord
+from padoc_common.models.enums import FileStatusEnum, RecordingTypeEnum
+from padoc_common.sampling_codec import SamplingSeries, encode_sampling, encode_sampling_lod
+
+
+async def _add_sentence_record(db_session, patient_id: int, count: int, with_lod: bool = True) -> int:
+    record = VoiceRecord(
+        patient_id=patient_id,
+        file_path=f"{patient_id}/sampling_{count}.wav",
+        type=RecordingTypeEnum.voice_sentence,
+        status=FileStatusEnum.COMPLETED,
+    )
+    db_session.add(record)
+    await db_session.flush()
+
+    energy = [60 + 10 * math.sin(i / 25) for i in range(count)]
+    frequency = [None if i % 200 < 20 else 130 + 15 * math.sin(i / 90) for i in range(count)]
+    blob = encode_sampling(energy, frequency, sampling_rate=44100.0, start_time=0.0125, time_step=0.025)
+    db_session.add(
+        SentenceFeatures(
+            record_id=record.id,
+            cpp=10.0,
+            csid=5.0,
+            sampling_blob=blob,
+            sampling_lod=encode_sampling_lod(SamplingSeries(blob)) if with_lod else None,
+        )
+    )
+    await db_session.commit()
+    return record.id
+
+
+@pytest.mark.asyncio
+async def test_voice_sampling_downsampled(client: AsyncClient, db_session, patient_auth_headers: dict):
+    """저장된 LOD 와 원본 계산 결과, min/max 방식, 점 개수 제한 테스트"""
+    patient_id = (await client.get("/users/profile", headers=patient_auth_headers)).json()["account_id"]
+    record_id = await _add_sentence_record(db_session, patient_id, 7200)
+    legacy_id = await _add_sentence_record(db_session, patient_id, 7200, with_lod=False)
+
+    response = await client.get(f"/dashboard/voice/{record_id}/sampling?points=512", headers=patient_auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["source_points"] == 7200
+    assert body["time_step"] == 0.025
+    assert len(body["energy"]["index"]) == len(body["energy"]["values"]) == 512
+    assert body["energy"]["index"][0] == 0 and body["energy"]["index"][-1] == 7199
+    assert None in body["frequency"]["values"]
+
+    # LOD 단계와 같은 점 개수는 LOD 가 없는 행을 원본에서 계산한 결과와 같아야 합니다.
+    legacy = await client.get(f"/dashboard/voice/{legacy_id}/sampling?points=512", headers=patient_auth_headers)
+    assert legacy.json()["energy"] == body["energy"]
+    assert legacy.json()["frequency"] == body["frequency"]
+
+    # LOD 단계 사이의 점 개수
+    response = await client.get(f"/dashboard/voice/{record_id}/sampling?points=300", headers=patient_auth_headers)
+    assert len(response.json()["energy"]["index"]) == 300
+
+    response = await client.get(
+        f"/dashboard/voice/{record_id}/sampling?points=300&method=minmax", headers=patient_auth_headers
+    )
+    assert response.json()["method"] == "minmax"
+    assert len(response.json()["energy"]["index"]) <= 300
+
+    response = await client.get(f"/dashboard/voice/{record_id}/sampling?points=1", headers=patient_auth_headers)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_voice_sampling_access(client: AsyncClient, db_session, patient_auth_headers: dict, doctor_auth_headers: dict):
+    """연결되지 않은 의사는 403, 없는 녹음은 404 를 반환하는지 테스트"""
+    patient_id = (await client.get("/users/profile", headers=patient_auth_headers)).json()["account_id"]
+    record_id = await _add_sentence_record(db_session, patient_id, 1000)
+
+    response = await client.get(f"/dashboard/voice/{record_id}/sampling", headers=doctor_auth_headers)
+    assert response.status_code == 403
+
+    await client.post("/users/connections/requests", json={"patient_id": patient_id}, headers=doctor_auth_headers)
+    connection_id = (await client.get("/users/connections", headers=patient_auth_headers)).json()["connections"][0]["id"]
+    await client.put("/users/connections/approve", json={"connection_id": connection_id}, headers=patient_auth_headers)
+
+    response = await client.get(f"/dashboard/voice/{record_id}/sampling", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    # 원본(1000개)보다 많은 점을 요청하면 원본을 그대로 돌려줍니다.
+    assert response.json()["energy"]["index"] == list(range(1000))
+
+    response = await client.get(f"/dashboard/voice/{record_id + 100}/sampling", headers=patient_auth_headers)
+    assert response.status_code == 404
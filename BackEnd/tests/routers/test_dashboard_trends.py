@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+
+from padoc_common.models import AdvancedTrainingInformation, PatientFeatureRollup
+from padoc_common.models.enums import RollupPeriodEnum
+
+from app.services import rollup_service
+
+
+@pytest.mark.asyncio
+async def test_patient_trends_raw_and_rollup_match(client: AsyncClient, patient_auth_headers: dict, submit_training):
+    """짧은 기간(원본)과 긴 기간(집계 테이블) 조회 결과가 일치하는지 테스트"""
+    await submit_training(patient_auth_headers, 80)
+    await submit_training(patient_auth_headers, 60)
+
+    today = datetime.now(timezone.utc).date()
+
+    raw = await client.get(
+        f"/dashboard/patient/trends?start_date={today}&end_date={today}",
+        headers=patient_auth_headers,
+    )
+    assert raw.status_code == 200
+    raw_json = raw.json()
+    assert raw_json["source"] == "raw"
+
+    start = today - timedelta(days=rollup_service.ROLLUP_THRESHOLD_DAYS)
+    rollup = await client.get(
+        f"/dashboard/patient/trends?start_date={start}&end_date={today}",
+        headers=patient_auth_headers,
+    )
+    assert rollup.status_code == 200
+    rollup_json = rollup.json()
+    assert rollup_json["source"] == "rollup"
+
+    assert raw_json["buckets"] == rollup_json["buckets"]
+    metric = rollup_json["buckets"][0]["metrics"][0]
+    assert metric["metric"] == "avg_score"
+    assert metric["count"] == 2
+    assert metric["mean"] == 70
+    assert metric["min"] == 60
+    assert metric["max"] == 80
+
+
+@pytest.mark.asyncio
+async def test_patient_weekly_trends_and_consistency(client: AsyncClient, db_session, patient_auth_headers: dict, submit_training):
+    """주 단위 조회 및 백필/정합성 검사 테스트"""
+    await submit_training(patient_auth_headers, 90)
+
+    response = await client.get("/dashboard/patient/trends?period=week", headers=patient_auth_headers)
+    assert response.status_code == 200
+    buckets = response.json()["buckets"]
+    assert len(buckets) == 1
+    assert datetime.fromisoformat(buckets[0]["period_start"]).weekday() == 0
+
+    assert await rollup_service.check_rollup_consistency(db_session) == []
+    assert await rollup_service.backfill_rollups(db_session) == 2
+    assert await rollup_service.check_rollup_consistency(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rollups_are_not_lost(engine, db_session):
+    """같은 환자/날짜의 집계를 두 세션이 동시에 갱신해도 개수가 유실되지 않는지 테스트"""
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    now = datetime.now(timezone.utc)
+
+    async def apply(avg_score):
+        async with async_session() as session:
+            await rollup_service.apply_rollup(
+                session, 1, now, AdvancedTrainingInformation(avg_score=avg_score, progress="level 1")
+            )
+            await session.commit()
+
+    await asyncio.gather(apply(80), apply(60))
+    await apply(70)
+
+    rows = (await db_session.execute(select(PatientFeatureRollup))).scalars().all()
+    assert {row.period for row in rows} == set(RollupPeriodEnum)
+    for row in rows:
+        assert (row.count, row.total, row.min_value, row.max_value) == (3, 210, 60, 80)
+
+
+@pytest.mark.asyncio
+async def test_patient_trends_invalid_date_range(client: AsyncClient, patient_auth_headers: dict):
+    """잘못된 날짜 범위로 추이 조회 실패 테스트"""
+    today = datetime.now(timezone.utc).date()
+    response = await client.get(
+        f"/dashboard/patient/trends?start_date={today}&end_date={today - timedelta(days=1)}",
+        headers=patient_auth_headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_doctor_trends_without_connection(client: AsyncClient, doctor_auth_headers: dict):
+    """연결되지 않은 환자의 추이 조회 시 권한 오류 테스트"""
+    response = await client.get("/dashboard/doctor/999/trends", headers=doctor_auth_headers)
+    assert response.status_code == 403
@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.services import export_service
+from padoc_common.models import AhFeatures, SentenceFeatures, VoiceRecord
+from padoc_common.models.enums import FileStatusEnum, RecordingTypeEnum
+
+
+async def _add_records(db_session, patient_id: int, count: int) -> None:
+    """/아/ 녹음과 문장 녹음을 번갈아 count 개 추가합니다. (마지막에 분석 중인 녹음 1개 추가)"""
+    now = datetime.now(timezone.utc)
+    for i in range(count + 1):
+        is_ah = i % 2 == 0
+        record = VoiceRecord(
+            patient_id=patient_id,
+            file_path=f"{patient_id}/export_{i}.wav",
+            type=RecordingTypeEnum.voice_ah if is_ah else RecordingTypeEnum.voice_sentence,
+            status=FileStatusEnum.COMPLETED if i < count else FileStatusEnum.PROCESSING,
+            created_at=now - timedelta(days=count - i),
+        )
+        db_session.add(record)
+        await db_session.flush()
+        if is_ah:
+            db_session.add(AhFeatures(record_id=record.id, jitter_local=0.1 * i, hnr=20.0 + i))
+        else:
+            db_session.add(SentenceFeatures(record_id=record.id, cpp=10.0 + i, csid=5.0))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_export_patient_csv_and_ndjson(client: AsyncClient, db_session, monkeypatch, signup_patient):
+    """본인 이력 CSV/NDJSON 내보내기 (여러 묶음으로 나뉘어도 순서와 값이 유지되는지) 테스트"""
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_ROWS", 2)
+    patient_id, headers = await signup_patient("export_patient")
+    await _add_records(db_session, patient_id, 5)
+
+    response = await client.get("/export/voice-features", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 5
+    assert [row["recording_type"] for row in rows[:2]] == ["voice_ah", "voice_sentence"]
+    assert rows[0]["hnr"] == "20.0" and rows[0]["cpp"] == ""
+    assert rows[1]["cpp"] == "11.0" and rows[1]["jitter_local"] == ""
+
+    response = await client.get("/export/voice-features?format=ndjson", headers=headers)
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["record_id"] for line in lines] == [int(row["record_id"]) for row in rows]
+    assert lines[2]["hnr"] == 22.0 and lines[2]["csid"] is None
+
+    today = datetime.now(timezone.utc).date()
+    response = await client.get(
+        f"/export/voice-features?format=ndjson&start_date={today - timedelta(days=2)}&end_date={today}",
+        headers=headers,
+    )
+    assert len(response.text.splitlines()) == 2
+
+    response = await client.get(f"/export/voice-features?patient_ids={patient_id + 1}", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_doctor_cohort(client: AsyncClient, db_session, doctor_auth_headers: dict, signup_patient, connect_patient):
+    """의사가 연결된 환자들의 이력을 한 파일로 내보내고, 연결되지 않은 환자는 거부되는지 테스트"""
+    first_id, first_headers = await signup_patient("export_first")
+    second_id, second_headers = await signup_patient("export_second")
+    other_id, _ = await signup_patient("export_other")
+    await connect_patient(doctor_auth_headers, first_headers)
+    await connect_patient(doctor_auth_headers, second_headers)
+    await _add_records(db_session, first_id, 3)
+    await _add_records(db_session, second_id, 2)
+    await _add_records(db_session, other_id, 2)
+
+    response = await client.get("/export/voice-features?format=ndjson", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    patient_ids = [json.loads(line)["patient_id"] for line in response.text.splitlines()]
+    assert patient_ids == [first_id] * 3 + [second_id] * 2
+
+    response = await client.get(
+        f"/export/voice-features?format=ndjson&patient_ids={second_id}", headers=doctor_auth_headers
+    )
+    assert len(response.text.splitlines()) == 2
+
+    response = await client.get(
+        f"/export/voice-features?patient_ids={first_id}&patient_ids={other_id}", headers=doctor_auth_headers
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(client: AsyncClient, db_session, monkeypatch, signup_patient):
+    """Parquet 내보내기 결과를 다시 읽었을 때 행 수와 값이 일치하는지 테스트 (pyarrow 필요)"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_ROWS", 2)
+    patient_id, headers = await signup_patient("export_parquet")
+    await _add_records(db_session, patient_id, 5)
+
+    response = await client.get("/export/voice-features?format=parquet", headers=headers)
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 5
+    assert table.column("recording_type").to_pylist()[:2] == ["voice_ah", "voice_sentence"]
+    assert table.column("cpp").to_pylist()[1] == 11.0
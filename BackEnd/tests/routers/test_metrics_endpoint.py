@@ -0,0 +1,54 @@
+import pytest
+from httpx import AsyncClient
+
+from padoc_common.metrics import (
+    DB_QUERY_LATENCY,
+    HTTP_LATENCY,
+    REQUEST_DB_QUERIES,
+    UNMATCHED_ROUTE,
+    instrument_engine,
+)
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient, engine, doctor_auth_headers: dict, monkeypatch):
+    """라우트 템플릿 단위 지연 시간, 요청당 DB 쿼리 수 수집 및 /metrics 출력 테스트"""
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-token")
+    instrument_engine(engine)
+    route = "/dashboard/doctor/{patient_id}/trends"
+    requests_before = HTTP_LATENCY.get_count(method="GET", route=route)
+    queries_before = REQUEST_DB_QUERIES.get_sum(route=route)
+    selects_before = DB_QUERY_LATENCY.get_count(operation="SELECT")
+
+    await client.get("/dashboard/doctor/12345/trends", headers=doctor_auth_headers)
+    await client.get("/dashboard/doctor/67890/trends", headers=doctor_auth_headers)
+    await client.get("/no/such/path")
+
+    assert HTTP_LATENCY.get_count(method="GET", route=route) == requests_before + 2
+    assert REQUEST_DB_QUERIES.get_sum(route=route) > queries_before
+    assert DB_QUERY_LATENCY.get_count(operation="SELECT") > selects_before
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert f'padoc_http_requests_total{{method="GET",route="{route}",status="403"}}' in text
+    assert f'route="{UNMATCHED_ROUTE}",status="404"' in text
+    assert 'padoc_http_requests_in_progress{method="GET"} 0' in text
+    # /metrics 자신은 수집하지 않습니다.
+    assert 'route="/metrics"' not in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_requires_token(client: AsyncClient, doctor_auth_headers: dict, monkeypatch):
+    """수집 토큰이 없거나 다르면 /metrics 가 메트릭을 내보내지 않는지 테스트"""
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    assert (await client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})).status_code == 404
+
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-token")
+    response = await client.get("/metrics")
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+    assert (await client.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 401
+    # 로그인 세션 토큰으로는 수집할 수 없습니다.
+    assert (await client.get("/metrics", headers=doctor_auth_headers)).status_code == 401
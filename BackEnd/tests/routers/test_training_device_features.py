@@ -0,0 +1,89 @@
+import pytest
+from httpx import AsyncClient
+from sqlmodel import select
+
+from app import storage
+from app.main import app
+from app.services import device_features_service
+from padoc_common.models import AhFeatures
+from padoc_common.models.enums import FeatureSourceEnum
+from padoc_common.models.voice_records import VoiceRecord
+
+DEVICE_FEATURES = {
+    "parameter_set": "server",
+    "jitter_local": 0.006, "jitter_rap": 0.003, "jitter_ppq5": 0.0035, "jitter_ddp": 0.009,
+    "shimmer_local": 0.04, "shimmer_apq3": 0.02, "shimmer_apq5": 0.025, "shimmer_apq11": 0.03, "shimmer_dda": 0.06,
+    "hnr": 18.5, "nhr": 0.02, "f0": 180.0, "max_f0": 210.0, "min_f0": 150.0,
+}
+
+
+@pytest.fixture
+def upload_mocks(mocker):
+    """S3 클라이언트와 백그라운드 폴링을 가짜로 바꿉니다."""
+    s3_client = mocker.MagicMock()
+    s3_client.generate_presigned_url.return_value = "http://example.com/upload"
+    app.dependency_overrides[storage.get_s3_client] = lambda: s3_client
+    return mocker.patch("app.routers.training.poll_s3_file_status", new=mocker.AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_upload_with_device_features_skips_extraction(
+    client: AsyncClient, db_session, patient_auth_headers, upload_mocks, monkeypatch
+):
+    """장치 특징을 함께 보내면 바로 저장하고 서버 추출을 생략하는지 테스트"""
+    monkeypatch.setattr(device_features_service, "VERIFY_RATE", 0.0)
+    response = await client.post(
+        "/training/basic/upload",
+        json={"file_name": "ah.wav", "type": "voice_ah", "device_features": DEVICE_FEATURES},
+        headers=patient_auth_headers,
+    )
+    assert response.status_code == 200
+    record_id = response.json()["record_id"]
+
+    features = await db_session.get(AhFeatures, record_id)
+    assert features is not None
+    assert features.jitter_local == pytest.approx(0.006)
+    assert features.shimmer_apq11 == pytest.approx(0.03)
+    record = await db_session.get(VoiceRecord, record_id)
+    assert record.feature_source == FeatureSourceEnum.DEVICE
+    assert upload_mocks.call_args.kwargs["extract_features"] is False
+
+
+@pytest.mark.asyncio
+async def test_upload_with_implausible_device_features(
+    client: AsyncClient, db_session, patient_auth_headers, upload_mocks
+):
+    """범위를 벗어난 장치 특징은 저장하지 않고 서버 추출로 넘기는지 테스트"""
+    response = await client.post(
+        "/training/basic/upload",
+        json={"file_name": "ah.wav", "type": "voice_ah", "device_features": {**DEVICE_FEATURES, "f0": 5000.0}},
+        headers=patient_auth_headers,
+    )
+    assert response.status_code == 200
+    record_id = response.json()["record_id"]
+
+    assert await db_session.get(AhFeatures, record_id) is None
+    assert upload_mocks.call_args.kwargs["extract_features"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "device_features",
+    [
+        {**DEVICE_FEATURES, "parameter_set": "device"},
+        {key: value for key, value in DEVICE_FEATURES.items() if key != "shimmer_apq3"},
+        {key: value for key, value in DEVICE_FEATURES.items() if key != "parameter_set"},
+    ],
+)
+async def test_upload_rejects_incomplete_device_features(
+    client: AsyncClient, db_session, patient_auth_headers, upload_mocks, device_features
+):
+    """서버와 다른 파라미터로 계산했거나 지표가 빠진 장치 특징은 녹음을 만들기 전에 거절하는지 테스트"""
+    response = await client.post(
+        "/training/basic/upload",
+        json={"file_name": "ah.wav", "type": "voice_ah", "device_features": device_features},
+        headers=patient_auth_headers,
+    )
+    assert response.status_code in (400, 422)
+    assert (await db_session.execute(select(VoiceRecord))).scalars().all() == []
+    upload_mocks.assert_not_called()
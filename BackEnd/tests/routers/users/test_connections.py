@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.services.users_service.access_cache import connection_access_cache
+
 # ---------------------------------------
 # Test Cases for Connection Management
 # ---------------------------------------
@@ -53,3 +55,149 @@ async def test_connection_flow(client: AsyncClient, doctor_auth_headers: dict, p
     final_list_res = await client.get("/users/connections", headers=patient_auth_headers)
     assert final_list_res.status_code == 200
     assert len(final_list_res.json()["connections"]) == 0
+
+
+async def _signup_and_login_patient(client: AsyncClient, login_id: str) -> tuple:
+    """환자를 가입시키고 (account_id, 인증 헤더)를 반환합니다."""
+    data = {"login_id": login_id, "password": "password_X!", "full_name": f"환자_{login_id}", "role": "patient"}
+    await client.post("/auth/patients", json=data)
+    login_res = await client.post("/auth/sessions", json={"login_id": login_id, "password": data["password"]})
+    headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+    account_id = (await client.get("/users/profile", headers=headers)).json()["account_id"]
+    return account_id, headers
+
+
+@pytest.mark.asyncio
+async def test_bulk_connection_flow(client: AsyncClient, doctor_auth_headers: dict):
+    """일괄 연결 요청/승인/거절/해제 및 항목별 결과 테스트"""
+    patients = [await _signup_and_login_patient(client, f"bulk_patient_{i}") for i in range(3)]
+    (p0, h0), (p1, h1), (p2, h2) = patients
+
+    # 1. 일괄 요청: 존재하지 않는 환자와 중복 ID 가 섞여 있어도 항목별로 처리됩니다.
+    response = await client.post(
+        "/users/connections/bulk/requests",
+        json={"patient_ids": [p0, p1, p2, p0, 99999]},
+        headers=doctor_auth_headers,
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 3
+    assert body["failed"] == 1
+    assert [item["id"] for item in body["results"]] == [p0, p1, p2, 99999]
+    assert all(item["connection_status"] == "pending" for item in body["results"][:3])
+    connection_ids = {item["id"]: item["connection_id"] for item in body["results"][:3]}
+
+    # 2. 이미 대기 중인 환자에게 다시 요청하면 해당 항목만 실패합니다.
+    response = await client.post(
+        "/users/connections/bulk/requests", json={"patient_ids": [p0]}, headers=doctor_auth_headers
+    )
+    assert response.json()["results"][0]["message"] == "이미 요청 중인 연결입니다."
+
+    # 3. 환자 0 이 자신의 연결과 남의 연결을 함께 승인하면 자신의 것만 승인됩니다.
+    response = await client.put(
+        "/users/connections/bulk/approve",
+        json={"connection_ids": [connection_ids[p0], connection_ids[p1]]},
+        headers=h0,
+    )
+    results = response.json()["results"]
+    assert results[0]["success"] is True
+    assert results[0]["connection_status"] == "approved"
+    assert results[1]["success"] is False
+
+    # 4. 환자 1 은 거절, 환자 2 는 승인합니다.
+    await client.put("/users/connections/bulk/reject", json={"connection_ids": [connection_ids[p1]]}, headers=h1)
+    await client.put("/users/connections/bulk/approve", json={"connection_ids": [connection_ids[p2]]}, headers=h2)
+
+    # 5. 의사가 일괄 해제: 거절된 연결은 해제할 수 없으므로 실패합니다.
+    response = await client.put(
+        "/users/connections/bulk/terminate",
+        json={"connection_ids": list(connection_ids.values())},
+        headers=doctor_auth_headers,
+    )
+    body = response.json()
+    assert body["succeeded"] == 2
+    assert [item["success"] for item in body["results"]] == [True, False, True]
+    assert body["results"][1]["connection_status"] == "rejected"
+
+    # 6. 해제/거절된 환자에게는 다시 요청할 수 있고, 같은 연결 행이 재사용됩니다.
+    response = await client.post(
+        "/users/connections/bulk/requests", json={"patient_ids": [p1, p2]}, headers=doctor_auth_headers
+    )
+    body = response.json()
+    assert body["succeeded"] == 2
+    assert [item["connection_id"] for item in body["results"]] == [connection_ids[p1], connection_ids[p2]]
+    assert all(item["connection_status"] == "pending" for item in body["results"])
+
+
+@pytest.mark.asyncio
+async def test_bulk_connection_permissions(client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict):
+    """일괄 처리 권한 테스트"""
+    response = await client.post(
+        "/users/connections/bulk/requests", json={"patient_ids": [1]}, headers=patient_auth_headers
+    )
+    assert response.status_code == 403
+
+    response = await client.put(
+        "/users/connections/bulk/approve", json={"connection_ids": [1]}, headers=doctor_auth_headers
+    )
+    assert response.status_code == 403
+
+    response = await client.post(
+        "/users/connections/bulk/requests", json={"patient_ids": []}, headers=doctor_auth_headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_doctor_trends_access_cache_follows_connection(client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict):
+    """연결 승인/해제 시 권한 캐시가 무효화되고, 그 사이 조회는 캐시에서 처리되는지 테스트"""
+    patient_id = (await client.get("/users/profile", headers=patient_auth_headers)).json()["account_id"]
+    await client.post("/users/connections/requests", json={"patient_id": patient_id}, headers=doctor_auth_headers)
+
+    response = await client.get(f"/dashboard/doctor/{patient_id}/trends", headers=doctor_auth_headers)
+    assert response.status_code == 403
+
+    connection_id = (await client.get("/users/connections", headers=patient_auth_headers)).json()["connections"][0]["id"]
+    await client.put("/users/connections/approve", json={"connection_id": connection_id}, headers=patient_auth_headers)
+
+    response = await client.get(f"/dashboard/doctor/{patient_id}/trends", headers=doctor_auth_headers)
+    assert response.status_code == 200
+
+    misses = connection_access_cache.misses
+    response = await client.get(f"/dashboard/doctor/{patient_id}/trends?period=week", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    assert connection_access_cache.misses == misses
+
+    await client.delete(f"/users/connections/{connection_id}", headers=doctor_auth_headers)
+    response = await client.get(f"/dashboard/doctor/{patient_id}/trends", headers=doctor_auth_headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bulk_connection_updates_invalidate_access_cache(client: AsyncClient, doctor_auth_headers: dict):
+    """일괄 승인/해제 시 권한 캐시가 무효화되는지 테스트"""
+    (p0, h0), (p1, _) = [await _signup_and_login_patient(client, f"cache_patient_{i}") for i in range(2)]
+    response = await client.post(
+        "/users/connections/bulk/requests", json={"patient_ids": [p0, p1]}, headers=doctor_auth_headers
+    )
+    connection_id = response.json()["results"][0]["connection_id"]
+
+    # 승인 전 조회로 "연결 없음" 이 캐시에 들어갑니다.
+    for patient_id in (p0, p1):
+        response = await client.get(f"/dashboard/doctor/{patient_id}/trends", headers=doctor_auth_headers)
+        assert response.status_code == 403
+
+    await client.put("/users/connections/bulk/approve", json={"connection_ids": [connection_id]}, headers=h0)
+    response = await client.get(f"/dashboard/doctor/{p0}/trends", headers=doctor_auth_headers)
+    assert response.status_code == 200
+
+    misses = connection_access_cache.misses
+    response = await client.get(f"/dashboard/doctor/{p1}/trends", headers=doctor_auth_headers)
+    assert response.status_code == 403
+    assert connection_access_cache.misses == misses
+
+    await client.put(
+        "/users/connections/bulk/terminate", json={"connection_ids": [connection_id]}, headers=doctor_auth_headers
+    )
+    response = await client.get(f"/dashboard/doctor/{p0}/trends", headers=doctor_auth_headers)
+    assert response.status_code == 403
@@ -65,3 +65,112 @@ async def test_patient_list_order_flow(client: AsyncClient, doctor_auth_headers:
     assert final_get_res.status_code == 200
     final_order = final_get_res.json().get("patient_order", [])
     assert final_order == new_order
+
+
+@pytest.mark.asyncio
+async def test_patient_list_order_syncs_with_connections(client: AsyncClient, doctor_auth_headers: dict):
+    """연결이 끊긴 환자는 빠지고, 대기 중인 요청은 포함되지 않으며, 저장된 순서는 유지되는지 테스트"""
+    patient_ids = []
+    for suffix in ("C", "D", "E"):
+        patient_ids.append(
+            await create_and_connect_patient(
+                client,
+                doctor_auth_headers,
+                {"login_id": f"patient_{suffix}_order", "password": "password_X!", "full_name": f"환자{suffix}", "role": "patient"},
+            )
+        )
+    c_id, d_id, e_id = patient_ids
+
+    await client.post("/users/list-order", json={"patient_order": [e_id, d_id, c_id]}, headers=doctor_auth_headers)
+
+    # 승인되지 않은(대기 중) 연결 요청을 하나 만듭니다.
+    await client.post(
+        "/auth/patients",
+        json={"login_id": "patient_pending_order", "password": "password_X!", "full_name": "대기환자", "role": "patient"},
+    )
+    login_res = await client.post("/auth/sessions", json={"login_id": "patient_pending_order", "password": "password_X!"})
+    pending_headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+    pending_id = (await client.get("/users/profile", headers=pending_headers)).json()["account_id"]
+    await client.post("/users/connections/requests", json={"patient_id": pending_id}, headers=doctor_auth_headers)
+
+    # 환자 D 와의 연결을 끊습니다.
+    connections = (await client.get("/users/connections", headers=doctor_auth_headers)).json()["connections"]
+    d_connection_id = next(c["id"] for c in connections if c["patient_id"] == d_id)
+    await client.delete(f"/users/connections/{d_connection_id}", headers=doctor_auth_headers)
+
+    response = await client.get("/users/list-order", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    assert response.json()["patient_order"] == [e_id, c_id]
+
+
+async def _view_setting(db_session, doctor_id: int):
+    from sqlmodel import select
+    from padoc_common.models import DoctorPatientViewSetting
+
+    db_session.expire_all()
+    return (
+        await db_session.execute(select(DoctorPatientViewSetting).where(DoctorPatientViewSetting.doctor_id == doctor_id))
+    ).scalars().first()
+
+
+@pytest.mark.asyncio
+async def test_patient_list_order_get_does_not_write_unchanged_order(
+    client: AsyncClient, db_session, doctor_auth_headers: dict
+):
+    """조회만으로는 설정 행을 만들지 않고, 저장된 순서가 그대로면 다시 저장하지 않는지 테스트"""
+    patient_id = await create_and_connect_patient(
+        client, doctor_auth_headers,
+        {"login_id": "patient_H_order", "password": "password_X!", "full_name": "환자H", "role": "patient"},
+    )
+    doctor_id = (await client.get("/users/profile", headers=doctor_auth_headers)).json()["account_id"]
+
+    response = await client.get("/users/list-order", headers=doctor_auth_headers)
+    assert response.json()["patient_order"] == [patient_id]
+    assert await _view_setting(db_session, doctor_id) is None
+
+    await client.post("/users/list-order", json={"patient_order": [patient_id]}, headers=doctor_auth_headers)
+    saved = await _view_setting(db_session, doctor_id)
+    version, updated_at = saved.version, saved.updated_at
+
+    response = await client.get("/users/list-order", headers=doctor_auth_headers)
+    assert response.json()["patient_order"] == [patient_id]
+    saved = await _view_setting(db_session, doctor_id)
+    assert (saved.version, saved.updated_at) == (version, updated_at)
+
+
+@pytest.mark.asyncio
+async def test_patient_list_order_retries_on_concurrent_update(
+    client: AsyncClient, db_session, doctor_auth_headers: dict, mocker
+):
+    """저장 직전에 다른 요청이 순서를 바꾼 경우(version 불일치) 다시 읽어 병합하는지 테스트"""
+    from app.services.users_service import list_order_service
+
+    patient_f = await create_and_connect_patient(
+        client, doctor_auth_headers,
+        {"login_id": "patient_F_order", "password": "password_X!", "full_name": "환자F", "role": "patient"},
+    )
+    doctor_id = (await client.get("/users/profile", headers=doctor_auth_headers)).json()["account_id"]
+    # 설정 행을 만들어 둡니다.
+    await client.post("/users/list-order", json={"patient_order": [patient_f]}, headers=doctor_auth_headers)
+    patient_g = await create_and_connect_patient(
+        client, doctor_auth_headers,
+        {"login_id": "patient_G_order", "password": "password_X!", "full_name": "환자G", "role": "patient"},
+    )
+
+    real_fetch = list_order_service._fetch_order_state
+    calls = []
+
+    async def stale_first_fetch(db, doctor_id):
+        setting_id, saved_order, version, approved = await real_fetch(db, doctor_id)
+        calls.append(version)
+        if len(calls) == 1:
+            # 첫 번째 읽기는 이미 낡은 version 을 본 것으로 만듭니다.
+            version -= 1
+        return setting_id, saved_order, version, approved
+
+    mocker.patch.object(list_order_service, "_fetch_order_state", side_effect=stale_first_fetch)
+
+    order = await list_order_service.get_patient_order(db_session, doctor_id)
+    assert order.patient_order == [patient_f, patient_g]
+    assert len(calls) == 2
+    assert (await _view_setting(db_session, doctor_id)).version == calls[-1] + 1
@@ -0,0 +1,128 @@
+import pytest
+from httpx import AsyncClient
+
+# ---------------------------------------
+# Test Cases for Doctor Notes
+# ---------------------------------------
+
+async def _signup_and_login_doctor(client: AsyncClient, doctor_signup_data: dict, login_id: str, license_id: str) -> dict:
+    data = {**doctor_signup_data, "login_id": login_id, "email": f"{login_id}@test.com", "valid_license_id": license_id}
+    await client.post("/auth/doctors", json=data)
+    login_res = await client.post("/auth/sessions", json={"login_id": login_id, "password": data["password"]})
+    return {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_note_flow_and_pagination(client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict, connect_patient):
+    """메모 작성, 수정, 커서 페이지 조회, 개수 요약 테스트"""
+    patient_id = await connect_patient(doctor_auth_headers, patient_auth_headers)
+
+    note_ids = []
+    for i in range(5):
+        res = await client.post(
+            "/users/notes", json={"patient_id": patient_id, "note_content": f"메모 {i}"}, headers=doctor_auth_headers
+        )
+        assert res.status_code == 200
+        note_ids.append(res.json()["id"])
+
+    update_res = await client.put(
+        f"/users/notes/{note_ids[0]}", json={"note_content": "수정된 메모"}, headers=doctor_auth_headers
+    )
+    assert update_res.status_code == 200
+    assert update_res.json()["note_content"] == "수정된 메모"
+
+    # 최신순으로 2개씩 끝까지 넘겨 봅니다.
+    seen, cursor = [], None
+    while True:
+        params = {"patient_id": patient_id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        res = await client.get("/users/notes", params=params, headers=doctor_auth_headers)
+        assert res.status_code == 200
+        page = res.json()
+        assert len(page["notes"]) <= 2
+        seen.extend(note["id"] for note in page["notes"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == list(reversed(note_ids))
+
+    counts_res = await client.get("/users/notes/counts", headers=doctor_auth_headers)
+    assert counts_res.status_code == 200
+    assert counts_res.json()["counts"] == [
+        {"patient_id": patient_id, "count": 5, "latest_at": counts_res.json()["counts"][0]["latest_at"]}
+    ]
+
+    # 연결되지 않은 환자 ID 는 요약에서 제외됩니다.
+    filtered_res = await client.get(
+        "/users/notes/counts", params={"patient_ids": [patient_id, 99999]}, headers=doctor_auth_headers
+    )
+    assert [item["patient_id"] for item in filtered_res.json()["counts"]] == [patient_id]
+
+
+@pytest.mark.asyncio
+async def test_note_permissions(client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict, connect_patient):
+    """연결되지 않은 환자, 환자 역할, 잘못된 커서에 대한 테스트"""
+    patient_id = (await client.get("/users/profile", headers=patient_auth_headers)).json()["account_id"]
+
+    res = await client.post(
+        "/users/notes", json={"patient_id": patient_id, "note_content": "메모"}, headers=doctor_auth_headers
+    )
+    assert res.status_code == 403
+
+    res = await client.get("/users/notes", params={"patient_id": patient_id}, headers=patient_auth_headers)
+    assert res.status_code == 403
+
+    await connect_patient(doctor_auth_headers, patient_auth_headers)
+    res = await client.get(
+        "/users/notes", params={"patient_id": patient_id, "cursor": "invalid"}, headers=doctor_auth_headers
+    )
+    assert res.status_code == 400
+
+    res = await client.put("/users/notes/99999", json={"note_content": "메모"}, headers=doctor_auth_headers)
+    assert res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_notes_are_private_to_author(
+    client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict, doctor_signup_data: dict
+, connect_patient):
+    """같은 환자에 연결된 다른 의사에게는 메모 목록과 개수가 보이지 않는지 테스트"""
+    patient_id = await connect_patient(doctor_auth_headers, patient_auth_headers)
+    res = await client.post(
+        "/users/notes", json={"patient_id": patient_id, "note_content": "메모"}, headers=doctor_auth_headers
+    )
+    note_id = res.json()["id"]
+
+    other_headers = await _signup_and_login_doctor(client, doctor_signup_data, "other_doctor", "654321")
+    await client.post("/users/connections/requests", json={"patient_id": patient_id}, headers=other_headers)
+    connection_id = (await client.get("/users/connections", headers=other_headers)).json()["connections"][0]["id"]
+    res = await client.put("/users/connections/approve", json={"connection_id": connection_id}, headers=patient_auth_headers)
+    assert res.status_code == 200
+
+    res = await client.get("/users/notes", params={"patient_id": patient_id}, headers=other_headers)
+    assert res.status_code == 200
+    assert res.json() == {"notes": [], "next_cursor": None}
+
+    res = await client.get("/users/notes/counts", headers=other_headers)
+    assert res.json()["counts"] == [{"patient_id": patient_id, "count": 0, "latest_at": None}]
+
+    res = await client.put(f"/users/notes/{note_id}", json={"note_content": "수정"}, headers=other_headers)
+    assert res.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_note_update_requires_connection(client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict, connect_patient):
+    """연결이 끊긴 환자에 대한 메모는 수정할 수 없는지 테스트"""
+    patient_id = await connect_patient(doctor_auth_headers, patient_auth_headers)
+    res = await client.post(
+        "/users/notes", json={"patient_id": patient_id, "note_content": "메모"}, headers=doctor_auth_headers
+    )
+    note_id = res.json()["id"]
+
+    connection_id = (await client.get("/users/connections", headers=doctor_auth_headers)).json()["connections"][0]["id"]
+    res = await client.delete(f"/users/connections/{connection_id}", headers=doctor_auth_headers)
+    assert res.status_code == 204
+
+    res = await client.put(f"/users/notes/{note_id}", json={"note_content": "수정"}, headers=doctor_auth_headers)
+    assert res.status_code == 403
@@ -43,3 +43,61 @@ async def test_schedule_management_flow(client: AsyncClient, patient_auth_header
     final_res = await client.get("/users/schedules", headers=patient_auth_headers)
     assert final_res.status_code == 200
     assert final_res.json()["appointment_dates"] == []
+
+
+@pytest.mark.asyncio
+async def test_schedule_bulk_and_range(client: AsyncClient, patient_auth_headers: dict):
+    """스케줄 일괄 생성(중복 날짜 건너뜀) 및 기간 조회 테스트"""
+    add_res = await client.post("/users/schedules", json={"date": "2025-11-03"}, headers=patient_auth_headers)
+    assert add_res.status_code == 200
+
+    # 같은 날짜를 다시 추가하면 유니크 제약으로 거절됩니다.
+    dup_res = await client.post("/users/schedules", json={"date": "2025-11-03"}, headers=patient_auth_headers)
+    assert dup_res.status_code == 400
+
+    bulk_res = await client.post(
+        "/users/schedules/bulk",
+        json={"dates": ["2025-11-05", "2025-11-03", "2025-11-05", "2025-11-20"]},
+        headers=patient_auth_headers,
+    )
+    assert bulk_res.status_code == 200
+    body = bulk_res.json()
+    assert body["created_count"] == 2
+    assert body["skipped_count"] == 1
+    assert [item["date"] for item in body["appointment_dates"]] == ["2025-11-03", "2025-11-05", "2025-11-20"]
+    assert body["appointment_dates"][0]["schedule_id"] == add_res.json()["schedule_id"]
+
+    range_res = await client.get(
+        "/users/schedules?start_date=2025-11-04&end_date=2025-11-30", headers=patient_auth_headers
+    )
+    assert range_res.status_code == 200
+    assert [item["date"] for item in range_res.json()["appointment_dates"]] == ["2025-11-05", "2025-11-20"]
+
+    invalid_res = await client.get(
+        "/users/schedules?start_date=2025-11-30&end_date=2025-11-01", headers=patient_auth_headers
+    )
+    assert invalid_res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_schedule_recurring(client: AsyncClient, patient_auth_headers: dict):
+    """반복 스케줄(월/수/금, 2주) 생성 테스트"""
+    # 2025-11-05 는 수요일이므로 첫 주의 월요일(11-03)은 제외됩니다.
+    res = await client.post(
+        "/users/schedules/recurring",
+        json={"start_date": "2025-11-05", "weekdays": [4, 0, 2], "weeks": 2},
+        headers=patient_auth_headers,
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["created_count"] == 5
+    assert [item["date"] for item in body["appointment_dates"]] == [
+        "2025-11-05", "2025-11-07", "2025-11-10", "2025-11-12", "2025-11-14",
+    ]
+
+    invalid_res = await client.post(
+        "/users/schedules/recurring",
+        json={"start_date": "2025-11-05", "weekdays": [7], "weeks": 2},
+        headers=patient_auth_headers,
+    )
+    assert invalid_res.status_code == 422
@@ -81,4 +81,90 @@ async def test_search_users_empty_keyword(client: AsyncClient, doctor_auth_heade
     response = await client.get("/users/search?q=", headers=doctor_auth_headers)
 
     # 2. 응답 확인: 400 에러가 발생하는지 확인
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_search_users_ranking_and_pagination(client: AsyncClient, doctor_auth_headers: dict):
+    """완전 일치 > 앞부분 일치 > 부분 일치 순 정렬과 limit/offset 페이지네이션 테스트"""
+    for i, full_name in enumerate(["이민수", "민수", "민수정", "김민수"]):
+        await create_user(
+            client,
+            {"login_id": f"rank_user_{i}", "password": "test_password!", "full_name": full_name, "role": "patient"},
+        )
+
+    response = await client.get("/users/search?q=민수", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 4
+    assert [user["full_name"] for user in body["users"]] == ["민수", "민수정", "김민수", "이민수"]
+
+    response = await client.get("/users/search?q=민수&limit=2&offset=1", headers=doctor_auth_headers)
+    body = response.json()
+    assert body["total"] == 4
+    assert [user["full_name"] for user in body["users"]] == ["민수정", "김민수"]
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_signup_and_profile_update(
+    client: AsyncClient, doctor_auth_headers: dict, patient_auth_headers: dict, patient_signup_data: dict
+):
+    """색인 적재 이후의 회원가입과 이름 변경이 검색 결과에 바로 반영되는지 테스트"""
+    # 색인을 먼저 적재시킵니다.
+    response = await client.get("/users/search?q=박환자", headers=doctor_auth_headers)
+    assert [user["full_name"] for user in response.json()["users"]] == [patient_signup_data["full_name"]]
+
+    await create_user(
+        client,
+        {"login_id": "late_user", "password": "test_password!", "full_name": "최늦음", "role": "patient"},
+    )
+    response = await client.get("/users/search?q=늦음", headers=doctor_auth_headers)
+    assert [user["login_id"] for user in response.json()["users"]] == ["late_user"]
+
+    response = await client.put(
+        "/users/profile", json={"full_name": "박바뀜"}, headers=patient_auth_headers
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/users/search?q=박환자", headers=doctor_auth_headers)
+    assert response.json()["users"] == []
+    response = await client.get("/users/search?q=바뀜", headers=doctor_auth_headers)
+    assert [user["login_id"] for user in response.json()["users"]] == [patient_signup_data["login_id"]]
+
+
+@pytest.mark.asyncio
+async def test_typeahead_prefix_and_version(client: AsyncClient, doctor_auth_headers: dict):
+    """이름/로그인 ID 접두사 자동완성과 version 증가 테스트"""
+    for login_id, full_name in [("kim_a", "김가람"), ("kim_b", "김가"), ("lee_a", "이가람")]:
+        await create_user(
+            client,
+            {"login_id": login_id, "password": "test_password!", "full_name": full_name, "role": "patient"},
+        )
+
+    response = await client.get("/users/search/typeahead?q=김가", headers=doctor_auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    # 완전 일치가 먼저, 부분 일치(이가람)는 포함되지 않습니다.
+    assert [user["full_name"] for user in body["users"]] == ["김가", "김가람"]
+    version = body["version"]
+
+    response = await client.get("/users/search/typeahead?q=KIM_&k=1", headers=doctor_auth_headers)
+    assert [user["login_id"] for user in response.json()["users"]] == ["kim_a"]
+
+    await create_user(
+        client,
+        {"login_id": "kim_c", "password": "test_password!", "full_name": "김가온", "role": "patient"},
+    )
+    response = await client.get("/users/search/typeahead?q=김가", headers=doctor_auth_headers)
+    body = response.json()
+    assert body["version"] > version
+    assert [user["full_name"] for user in body["users"]] == ["김가", "김가람", "김가온"]
+
+
+@pytest.mark.asyncio
+async def test_typeahead_permission_and_empty(client: AsyncClient, patient_auth_headers: dict, doctor_auth_headers: dict):
+    """자동완성 권한 및 빈 검색어 테스트"""
+    response = await client.get("/users/search/typeahead?q=김", headers=patient_auth_headers)
+    assert response.status_code == 403
+
+    response = await client.get("/users/search/typeahead?q=", headers=doctor_auth_headers)
+    assert response.status_code == 400
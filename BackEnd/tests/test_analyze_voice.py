@@ -0,0 +1,45 @@
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("parselmouth")
+
+# 장치(AIot) 분석 스크립트
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "AIot" / "padoc" / "src" / "praat"))
+import analyze_voice  # noqa: E402
+
+RECORDING = Path(__file__).parent / "test_sound.wav"
+
+
+class CountingPool(ProcessPoolExecutor):
+    """프로세스 풀에 제출된 작업 수를 셉니다."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self._lock:
+            self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_concurrent_single_file_requests_run_in_process_pool():
+    """상주 모드에서 동시에 들어온 파일 1개짜리 요청이 요청 스레드가 아닌 프로세스 풀에서 분석되는지 테스트"""
+    expected = analyze_voice.analyze(str(RECORDING))
+
+    with CountingPool(max_workers=2) as pool, ThreadPoolExecutor(max_workers=4) as request_threads:
+        futures = [
+            request_threads.submit(analyze_voice.handle_request, {"path": str(RECORDING)}, lambda message: None, pool)
+            for _ in range(4)
+        ]
+        results = [future.result() for future in futures]
+
+    assert pool.submitted == 4
+    assert all(result == expected for result in results)
@@ -0,0 +1,133 @@
+import pytest
+
+from app.services import device_features_service
+from app.services.background_file_check_service import _save_features
+from app.services.device_features_service import (
+    DECISION_DEVICE,
+    DECISION_SERVER,
+    DECISION_VERIFY,
+    decide,
+    feature_drift,
+    implausible_fields,
+    validate_device_features,
+)
+from padoc_common.exceptions import BadRequestError
+from padoc_common.models import AhFeatures
+from padoc_common.models.enums import FeatureSourceEnum, RecordingTypeEnum
+from padoc_common.models.voice_records import VoiceRecord
+from padoc_common.schemas.training import DeviceFeatures
+
+AH_VALUES = {
+    "jitter_local": 0.006, "jitter_rap": 0.003, "jitter_ppq5": 0.0035, "jitter_ddp": 0.009,
+    "shimmer_local": 0.04, "shimmer_apq3": 0.02, "shimmer_apq5": 0.025, "shimmer_apq11": 0.03, "shimmer_dda": 0.06,
+    "hnr": 18.5, "nhr": 0.02, "f0": 180.0, "max_f0": 210.0, "min_f0": 150.0,
+}
+
+
+def test_validate_device_features():
+    """서버 파라미터로 계산한 모든 지표가 있어야 받고, 아니면 거절하는지 테스트"""
+    ah = RecordingTypeEnum.voice_ah
+    validate_device_features(ah, DeviceFeatures(parameter_set="server", **AH_VALUES))
+    validate_device_features(
+        RecordingTypeEnum.voice_sentence, DeviceFeatures(parameter_set="server", cpp=12.0, csid=20.0)
+    )
+
+    # 장치 화면용 DEVICE 파라미터 값은 서버 값과 정의가 달라 같은 열에 저장할 수 없습니다.
+    with pytest.raises(BadRequestError):
+        validate_device_features(ah, DeviceFeatures(parameter_set="device", **AH_VALUES))
+    # jitter_local/shimmer_local 만 보내면 나머지 jitter/shimmer 열이 비므로 거절합니다.
+    with pytest.raises(BadRequestError, match="jitter_rap"):
+        validate_device_features(ah, DeviceFeatures(parameter_set="server", **{**AH_VALUES, "jitter_rap": None}))
+    with pytest.raises(BadRequestError):
+        validate_device_features(RecordingTypeEnum.none_, DeviceFeatures(parameter_set="server", **AH_VALUES))
+
+
+def test_decide_device_verify_server():
+    """정상 값은 표본 비율에 따라 장치/검증, 비정상 값은 서버 추출로 정하는지 테스트"""
+    ah = RecordingTypeEnum.voice_ah
+    assert decide(ah, AH_VALUES, verify_rate=0.1, rng=lambda: 0.5) == DECISION_DEVICE
+    assert decide(ah, AH_VALUES, verify_rate=0.1, rng=lambda: 0.05) == DECISION_VERIFY
+
+    # 필수 값 누락, 범위 밖, F0 순서 오류, NaN 은 모두 서버에서 추출합니다.
+    assert implausible_fields(ah, {**AH_VALUES, "hnr": None}) == ["hnr"]
+    assert implausible_fields(ah, {**AH_VALUES, "jitter_local": 3.0}) == ["jitter_local"]
+    assert implausible_fields(ah, {**AH_VALUES, "min_f0": 190.0}) == ["f0_order"]
+    assert implausible_fields(ah, {**AH_VALUES, "nhr": float("nan")}) == ["nhr"]
+    assert decide(ah, {**AH_VALUES, "f0": 900.0}, rng=lambda: 0.9) == DECISION_SERVER
+
+    # 특징 테이블이 없는 녹음 유형은 항상 서버 처리
+    assert decide(RecordingTypeEnum.none_, AH_VALUES, rng=lambda: 0.9) == DECISION_SERVER
+    assert decide(RecordingTypeEnum.voice_sentence, {"cpp": 12.0, "csid": 20.0}, verify_rate=0.0) == DECISION_DEVICE
+
+
+def test_feature_drift_relative_error():
+    """가장 크게 어긋난 필드의 상대 오차를 쓰고, 0 근처 값은 분모 하한으로 과장되지 않는지 테스트"""
+    ah = RecordingTypeEnum.voice_ah
+    server = {**AH_VALUES, "f0": 200.0}
+    assert feature_drift(ah, AH_VALUES, server) == pytest.approx(0.1)
+    # 0.0001 -> 0.0002 는 100% 차이지만 jitter 분모 하한(0.005)으로 2% 로 봅니다.
+    assert feature_drift(ah, {"jitter_local": 0.0001}, {"jitter_local": 0.0002}) == pytest.approx(0.02)
+    assert feature_drift(ah, {"hnr": None}, {"hnr": 10.0}) is None
+
+
+@pytest.mark.asyncio
+async def test_store_and_verify_device_features(db_session, monkeypatch):
+    """장치 값을 저장한 뒤, 표본 검증에서 서버 값으로 교체하고 drift 를 기록하는지 테스트"""
+    record = VoiceRecord(patient_id=1, file_path="a.wav", type=RecordingTypeEnum.voice_ah)
+    db_session.add(record)
+    await db_session.commit()
+    await db_session.refresh(record)
+
+    monkeypatch.setattr(device_features_service, "VERIFY_RATE", 1.0)
+    decision = await device_features_service.store_device_features(
+        db_session, record.id, RecordingTypeEnum.voice_ah, DeviceFeatures(parameter_set="server", **AH_VALUES, cpp=10.0)
+    )
+    assert decision == DECISION_VERIFY
+    stored = await db_session.get(AhFeatures, record.id)
+    assert stored.f0 == 180.0
+    assert record.feature_source == FeatureSourceEnum.DEVICE
+
+    server_values = {name: None for name in device_features_service.AH_FIELDS}
+    server_values.update(AH_VALUES, f0=200.0)
+    features = await _save_features(db_session, record, AhFeatures, server_values)
+    await db_session.commit()
+
+    assert features is stored
+    assert stored.f0 == 200.0
+    assert record.feature_source == FeatureSourceEnum.DEVICE_VERIFIED
+    assert record.feature_drift == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio
+async def test_save_features_without_device_values_is_not_verification(db_session):
+    """이전 서버 추출 행이 있는 녹음을 다시 추출하면 검증으로 표시하지 않고 덮어쓰는지 테스트"""
+    record = VoiceRecord(patient_id=1, file_path="a.wav", type=RecordingTypeEnum.voice_ah)
+    db_session.add(record)
+    await db_session.commit()
+    await db_session.refresh(record)
+
+    await _save_features(db_session, record, AhFeatures, AH_VALUES)
+    await db_session.commit()
+    assert record.feature_source == FeatureSourceEnum.SERVER
+
+    features = await _save_features(db_session, record, AhFeatures, {**AH_VALUES, "f0": 200.0})
+    await db_session.commit()
+    assert features.f0 == 200.0
+    assert record.feature_source == FeatureSourceEnum.SERVER
+    assert record.feature_drift is None
+
+
+@pytest.mark.asyncio
+async def test_store_device_features_rejects_implausible(db_session):
+    """비정상 장치 값은 저장하지 않는지 테스트"""
+    record = VoiceRecord(patient_id=1, file_path="a.wav", type=RecordingTypeEnum.voice_ah)
+    db_session.add(record)
+    await db_session.commit()
+    await db_session.refresh(record)
+
+    decision = await device_features_service.store_device_features(
+        db_session, record.id, RecordingTypeEnum.voice_ah, DeviceFeatures(parameter_set="server", **{**AH_VALUES, "hnr": 90.0})
+    )
+    assert decision == DECISION_SERVER
+    assert await db_session.get(AhFeatures, record.id) is None
+    assert record.feature_source is None
@@ -0,0 +1,47 @@
+import math
+
+from padoc_common.downsampling import downsample, lttb, minmax
+from padoc_common.sampling_codec import LOD_LEVELS, SamplingLod, SamplingSeries, encode_sampling, encode_sampling_lod
+
+
+def test_lttb_and_minmax_keep_shape():
+    """LTTB 는 양 끝과 피크를, min/max 는 구간별 극값을 보존하는지 테스트"""
+    values = [math.sin(i / 50) for i in range(2000)]
+    values[777] = 10.0  # 스파이크
+
+    indices = lttb(values, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 1999
+    assert indices == sorted(indices)
+    assert 777 in indices
+
+    indices = minmax(values, 100)
+    assert len(indices) <= 100
+    assert 777 in indices
+
+    # 점 개수가 원본 이상이면 그대로, 빈 값은 None 으로 돌려줍니다.
+    assert downsample([1.0, None, float("nan")], 10) == ([0, 1, 2], [1.0, None, None])
+
+
+def test_sampling_lod_round_trip():
+    """LOD 피라미드가 원본보다 작은 단계만 저장하고, 각 단계가 원본 값과 일치하는지 테스트"""
+    count = 3000
+    energy = [50 + 10 * math.sin(i / 30) for i in range(count)]
+    frequency = [None if i % 100 < 10 else 120 + 20 * math.cos(i / 70) for i in range(count)]
+    series = SamplingSeries(encode_sampling(energy, frequency, time_step=0.025))
+
+    lod = SamplingLod(encode_sampling_lod(series))
+    assert lod.source_count == count
+    assert lod.targets() == sorted(level for level in LOD_LEVELS if level < count)
+
+    (energy_idx, energy_val), (frequency_idx, frequency_val) = lod.level(512)
+    assert list(energy_idx) == lttb(series.energy, 512)
+    assert all(series.energy[i] == value for i, value in zip(energy_idx, energy_val))
+    assert all(
+        math.isnan(value) if frequency[i] is None else series.frequency[i] == value
+        for i, value in zip(frequency_idx, frequency_val)
+    )
+
+    # 가장 작은 단계보다 짧은 시계열은 LOD 를 만들지 않습니다.
+    short = SamplingSeries(encode_sampling([1.0] * 100, [2.0] * 100))
+    assert encode_sampling_lod(short) is None
@@ -0,0 +1,45 @@
+import pytest
+
+from padoc_common.metrics import Registry, track_upstream, UPSTREAM_LATENCY
+
+
+def test_metrics_text_format():
+    """카운터/게이지/히스토그램이 Prometheus 텍스트 형식으로 내보내지는지 테스트"""
+    registry = Registry()
+    requests = registry.counter("demo_requests_total", "요청 수", ("route",))
+    in_progress = registry.gauge("demo_in_progress", "처리 중")
+    latency = registry.histogram("demo_latency_seconds", "지연", ("route",), buckets=(0.1, 1.0))
+
+    requests.inc(route="/a")
+    requests.inc(2, route='/b"x')
+    in_progress.inc()
+    in_progress.dec()
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value, route="/a")
+
+    text = registry.render()
+    assert "# TYPE demo_requests_total counter" in text
+    assert 'demo_requests_total{route="/a"} 1' in text
+    assert 'demo_requests_total{route="/b\\"x"} 2' in text
+    assert "demo_in_progress 0" in text
+    assert 'demo_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'demo_latency_seconds_count{route="/a"} 3' in text
+    assert latency.get_sum(route="/a") == pytest.approx(3.55)
+
+    # 같은 이름을 같은 형태로 다시 등록하면 기존 메트릭을 돌려줍니다.
+    assert registry.counter("demo_requests_total", "요청 수", ("route",)) is requests
+    with pytest.raises(ValueError):
+        registry.gauge("demo_requests_total", "요청 수", ("route",))
+    with pytest.raises(ValueError):
+        requests.inc(path="/a")
+
+
+def test_track_upstream_outcome():
+    """외부 호출이 실패하면 outcome=error 로 기록되는지 테스트"""
+    before = UPSTREAM_LATENCY.get_count(target="test-upstream", outcome="error")
+    with pytest.raises(RuntimeError):
+        with track_upstream("test-upstream"):
+            raise RuntimeError("down")
+    assert UPSTREAM_LATENCY.get_count(target="test-upstream", outcome="error") == before + 1
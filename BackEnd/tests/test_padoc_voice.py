@@ -0,0 +1,144 @@
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+parselmouth = pytest.importorskip("parselmouth")
+pytest.importorskip("soundfile")
+
+from padoc_voice import kernels  # noqa: E402
+from padoc_voice.audio import LoadedAudio  # noqa: E402
+from padoc_voice.batch import average, extract_many  # noqa: E402
+from padoc_voice.features import (  # noqa: E402
+    AH_KEYS,
+    extract_all,
+    extract_sentence,
+    extract_upload_features,
+    nest_ah,
+)
+from padoc_voice.params import DEVICE, SERVER, get_params  # noqa: E402
+
+TESTS = Path(__file__).parent
+RECORDING = TESTS / "test_sound.wav"
+# 공용 패키지로 옮기기 전의 장치(analyze_voice.analyze) / 서버(praat_ah, praat_sentence) 결과
+GOLDEN = json.loads((TESTS / "golden" / "padoc_voice_test_sound.json").read_text(encoding="utf-8"))
+TOLERANCE = 1e-9
+
+DEVICE_KEYS = {
+    "localJitter": "jitter_local", "localShimmer": "shimmer_local", "hnr": "hnr", "nhr": "nhr",
+    "meanF0": "f0", "maxF0": "max_f0", "minF0": "min_f0", "cpp": "cpp", "csid": "csid",
+}
+
+
+def _close(actual, expected):
+    return math.isclose(actual, expected, rel_tol=TOLERANCE, abs_tol=TOLERANCE)
+
+
+def test_server_features_match_golden():
+    """서버 파라미터 결과가 기존 음성 분석 서버 응답과 같은지 테스트 (채널 평균 후 분석)"""
+    audio = LoadedAudio.from_bytes(RECORDING.read_bytes(), SERVER.downmix)
+    ah = nest_ah(extract_all(audio, SERVER))
+    for key, expected in GOLDEN["server_ah"].items():
+        if isinstance(expected, dict):
+            assert all(_close(ah[key][kind], value) for kind, value in expected.items()), key
+        else:
+            assert _close(ah[key], expected), key
+
+    sentence = extract_sentence(audio, SERVER, contour=True)
+    assert _close(sentence["cpp"], GOLDEN["server_sentence"]["cpp"])
+    assert _close(sentence["csid"], GOLDEN["server_sentence"]["csid"])
+
+    expected, actual = GOLDEN["server_sentence"]["sampling_data"], sentence["sampling_data"]
+    assert actual["sampling_rate"] == expected["sampling_rate"]
+    assert _close(actual["start_time"], expected["start_time"])
+    assert _close(actual["time_step"], expected["time_step"])
+    assert len(actual["data_points"]) == len(expected["data_points"])
+    for got, want in zip(actual["data_points"], expected["data_points"]):
+        assert _close(got["energy"], want["energy"]) and _close(got["frequency"], want["frequency"])
+
+
+def test_device_features_match_golden():
+    """장치 파라미터 결과가 기존 장치 analyze_voice.analyze 결과와 같은지 테스트 (파일 직접 디코딩)"""
+    features = extract_all(str(RECORDING), "device")
+    for device_key, name in DEVICE_KEYS.items():
+        assert _close(features[name], GOLDEN["device"][device_key]), device_key
+
+    # 두 설정 차이(CPPS 탐색 범위 등)가 실제로 결과에 반영되는지
+    assert not _close(features["cpp"], GOLDEN["server_sentence"]["cpp"])
+    assert set(AH_KEYS) <= set(features)
+
+
+def test_upload_features_match_server():
+    """장치가 업로드 요청에 보내는 값이 음성 분석 서버 추출 값과 같은지 테스트 (같은 DB 열에 저장)"""
+    data = RECORDING.read_bytes()
+    ah = extract_upload_features(data, "ah")
+    assert ah.pop("parameter_set") == SERVER.name
+    assert set(ah) == set(AH_KEYS)
+    nested = nest_ah(ah)
+    for key, expected in GOLDEN["server_ah"].items():
+        if isinstance(expected, dict):
+            assert all(_close(nested[key][kind], value) for kind, value in expected.items()), key
+        else:
+            assert _close(nested[key], expected), key
+
+    sentence = extract_upload_features(data, "sentence")
+    assert sentence == {
+        "cpp": pytest.approx(GOLDEN["server_sentence"]["cpp"], rel=TOLERANCE),
+        "csid": pytest.approx(GOLDEN["server_sentence"]["csid"], rel=TOLERANCE),
+        "parameter_set": SERVER.name,
+    }
+    with pytest.raises(ValueError):
+        extract_upload_features(data, "all")
+
+
+def test_batch_keeps_order_and_averages():
+    """여러 파일 분석 결과가 입력 순서를 지키고, 실패한 파일은 평균에서 빠지는지 테스트"""
+    paths = [str(RECORDING), str(TESTS / "missing.wav"), str(RECORDING)]
+    seen = []
+    results = extract_many(paths, kind="ah", params=DEVICE, workers=1,
+                           on_result=lambda i, path, result, done: seen.append((i, done)))
+    assert seen == [(0, 1), (1, 2), (2, 3)]
+    assert "error" in results[1] and results[0] == results[2]
+
+    averaged = average(results, ["f0", "unknown"])
+    assert _close(averaged["f0"], GOLDEN["device"]["meanF0"])
+    assert averaged["unknown"] is None
+    assert average([results[1]], ["f0"]) is None
+
+    with pytest.raises(ValueError):
+        get_params("studio")
+
+
+def test_kernels_handle_short_and_stereo_signals():
+    """프레임보다 짧은 신호, 스테레오 downmix 방식별 모노 신호 테스트"""
+    assert math.isnan(kernels.cpps(np.zeros(10), 16000, SERVER))
+    assert kernels.lh_ratio_series(np.zeros(10), 16000, SERVER).size == 0
+    assert math.isnan(kernels.csid_awan2016(5.0, np.array([])))
+
+    left = np.sin(np.arange(4800) / 10)
+    stereo = np.stack([left, 0.5 * left], axis=1)
+    mean = LoadedAudio.from_samples(stereo, 48000, "mean")
+    first = LoadedAudio.from_samples(stereo, 48000, "first")
+    assert mean.praat_sound.n_channels == 1 and first.praat_sound.n_channels == 2
+    assert np.allclose(mean.mono.values[0], 0.75 * left)
+    assert np.allclose(first.mono.values[0], left)
+    assert first.resampled(16000) is first.resampled(16000)
+
+
+def test_pitch_at_times_matches_praat():
+    """배열 보간이 Praat Get value at time 을 프레임마다 호출한 결과와 같은지 테스트 (무성 구간 경계 포함)"""
+    rng = np.random.default_rng(3)
+    sr = 16000
+    t = np.arange(int(1.5 * sr)) / sr
+    voiced = (np.sin(2 * np.pi * 2 * t) > 0).astype(float)
+    signal = voiced * np.sin(2 * np.pi * (150 + 40 * t) * t) + 0.01 * rng.standard_normal(len(t))
+    pitch = parselmouth.Sound(signal, sampling_frequency=sr).to_pitch(pitch_floor=75, pitch_ceiling=600)
+
+    times = np.concatenate([np.linspace(-0.05, 1.55, 400), pitch.xs()])
+    expected = np.array([pitch.get_value_at_time(time) for time in times])
+    actual = kernels.pitch_at_times(pitch, times)
+    assert np.array_equal(np.isnan(actual), np.isnan(expected))
+    assert np.allclose(actual[~np.isnan(actual)], expected[~np.isnan(expected)], rtol=0, atol=1e-9)
@@ -0,0 +1,73 @@
+import io
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+librosa = pytest.importorskip("librosa")
+
+from padoc_voice.window import load_window  # noqa: E402
+
+TARGET_SR = 48000
+RECORDING = Path(__file__).parent / "test_sound.wav"
+
+
+def _wav_bytes(seconds, sampling_rate, channels=1):
+    rng = np.random.default_rng(int(seconds * 1000) + sampling_rate)
+    t = np.arange(int(seconds * sampling_rate)) / sampling_rate
+    signal = 0.3 * np.sin(2 * np.pi * (180 + 20 * t) * t) + 0.02 * rng.standard_normal(len(t))
+    if channels == 2:
+        signal = np.stack([signal, 0.5 * signal], axis=1)
+    buf = io.BytesIO()
+    sf.write(buf, signal, sampling_rate, format="WAV", subtype="PCM_16")
+    return buf.getvalue()
+
+
+def _mel_db(segment):
+    melspec = librosa.feature.melspectrogram(y=segment, sr=TARGET_SR, n_mels=256)
+    return librosa.power_to_db(melspec, ref=np.max)
+
+
+@pytest.mark.parametrize(
+    "seconds, sampling_rate, channels",
+    [(5, 44100, 1), (5, 22050, 2), (30, 16000, 1), (5, 48000, 1), (2.03, 44100, 1), (1.2, 11025, 1), (0.7, 44100, 1)],
+)
+def test_window_matches_full_decode(seconds, sampling_rate, channels):
+    """필요한 구간만 읽어 리샘플한 신호와 멜 스펙트로그램이 전체 librosa.load 후 자른 결과와 같은지 테스트"""
+    data = _wav_bytes(seconds, sampling_rate, channels)
+    full, _ = librosa.load(io.BytesIO(data), sr=TARGET_SR)
+    expected = full[TARGET_SR:TARGET_SR * 2]
+
+    segment, total = load_window(io.BytesIO(data), TARGET_SR, 1.0, 2.0)
+    assert total == len(full)
+    assert segment.dtype == np.float32 and len(segment) == len(expected)
+    if len(expected) == 0:
+        return
+    # soxr 내부 float32 연산 순서 차이만 남습니다.
+    assert np.max(np.abs(segment - expected)) < 1e-5
+    assert np.allclose(_mel_db(segment), _mel_db(expected), rtol=0, atol=0.01)
+
+
+def test_window_from_path_and_unsupported_format():
+    """파일 경로 입력, soundfile 이 읽지 못하는 입력(librosa 전체 디코딩으로 넘김)의 오류 테스트"""
+    full, _ = librosa.load(str(RECORDING), sr=TARGET_SR)
+    segment, total = load_window(str(RECORDING), TARGET_SR, 1.0, 2.0)
+    assert total == len(full)
+    assert np.max(np.abs(segment - full[TARGET_SR:TARGET_SR * 2])) < 1e-5
+
+    with pytest.raises(Exception):
+        load_window(io.BytesIO(b"not audio"), TARGET_SR, 1.0, 2.0)
+
+
+def test_prediction_window_starts():
+    """여러 구간 예측의 구간 시작 시각: 짧은 녹음은 1개, 겹치는 0.5초 간격, 많으면 고르게 K개"""
+    pytest.importorskip("tensorflow")
+    from voice_analysis_server.ai_model.parkins_prediction import window_starts
+
+    assert window_starts(0.5).tolist() == [1.0]
+    assert window_starts(2.2).tolist() == [1.0]
+    assert window_starts(4.0).tolist() == [1.0, 1.5, 2.0, 2.5, 3.0]
+
+    starts = window_starts(60.0, max_windows=8)
+    assert len(starts) == 8 and starts[0] == 1.0 and starts[-1] == 59.0
@@ -0,0 +1,71 @@
+import pytest
+
+from padoc_common.models import SentenceFeatures
+from padoc_common.sampling_codec import SamplingCodecError, SamplingSeries, encode_sampling, encode_sampling_data
+from app.services.features_service import build_sentence_features
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_sampling_round_trip(compress: bool):
+    """이진 형식 인코딩/디코딩 왕복 시 값(float32 정밀도)과 빈 값이 보존되는지 테스트"""
+    sampling_data = {
+        "sampling_rate": 44100.0,
+        "start_time": 0.0125,
+        "time_step": 0.025,
+        "data_points": [
+            {"energy": 61.25, "frequency": 118.5},
+            {"energy": 62.123456, "frequency": None},
+            {"energy": None, "frequency": 0.0},
+        ],
+    }
+    series = SamplingSeries(encode_sampling_data(sampling_data, compress=compress))
+
+    assert len(series) == 3
+    assert series.sampling_rate == 44100.0
+    assert series.time_step == 0.025
+    assert series.times()[1] == pytest.approx(0.0375)
+
+    decoded = series.to_sampling_data()["data_points"]
+    assert decoded[0] == {"energy": 61.25, "frequency": 118.5}
+    assert decoded[1]["energy"] == pytest.approx(62.123456, rel=1e-6)
+    assert decoded[1]["frequency"] is None
+    assert decoded[2] == {"energy": None, "frequency": 0.0}
+
+
+def test_sampling_legacy_metadata_and_errors():
+    """시작 시각/간격이 없는 기존 데이터와 잘못된 입력 처리 테스트"""
+    series = SamplingSeries(encode_sampling([1.0], [2.0]))
+    assert series.sampling_rate is None
+    assert series.times() is None
+
+    with pytest.raises(SamplingCodecError):
+        encode_sampling([1.0, 2.0], [1.0])
+    with pytest.raises(SamplingCodecError):
+        SamplingSeries(b"JSON" + bytes(32))
+
+
+def test_build_sentence_features_from_blob_and_json():
+    """이진 형식 행과 아직 옮기지 않은 JSON 행이 같은 응답으로 변환되는지 테스트"""
+    sampling_data = {
+        "sampling_rate": 16000.0,
+        "data_points": [{"energy": 50.5, "frequency": 100.25}, {"energy": 51.0, "frequency": 0.0}],
+    }
+    blob_row = SentenceFeatures(record_id=1, cpp=10.0, csid=5.0, sampling_blob=encode_sampling_data(sampling_data))
+    json_row = SentenceFeatures(record_id=2, cpp=10.0, csid=5.0, sampling_data=sampling_data)
+
+    from_blob = build_sentence_features(blob_row).model_dump()
+    from_json = build_sentence_features(json_row).model_dump()
+    assert from_blob == from_json
+    assert from_blob["sampling_data"]["energy"] == [50.5, 51.0]
+    assert from_blob["sampling_data"]["frequency"] == [100.25, 0.0]
+
+
+def test_build_sentence_features_missing_values_are_none():
+    """값이 없는 프레임이 NaN 이 아닌 None 으로 응답되는지 테스트"""
+    sampling_data = {"data_points": [{"energy": None, "frequency": 120.0}, {"energy": 49.5, "frequency": None}]}
+    row = SentenceFeatures(record_id=1, cpp=10.0, csid=5.0, sampling_blob=encode_sampling_data(sampling_data))
+
+    response = build_sentence_features(row)
+    assert response.sampling_data.energy == [None, 49.5]
+    assert response.sampling_data.frequency == [120.0, None]
+    assert response.model_dump_json()
@@ -0,0 +1,41 @@
+import json
+
+from voice_analysis_server import profiling
+
+
+def test_stage_profile_and_report():
+    """단계별 시간/할당량 측정, 응답 헤더 값, 녹음 길이 구간별 누적 보고서 테스트"""
+    profiling.report.clear()
+
+    # 추적 중이 아니면 측정하지 않습니다.
+    with profiling.stage("decode"):
+        pass
+
+    for sample_count in (3 * 16000, 4 * 16000, 40 * 16000):
+        with profiling.profile("/sentence-features", enabled=True) as trace:
+            with profiling.stage("decode"):
+                profiling.set_audio(sample_count, 16000)
+                kept = bytearray(256 * 1024)
+            with profiling.stage("cpps"):
+                scratch = [bytearray(1024) for _ in range(512)]
+                del scratch
+
+    summary = json.loads(profiling.header_value(trace))
+    assert summary["audio_seconds"] == 40.0
+    decode, cpps = summary["stages"]
+    assert decode["stage"] == "decode" and decode["alloc_kib"] >= 256
+    # 단계 안에서 만들었다가 버린 메모리는 남지 않지만 최대 할당량에는 잡힙니다.
+    assert cpps["peak_kib"] >= 512 and cpps["alloc_kib"] < 64
+    del kept
+
+    data = profiling.report.to_dict()
+    buckets = {group["length_bucket"]: group for group in data["groups"]}
+    assert set(buckets) == {"2-5s", "30-60s"}
+    assert buckets["2-5s"]["requests"] == 2
+    assert {stage["stage"] for stage in buckets["2-5s"]["stages"]} == {"decode", "cpps"}
+    assert profiling.header_value(None) is None
+
+    with profiling.profile("/ah-features", enabled=False) as trace:
+        assert trace is None
+    profiling.report.clear()
+    assert profiling.report.to_dict()["groups"] == []
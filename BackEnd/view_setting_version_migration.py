@@ -0,0 +1,50 @@
+# view_setting_version_migration.py
+# backend안에 위치
+# 환자 목록 순서 동기화(list_order_service)의 낙관적 동시성 제어에 쓰는 doctorpatientviewsetting.version 컬럼을 추가합니다.
+# 기존 행은 0 으로 채워지며, 이미 컬럼이 있으면 건너뛰므로 여러 번 실행해도 안전합니다.
+#
+# 사용 예)
+#   python view_setting_version_migration.py
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import asyncio
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import inspect, text
+
+from app.db import AsyncSessionMaker
+from padoc_common.models import DoctorPatientViewSetting
+
+
+def _ensure_version_column(sync_conn) -> bool:
+    """version 컬럼이 없으면 추가합니다. 추가했으면 True 를 반환합니다."""
+    table = DoctorPatientViewSetting.__table__
+    columns = {column["name"] for column in inspect(sync_conn).get_columns(table.name)}
+    if "version" in columns:
+        return False
+    sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+    return True
+
+
+async def run() -> int:
+    async with AsyncSessionMaker() as db:
+        connection = await db.connection()
+        added = await connection.run_sync(_ensure_version_column)
+        await db.commit()
+
+    print("✅ version 컬럼을 추가했습니다." if added else "version 컬럼이 이미 있습니다.")
+    return 0
+
+
+def main():
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
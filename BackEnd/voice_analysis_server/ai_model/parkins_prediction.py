@@ -6,7 +6,13 @@ import tensorflow as tf
 
 # Pydantic 모델 및 사용자 정의 예외 import
 import padoc_common.exceptions as exceptions
-from padoc_common.schemas.features import ParkinsonPredictionResult
+from padoc_common.schemas.features import (
+    ParkinsonPredictionResult,
+    ParkinsonWindowPredictionResult,
+    ParkinsonWindowScore,
+)
+from padoc_voice.window import load_window
+from voice_analysis_server.profiling import set_audio, stage
 import matplotlib.pyplot as plt
 from PIL import Image
 
@@ -19,6 +25,28 @@ N_MELS = 256
 IMAGE_SIZE = (224, 224)
 MODEL_PATH = os.getenv("MODEL_PATH")
 
+# --- 여러 구간 예측 ---
+SEGMENT_START_S = 1.0     # 첫 구간 시작 (기존 단일 구간과 같은 1초 지점)
+WINDOW_HOP_S = 0.5        # 구간 간격 (1초 구간이 절반씩 겹칩니다)
+DEFAULT_WINDOWS = 8
+MAX_WINDOWS = 32          # 한 번의 모델 호출에 넣는 최대 구간 수 (K)
+
+
+def window_starts(duration_s: float, max_windows: int = DEFAULT_WINDOWS, hop_s: float = WINDOW_HOP_S) -> np.ndarray:
+    """1초 지점부터 hop_s 간격으로 녹음 안에 들어가는 1초 구간들의 시작 시각(초).
+
+    구간이 max_windows 개보다 많으면 같은 범위에서 고르게 max_windows 개를 고릅니다.
+    녹음이 2초보다 짧으면 1초 지점 구간 하나입니다. (모자란 부분은 0 으로 채웁니다)
+    """
+    last_start = duration_s - SEGMENT_DURATION_S
+    if last_start <= SEGMENT_START_S:
+        return np.array([SEGMENT_START_S])
+    count = int((last_start - SEGMENT_START_S) / hop_s + 1e-9) + 1
+    starts = SEGMENT_START_S + hop_s * np.arange(count)
+    if count > max_windows:
+        starts = np.linspace(SEGMENT_START_S, starts[-1], max_windows)
+    return starts
+
 
 class ParkinsPredictionModel:
     """
@@ -53,50 +81,25 @@ class ParkinsPredictionModel:
         (멜 스펙트로그램 이미지 변환 -> 리사이징 -> 정규화)
         """
         try:
-            # 1. 음성 파일 로드 (샘플링 레이트 48000Hz로 고정)
-            signal, sr = librosa.load(voice_data, sr=TARGET_SR)
+            # 1. 음성 파일에서 사용할 구간(1초 ~ 2초)만 읽어 48000Hz 로 리샘플
+            #    (파일 전체를 디코딩/리샘플하던 librosa.load 와 같은 값, 녹음 길이와 상관없이 일정한 비용)
+            sr = TARGET_SR
+            with stage("decode"):
+                segment, total_length = load_window(voice_data, sr, 1.0, 2.0)
+            set_audio(total_length, sr)
+
+            # 2. 음성 신호에서 1초 구간 추출 (1초 ~ 2초)
 
-            # 2. 음성 신호에서 1초 구간 추출 (1.5초 ~ 2.5초)
-            
-            # 최소 2.5초(120000 샘플) 길이인지 확인
+            # 최소 1.5초 길이인지 확인
             required_length = int(sr * 1.5)
-            if len(signal) < required_length:
-                print(f"INFO: 음성 파일 '{voice_data}'의 길이가 2.5초 미만이라 패딩을 추가합니다.")
-                # 길이가 짧으면 0으로 채워 2.5초를 만듭니다 (Zero Padding)
-                signal = np.pad(signal, (0, required_length - len(signal)), 'constant')
-                
-            # 1.5초(72000)부터 2.5초(120000)까지의 1초 구간 추출
-            segment = signal[int(sr) : int(sr * 2)]
-            # segment = signal[int(len(signal) / 2) - original_sr // 2: int(len(signal) / 2) + original_sr // 2]
+            if total_length < required_length:
+                print(f"INFO: 음성 파일 '{voice_data}'의 길이가 1.5초 미만이라 패딩을 추가합니다.")
+            # 길이가 짧으면 전체 신호를 1.5초로 0 패딩한 뒤 자른 것과 같은 길이가 되도록 0으로 채웁니다 (Zero Padding)
+            segment_length = min(int(sr * 2), max(total_length, required_length)) - int(sr)
+            segment = np.pad(segment, (0, segment_length - len(segment)), 'constant')
 
-            # 3. 멜 스펙트로그램 생성
-            melspec = librosa.feature.melspectrogram(y=segment, sr=sr, n_mels=N_MELS)
-            
-            # 4. 스펙트로그램을 데시벨(dB) 단위로 변환
-            melspec_db = librosa.power_to_db(melspec, ref=np.max)
-
-            # 5. 스펙트로그램을 이미지로 변환 (메모리 내에서 처리)
-            fig, ax = plt.subplots()
-            ax.axes.get_xaxis().set_visible(False)
-            ax.axes.get_yaxis().set_visible(False)
-            librosa.display.specshow(melspec_db, sr=sr, x_axis='time', y_axis='mel', ax=ax)
-            plt.axis('off')
-            plt.margins(0)
-            
-            # 이미지를 파일로 저장하지 않고 메모리 버퍼에 저장
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0)
-            # plt.show()
-            plt.close(fig)
-            buf.seek(0)
-
-            # 6. 이미지 로드, RGB 변환 및 리사이징 (224x224)
-            img = Image.open(buf).convert('RGB')
-            img = img.resize(IMAGE_SIZE)
-            
-            # 7. 이미지를 NumPy 배열로 변환 및 정규화
-            img_array = tf.keras.preprocessing.image.img_to_array(img)
-            img_array = img_array / 255.0
+            # 3 ~ 7. 멜 스펙트로그램 → 이미지 → 정규화 (구간 1개짜리 배치로 처리)
+            img_array = self._spectrogram_images(segment[np.newaxis, :], sr)[0]
 
             # 8. 모델 입력에 맞게 차원 추가 (batch 차원)
             # img_array = np.expand_dims(img_array, axis=0) # (1, 224, 224, 3) 형태로 변환
@@ -107,6 +110,53 @@ class ParkinsPredictionModel:
             print(f"파일 처리 중 오류 발생: {e}")
             return None
 
+    def _spectrogram_images(self, segments: np.ndarray, sr: int) -> np.ndarray:
+        """
+        (구간 수, 샘플 수) 신호를 모델 입력 이미지 (구간 수, 224, 224, 3) 로 변환합니다.
+        멜 스펙트로그램은 모든 구간을 한 번에 계산하고, 그림은 하나를 만들어 구간마다 값만 바꿔 저장합니다.
+        (구간마다 그림을 새로 만든 것과 같은 이미지)
+        """
+        # 3. 멜 스펙트로그램 생성 (구간 전체를 한 번의 STFT 로)
+        with stage("mel"):
+            melspecs = librosa.feature.melspectrogram(y=segments, sr=sr, n_mels=N_MELS)
+
+            # 4. 스펙트로그램을 데시벨(dB) 단위로 변환 (기준값은 구간마다의 최댓값)
+            melspecs_db = [librosa.power_to_db(melspec, ref=np.max) for melspec in melspecs]
+
+        with stage("image_render"):
+            # 5. 스펙트로그램을 이미지로 변환 (메모리 내에서 처리)
+            fig, ax = plt.subplots()
+            ax.axes.get_xaxis().set_visible(False)
+            ax.axes.get_yaxis().set_visible(False)
+            mesh = None
+            images = []
+            try:
+                for melspec_db in melspecs_db:
+                    if mesh is None:
+                        mesh = librosa.display.specshow(melspec_db, sr=sr, x_axis='time', y_axis='mel', ax=ax)
+                        plt.axis('off')
+                        plt.margins(0)
+                    else:
+                        # 같은 모양의 구간이므로 값과 색 범위만 바꿉니다.
+                        mesh.set_array(melspec_db.ravel())
+                        mesh.set_clim(melspec_db.min(), melspec_db.max())
+
+                    # 이미지를 파일로 저장하지 않고 메모리 버퍼에 저장
+                    buf = io.BytesIO()
+                    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0)
+                    buf.seek(0)
+
+                    # 6. 이미지 로드, RGB 변환 및 리사이징 (224x224)
+                    img = Image.open(buf).convert('RGB')
+                    img = img.resize(IMAGE_SIZE)
+
+                    # 7. 이미지를 NumPy 배열로 변환 및 정규화
+                    images.append(tf.keras.preprocessing.image.img_to_array(img) / 255.0)
+            finally:
+                plt.close(fig)
+
+        return np.stack(images)
+
 
     def predict_parkinsons_from_file(self, voice_data: io.BytesIO) -> ParkinsonPredictionResult:
         """
@@ -132,7 +182,53 @@ class ParkinsPredictionModel:
         input_tensor = np.expand_dims(processed_image, axis=0)
 
         # 3. 모델 예측 수행
-        probability = self.model.predict(input_tensor)
+        with stage("predict"):
+            probability = self.model.predict(input_tensor)
 
         # 4. 결과 반환 (결과는 [[확률]] 형태로 나오므로 값만 추출)
-        return int(probability[0][0] * 100)
\ No newline at end of file
+        return int(probability[0][0] * 100)
+
+    def predict_parkinsons_windows(
+        self,
+        voice_data: io.BytesIO,
+        max_windows: int = DEFAULT_WINDOWS,
+        hop_s: float = WINDOW_HOP_S,
+    ) -> ParkinsonWindowPredictionResult:
+        """
+        녹음을 hop_s 간격으로 겹치는 1초 구간 최대 max_windows 개로 나누어 한 번에 예측합니다.
+
+        멜 스펙트로그램은 한 번의 STFT 로, 모델은 (구간 수, 224, 224, 3) 입력으로 한 번만 호출합니다.
+        ai_score 는 구간별 확률의 평균이며, 구간별 점수도 함께 반환합니다.
+        (기존 1초 구간 하나의 결과는 predict_parkinsons_from_file 로 그대로 사용할 수 있습니다)
+        """
+        max_windows = max(1, min(max_windows, MAX_WINDOWS))
+        sr = TARGET_SR
+
+        # 1. 구간들이 녹음 전체에 걸쳐 있으므로 한 번에 디코딩합니다.
+        with stage("decode"):
+            signal, _ = librosa.load(voice_data, sr=sr)
+        set_audio(len(signal), sr)
+
+        # 2. 구간 자르기 (모든 구간이 같은 길이가 되도록 짧은 녹음은 0 으로 채웁니다)
+        starts = window_starts(len(signal) / sr, max_windows, hop_s)
+        window_length = int(sr * SEGMENT_DURATION_S)
+        offsets = (starts * sr).astype(int)
+        if len(signal) < offsets[-1] + window_length:
+            signal = np.pad(signal, (0, offsets[-1] + window_length - len(signal)), 'constant')
+        segments = np.stack([signal[offset:offset + window_length] for offset in offsets])
+
+        # 3. 멜 스펙트로그램 이미지 배치 (K, 224, 224, 3)
+        images = self._spectrogram_images(segments, sr)
+
+        # 4. 모델 한 번 호출 (predict 는 32개씩 나누어 호출하므로 직접 호출합니다)
+        with stage("predict"):
+            probabilities = np.asarray(self.model(images, training=False))[:, 0]
+
+        return ParkinsonWindowPredictionResult(
+            ai_score=int(float(np.mean(probabilities)) * 100),
+            window_seconds=SEGMENT_DURATION_S,
+            windows=[
+                ParkinsonWindowScore(start_time=round(float(start), 3), ai_score=int(probability * 100))
+                for start, probability in zip(starts, probabilities)
+            ],
+        )
\ No newline at end of file
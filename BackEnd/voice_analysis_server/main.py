@@ -10,20 +10,39 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import io
 import uvicorn
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from typing import Optional
+from fastapi import FastAPI, File, Header, UploadFile, HTTPException, Query
+from fastapi.responses import Response
 
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
 # Pydantic 스키마 및 사용자 정의 예외 import
 from padoc_common.schemas.base import ErrorResponse
-from padoc_common.schemas.features import AhFeatures, SentenceFeatures, ParkinsonPredictionResult
+from padoc_common.schemas.features import (
+    AhFeatures,
+    SentenceFeatures,
+    ParkinsonPredictionResult,
+    ParkinsonWindowPredictionResult,
+)
 import padoc_common.exceptions as exceptions
+from padoc_common.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    MetricsMiddleware,
+    render_latest,
+    scrape_status,
+)
 
 # 분석 모듈 import
-from voice_analysis_server.ai_model.parkins_prediction import ParkinsPredictionModel
+from voice_analysis_server.ai_model.parkins_prediction import (
+    DEFAULT_WINDOWS,
+    MAX_WINDOWS,
+    WINDOW_HOP_S,
+    ParkinsPredictionModel,
+)
 from voice_analysis_server.voice_feature.praat_ah import extract_ah_features
 from voice_analysis_server.voice_feature.praat_sentence import extract_sentence_features
+from voice_analysis_server import profiling
 
 
 
@@ -64,6 +83,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 라우트별 지연 시간/요청 수 수집 (특징 추출 단계별 시간과 함께 /metrics 로 노출)
+app.add_middleware(MetricsMiddleware)
 
 # --- 라우터 정의 ---
 
@@ -72,6 +93,36 @@ def read_root():
     """서버가 정상적으로 실행 중인지 확인하는 기본 엔드포인트입니다."""
     return {"message": "PaDoc Voice Analysis Server is running successfully!"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus 수집용 메트릭 (텍스트 형식)
+
+    API 와 같은 포트로 열려 있으므로 "Authorization: Bearer <METRICS_TOKEN>" 헤더가 있는 요청에만 응답합니다.
+    METRICS_TOKEN 이 설정되지 않았으면 404 로 응답합니다.
+    """
+    status_code = scrape_status(authorization)
+    if status_code == 401:
+        return Response(status_code=status_code, headers={"WWW-Authenticate": "Bearer"})
+    if status_code != 200:
+        return Response(status_code=status_code)
+    return Response(content=render_latest(), media_type=METRICS_CONTENT_TYPE)
+
+def _attach_profile(response: Response, trace) -> None:
+    """프로파일링이 켜져 있으면 단계별 측정 결과를 응답 헤더에 담습니다."""
+    value = profiling.header_value(trace)
+    if value is not None:
+        response.headers[profiling.PROFILE_HEADER] = value
+
+@app.get("/profile/report", summary="단계별 프로파일 누적 보고서 (VOICE_PROFILING=true 일 때 수집)")
+def get_profile_report():
+    """엔드포인트, 녹음 길이 구간별로 각 단계의 평균/최대 처리 시간과 메모리 할당량을 반환합니다."""
+    return profiling.report.to_dict()
+
+@app.delete("/profile/report", summary="단계별 프로파일 누적 보고서 초기화")
+def reset_profile_report():
+    profiling.report.clear()
+    return {"message": "프로파일 보고서를 초기화했습니다."}
+
 @app.post(
     "/ah-features",
     response_model=AhFeatures,
@@ -83,6 +134,7 @@ def read_root():
     },
 )
 async def analyze_ah_voice(
+    response: Response,
     voice_file: UploadFile = File(..., description="분석할 '아' 발성 .wav 파일"),
 ):
     """
@@ -93,7 +145,9 @@ async def analyze_ah_voice(
     
     try:
         voice_data = await voice_file.read()
-        features = await extract_ah_features(voice_data)
+        with profiling.profile("/ah-features") as trace:
+            features = await extract_ah_features(voice_data)
+        _attach_profile(response, trace)
         return features
     except exceptions.BackEndInternalError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -112,6 +166,7 @@ async def analyze_ah_voice(
     },
 )
 async def analyze_sentence_voice(
+    response: Response,
     voice_file: UploadFile = File(..., description="분석할 문장 발성 .wav 파일"),
 ):
     """
@@ -122,7 +177,9 @@ async def analyze_sentence_voice(
         
     try:
         voice_data = await voice_file.read()
-        features = await extract_sentence_features(voice_data)
+        with profiling.profile("/sentence-features") as trace:
+            features = await extract_sentence_features(voice_data)
+        _attach_profile(response, trace)
         return features
     except exceptions.BackEndInternalError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -141,6 +198,7 @@ async def analyze_sentence_voice(
     },
 )
 async def predict_parkinsons(
+    response: Response,
     voice_file: UploadFile = File(..., description="파킨슨병 예측에 사용할 .wav 파일"),
 ):
     """
@@ -156,7 +214,9 @@ async def predict_parkinsons(
         # predict_parkinsons_from_file 함수는 io.BytesIO 객체를 기대합니다.
         voice_data_stream = io.BytesIO(await voice_file.read())
         prediction_model = ml_models["parkinsons_prediction"]
-        result = prediction_model.predict_parkinsons_from_file(voice_data_stream)
+        with profiling.profile("/parkinson-prediction") as trace:
+            result = prediction_model.predict_parkinsons_from_file(voice_data_stream)
+        _attach_profile(response, trace)
         return ParkinsonPredictionResult(ai_score=result)
     except exceptions.BackEndInternalError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -164,6 +224,45 @@ async def predict_parkinsons(
         raise HTTPException(status_code=400, detail=f"오디오 파일을 처리할 수 없습니다: {e}")
 
 
+@app.post(
+    "/parkinson-prediction/windows",
+    response_model=ParkinsonWindowPredictionResult,
+    summary="음성 기반 파킨슨병 예측 (여러 구간)",
+    description="녹음을 겹치는 1초 구간 여러 개로 나누어 한 번에 예측하고, 평균 점수와 구간별 점수를 반환합니다.",
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 파일 형식 또는 처리할 수 없는 오디오"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+    },
+)
+async def predict_parkinsons_windows(
+    response: Response,
+    voice_file: UploadFile = File(..., description="파킨슨병 예측에 사용할 .wav 파일"),
+    windows: int = Query(DEFAULT_WINDOWS, ge=1, le=MAX_WINDOWS, description="최대 구간 수"),
+    hop: float = Query(WINDOW_HOP_S, gt=0, le=10, description="구간 간격(초)"),
+):
+    """
+    음성 파일(.wav)을 여러 구간으로 나누어 파킨슨병 여부를 예측합니다.
+    (기존 1초 구간 하나의 점수는 /parkinson-prediction 에서 그대로 제공합니다)
+    """
+    if "parkinsons_prediction" not in ml_models or ml_models["parkinsons_prediction"] is None:
+        raise HTTPException(status_code=503, detail="모델이 현재 사용 불가능합니다. 서버 관리자에게 문의하세요.")
+
+    if not voice_file.filename.lower().endswith('.wav'):
+        raise HTTPException(status_code=400, detail="잘못된 파일 형식입니다. .wav 파일을 업로드해주세요.")
+
+    try:
+        voice_data_stream = io.BytesIO(await voice_file.read())
+        prediction_model = ml_models["parkinsons_prediction"]
+        with profiling.profile("/parkinson-prediction/windows") as trace:
+            result = prediction_model.predict_parkinsons_windows(voice_data_stream, windows, hop)
+        _attach_profile(response, trace)
+        return result
+    except exceptions.BackEndInternalError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"오디오 파일을 처리할 수 없습니다: {e}")
+
+
 # --- 서버 실행 ---
 if __name__ == "__main__":
     # 환경변수에서 포트 번호를 가져오되, 없으면 8001을 기본값으로 사용
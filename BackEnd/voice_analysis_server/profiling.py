@@ -0,0 +1,256 @@
+# voice_analysis_server/profiling.py
+"""음성 특징 추출 단계별 프로파일링 (선택 사용)
+
+VOICE_PROFILING=true 로 실행하면 각 분석 요청의 단계(디코딩, 피치, CPPS, 멜 변환 ...)마다
+처리 시간과 tracemalloc 으로 잰 메모리 할당량을 기록합니다.
+
+- 요청별 결과: 응답 헤더 X-Voice-Profile (JSON)
+- 누적 결과: GET /profile/report (엔드포인트, 녹음 길이 구간, 단계별 합계/최대)
+
+꺼져 있을 때 stage() 는 /metrics 용 단계별 처리 시간만 기록하며, tracemalloc 은 켜지 않습니다.
+tracemalloc 은 프로세스 전체의 할당을 추적하므로 동시에 처리 중인 다른 요청의 할당이 섞일 수
+있습니다. 정확한 값이 필요하면 요청을 하나씩 보내서 측정하세요.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from padoc_common.metrics import track_stage
+
+PROFILING_ENABLED = os.getenv("VOICE_PROFILING", "false").lower() == "true"
+PROFILE_HEADER = "X-Voice-Profile"
+
+# 녹음 길이(초) 구간 경계. 길이에 따라 어느 단계가 늘어나는지 보기 위해 구간별로 따로 집계합니다.
+LENGTH_BUCKETS = (2.0, 5.0, 10.0, 30.0, 60.0)
+
+
+def length_bucket(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "unknown"
+    lower = 0.0
+    for upper in LENGTH_BUCKETS:
+        if seconds < upper:
+            return f"{lower:g}-{upper:g}s"
+        lower = upper
+    return f"{lower:g}s+"
+
+
+class StageTrace:
+    """요청 하나의 단계별 측정 결과"""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.audio_seconds: Optional[float] = None
+        # (단계, 처리 시간(초), 단계가 끝났을 때 남은 할당량(bytes), 단계 중 최대 추가 할당량(bytes))
+        self.stages: List[Tuple[str, float, int, int]] = []
+        self.total_seconds = 0.0
+
+    def set_audio(self, sample_count: int, sampling_rate: float) -> None:
+        if sampling_rate:
+            self.audio_seconds = sample_count / sampling_rate
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "audio_seconds": None if self.audio_seconds is None else round(self.audio_seconds, 3),
+            "total_ms": round(self.total_seconds * 1000, 2),
+            "stages": [
+                {
+                    "stage": name,
+                    "ms": round(seconds * 1000, 2),
+                    "alloc_kib": round(allocated / 1024, 1),
+                    "peak_kib": round(peak / 1024, 1),
+                }
+                for name, seconds, allocated, peak in self.stages
+            ],
+        }
+
+
+_current_trace: ContextVar[Optional[StageTrace]] = ContextVar("voice_profile_trace", default=None)
+
+
+class ProfileReport:
+    """엔드포인트, 녹음 길이 구간, 단계별 누적 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (엔드포인트, 길이 구간) -> {"requests", "total_seconds", "stages": {단계: 통계}}
+        self._groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def add(self, trace: StageTrace) -> None:
+        key = (trace.endpoint, length_bucket(trace.audio_seconds))
+        with self._lock:
+            group = self._groups.setdefault(key, {"requests": 0, "total_seconds": 0.0, "stages": {}})
+            group["requests"] += 1
+            group["total_seconds"] += trace.total_seconds
+            for name, seconds, allocated, peak in trace.stages:
+                stats = group["stages"].setdefault(
+                    name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "total_alloc": 0, "max_peak": 0}
+                )
+                stats["count"] += 1
+                stats["total_seconds"] += seconds
+                stats["max_seconds"] = max(stats["max_seconds"], seconds)
+                stats["total_alloc"] += allocated
+                stats["max_peak"] = max(stats["max_peak"], peak)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._groups.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """단계는 평균 처리 시간이 긴 순서로 정렬합니다."""
+        groups = []
+        with self._lock:
+            for (endpoint, bucket), group in sorted(self._groups.items()):
+                requests = group["requests"]
+                stages = [
+                    {
+                        "stage": name,
+                        "count": stats["count"],
+                        "avg_ms": round(stats["total_seconds"] / stats["count"] * 1000, 2),
+                        "max_ms": round(stats["max_seconds"] * 1000, 2),
+                        "share": round(stats["total_seconds"] / group["total_seconds"], 3) if group["total_seconds"] else 0.0,
+                        "avg_alloc_kib": round(stats["total_alloc"] / stats["count"] / 1024, 1),
+                        "max_peak_kib": round(stats["max_peak"] / 1024, 1),
+                    }
+                    for name, stats in group["stages"].items()
+                ]
+                stages.sort(key=lambda stage: stage["avg_ms"], reverse=True)
+                groups.append({
+                    "endpoint": endpoint,
+                    "length_bucket": bucket,
+                    "requests": requests,
+                    "avg_total_ms": round(group["total_seconds"] / requests * 1000, 2),
+                    "stages": stages,
+                })
+        return {"enabled": PROFILING_ENABLED, "groups": groups}
+
+
+report = ProfileReport()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """분석 단계 하나를 측정합니다. (/metrics 단계별 시간은 항상, 상세 프로파일은 요청 추적 중일 때만)"""
+    trace = _current_trace.get()
+    if trace is None:
+        with track_stage(name):
+            yield
+        return
+
+    current_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    try:
+        with track_stage(name):
+            yield
+    finally:
+        elapsed = time.perf_counter() - started
+        current_after, peak = tracemalloc.get_traced_memory()
+        trace.stages.append((name, elapsed, current_after - current_before, max(0, peak - current_before)))
+
+
+def set_audio(sample_count: int, sampling_rate: float) -> None:
+    """추적 중인 요청의 녹음 길이를 기록합니다. (길이 구간별 집계용)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.set_audio(sample_count, sampling_rate)
+
+
+@contextmanager
+def profile(endpoint: str, enabled: Optional[bool] = None) -> Iterator[Optional[StageTrace]]:
+    """블록 안에서 실행되는 stage() 를 요청 하나로 묶어 측정합니다. 꺼져 있으면 None 을 반환합니다.
+
+    블록이 정상적으로 끝나면 누적 보고서에 더합니다.
+    """
+    if not (PROFILING_ENABLED if enabled is None else enabled):
+        yield None
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    trace = StageTrace(endpoint)
+    token = _current_trace.set(trace)
+    started = time.perf_counter()
+    try:
+        yield trace
+        trace.total_seconds = time.perf_counter() - started
+        report.add(trace)
+    finally:
+        _current_trace.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def header_value(trace: Optional[StageTrace]) -> Optional[str]:
+    """응답 헤더용 한 줄 JSON (헤더는 ASCII 만 허용하므로 ensure_ascii 를 유지합니다)"""
+    if trace is None:
+        return None
+    return json.dumps(trace.summary(), separators=(",", ":"))
+
+
+def _print_report(data: Dict[str, Any]) -> None:
+    for group in data["groups"]:
+        print(f"\n[{group['endpoint']}] 녹음 {group['length_bucket']}, {group['requests']}회, 평균 {group['avg_total_ms']} ms")
+        print(f"  {'stage':<16} {'avg ms':>9} {'max ms':>9} {'share':>6} {'alloc KiB':>10} {'peak KiB':>10}")
+        for item in group["stages"]:
+            print(
+                f"  {item['stage']:<16} {item['avg_ms']:>9.2f} {item['max_ms']:>9.2f} {item['share']:>6.1%}"
+                f" {item['avg_alloc_kib']:>10.1f} {item['max_peak_kib']:>10.1f}"
+            )
+
+
+def main(argv: List[str]) -> int:
+    """로컬 WAV 파일로 단계별 프로파일을 출력합니다.
+
+    사용 예) python -m voice_analysis_server.profiling a.wav b.wav --repeat 3 [--predict]
+    """
+    import argparse
+    import asyncio
+    import io
+
+    parser = argparse.ArgumentParser(description="음성 특징 추출 단계별 프로파일")
+    parser.add_argument("files", nargs="+", help="분석할 .wav 파일")
+    parser.add_argument("--repeat", type=int, default=1, help="파일마다 반복 횟수")
+    parser.add_argument("--predict", action="store_true", help="파킨슨병 예측 모델 전처리/추론도 측정합니다. (MODEL_PATH 필요)")
+    args = parser.parse_args(argv)
+
+    # python -m 으로 실행하면 이 파일은 __main__ 이고, 분석 모듈은 voice_analysis_server.profiling 을
+    # 따로 import 합니다. 측정 결과가 그쪽에 쌓이므로 같은 모듈 객체의 profile/report 를 써야 합니다.
+    from voice_analysis_server import profiling
+    from voice_analysis_server.voice_feature.praat_ah import extract_ah_features
+    from voice_analysis_server.voice_feature.praat_sentence import extract_sentence_features
+
+    model = None
+    if args.predict:
+        from voice_analysis_server.ai_model.parkins_prediction import ParkinsPredictionModel
+        model = ParkinsPredictionModel()
+
+    for path in args.files:
+        with open(path, "rb") as f:
+            voice_data = f.read()
+        for _ in range(args.repeat):
+            with profiling.profile("/ah-features", enabled=True):
+                asyncio.run(extract_ah_features(voice_data))
+            with profiling.profile("/sentence-features", enabled=True):
+                asyncio.run(extract_sentence_features(voice_data))
+            if model is not None:
+                with profiling.profile("/parkinson-prediction", enabled=True):
+                    model.predict_parkinsons_from_file(io.BytesIO(voice_data))
+                with profiling.profile("/parkinson-prediction/windows", enabled=True):
+                    model.predict_parkinsons_windows(io.BytesIO(voice_data))
+
+    _print_report(profiling.report.to_dict())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,22 +1,15 @@
 import io
-import json
-import asyncio
-import pathlib
-import numpy as np
-import parselmouth
 import soundfile as sf
 
-# ============================
-# 1. 상수 정의
-# ============================
-PITCH_FLOOR = 75.0
-PITCH_CEILING = 500.0
-JITTER_SHIMMER_COMMON_ARGS = (0, 0, 0.0001, 0.02, 1.3)
-SHIMMER_EXTRA_ARGS = (1.6,)
+from padoc_voice import SERVER, LoadedAudio, extract_ah, nest_ah
+from voice_analysis_server.profiling import set_audio, stage
+
+# 파라미터(피치 범위, jitter/shimmer 인자 등)는 padoc_voice.params.SERVER 에 있습니다.
+# 장치(AIot analyze_voice.py)와 같은 계산 코드를 쓰며, 다른 점은 SERVER/DEVICE 파라미터 묶음에만 있습니다.
 
 
 # ============================
-# 2. '아' 발성 특징 추출 함수
+# '아' 발성 특징 추출 함수
 # ============================
 async def extract_ah_features(voice_data: bytes) -> dict:
     """
@@ -32,64 +25,23 @@ async def extract_ah_features(voice_data: bytes) -> dict:
         ValueError: 음성 파일을 처리하는 중 오류가 발생할 경우 발생합니다.
     """
     try:
-        # 1. 음성 데이터 로드 및 parselmouth 객체 생성
-        samples, sampling_frequency = sf.read(io.BytesIO(voice_data))
+        # 1. 음성 데이터 로드
+        with stage("decode"):
+            samples, sampling_frequency = sf.read(io.BytesIO(voice_data))
+        set_audio(len(samples), sampling_frequency)
 
         # 스테레오(2D 배열)인 경우, 채널을 평균내어 모노(1D 배열)로 변환
         if samples.ndim == 2:
-            samples = samples.mean(axis=1)
+            with stage("downmix"):
+                samples = samples.mean(axis=1)
 
         # parselmouth.Sound 객체 생성
-        snd = parselmouth.Sound(samples, sampling_frequency=sampling_frequency)
-        
-        # 음높이(Pitch)와 관련 객체 생성
-        point_process = parselmouth.praat.call(snd, "To PointProcess (periodic, cc)", PITCH_FLOOR, PITCH_CEILING)
-        pitch = snd.to_pitch(pitch_floor=PITCH_FLOOR, pitch_ceiling=PITCH_CEILING)
-        harmonicity = snd.to_harmonicity(minimum_pitch=PITCH_FLOOR)
-
-        # 2. 특성 추출
-        jitter_types = ["local", "rap", "ppq5", "ddp"]
-        jitter_features = {
-            f"jitter_{j_type}": parselmouth.praat.call(point_process, f"Get jitter ({j_type})", *JITTER_SHIMMER_COMMON_ARGS)
-            for j_type in jitter_types
-        }
-
-        shimmer_types = ["local", "apq3", "apq5", "apq11", "dda"]
-        shimmer_features = {
-            f"shimmer_{s_type}": parselmouth.praat.call(
-                (snd, point_process), f"Get shimmer ({s_type})", *JITTER_SHIMMER_COMMON_ARGS, *SHIMMER_EXTRA_ARGS
-            )
-            for s_type in shimmer_types
-        }
+        with stage("sound"):
+            audio = LoadedAudio.from_samples(samples, sampling_frequency, SERVER.downmix)
 
-        hnr = parselmouth.praat.call(harmonicity, "Get mean", 0, 0)
-        nhr = 10 ** (-hnr / 10) if hnr > 0 else 0.0
-
-        f0 = parselmouth.praat.call(pitch, "Get mean", 0, 0, "Hertz")
-        max_f0 = parselmouth.praat.call(pitch, "Get maximum", 0, 0, "Hertz", "Parabolic")
-        min_f0 = parselmouth.praat.call(pitch, "Get minimum", 0, 0, "Hertz", "Parabolic")
-
-        other_features = {
-            "hnr": hnr,
-            "nhr": nhr,
-            "f0": f0,
-            "max_f0": max_f0,
-            "min_f0": min_f0,
-        }
-
-        # 3. 추출된 특성들을 딕셔너리 구조에 맞게 재구성하여 반환
-        jitter_data = {key.replace('jitter_', ''): value for key, value in jitter_features.items()}
-        shimmer_data = {key.replace('shimmer_', ''): value for key, value in shimmer_features.items()}
-
-        # 최종 딕셔너리를 생성하여 반환
-        final_features = {
-            "jitter": jitter_data,
-            "shimmer": shimmer_data,
-            **other_features
-        }
-        return final_features
+        # 2. 특성 추출 후 {"jitter": {...}, "shimmer": {...}, "hnr": ...} 형태로 반환
+        return nest_ah(extract_ah(audio, SERVER, stage=stage))
 
     except Exception as e:
         # 간단한 예외로 처리하여 외부 의존성을 없앱니다.
         raise ValueError(f"특징 추출 중 오디오 데이터 처리 오류: {e}")
-
@@ -0,0 +1,162 @@
+# voice_kernel_benchmark.py
+# backend안에 위치
+# padoc_voice 의 배열 연산 커널(CPPS, L/H ratio, intensity/pitch 시계열)과
+# 예전 프레임 루프 구현(장치 analyze_voice.py, 서버 praat_sentence.py)의 처리 시간과 결과 차이를 비교합니다.
+# 장치/서버 파라미터 묶음으로 전체 지표 추출(extract_all) 시간도 함께 측정합니다.
+#
+# 사용 예)
+#   python voice_kernel_benchmark.py                      # 5 s, 30 s, 180 s 합성 녹음
+#   python voice_kernel_benchmark.py --seconds 10 60 --repeat 5
+#   python voice_kernel_benchmark.py a.wav b.wav
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+import parselmouth
+from parselmouth.praat import call
+
+from padoc_voice import kernels
+from padoc_voice.audio import LoadedAudio
+from padoc_voice.features import extract_all
+from padoc_voice.params import DEVICE, SERVER
+
+SAMPLE_RATE = 44100
+
+
+def loop_cpps(x, sr, params):
+    """예전 구현: 프레임마다 FFT 와 np.polyfit"""
+    n_frame = int(round(params.cpp_frame_len * sr))
+    n_hop = int(round(params.cpp_hop_len * sr))
+    win = kernels.hamming(n_frame, "periodic")
+    cpp_list = []
+    i = 0
+    while i + n_frame <= len(x):
+        cep = np.fft.irfft(np.log(np.abs(np.fft.rfft(x[i:i + n_frame] * win)) + params.eps))
+        i += n_hop
+        q = np.arange(len(cep)) / sr
+        mask = (q >= 1.0 / params.cpp_fmax) & (q <= 1.0 / params.cpp_fmin)
+        y, xq = cep[mask], q[mask]
+        trend = np.polyval(np.polyfit(xq, y, 1), xq)
+        peak_idx = np.argmax(y)
+        cpp_list.append((y[peak_idx] - trend[peak_idx]) * 20 / np.log(10))
+    return float(np.mean(cpp_list)) if cpp_list else float("nan")
+
+
+def loop_lh_ratio_series(signal, sr, params):
+    """예전 구현: 프레임마다 창 생성과 FFT"""
+    frame_n = int(round(params.lh_frame_len * sr))
+    hop_n = int(round(params.lh_hop_len * sr))
+    result = []
+    for start in range(0, len(signal) - frame_n + 1, hop_n):
+        mag2 = np.abs(np.fft.rfft(signal[start:start + frame_n] * kernels.hamming(frame_n, params.lh_window))) ** 2
+        freqs = np.fft.rfftfreq(frame_n, d=1.0 / sr)
+        low_e = float(np.sum(mag2[freqs <= params.lh_split_hz])) + params.eps
+        high_e = float(np.sum(mag2[freqs > params.lh_split_hz])) + params.eps
+        result.append(10.0 * np.log10(low_e / high_e))
+    return np.array(result, dtype=float)
+
+
+def loop_contour(intensity, pitch):
+    """예전 구현: intensity 프레임마다 get_value / get_value_at_time 호출"""
+    points = []
+    for i in range(intensity.n_frames):
+        t = intensity.get_time_from_frame_number(i + 1)
+        energy = intensity.get_value(t)
+        frequency = pitch.get_value_at_time(t)
+        points.append((0.0 if np.isnan(energy) else energy, 0.0 if np.isnan(frequency) else frequency))
+    return points
+
+
+def vector_contour(intensity, pitch):
+    times = intensity.xs()
+    energy = np.nan_to_num(intensity.values[0])
+    frequency = np.nan_to_num(kernels.pitch_at_times(pitch, times))
+    return list(zip(energy.tolist(), frequency.tolist()))
+
+
+def make_sentence(path, seconds, f0=140.0):
+    """음절처럼 끊기는 유성/무성 구간과 피치 변화가 있는 합성 문장 발성을 16 bit wav 로 저장합니다."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    phase = 2 * np.pi * np.cumsum(f0 * (1 + 0.15 * np.sin(2 * np.pi * 0.7 * t))) / SAMPLE_RATE
+    voiced = (np.sin(2 * np.pi * 3 * t) > -0.4).astype(float)
+    signal = voiced * sum(np.sin(k * phase) / k for k in range(1, 12))
+    signal = 0.3 * signal / np.max(np.abs(signal)) + 0.005 * rng.standard_normal(len(t))
+    parselmouth.Sound(signal[np.newaxis, :], sampling_frequency=SAMPLE_RATE).save(path, "WAV")
+
+
+def _timeit(func, repeat):
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000, result
+
+
+def _max_diff(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    if a.shape != b.shape:
+        return float("inf")
+    return float(np.max(np.abs(a - b))) if a.size else 0.0
+
+
+def bench_file(path, repeat):
+    audio = LoadedAudio.from_file(path, SERVER.downmix)
+    mono = audio.mono
+    resampled = audio.resampled(SERVER.cpp_fs_target)
+    x16k, sr16k = resampled.values[0].astype(np.float64), int(resampled.sampling_frequency)
+    signal, sr = mono.values[0], mono.sampling_frequency
+    intensity = call(mono, "To Intensity...", SERVER.intensity_min_pitch, SERVER.intensity_time_step, True)
+    pitch = call(mono, "To Pitch...", SERVER.pitch_time_step, SERVER.pitch_floor, SERVER.contour_pitch_ceiling)
+
+    rows = []
+    for name, loop, vector in (
+        ("cpps", lambda: loop_cpps(x16k, sr16k, SERVER), lambda: kernels.cpps(x16k, sr16k, SERVER)),
+        ("lh_ratio", lambda: loop_lh_ratio_series(signal, sr, SERVER),
+         lambda: kernels.lh_ratio_series(signal, sr, SERVER)),
+        ("contour", lambda: loop_contour(intensity, pitch), lambda: vector_contour(intensity, pitch)),
+    ):
+        loop_ms, loop_result = _timeit(loop, repeat)
+        vector_ms, vector_result = _timeit(vector, repeat)
+        rows.append((name, loop_ms, vector_ms, _max_diff(loop_result, vector_result)))
+
+    print(f"{os.path.basename(path):<24} {audio.duration:7.2f}s")
+    for name, loop_ms, vector_ms, diff in rows:
+        print(f"  {name:<10} loop {loop_ms:9.1f} ms  vector {vector_ms:8.1f} ms"
+              f"  x{loop_ms / max(vector_ms, 1e-9):6.1f}  max|diff| {diff:.2e}")
+    for params in (DEVICE, SERVER):
+        total_ms, _ = _timeit(lambda: extract_all(path, params), repeat)
+        print(f"  extract_all({params.name:<6}) {total_ms:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="padoc_voice 커널 벤치마크 (프레임 루프 대비)")
+    parser.add_argument("paths", nargs="*", help="측정할 wav 파일 (없으면 합성 녹음)")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[5, 30, 180], help="합성 녹음 길이(초)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    if args.paths:
+        for path in args.paths:
+            bench_file(path, args.repeat)
+        return
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for seconds in args.seconds:
+            path = os.path.join(tmp, f"sentence_{seconds:g}s.wav")
+            make_sentence(path, seconds)
+            bench_file(path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -31,8 +31,11 @@ export interface VoiceAnalysisData {
     cpp: number;
     csid: number;
     sampling_data: {
-      sampling_rate: number;
-      data_points: { energy: number; frequency: number }[];
+      sampling_rate: number | null;
+      start_time: number | null;
+      time_step: number | null;
+      energy: (number | null)[];
+      frequency: (number | null)[];
     };
   };
 }
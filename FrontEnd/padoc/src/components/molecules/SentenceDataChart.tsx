@@ -74,37 +74,25 @@ export default function SentenceDataChart({ data, allData }: SentenceDataChartPr
     const timestamps: string[] = [];
     
     voiceDataArray.forEach((voiceData, dataIndex) => {
-      if (!voiceData.sentence_features?.sampling_data?.data_points) {
+      const samplingData = voiceData.sentence_features?.sampling_data;
+      if (!samplingData?.energy || !samplingData?.frequency) {
         return;
       }
 
-      const dataPoints = voiceData.sentence_features.sampling_data.data_points;
-      
-      // dataPoints가 단일 객체인 경우
-      if (!Array.isArray(dataPoints)) {
-        const point = dataPoints;
-        const energy = point.energy;
-        const frequency = point.frequency;
-        
+      // energy[i], frequency[i]가 i번째 프레임 값 (값이 없는 프레임은 null)
+      const { energy: energyColumn, frequency: frequencyColumn } = samplingData;
+      const length = Math.max(energyColumn.length, frequencyColumn.length);
+
+      for (let pointIndex = 0; pointIndex < length; pointIndex++) {
+        const energy = energyColumn[pointIndex];
+        const frequency = frequencyColumn[pointIndex];
+
         if ((energy !== undefined && energy !== null) || 
             (frequency !== undefined && frequency !== null)) {
           allEnergy.push(energy !== undefined && energy !== null ? energy : 0);
           allFrequency.push(frequency !== undefined && frequency !== null ? frequency : 0);
-          timestamps.push(`${voiceData.created_at}_${dataIndex}_0`);
+          timestamps.push(`${voiceData.created_at}_${dataIndex}_${pointIndex}`);
         }
-      } else {
-        // dataPoints가 배열인 경우
-        dataPoints.forEach((point, pointIndex) => {
-          const energy = point.energy;
-          const frequency = point.frequency;
-          
-          if ((energy !== undefined && energy !== null) || 
-              (frequency !== undefined && frequency !== null)) {
-            allEnergy.push(energy !== undefined && energy !== null ? energy : 0);
-            allFrequency.push(frequency !== undefined && frequency !== null ? frequency : 0);
-            timestamps.push(`${voiceData.created_at}_${dataIndex}_${pointIndex}`);
-          }
-        });
       }
     });
 
@@ -36,11 +36,11 @@ export interface VoiceData {
     cpp: number;
     csid: number;
     sampling_data: {
-      sampling_rate: number;
-      data_points: {
-        energy: number;
-        frequency: number;
-      };
+      sampling_rate: number | null;
+      start_time: number | null;
+      time_step: number | null;
+      energy: (number | null)[];
+      frequency: (number | null)[];
     };
   } | null;
   created_at: string;